@@ -84,6 +84,21 @@ DATABASES = {
     }
 }
 
+# Optional read replica for the Django Ledger read-only workloads (digests, financial statement reports)...
+# Set DJANGO_LEDGER_READ_REPLICA to the replica SQLite file name. Otherwise, the replica alias points to the default
+# database and is only used explicitly. Tests mirror the default database.
+DJANGO_LEDGER_READ_REPLICA = os.getenv('DJANGO_LEDGER_READ_REPLICA')
+DATABASES['replica'] = {
+    'ENGINE': 'django.db.backends.sqlite3',
+    'NAME': os.path.join(BASE_DIR, DJANGO_LEDGER_READ_REPLICA or 'db.sqlite3'),
+    'TEST': {
+        'MIRROR': 'default',
+    },
+}
+if DJANGO_LEDGER_READ_REPLICA:
+    DATABASE_ROUTERS = ['django_ledger.routers.DjangoLedgerRouter']
+    DJANGO_LEDGER_READ_DATABASE = 'replica'
+
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
 
@@ -5,8 +5,9 @@ from django.forms import BaseInlineFormSet
 from django.shortcuts import get_object_or_404
 from django.utils.html import format_html
 
+from django_ledger.io.io_cache import bump_digest_version
 from django_ledger.models import (
-    LedgerModel, JournalEntryModel, EntityModel,
+    LedgerModel, JournalEntryModel, EntityModel, TransactionModel,
     LedgerModelValidationError
 )
 
@@ -214,6 +215,9 @@ class LedgerModelAdmin(ModelAdmin):
                 'posted',
                 'updated'
             ])
+        TransactionModel.objects.filter(journal_entry__ledger__in=queryset).sync_denormalized_fields()
+        for entity_uuid in set(obj.entity_id for obj in queryset):
+            bump_digest_version(entity_uuid)
 
     def lock(self, request, queryset):
         for obj in queryset:
@@ -247,6 +251,9 @@ class LedgerModelAdmin(ModelAdmin):
                 'posted',
                 'updated'
             ])
+        TransactionModel.objects.filter(journal_entry__ledger__in=queryset).sync_denormalized_fields()
+        for entity_uuid in set(obj.entity_id for obj in queryset):
+            bump_digest_version(entity_uuid)
 
     def unlock(self, request, queryset):
         for obj in queryset:
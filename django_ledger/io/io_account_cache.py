@@ -0,0 +1,123 @@
+"""
+Django Ledger created by Miguel Sanda <msanda@arrobalytics.com>.
+Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
+
+The account metadata cache stores the code, name, role, balance type and chart of accounts slug of every AccountModel
+of an EntityModel, so the database digest query only needs to group transactions by account, without joining the
+AccountModel and ChartOfAccountModel tables. The metadata is attached to the digest records in Python.
+
+Cache keys include a per-EntityModel version. Every AccountModel or ChartOfAccountModel change bumps the version, so
+stale metadata is never read back and simply expires.
+"""
+from time import time_ns
+from typing import Dict, Optional
+from uuid import UUID
+
+from django.core.cache import caches
+from django.db import transaction
+
+from django_ledger import settings
+from django_ledger.models.utils import lazy_loader
+
+# digest record key -> AccountModel lookup...
+ACCOUNT_METADATA_FIELDS = {
+    'account__balance_type': 'balance_type',
+    'account__code': 'code',
+    'account__name': 'name',
+    'account__role': 'role',
+    'account__coa_model__slug': 'coa_model__slug',
+}
+
+
+def is_account_metadata_cache_enabled() -> bool:
+    return settings.DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_ENABLED
+
+
+def get_account_metadata_cache():
+    return caches[settings.DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_NAME]
+
+
+def get_account_metadata_version_key(entity_uuid: UUID) -> str:
+    return f'djl_account_metadata_version_{entity_uuid}'
+
+
+def get_account_metadata_version(entity_uuid: UUID) -> int:
+    """
+    Returns the current account metadata version of the EntityModel. A missing (or evicted) version is initialized
+    with a time based value, so previously cached metadata cannot be matched again.
+    """
+    cache = get_account_metadata_cache()
+    version_key = get_account_metadata_version_key(entity_uuid)
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, time_ns(), None)
+        version = cache.get(version_key, time_ns())
+    return version
+
+
+def bump_account_metadata_version(entity_uuid: Optional[UUID]):
+    """
+    Invalidates the cached account metadata of the EntityModel. Does nothing unless
+    DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_ENABLED is enabled. When called within a transaction, the version is bumped
+    again once the transaction commits, so metadata read from the uncommitted state is discarded as well.
+
+    Parameters
+    ----------
+    entity_uuid: UUID
+        The EntityModel UUID.
+    """
+    if not is_account_metadata_cache_enabled() or not entity_uuid:
+        return
+
+    def bump():
+        cache = get_account_metadata_cache()
+        version_key = get_account_metadata_version_key(entity_uuid)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.add(version_key, time_ns(), None)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def fetch_account_metadata(entity_uuid: UUID) -> Dict[UUID, tuple]:
+    AccountModel = lazy_loader.get_account_model()
+    lookups = list(ACCOUNT_METADATA_FIELDS.values())
+    return {
+        account_uuid: tuple(values) for account_uuid, *values in AccountModel.objects.filter(
+            coa_model__entity_id=entity_uuid
+        ).values_list('uuid', *lookups)
+    }
+
+
+def get_account_metadata(entity_uuid: UUID, refresh: bool = False) -> Dict[UUID, Dict]:
+    """
+    Returns the metadata of every AccountModel of the EntityModel, fetching and caching it on a cache miss.
+
+    Parameters
+    ----------
+    entity_uuid: UUID
+        The EntityModel UUID.
+    refresh: bool
+        Fetches the metadata from the database even if cached, replacing the cached value. Defaults to False.
+
+    Returns
+    -------
+    dict
+        The digest record metadata fields (account__code, account__name, account__role, account__balance_type and
+        account__coa_model__slug) by AccountModel UUID.
+    """
+    cache = get_account_metadata_cache()
+    version = get_account_metadata_version(entity_uuid)
+    cache_key = f'djl_account_metadata_{entity_uuid}_{version}'
+
+    account_metadata = None if refresh else cache.get(cache_key)
+    if account_metadata is None:
+        account_metadata = fetch_account_metadata(entity_uuid)
+        cache.set(cache_key, account_metadata, settings.DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_TIMEOUT)
+
+    fields = list(ACCOUNT_METADATA_FIELDS)
+    return {
+        account_uuid: dict(zip(fields, values)) for account_uuid, values in account_metadata.items()
+    }
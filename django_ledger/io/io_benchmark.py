@@ -0,0 +1,93 @@
+"""
+Django Ledger created by Miguel Sanda <msanda@arrobalytics.com>.
+Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
+
+Helpers of the IO middleware benchmark: synthetic IO digest account records and the legacy per-role account scan,
+kept as the reference implementation the single pass role and group aggregation is checked against.
+"""
+from collections import defaultdict
+from decimal import Decimal
+from random import Random
+from uuid import UUID
+
+from django_ledger.io import roles as roles_module
+
+
+def generate_digest_accounts(rows: int, units: int = 5, periods: int = 24, seed: int = 0) -> list:
+    """
+    Generates synthetic IO digest account records, grouped by unit and period.
+    """
+    rnd = Random(seed)
+    role_list = [getattr(roles_module, r) for l in roles_module.ROLES_DIRECTORY.values() for r in l]
+    unit_list = [(UUID(int=rnd.getrandbits(128)), f'Unit {i}') for i in range(units)]
+    accounts = list()
+    for i in range(rows):
+        unit_uuid, unit_name = rnd.choice(unit_list)
+        period_idx = rnd.randrange(periods)
+        accounts.append({
+            'account_uuid': UUID(int=rnd.getrandbits(128)),
+            'role': rnd.choice(role_list),
+            'unit_uuid': unit_uuid,
+            'unit_name': unit_name,
+            'period_year': 2020 + period_idx // 12,
+            'period_month': period_idx % 12 + 1,
+            'activity': None,
+            'balance': Decimal(rnd.randint(-1000000, 1000000)) / 100,
+        })
+    return accounts
+
+
+def legacy_bucket_aggregation(accounts: list, buckets: dict, by_period: bool, by_unit: bool):
+    """
+    Reference implementation of the per-bucket account scan formerly used by the IO middleware.
+    Buckets is an ordered dictionary of bucket name to the account membership predicate.
+    """
+    bucket_accounts = dict()
+    bucket_balances = dict()
+    balances_by_period = defaultdict(lambda: dict())
+    balances_by_unit = defaultdict(lambda: dict())
+
+    for b, is_member in buckets.items():
+        acc_list = list(acc for acc in accounts if is_member(acc))
+        bucket_accounts[b] = acc_list
+        bucket_balances[b] = sum(acc['balance'] for acc in acc_list)
+
+        if by_period or by_unit:
+            for acc in acc_list:
+                if by_period:
+                    key = (acc['period_year'], acc['period_month'])
+                    balances_by_period[key][b] = sum(acc['balance'] for acc in acc_list if all([
+                        acc['period_year'] == key[0],
+                        acc['period_month'] == key[1]]
+                    ))
+                if by_unit:
+                    key = (acc['unit_uuid'], acc['unit_name'])
+                    balances_by_unit[key][b] = sum(
+                        acc['balance'] for acc in acc_list if acc['unit_uuid'] == key[0])
+
+    return bucket_accounts, bucket_balances, balances_by_period, balances_by_unit
+
+
+def as_ordered_items(result) -> list:
+    """
+    Converts nested aggregation dictionaries into lists of items, so comparisons also account for key order.
+    """
+    if isinstance(result, dict):
+        return [(k, as_ordered_items(v)) for k, v in result.items()]
+    if isinstance(result, (list, tuple)):
+        return [as_ordered_items(v) for v in result]
+    return result
+
+
+def legacy_role_buckets() -> dict:
+    return {
+        r: (lambda acc, role=getattr(roles_module, r): acc['role'] == role)
+        for l in roles_module.ROLES_DIRECTORY.values() for r in l
+    }
+
+
+def legacy_group_buckets() -> dict:
+    return {
+        g: (lambda acc, group=getattr(roles_module, g): acc['role'] in group)
+        for g in roles_module.ROLES_GROUPS
+    }
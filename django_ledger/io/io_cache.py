@@ -0,0 +1,189 @@
+"""
+Django Ledger created by Miguel Sanda <msanda@arrobalytics.com>.
+Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
+
+The IO digest cache stores the results of IOMixIn.digest() using the Django caches framework.
+
+Cache keys are derived from the IO model, the normalized digest arguments and the ledger-state version of the
+EntityModel the IO model belongs to. Every mutation that may change a digest result (committing transactions,
+posting, un-posting or locking journal entries and ledgers, closing entries) bumps the EntityModel version,
+so stale results are never read back and simply expire.
+
+Concurrent requests for the same cold digest are coordinated with a single-flight lock, so only one of them
+performs the database aggregation while the others wait for the cached result.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from hashlib import sha256
+from time import monotonic, sleep, time_ns
+from typing import Callable, Dict, Optional
+from uuid import UUID
+
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Model, QuerySet
+
+from django_ledger import settings
+from django_ledger.io.io_context import IODigestContextManager
+
+
+class IODigestCacheUnsupportedArgument(Exception):
+    pass
+
+
+def normalize_digest_argument(value):
+    """
+    Converts a digest argument into a deterministic, hashable representation.
+
+    Raises
+    ------
+    IODigestCacheUnsupportedArgument
+        If the value cannot be represented deterministically, in which case the digest must not be cached.
+    """
+    if value is None or isinstance(value, (bool, int, str, Decimal, UUID)):
+        return value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Model):
+        return f'{value._meta.label_lower}:{value.pk}'
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_digest_argument(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((normalize_digest_argument(v) for v in value), key=repr))
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), normalize_digest_argument(v)) for k, v in value.items()))
+    raise IODigestCacheUnsupportedArgument(f'Cannot cache digest argument of type {type(value)}')
+
+
+def get_digest_cache():
+    return caches[settings.DJANGO_LEDGER_DIGEST_CACHE_NAME]
+
+
+def get_digest_version_key(entity_uuid: UUID) -> str:
+    return f'djl_digest_version_{entity_uuid}'
+
+
+def get_digest_version(entity_uuid: UUID) -> int:
+    """
+    Returns the current ledger-state version of the EntityModel. A missing (or evicted) version is initialized
+    with a time based value, so previously cached digests cannot be matched again.
+    """
+    cache = get_digest_cache()
+    version_key = get_digest_version_key(entity_uuid)
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, time_ns(), None)
+        version = cache.get(version_key, time_ns())
+    return version
+
+
+def bump_digest_version(entity_uuid: Optional[UUID]):
+    """
+    Invalidates all cached digests of the EntityModel. Does nothing unless DJANGO_LEDGER_DIGEST_CACHE_ENABLED is
+    enabled. When called within a transaction, the version is bumped again once the transaction commits, so
+    digests computed from the uncommitted state are discarded as well.
+
+    Parameters
+    ----------
+    entity_uuid: UUID
+        The EntityModel UUID.
+    """
+    if not settings.DJANGO_LEDGER_DIGEST_CACHE_ENABLED or not entity_uuid:
+        return
+
+    def bump():
+        cache = get_digest_cache()
+        version_key = get_digest_version_key(entity_uuid)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.add(version_key, time_ns(), None)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+class IODigestCache:
+    """
+    Pluggable digest result cache for an IO model (EntityModel, EntityUnitModel or LedgerModel).
+    """
+    LOCK_POLL_INTERVAL = 0.05
+
+    def __init__(self, io_model, cache_name: Optional[str] = None, timeout: Optional[int] = None):
+        self.IO_MODEL = io_model
+        self.CACHE = caches[cache_name or settings.DJANGO_LEDGER_DIGEST_CACHE_NAME]
+        self.TIMEOUT = timeout or settings.DJANGO_LEDGER_DIGEST_CACHE_TIMEOUT
+        self.LOCK_TIMEOUT = settings.DJANGO_LEDGER_DIGEST_CACHE_LOCK_TIMEOUT
+
+    def get_entity_uuid(self) -> UUID:
+        if self.IO_MODEL.is_entity_model():
+            return self.IO_MODEL.uuid
+        return self.IO_MODEL.entity_id
+
+    def get_cache_key(self, digest_kwargs: Dict) -> str:
+        normalized_kwargs = normalize_digest_argument(digest_kwargs)
+        kwargs_hash = sha256(repr(normalized_kwargs).encode('utf-8')).hexdigest()
+        version = get_digest_version(self.get_entity_uuid())
+        return f'djl_digest_{self.IO_MODEL._meta.label_lower}_{self.IO_MODEL.pk}_{version}_{kwargs_hash}'
+
+    def get_payload(self, io_digest: IODigestContextManager) -> Dict:
+        io_state = io_digest.get_io_data().copy()
+        del io_state['io_model']
+        io_result = io_digest.get_io_result()
+        if isinstance(io_result.txs_queryset, QuerySet):
+            # cached payloads hold the evaluated digest rows...
+            io_result.txs_queryset = list(io_result.txs_queryset)
+        return io_state
+
+    def get_context_manager(self, payload: Dict) -> IODigestContextManager:
+        io_state = payload
+        io_state['io_model'] = self.IO_MODEL
+        return IODigestContextManager(io_state=io_state)
+
+    def get_or_compute(self,
+                       digest_kwargs: Dict,
+                       digest_func: Callable[[], IODigestContextManager]) -> IODigestContextManager:
+        """
+        Returns the cached digest result for the provided arguments, computing and caching it if not present.
+        Only one caller computes a cold digest at a time, other callers wait for the result up to
+        DJANGO_LEDGER_DIGEST_CACHE_LOCK_TIMEOUT seconds before computing it themselves.
+
+        Parameters
+        ----------
+        digest_kwargs: dict
+            The digest arguments.
+        digest_func: callable
+            Computes the digest result when not cached.
+
+        Returns
+        -------
+        IODigestContextManager
+            The digest result.
+        """
+        try:
+            cache_key = self.get_cache_key(digest_kwargs)
+        except IODigestCacheUnsupportedArgument:
+            return digest_func()
+
+        payload = self.CACHE.get(cache_key)
+        if payload is not None:
+            return self.get_context_manager(payload)
+
+        lock_key = f'{cache_key}_lock'
+        if not self.CACHE.add(lock_key, True, self.LOCK_TIMEOUT):
+            wait_until = monotonic() + self.LOCK_TIMEOUT
+            while monotonic() < wait_until:
+                sleep(self.LOCK_POLL_INTERVAL)
+                payload = self.CACHE.get(cache_key)
+                if payload is not None:
+                    return self.get_context_manager(payload)
+                if self.CACHE.get(lock_key) is None:
+                    break
+            return digest_func()
+
+        try:
+            io_digest = digest_func()
+            self.CACHE.set(cache_key, self.get_payload(io_digest), self.TIMEOUT)
+            return io_digest
+        finally:
+            self.CACHE.delete(lock_key)
@@ -0,0 +1,149 @@
+"""
+Django Ledger created by Miguel Sanda <msanda@arrobalytics.com>.
+Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
+
+The closing entry cache stores the aggregated balances of a closing entry in a compact binary encoding, instead of
+serialized ClosingEntryTransactionModel rows. Only the (account_uuid, unit_uuid, activity, tx_type, balance) tuples
+are kept, which is all IOMixIn.database_digest() needs to merge a closing entry into a digest.
+
+The encoding starts with a header holding a magic number, the format version, the activity string table size and
+the number of balances. Each balance is then stored as a fixed size record:
+
+    account_uuid (16 bytes) | unit_uuid (16 bytes, zeros if None) | activity code (1 byte) |
+    tx_type (1 byte) | balance (16 bytes, signed integer scaled by 10^6)
+
+Values that cannot be decoded, including values written with a different format version, are treated as a cache
+miss.
+"""
+import struct
+from decimal import Decimal
+from typing import Iterable, List, NamedTuple, Optional
+from uuid import UUID
+
+CLOSING_ENTRY_CACHE_MAGIC = b'DJCE'
+CLOSING_ENTRY_CACHE_VERSION = 1
+
+# matches the ClosingEntryTransactionModel balance decimal places...
+BALANCE_DECIMAL_PLACES = 6
+BALANCE_SIZE = 16
+
+HEADER_STRUCT = struct.Struct('>4sBBI')
+ROW_STRUCT = struct.Struct(f'>16s16sBB{BALANCE_SIZE}s')
+
+NULL_UUID_BYTES = bytes(16)
+TX_TYPE_CODES = {
+    'debit': 0,
+    'credit': 1,
+}
+TX_TYPES = {v: k for k, v in TX_TYPE_CODES.items()}
+
+
+class ClosingEntryBalance(NamedTuple):
+    account_uuid: UUID
+    unit_uuid: Optional[UUID]
+    activity: Optional[str]
+    tx_type: str
+    balance: Decimal
+
+
+def encode_closing_entry_balances(balances: Iterable[ClosingEntryBalance]) -> bytes:
+    """
+    Encodes the closing entry balances into the binary cache format.
+
+    Parameters
+    ----------
+    balances: iterable of ClosingEntryBalance
+        The closing entry balances to encode.
+
+    Returns
+    -------
+    bytes
+        The encoded closing entry balances.
+    """
+    activities = dict()
+    rows = list()
+
+    for ce_balance in balances:
+        activity_code = 0
+        if ce_balance.activity:
+            activity_code = activities.setdefault(ce_balance.activity, len(activities) + 1)
+        scaled_balance = int(Decimal(ce_balance.balance).scaleb(BALANCE_DECIMAL_PLACES).to_integral_value())
+        rows.append(
+            ROW_STRUCT.pack(
+                ce_balance.account_uuid.bytes,
+                ce_balance.unit_uuid.bytes if ce_balance.unit_uuid else NULL_UUID_BYTES,
+                activity_code,
+                TX_TYPE_CODES[ce_balance.tx_type],
+                scaled_balance.to_bytes(BALANCE_SIZE, byteorder='big', signed=True),
+            )
+        )
+
+    activity_table = list()
+    for activity in activities:
+        activity_bytes = activity.encode('utf-8')
+        activity_table.append(bytes([len(activity_bytes)]) + activity_bytes)
+
+    return b''.join(
+        [
+            HEADER_STRUCT.pack(
+                CLOSING_ENTRY_CACHE_MAGIC,
+                CLOSING_ENTRY_CACHE_VERSION,
+                len(activity_table),
+                len(rows),
+            ),
+            *activity_table,
+            *rows,
+        ]
+    )
+
+
+def decode_closing_entry_balances(data) -> Optional[List[ClosingEntryBalance]]:
+    """
+    Decodes closing entry balances encoded by encode_closing_entry_balances().
+
+    Parameters
+    ----------
+    data: bytes
+        The encoded closing entry balances.
+
+    Returns
+    -------
+    list of ClosingEntryBalance or None
+        The decoded closing entry balances. None if the data is not a valid closing entry cache value of the
+        current format version.
+    """
+    if not isinstance(data, (bytes, bytearray, memoryview)) or len(data) < HEADER_STRUCT.size:
+        return
+
+    data = memoryview(data)
+    magic, version, activity_count, row_count = HEADER_STRUCT.unpack_from(data)
+    if magic != CLOSING_ENTRY_CACHE_MAGIC or version != CLOSING_ENTRY_CACHE_VERSION:
+        return
+
+    try:
+        offset = HEADER_STRUCT.size
+        activities = [None]
+        for _ in range(activity_count):
+            size = data[offset]
+            activities.append(bytes(data[offset + 1:offset + 1 + size]).decode('utf-8'))
+            offset += 1 + size
+
+        if len(data) - offset != row_count * ROW_STRUCT.size:
+            return
+
+        return [
+            ClosingEntryBalance(
+                account_uuid=UUID(bytes=account_bytes),
+                unit_uuid=UUID(bytes=unit_bytes) if unit_bytes != NULL_UUID_BYTES else None,
+                activity=activities[activity_code],
+                tx_type=TX_TYPES[tx_type_code],
+                balance=Decimal(
+                    int.from_bytes(balance_bytes, byteorder='big', signed=True)
+                ).scaleb(-BALANCE_DECIMAL_PLACES),
+            )
+            for account_bytes, unit_bytes, activity_code, tx_type_code, balance_bytes in ROW_STRUCT.iter_unpack(
+                data[offset:]
+            )
+        ]
+    except (IndexError, KeyError, UnicodeDecodeError, ValueError):
+        return
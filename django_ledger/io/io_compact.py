@@ -0,0 +1,222 @@
+"""
+Django Ledger created by Miguel Sanda <msanda@arrobalytics.com>.
+Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
+
+The compact accounts digest is a columnar alternative to the list of account digest dictionaries produced by
+IOMixIn.python_digest().
+
+Every account digest record is stored as a row of parallel arrays. Account metadata, roles, units, periods,
+activities and transaction types are interned, so each row only holds small integer codes plus its balance.
+Balances are kept as Decimal values to preserve accounting precision.
+
+Reductions by any combination of columns are computed directly from the integer codes, and iterating over the
+digest yields the same dictionary records as the list representation, so templates and reports keep working.
+Dictionary records are only built for the rows that are accessed, and are cached, so every consumer shares the same
+record and changes made by the IO middleware are preserved.
+"""
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+class CompactAccountsDigest:
+    """
+    Columnar, array-backed representation of the IO accounts digest.
+
+    Each column holds interned integer codes, which map to the values stored in the corresponding values table.
+    The "account" column values are the account metadata tuples as defined by ACCOUNT_FIELDS.
+    """
+    ACCOUNT_FIELDS = (
+        'account_uuid',
+        'coa_slug',
+        'role_bs',
+        'role',
+        'code',
+        'name',
+        'balance_type',
+    )
+    COLUMNS = (
+        'account',
+        'role',
+        'unit',
+        'period',
+        'activity',
+        'tx_type',
+    )
+
+    def __init__(self):
+        self.CODES: Dict[str, array] = {c: array('I') for c in self.COLUMNS}
+        self.VALUES: Dict[str, List] = {c: list() for c in self.COLUMNS}
+        self.BALANCES: List = list()
+        self._INTERNED: Dict[str, Dict] = {c: dict() for c in self.COLUMNS}
+        self._RECORDS: Dict[int, Dict] = dict()
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> 'CompactAccountsDigest':
+        """
+        Builds the compact digest from account digest records. The records may be a generator, only one
+        record is held in memory at a time.
+
+        Parameters
+        ----------
+        records: iterable of dict
+            The account digest records, as produced by IOMixIn.iter_accounts_digest().
+
+        Returns
+        -------
+        CompactAccountsDigest
+            The compact accounts digest.
+        """
+        compact_digest = cls()
+        for record in records:
+            compact_digest.append(record)
+        return compact_digest
+
+    def intern(self, column: str, value) -> int:
+        interned = self._INTERNED[column]
+        try:
+            return interned[value]
+        except KeyError:
+            code = interned[value] = len(self.VALUES[column])
+            self.VALUES[column].append(value)
+            return code
+
+    def append(self, record: Dict):
+        row_values = (
+            tuple(record[f] for f in self.ACCOUNT_FIELDS),
+            record['role'],
+            (record['unit_uuid'], record['unit_name']),
+            (record['period_year'], record['period_month']),
+            record['activity'],
+            record['tx_type'],
+        )
+        for column, value in zip(self.COLUMNS, row_values):
+            self.CODES[column].append(self.intern(column, value))
+        self.BALANCES.append(record['balance'])
+
+    def __len__(self) -> int:
+        return len(self.BALANCES)
+
+    def __bool__(self) -> bool:
+        return len(self.BALANCES) > 0
+
+    def __getitem__(self, idx: int) -> Dict:
+        return self.get_record(idx)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.iter_records()
+
+    def __getstate__(self) -> Dict:
+        # the interning maps are rebuilt on unpickling...
+        state = self.__dict__.copy()
+        del state['_INTERNED']
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._INTERNED = {
+            c: {v: code for code, v in enumerate(self.VALUES[c])} for c in self.COLUMNS
+        }
+
+    def get_record(self, idx: int) -> Dict:
+        """
+        Returns the account digest dictionary record of the provided row. Records are built on first access and
+        cached, so the same record is returned on every call and any changes made to it are preserved.
+
+        Parameters
+        ----------
+        idx: int
+            The row index.
+
+        Returns
+        -------
+        dict
+            The account digest record.
+        """
+        try:
+            return self._RECORDS[idx]
+        except KeyError:
+            pass
+
+        account_uuid, coa_slug, role_bs, role, code, name, balance_type = self.VALUES['account'][
+            self.CODES['account'][idx]
+        ]
+        unit_uuid, unit_name = self.VALUES['unit'][self.CODES['unit'][idx]]
+        period_year, period_month = self.VALUES['period'][self.CODES['period'][idx]]
+        balance = self.BALANCES[idx]
+        record = self._RECORDS[idx] = {
+            'account_uuid': account_uuid,
+            'coa_slug': coa_slug,
+            'unit_uuid': unit_uuid,
+            'unit_name': unit_name,
+            'activity': self.VALUES['activity'][self.CODES['activity'][idx]],
+            'period_year': period_year,
+            'period_month': period_month,
+            'role_bs': role_bs,
+            'role': role,
+            'code': code,
+            'name': name,
+            'balance_type': balance_type,
+            'tx_type': self.VALUES['tx_type'][self.CODES['tx_type'][idx]],
+            'balance': balance,
+            'balance_abs': abs(balance),
+        }
+        return record
+
+    def iter_records(self, indices: Optional[Iterable[int]] = None) -> Iterator[Dict]:
+        """
+        Compatibility view yielding the account digest dictionary records.
+
+        Parameters
+        ----------
+        indices: iterable of int
+            The row indices to yield. Defaults to all rows.
+        """
+        if indices is None:
+            indices = range(len(self))
+        return (self.get_record(idx) for idx in indices)
+
+    def get_codes(self, column: str) -> Tuple[array, List]:
+        """
+        Returns the interned codes of a column and the values they map to.
+
+        Parameters
+        ----------
+        column: str
+            One of COLUMNS.
+
+        Returns
+        -------
+        tuple
+            The codes array, one code per row, and the values list indexed by code.
+        """
+        return self.CODES[column], self.VALUES[column]
+
+    def reduce(self, by: Union[str, Tuple[str, ...]]) -> Dict:
+        """
+        Sums the balances grouped by one or more columns. Groups are returned in the order they are first seen.
+
+        Parameters
+        ----------
+        by: str or tuple of str
+            The column or columns to group by. One or more of COLUMNS.
+
+        Returns
+        -------
+        dict
+            The total balance by column value. Keys are tuples of values when grouping by several columns.
+        """
+        if isinstance(by, str):
+            codes, values = self.get_codes(by)
+            totals = dict()
+            for code, balance in zip(codes, self.BALANCES):
+                totals[code] = totals.get(code, 0) + balance
+            return {values[code]: total for code, total in totals.items()}
+
+        columns = [self.get_codes(c) for c in by]
+        totals = dict()
+        for key, balance in zip(zip(*(codes for codes, _ in columns)), self.BALANCES):
+            totals[key] = totals.get(key, 0) + balance
+        return {
+            tuple(values[code] for code, (_, values) in zip(key, columns)): total
+            for key, total in totals.items()
+        }
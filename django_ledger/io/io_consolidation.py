@@ -0,0 +1,184 @@
+"""
+Django Ledger created by Miguel Sanda <msanda@arrobalytics.com>.
+Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
+
+Consolidation merges the account digests of several EntityModels of the same tree into a single accounts digest.
+Accounts of different entities are merged by account code and role, so entities sharing a chart of accounts layout
+consolidate into the same lines. The merged digest may then be processed by the IO middleware like any other digest.
+
+Intercompany balances are removed with elimination rules. Each EliminationRule matches the consolidated accounts to
+eliminate by code or role. The net debit/credit difference of the eliminated balances is reported, since fully
+reconciled intercompany balances must eliminate to zero.
+"""
+from decimal import Decimal
+from threading import get_ident
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from django.db import connections
+
+from django_ledger.io.io_core import IODatabaseMixIn
+from django_ledger.models.accounts import DEBIT
+from django_ledger.models.utils import lazy_loader
+
+
+class EliminationRule(NamedTuple):
+    """
+    An intercompany elimination rule. Consolidated accounts matching any of the codes or roles are eliminated.
+
+    Attributes
+    ----------
+    name: str
+        The name of the rule, used to report the eliminated balances.
+    codes: tuple of str
+        The account codes to eliminate.
+    roles: tuple of str
+        The account roles to eliminate.
+    """
+    name: str
+    codes: Tuple[str, ...] = ()
+    roles: Tuple[str, ...] = ()
+
+    def matches(self, acc: Dict) -> bool:
+        return acc['code'] in self.codes or acc['role'] in self.roles
+
+
+def digest_consolidation_entity(
+    entity_uuid: UUID,
+    digest_kwargs: Dict,
+    caller_thread_ident: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Computes the accounts digest of a single EntityModel of a consolidation. Defined at module level so it can be
+    submitted to thread or process pool executors.
+
+    Parameters
+    ----------
+    entity_uuid: UUID
+        The EntityModel UUID.
+    digest_kwargs: dict
+        The named arguments passed to EntityModel.digest().
+    caller_thread_ident: int
+        The identifier of the thread submitting the task. Database connections opened by the task are closed
+        when it runs in a different worker thread.
+
+    Returns
+    -------
+    list of dict
+        The accounts digest of the EntityModel.
+    """
+    try:
+        EntityModel = lazy_loader.get_entity_model()
+        entity_model = EntityModel.objects.get(uuid__exact=entity_uuid)
+        io_digest = entity_model.digest(**digest_kwargs)
+        return list(io_digest.get_io_result().accounts_digest)
+    finally:
+        # worker threads open their own database connections...
+        if caller_thread_ident is not None and get_ident() != caller_thread_ident:
+            connections.close_all()
+
+
+def get_consolidation_key(acc: Dict) -> Tuple:
+    return (
+        acc['code'],
+        acc['role'],
+        acc['balance_type'],
+        acc['period_year'],
+        acc['period_month'],
+        acc['activity'],
+        acc['tx_type'],
+    )
+
+
+def merge_accounts_digests(accounts_digests: Iterable[List[Dict]]) -> List[Dict]:
+    """
+    Merges the accounts digests of several EntityModels by account code and role. Merged records keep the
+    attributes of the first account seen, and list the UUIDs of every merged account.
+
+    Parameters
+    ----------
+    accounts_digests: iterable of list
+        The accounts digests to merge, in consolidation order.
+
+    Returns
+    -------
+    list of dict
+        The consolidated accounts digest, in the order the merged records are first seen.
+    """
+    consolidated = dict()
+    for accounts_digest in accounts_digests:
+        for acc in accounts_digest:
+            key = get_consolidation_key(acc)
+            try:
+                consolidated_acc = consolidated[key]
+            except KeyError:
+                consolidated[key] = {
+                    **acc,
+                    'unit_uuid': None,
+                    'unit_name': None,
+                    'account_uuids': [acc['account_uuid']],
+                }
+                continue
+            consolidated_acc['balance'] += acc['balance']
+            consolidated_acc['account_uuids'].append(acc['account_uuid'])
+
+    for acc in consolidated.values():
+        acc['balance_abs'] = abs(acc['balance'])
+    return list(consolidated.values())
+
+
+def get_debit_balance(acc: Dict, signs: bool = True):
+    """
+    The balance of a digest record expressed as debits minus credits.
+    """
+    balance = acc['balance'] if acc['balance_type'] == DEBIT else -acc['balance']
+    if signs and IODatabaseMixIn.is_contra_balance(acc['role'], acc['balance_type']):
+        balance = -balance
+    return balance
+
+
+def apply_elimination_rules(
+    accounts: List[Dict],
+    elimination_rules: Iterable[EliminationRule],
+    signs: bool = True,
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Removes the consolidated accounts matched by the elimination rules. Each account is eliminated by the first
+    rule that matches it.
+
+    Parameters
+    ----------
+    accounts: list of dict
+        The consolidated accounts digest.
+    elimination_rules: iterable of EliminationRule
+        The elimination rules to apply, in order.
+    signs: bool
+        Whether the balance sheet sign conventions were applied to the account balances.
+
+    Returns
+    -------
+    tuple
+        The remaining accounts, and one record per rule with the eliminated accounts and their net debit/credit
+        difference. A non-zero difference indicates unreconciled intercompany balances.
+    """
+    elimination_rules = list(elimination_rules)
+    eliminations = [
+        {
+            'name': rule.name,
+            'accounts': list(),
+            'difference': Decimal('0.00'),
+        } for rule in elimination_rules
+    ]
+    rules = list(zip(elimination_rules, eliminations))
+
+    remaining_accounts = list()
+    for acc in accounts:
+        for rule, elimination in rules:
+            if rule.matches(acc):
+                elimination['accounts'].append(acc)
+                elimination['difference'] += get_debit_balance(acc, signs=signs)
+                break
+        else:
+            remaining_accounts.append(acc)
+
+    return remaining_accounts, eliminations
@@ -7,7 +7,7 @@ Contributions to this module:
 """
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from django.core.exceptions import ValidationError
 
@@ -35,6 +35,9 @@ class IODigestContextManager:
     def get_io_txs_queryset(self):
         return self.IO_RESULT.txs_queryset
 
+    def get_profile(self) -> Optional[Dict]:
+        return self.IO_RESULT.profile
+
     def get_strftime_format(self):
         return self.STRFTIME_FORMAT
 
@@ -138,6 +141,56 @@ class IODigestContextManager:
                     'IO Digest does not have cash flow statement information available.'
                 )
 
+    # Consolidation Data...
+    def is_consolidated(self) -> bool:
+        return 'consolidated_entities' in self.IO_DATA
+
+    def get_consolidated_entities(self) -> List:
+        return self.IO_DATA.get('consolidated_entities', list())
+
+    def get_eliminations_data(self, raise_exception: bool = True) -> List[Dict]:
+        try:
+            return self.IO_DATA['eliminations']
+        except KeyError:
+            if raise_exception:
+                raise IODigestValidationError(
+                    'IO Digest does not have consolidation eliminations information available.'
+                )
+
+    # Comparative Statements Data...
+    def is_comparative(self) -> bool:
+        return 'comparative_columns' in self.IO_DATA
+
+    def get_comparative_columns(self) -> List[Dict]:
+        return self.IO_DATA.get('comparative_columns', list())
+
+    def get_comparative_base_column(self) -> Optional[int]:
+        return self.IO_DATA.get('comparative_base_column')
+
+    def has_comparative_balance_sheet(self) -> bool:
+        return 'comparative_balance_sheet' in self.IO_DATA
+
+    def get_comparative_balance_sheet_data(self, raise_exception: bool = True) -> Dict:
+        try:
+            return self.IO_DATA['comparative_balance_sheet']
+        except KeyError:
+            if raise_exception:
+                raise IODigestValidationError(
+                    'IO Digest does not have comparative balance sheet information available.'
+                )
+
+    def has_comparative_income_statement(self) -> bool:
+        return 'comparative_income_statement' in self.IO_DATA
+
+    def get_comparative_income_statement_data(self, raise_exception: bool = True) -> Dict:
+        try:
+            return self.IO_DATA['comparative_income_statement']
+        except KeyError:
+            if raise_exception:
+                raise IODigestValidationError(
+                    'IO Digest does not have comparative income statement information available.'
+                )
+
     # All Available Statements
     def get_financial_statements_data(self) -> Dict:
         return {
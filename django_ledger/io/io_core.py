@@ -56,16 +56,21 @@ Functions:
     - `check_tx_balance()`: Ensures transaction datasets are corrected to be balanced if requested.
     - `validate_io_timestamp()`: Ensures that input dates or timestamps are valid and timezone-aware.
     - `get_localtime()`, `get_localdate()`: Retrieve local time or local date based on Django's timezone settings.
+    - `get_next_month_start()`: Returns the first day of the month following a given date.
     - `validate_dates()`: Validates and parses `from_date` and `to_date` inputs.
 
 - **Digest Operations**:
     - `database_digest()`: Processes and aggregates transactions directly in the database with support for filters such as activity, role, and period.
     - `python_digest()`: Applies additional processing and group-by operations on transaction data after database-level aggregation.
     - `digest()`: A unified entry point for performing database digests and Python-level post-processing, with options to process roles, groups, ratios, and financial statements.
+      Results can be cached with the versioned `IODigestCache` (see `django_ledger.io.io_cache`).
+    - `digest_windows()`: Computes the digest of several date windows with a single database aggregation query.
+    - `adigest()`, `adatabase_digest()`: Async counterparts of `digest()` and `database_digest()` built on the async ORM, for ASGI deployments.
 
 - **Report Data Generation**:
     - `get_balance_sheet_statement()`, `get_income_statement()`, `get_cash_flow_statement()`: Generate specific financial statements, with optional PDF output.
     - `get_financial_statements()`: Generate all key financial statements together (Balance Sheet, Income Statement, Cash Flow Statement).
+    - `aget_financial_statements()`: Async counterpart of `get_financial_statements()`.
 
 Error Handling:
 ---------------
@@ -94,15 +99,17 @@ from datetime import date, datetime, timedelta
 from itertools import groupby
 from pathlib import Path
 from random import choice
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from uuid import UUID
 from zoneinfo import ZoneInfo
 
+from asgiref.sync import sync_to_async
 from django.conf import settings as global_settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import transaction
-from django.db.models import Case, DecimalField, F, QuerySet, Sum, When
-from django.db.models.functions import TruncMonth
+from django.db.models import Case, DecimalField, F, IntegerField, Q, QuerySet, Sum, Value, When
+from django.db.models.functions import ExtractIsoYear, ExtractMonth, ExtractWeek, ExtractYear
 from django.http import Http404
 from django.utils.dateparse import parse_date, parse_datetime
 from django.utils.timezone import is_naive, localdate, localtime, make_aware
@@ -112,20 +119,37 @@ from django_ledger import settings
 from django_ledger.exceptions import InvalidDateInputError, TransactionNotInBalanceError
 from django_ledger.io import CREDIT, DEBIT
 from django_ledger.io import roles as roles_module
+from django_ledger.io.io_account_cache import get_account_metadata
+from django_ledger.io.io_cache import IODigestCache, bump_digest_version
+from django_ledger.io.io_compact import CompactAccountsDigest
 from django_ledger.io.io_context import IODigestContextManager
+from django_ledger.io.io_profiler import IODigestProfiler
 from django_ledger.io.io_middleware import (
     AccountGroupIOMiddleware,
     AccountRoleIOMiddleware,
     BalanceSheetIOMiddleware,
     CashFlowStatementIOMiddleware,
+    ComparativeStatementIOMiddleware,
     IncomeStatementIOMiddleware,
     JEActivityIOMiddleware,
 )
 from django_ledger.io.ratios import FinancialRatioManager
 from django_ledger.models.utils import lazy_loader
+from django_ledger.routers import get_read_database, primary_database
 
 UserModel = get_user_model()
 
+DIGEST_PERIOD_WEEK = 'week'
+DIGEST_PERIOD_MONTH = 'month'
+DIGEST_PERIOD_FISCAL_QUARTER = 'fiscal_quarter'
+DIGEST_PERIOD_FISCAL_YEAR = 'fiscal_year'
+DIGEST_PERIODS = (
+    DIGEST_PERIOD_WEEK,
+    DIGEST_PERIOD_MONTH,
+    DIGEST_PERIOD_FISCAL_QUARTER,
+    DIGEST_PERIOD_FISCAL_YEAR,
+)
+
 
 def diff_tx_data(tx_data: list, raise_exception: bool = True):
     """
@@ -296,6 +320,23 @@ def get_localtime(tz=None) -> datetime:
     return datetime.now(tz=tz)
 
 
+def get_next_month_start(dt: date) -> date:
+    """
+    Returns the first day of the month following the provided date.
+
+    Parameters
+    ----------
+    dt : date
+        The reference date.
+
+    Returns
+    -------
+    date
+        The first day of the next month.
+    """
+    return (dt.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
 def get_localdate() -> date:
     """
     Fetches the current local date, optionally considering time zone settings.
@@ -471,6 +512,150 @@ def validate_activity(activity: str, raise_404: bool = False):
     return activity
 
 
+def validate_digest_period(by_period: Union[bool, str, None]) -> Optional[str]:
+    """
+    Validates the by_period digest argument and resolves it into one of the DIGEST_PERIODS.
+
+    Parameters
+    ----------
+    by_period : bool or str
+        The by_period digest argument. True is an alias of 'month' for backwards compatibility.
+
+    Returns
+    -------
+    str or None
+        The digest period, or None if the digest is not grouped by period.
+
+    Raises
+    ------
+    IOValidationError
+        If by_period is not a valid digest period.
+    """
+    if not by_period:
+        return None
+    if by_period is True:
+        return DIGEST_PERIOD_MONTH
+    if by_period not in DIGEST_PERIODS:
+        raise IOValidationError(
+            message=f'Invalid by_period value {by_period}. Choices are True, {", ".join(DIGEST_PERIODS)}.'
+        )
+    return by_period
+
+
+def get_digest_period_key(
+    dt: Union[date, datetime], period: str, fy_start_month: int = 1
+) -> Tuple[int, Optional[int]]:
+    """
+    Computes the (period_year, period_month) digest key of a date, matching the keys computed in the database
+    by the digest query.
+
+        * week: ISO year and ISO week number.
+        * month: Calendar year and month.
+        * fiscal_quarter: Fiscal year and fiscal quarter, as used by EntityModel.get_quarter_start().
+        * fiscal_year: Fiscal year, as returned by EntityModel.get_fy_for_date(), and None.
+
+    Parameters
+    ----------
+    dt : date or datetime
+        The date to evaluate.
+    period : str
+        One of DIGEST_PERIODS.
+    fy_start_month : int
+        The fiscal year start month of the EntityModel. Defaults to 1.
+
+    Returns
+    -------
+    tuple
+        The period_year and period_month key of the date.
+    """
+    if period == DIGEST_PERIOD_WEEK:
+        iso_year, iso_week, _ = dt.isocalendar()
+        return iso_year, iso_week
+    if period == DIGEST_PERIOD_MONTH:
+        return dt.year, dt.month
+    fiscal_year = dt.year if dt.month >= fy_start_month else dt.year - 1
+    if period == DIGEST_PERIOD_FISCAL_QUARTER:
+        return fiscal_year, (dt.month - fy_start_month) % 12 // 3 + 1
+    return fiscal_year, None
+
+
+def get_next_digest_period_start(dt: date, period: str, fy_start_month: int = 1) -> date:
+    """
+    Returns the first day of the digest period following the one the provided date belongs to. Weeks start on
+    Monday, same as ISO weeks.
+
+    Parameters
+    ----------
+    dt : date
+        The reference date.
+    period : str
+        One of DIGEST_PERIODS.
+    fy_start_month : int
+        The fiscal year start month of the EntityModel. Defaults to 1.
+
+    Returns
+    -------
+    date
+        The first day of the next period.
+    """
+    if period == DIGEST_PERIOD_WEEK:
+        return dt + timedelta(days=7 - dt.weekday())
+    if period == DIGEST_PERIOD_MONTH:
+        return get_next_month_start(dt)
+    period_months = 3 if period == DIGEST_PERIOD_FISCAL_QUARTER else 12
+    months_left = period_months - (dt.month - fy_start_month) % period_months
+    year, month = divmod(dt.month - 1 + months_left, 12)
+    return date(dt.year + year, month + 1, 1)
+
+
+def get_digest_period_windows(
+    from_date: date, to_date: date, period: str, fy_start_month: int = 1
+) -> List[Tuple[date, date]]:
+    """
+    Splits a date range into consecutive digest period windows. The first and last windows are clipped to the
+    date range, so they may be partial periods.
+
+    Parameters
+    ----------
+    from_date : date
+        The first date of the range.
+    to_date : date
+        The last date of the range.
+    period : str
+        One of DIGEST_PERIODS.
+    fy_start_month : int
+        The fiscal year start month of the EntityModel. Defaults to 1.
+
+    Returns
+    -------
+    list of tuple
+        The (from_date, to_date) pair of every period of the range, in chronological order.
+    """
+    windows = list()
+    window_from_date = from_date
+    while window_from_date <= to_date:
+        next_period_start = get_next_digest_period_start(
+            window_from_date, period=period, fy_start_month=fy_start_month
+        )
+        windows.append((window_from_date, min(next_period_start - timedelta(days=1), to_date)))
+        window_from_date = next_period_start
+    return windows
+
+
+def get_digest_period_label(dt: date, period: str, fy_start_month: int = 1) -> str:
+    """
+    Formats the digest period the provided date belongs to, such as 2024-W07, 2024-02, FY2024-Q1 or FY2024.
+    """
+    period_year, period_month = get_digest_period_key(dt, period=period, fy_start_month=fy_start_month)
+    if period == DIGEST_PERIOD_WEEK:
+        return f'{period_year}-W{period_month:02d}'
+    if period == DIGEST_PERIOD_MONTH:
+        return f'{period_year}-{period_month:02d}'
+    if period == DIGEST_PERIOD_FISCAL_QUARTER:
+        return f'FY{period_year}-Q{period_month}'
+    return f'FY{period_year}'
+
+
 class IOValidationError(ValidationError):
     pass
 
@@ -496,12 +681,30 @@ class IOResult:
         The starting date for closing entry lookups.
     ce_to_date : Optional[date]
         The ending date for closing entry lookups.
+    snapshot_match : bool
+        Indicates whether account balance snapshots were used for the full months of the period.
+    snapshot_from_period : Optional[date]
+        The first month answered from account balance snapshots. None if unbounded.
+    snapshot_to_period : Optional[date]
+        The last month answered from account balance snapshots. None if unbounded.
     txs_queryset
         The final queryset used for evaluation, typically containing processed
         transaction data.
-    accounts_digest : Optional[List[Dict]]
+    accounts_digest : Optional[Union[List[Dict], CompactAccountsDigest, Iterator[Dict]]]
         A summary or aggregation of account balances derived from the processed
-        data.
+        data. A CompactAccountsDigest, or a single pass iterator of records, if requested.
+    profile : Optional[Dict]
+        The per-stage wall time, SQL query count, SQL query time and row counts of the
+        digest. None unless profiling is enabled.
+    signed : bool
+        Indicates whether the database computed the normalized and signed balances (pushdown mode).
+    role_totals_queryset
+        The unevaluated queryset of balance subtotals by account role, if computed by the database.
+    role_totals : Optional[List[Dict]]
+        The balance subtotals by account role, unit and period, if computed by the database.
+    account_metadata : Optional[Dict]
+        The account metadata by account UUID, attached to the database digest records on aggregation.
+        None unless the account metadata cache was used.
     """
 
     # DB Aggregation...
@@ -513,11 +716,27 @@ class IOResult:
     ce_from_date: Optional[date] = None
     ce_to_date: Optional[date] = None
 
+    # Balance Snapshot lookup...
+    snapshot_match: bool = False
+    snapshot_from_period: Optional[date] = None
+    snapshot_to_period: Optional[date] = None
+
     # the final queryset to evaluate...
     txs_queryset = None
 
     # the aggregated account balance...
-    accounts_digest: Optional[List[Dict]] = None
+    accounts_digest: Optional[Union[List[Dict], CompactAccountsDigest, Iterator[Dict]]] = None
+
+    # per-stage instrumentation, if profiled...
+    profile: Optional[Dict] = None
+
+    # database computed balances and role subtotals, if pushed down...
+    signed: bool = False
+    role_totals_queryset = None
+    role_totals: Optional[List[Dict]] = None
+
+    # cached account metadata, if the account join was skipped...
+    account_metadata: Optional[Dict] = None
 
     @property
     def is_bounded(self) -> bool:
@@ -528,6 +747,21 @@ class IOResult:
             ]
         )
 
+    def get_role_totals(self) -> Optional[List[Dict]]:
+        """
+        Evaluates the role subtotals queryset, if any, and merges it with the role subtotals of the records
+        that did not come from the database digest query.
+
+        Returns
+        -------
+        list of dict or None
+            The balance subtotals by account role. None if not computed by the database.
+        """
+        if self.role_totals_queryset is not None:
+            self.role_totals = list(self.role_totals_queryset) + (self.role_totals or list())
+            self.role_totals_queryset = None
+        return self.role_totals
+
 
 class IODatabaseMixIn:
     """
@@ -671,92 +905,29 @@ class IODatabaseMixIn:
             return self.JOURNAL_ENTRY_MODEL_CLASS
         return lazy_loader.get_journal_entry_model()
 
-    def database_digest(
-        self,
-        entity_slug: Optional[str] = None,
-        unit_slug: Optional[str] = None,
-        from_date: Optional[Union[date, datetime]] = None,
-        to_date: Optional[Union[date, datetime]] = None,
-        by_activity: bool = False,
-        by_tx_type: bool = False,
-        by_period: bool = False,
-        by_unit: bool = False,
-        activity: Optional[str] = None,
-        role: str = Optional[str],
-        accounts: Optional[Union[str, List[str], Set[str]]] = None,
-        posted: bool = True,
-        exclude_zero_bal: bool = True,
-        use_closing_entry: bool = False,
-        **kwargs,
-    ) -> IOResult:
+    def get_txs_queryset_init(
+        self, entity_slug: Optional[str] = None, unit_slug: Optional[str] = None, annotated: bool = True
+    ):
         """
-        Aggregates transaction data based on the provided parameters to generate a
-        digest of financial entries. This method is designed to work with various
-        models (EntityModel, EntityUnitModel, LedgerModel) and processes
-        transactions, including handling closing entries to optimize database
-        queries. The resulting data can be customized based on specific filters
-        or aggregation criteria, such as activity, transaction type, or time periods.
+        Retrieves the initial TransactionModelQuerySet where the IO model is operating from, before any
+        date, closing entry or digest filters are applied.
 
         Parameters
         ----------
         entity_slug : Optional[str]
-            The identifier for the entity. Used to filter transactions for a specific
-            entity in cases where the model operates at the entity level.
+            The identifier of the entity. Required when operating from a LedgerModel or
+            EntityUnitModel.
         unit_slug : Optional[str]
-            The identifier for the unit. Valid when filtering transactions for a
-            specific unit within an entity.
-        user_model : Optional[UserModel]
-            The user model instance. Represents the user context in which the
-            transaction filtering applies.
-        from_date : Optional[Union[date, datetime]]
-            The starting date for filtering transactions. Aggregates data from
-            the given date if specified.
-        to_date : Optional[Union[date, datetime]]
-            The ending date for filtering transactions. Aggregates data up to this
-            date if specified.
-        by_activity : bool
-            Determines whether results should be aggregated by activity. Defaults
-            to False.
-        by_tx_type : bool
-            Indicates if results should be grouped by transaction type. Defaults
-            to False.
-        by_period : bool
-            Determines if results should be grouped by time period (e.g., months).
-            Defaults to False.
-        by_unit : bool
-            Indicates whether transactions should be grouped by entity unit.
-            Defaults to False.
-        activity : Optional[str]
-            A specific activity identifier to filter results. If provided, only
-            transactions related to this activity will be included.
-        role : Optional[str]
-            A specific role to filter transactions by. Transactions matching this
-            role will be included in the aggregation.
-        accounts : Optional[Union[str, List[str], Set[str]]]
-            Specifies accounts to filter by. Can be a single account or a list/set
-            of accounts. Filters transactions associated with the provided accounts.
-        posted : bool
-            Indicates whether to filter transactions that are posted (committed).
-            Defaults to True.
-        exclude_zero_bal : bool
-            If True, transactions with zero-balance amounts will be excluded.
-            Defaults to True.
-        use_closing_entry : bool
-            Specifies whether closing entries should be used to optimize database
-            aggregation. If not provided, the value is determined by the system-global
-            setting.
-        kwargs : dict
-            Additional parameters that can be passed for extended flexibility or
-            customization when filtering and processing transactions.
+            The identifier of the unit to filter by, if any.
+        annotated : bool
+            Whether the queryset carries the TransactionModel manager annotations, which join the
+            account and chart of accounts tables. Defaults to True.
 
         Returns
         -------
-        IOResult
-            An object containing the aggregated results, filtered transaction querysets,
-            and metadata such as database query bounds or details about closing
-            entry matches.
+        TransactionModelQuerySet
+            The initial transaction queryset for the IO model.
         """
-
         TransactionModel = self.get_transaction_model()
 
         # get_initial txs_queryset... where the IO model is operating from??...
@@ -769,12 +940,12 @@ class IODatabaseMixIn:
                     )
             if unit_slug:
                 txs_queryset_init = TransactionModel.objects.for_entity(
-                    entity_model=entity_slug or self.slug
+                    entity_model=entity_slug or self.slug, annotated=annotated
                 ).for_unit(unit_slug=unit_slug)
 
             else:
                 txs_queryset_init = TransactionModel.objects.for_entity(
-                    entity_model=self
+                    entity_model=self, annotated=annotated
                 )
         elif self.is_entity_unit_model():
             if not entity_slug:
@@ -783,7 +954,7 @@ class IODatabaseMixIn:
                 )
 
             txs_queryset_init = TransactionModel.objects.for_entity(
-                entity_model=entity_slug
+                entity_model=entity_slug, annotated=annotated
             ).for_unit(unit_slug=unit_slug or self)
 
         elif self.is_ledger_model():
@@ -793,101 +964,50 @@ class IODatabaseMixIn:
                 )
 
             txs_queryset_init = TransactionModel.objects.for_entity(
-                entity_model=entity_slug
+                entity_model=entity_slug, annotated=annotated
             ).for_ledger(ledger_model=self)
 
         else:
             raise IOValidationError(
                 message=f'Cannot call digest from {self.__class__.__name__}'
             )
+        return txs_queryset_init
 
-        io_result = IOResult(db_to_date=to_date, db_from_date=from_date)
-        txs_queryset_agg = txs_queryset_init.not_closing_entry()
-        txs_queryset_from_closing_entry = txs_queryset_init.none()
-        txs_queryset_to_closing_entry = txs_queryset_init.none()
-
-        USE_CLOSING_ENTRIES = settings.DJANGO_LEDGER_USE_CLOSING_ENTRIES
-        if use_closing_entry is not None:
-            USE_CLOSING_ENTRIES = use_closing_entry
-
-        # use closing entries to minimize DB aggregation if possible and activated...
-        if USE_CLOSING_ENTRIES:
-            txs_queryset_closing_entry = txs_queryset_init.is_closing_entry()
-            entity_model = self.get_entity_model_from_io()
-
-            # looking up available dates...
-            ce_from_date = entity_model.get_closing_entry_for_date(
-                io_date=from_date, inclusive=False
-            )
-            ce_to_date = entity_model.get_closing_entry_for_date(io_date=to_date)
-
-            # unbounded lookup, no date match
-            # finding the closest closing entry to aggregate from if present...
-            if not from_date and not ce_to_date:
-                ce_alt_from_date = entity_model.get_nearest_next_closing_entry(
-                    io_date=to_date
-                )
-
-                # if there's a suitable closing entry...
-                if ce_alt_from_date:
-                    txs_queryset_from_closing_entry = txs_queryset_closing_entry.filter(
-                        journal_entry__timestamp__date=ce_alt_from_date
-                    )
-                    io_result.ce_match = True
-                    io_result.ce_from_date = ce_alt_from_date
-
-                    # limit db aggregation to unclosed entries...
-                    io_result.db_from_date = ce_alt_from_date + timedelta(days=1)
-                    io_result.db_to_date = to_date
-
-                    # print(f'Unbounded lookup no date match. Closest from_dt: {ce_alt_from_date}...')
-
-            # unbounded lookup, exact to_date match...
-            elif not from_date and ce_to_date:
-                txs_queryset_to_closing_entry = txs_queryset_closing_entry.filter(
-                    journal_entry__timestamp__date=ce_to_date
-                )
-                io_result.ce_match = True
-                io_result.ce_to_date = ce_to_date
-
-                # no need to DB aggregate, just use closing entry...
-                io_result.db_from_date = None
-                io_result.db_to_date = None
-                txs_queryset_agg = TransactionModel.objects.none()
-
-            # bounded exact from_date and to_date match...
-            elif ce_from_date and ce_to_date:
-                txs_queryset_from_closing_entry = txs_queryset_closing_entry.filter(
-                    journal_entry__timestamp__date=ce_from_date
-                )
-
-                txs_queryset_to_closing_entry = txs_queryset_closing_entry.filter(
-                    journal_entry__timestamp__date=ce_to_date
-                )
-
-                io_result.ce_match = True
-                io_result.ce_from_date = ce_from_date
-                io_result.ce_to_date = ce_to_date
-
-                # no need to aggregate, use both closing entries...
-                io_result.db_from_date = None
-                io_result.db_to_date = None
-                txs_queryset_agg = TransactionModel.objects.none()
-
-        txs_queryset_closing_entry = (
-            txs_queryset_from_closing_entry | txs_queryset_to_closing_entry
-        )
-
-        if io_result.db_from_date:
-            txs_queryset_agg = txs_queryset_agg.from_date(
-                from_date=io_result.db_from_date
-            )
-
-        if io_result.db_to_date:
-            txs_queryset_agg = txs_queryset_agg.to_date(to_date=io_result.db_to_date)
+    def filter_txs_queryset(
+        self,
+        txs_queryset,
+        posted: bool = True,
+        exclude_zero_bal: bool = True,
+        accounts: Optional[Union[str, List[str], Set[str]]] = None,
+        activity: Optional[Union[str, List[str]]] = None,
+        role: Optional[Union[str, List[str], Set[str]]] = None,
+        **kwargs,
+    ):
+        """
+        Applies the digest filters to the provided TransactionModelQuerySet.
 
-        txs_queryset = txs_queryset_agg | txs_queryset_closing_entry
+        Parameters
+        ----------
+        txs_queryset : TransactionModelQuerySet
+            The transaction queryset to filter.
+        posted : bool
+            Whether to include posted transactions only. Defaults to True.
+        exclude_zero_bal : bool
+            Whether to exclude zero-amount transactions. Defaults to True.
+        accounts : Optional[Union[str, List[str], Set[str]]]
+            The accounts to filter by, if any.
+        activity : Optional[Union[str, List[str]]]
+            The journal entry activities to filter by, if any.
+        role : Optional[Union[str, List[str], Set[str]]]
+            The account roles to filter by, if any.
+        kwargs : dict
+            Supports the "cleared" and "reconciled" boolean filters.
 
+        Returns
+        -------
+        TransactionModelQuerySet
+            The filtered transaction queryset.
+        """
         if exclude_zero_bal:
             txs_queryset = txs_queryset.filter(amount__gt=0.00)
 
@@ -937,34 +1057,64 @@ class IODatabaseMixIn:
                     f'Valid values are True, False'
                 )
 
-        if io_result.is_bounded:
-            txs_queryset = txs_queryset.annotate(
-                amount_io=Case(
-                    When(
-                        journal_entry__timestamp__date=ce_from_date, then=-F('amount')
-                    ),
-                    default=F('amount'),
-                    output_field=DecimalField(),
-                )
-            )
-
-        VALUES = [
-            'account__uuid',
-            'account__balance_type',
-            'account__code',
-            'account__name',
-            'account__role',
-            'account__coa_model__slug',
-            'tx_type',
-        ]
+        return txs_queryset
 
-        if kwargs.get('for_test'):
-            VALUES.append('journal_entry__ledger_id')
+    def get_digest_values_spec(
+        self,
+        by_unit: bool = False,
+        by_period: Union[bool, str] = False,
+        by_activity: bool = False,
+        by_tx_type: bool = False,
+        account_metadata: bool = False,
+        **kwargs,
+    ) -> Tuple[List[str], List[str], Dict]:
+        """
+        Determines the fields to group by, the ordering and the non-aggregate annotations of the
+        database digest query. Balance annotations are left to the caller.
+
+        Parameters
+        ----------
+        by_unit : bool
+            Whether to group by entity unit.
+        by_period : bool or str
+            The period to group by, one of DIGEST_PERIODS. True groups by month.
+        by_activity : bool
+            Whether to group by journal entry activity.
+        by_tx_type : bool
+            Whether to group by transaction type.
+        account_metadata : bool
+            Whether the account metadata is attached from the account metadata cache, grouping by
+            account UUID only, without joining the account and chart of accounts tables.
+
+        Returns
+        -------
+        tuple
+            The VALUES, ORDER_BY and ANNOTATE arguments of the digest query.
+        """
+        TransactionModel = self.get_transaction_model()
+        TIMESTAMP_LOOKUP = TransactionModel.resolve_lookup('journal_entry__timestamp')
+
+        if account_metadata:
+            VALUES = [
+                'account__uuid',
+                'tx_type',
+            ]
+        else:
+            VALUES = [
+                'account__uuid',
+                'account__balance_type',
+                'account__code',
+                'account__name',
+                'account__role',
+                'account__coa_model__slug',
+                'tx_type',
+            ]
+
+        if kwargs.get('for_test'):
+            VALUES.append('journal_entry__ledger_id')
             VALUES.append('journal_entry__ledger__entity_id')
 
-        ANNOTATE = {'balance': Sum('amount')}
-        if io_result.is_bounded:
-            ANNOTATE = {'balance': Sum('amount_io')}
+        ANNOTATE = dict()
 
         ORDER_BY = ['account__uuid']
 
@@ -975,9 +1125,13 @@ class IODatabaseMixIn:
                 'journal_entry__entity_unit__name',
             ]
 
-        if by_period:
-            ORDER_BY.append('journal_entry__timestamp')
-            ANNOTATE['dt_idx'] = TruncMonth('journal_entry__timestamp')
+        period = validate_digest_period(by_period)
+        if period:
+            PERIOD_ANNOTATE = self.get_digest_period_annotations(
+                period=period, timestamp_lookup=TIMESTAMP_LOOKUP
+            )
+            ORDER_BY += list(PERIOD_ANNOTATE)
+            ANNOTATE.update(PERIOD_ANNOTATE)
 
         if by_activity:
             ORDER_BY.append('journal_entry__activity')
@@ -987,86 +1141,1652 @@ class IODatabaseMixIn:
             ORDER_BY.append('tx_type')
             VALUES.append('tx_type')
 
-        io_result.txs_queryset = (
-            txs_queryset.values(*VALUES).annotate(**ANNOTATE).order_by(*ORDER_BY)
-        )
-        return io_result
+        return VALUES, ORDER_BY, ANNOTATE
 
-    def python_digest(
+    def get_digest_period_annotations(self, period: str, timestamp_lookup: str) -> Dict:
+        """
+        Builds the database expressions computing the period_year and period_month keys of each transaction,
+        so transactions are bucketed by the database. Fiscal periods are computed from the fiscal year start
+        month of the EntityModel. The keys match get_digest_period_key().
+
+        Parameters
+        ----------
+        period : str
+            One of DIGEST_PERIODS.
+        timestamp_lookup : str
+            The transaction timestamp lookup.
+
+        Returns
+        -------
+        dict
+            The period annotations. The fiscal_year period has no period_month annotation.
+        """
+        if period == DIGEST_PERIOD_WEEK:
+            return {
+                'period_year': ExtractIsoYear(timestamp_lookup),
+                'period_month': ExtractWeek(timestamp_lookup),
+            }
+        if period == DIGEST_PERIOD_MONTH:
+            return {
+                'period_year': ExtractYear(timestamp_lookup),
+                'period_month': ExtractMonth(timestamp_lookup),
+            }
+
+        fy_start_month = self.get_entity_model_from_io().fy_start_month
+        period_annotations = {
+            'period_year': ExtractYear(timestamp_lookup) if fy_start_month == 1 else Case(
+                When(
+                    **{f'{timestamp_lookup}__month__gte': fy_start_month},
+                    then=ExtractYear(timestamp_lookup),
+                ),
+                default=ExtractYear(timestamp_lookup) - 1,
+                output_field=IntegerField(),
+            )
+        }
+        if period == DIGEST_PERIOD_FISCAL_QUARTER:
+            period_annotations['period_month'] = Case(
+                *[
+                    When(
+                        **{
+                            f'{timestamp_lookup}__month__in': [
+                                (fy_start_month + m - 1) % 12 + 1 for m in range(q * 3, q * 3 + 3)
+                            ]
+                        },
+                        then=Value(q + 1),
+                    )
+                    for q in range(4)
+                ],
+                output_field=IntegerField(),
+            )
+        return period_annotations
+
+    def database_digest(
         self,
         entity_slug: Optional[str] = None,
         unit_slug: Optional[str] = None,
-        to_date: Optional[Union[date, datetime, str]] = None,
-        from_date: Optional[Union[date, datetime, str]] = None,
-        equity_only: bool = False,
-        activity: str = None,
-        role: Optional[Union[Set[str], List[str]]] = None,
-        accounts: Optional[Union[Set[str], List[str]]] = None,
-        signs: bool = True,
-        by_unit: bool = False,
+        from_date: Optional[Union[date, datetime]] = None,
+        to_date: Optional[Union[date, datetime]] = None,
         by_activity: bool = False,
         by_tx_type: bool = False,
-        by_period: bool = False,
+        by_period: Union[bool, str] = False,
+        by_unit: bool = False,
+        activity: Optional[str] = None,
+        role: str = Optional[str],
+        accounts: Optional[Union[str, List[str], Set[str]]] = None,
+        posted: bool = True,
+        exclude_zero_bal: bool = True,
         use_closing_entry: bool = False,
-        force_queryset_sorting: bool = False,
+        use_balance_snapshots: Optional[bool] = None,
+        use_closing_entry_cache: Optional[bool] = None,
+        signs: bool = True,
+        pushdown: Optional[bool] = None,
+        using: Optional[str] = None,
         **kwargs,
     ) -> IOResult:
         """
-        Computes and returns the digest of transactions for a given entity, unit,
-        and optional filters such as date range, account role, and activity. The
-        digest includes aggregated balances by specified group-by keys.
+        Aggregates transaction data based on the provided parameters to generate a
+        digest of financial entries. This method is designed to work with various
+        models (EntityModel, EntityUnitModel, LedgerModel) and processes
+        transactions, including handling closing entries to optimize database
+        queries. The resulting data can be customized based on specific filters
+        or aggregation criteria, such as activity, transaction type, or time periods.
 
         Parameters
         ----------
-        user_model : Optional[UserModel]
-            The user model to be used for the computation. Defaults to None.
         entity_slug : Optional[str]
-            The slug representing the entity to compute the digest for. Defaults
-            to None.
+            The identifier for the entity. Used to filter transactions for a specific
+            entity in cases where the model operates at the entity level.
         unit_slug : Optional[str]
-            The slug representing the unit within the entity. Defaults to None.
-        to_date : Optional[Union[date, datetime, str]]
-            The end date for the transaction filter. Defaults to None.
-        from_date : Optional[Union[date, datetime, str]]
-            The start date for the transaction filter. Defaults to None.
-        equity_only : bool
-            Whether to compute results only for earnings-related accounts. Defaults
-            to False.
-        activity : str
-            An optional activity filter for transactions. Defaults to None.
-        role : Optional[Union[Set[str], List[str]]]
-            The account roles to include in the digest. Defaults to None.
-        accounts : Optional[Union[Set[str], List[str]]]
-            A list or set of specific accounts to include. Defaults to None.
-        signs : bool
-            Whether to adjust the signs for the account balances based on balance type and account role.
-            Defaults to True.
-        by_unit : bool
-            Whether to group the results by unit. Defaults to False.
+            The identifier for the unit. Valid when filtering transactions for a
+            specific unit within an entity.
+        user_model : Optional[UserModel]
+            The user model instance. Represents the user context in which the
+            transaction filtering applies.
+        from_date : Optional[Union[date, datetime]]
+            The starting date for filtering transactions. Aggregates data from
+            the given date if specified.
+        to_date : Optional[Union[date, datetime]]
+            The ending date for filtering transactions. Aggregates data up to this
+            date if specified.
         by_activity : bool
-            Whether to group the results by activity. Defaults to False.
+            Determines whether results should be aggregated by activity. Defaults
+            to False.
         by_tx_type : bool
-            Whether to group the results by transaction type. Defaults to False.
-        by_period : bool
-            Whether to group the results by period (year and month). Defaults to False.
+            Indicates if results should be grouped by transaction type. Defaults
+            to False.
+        by_period : bool or str
+            Determines if results should be grouped by time period, one of 'week', 'month',
+            'fiscal_quarter' or 'fiscal_year'. True groups by month. Periods are computed
+            by the database. Defaults to False.
+        by_unit : bool
+            Indicates whether transactions should be grouped by entity unit.
+            Defaults to False.
+        activity : Optional[str]
+            A specific activity identifier to filter results. If provided, only
+            transactions related to this activity will be included.
+        role : Optional[str]
+            A specific role to filter transactions by. Transactions matching this
+            role will be included in the aggregation.
+        accounts : Optional[Union[str, List[str], Set[str]]]
+            Specifies accounts to filter by. Can be a single account or a list/set
+            of accounts. Filters transactions associated with the provided accounts.
+        posted : bool
+            Indicates whether to filter transactions that are posted (committed).
+            Defaults to True.
+        exclude_zero_bal : bool
+            If True, transactions with zero-balance amounts will be excluded.
+            Defaults to True.
         use_closing_entry : bool
-            Whether to include closing entries in the computation. Defaults  to False.
-        force_queryset_sorting : bool
-            Whether to force sorting of the transaction queryset. Defaults to  False.
-        **kwargs : dict
-            Additional keyword arguments passed to the computation.
+            Specifies whether closing entries should be used to optimize database
+            aggregation. Each date boundary is anchored to the nearest posted closing
+            entry at or before it, so only the transactions after the anchor are aggregated.
+            If not provided, the value is determined by the system-global setting.
+        use_balance_snapshots : Optional[bool]
+            Specifies whether account balance snapshots should be used to answer the full
+            months of the period, aggregating only the transactions of the partial boundary
+            months. Takes precedence over closing entries. If not provided, the value is
+            determined by the DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS setting.
+        use_closing_entry_cache : Optional[bool]
+            Specifies whether matched closing entry balances should be read from the closing
+            entry cache instead of querying the closing entry transactions. Only applies to
+            EntityModel digests of posted transactions. If not provided, the value is
+            determined by the DJANGO_LEDGER_CLOSING_ENTRY_CACHE_ENABLED setting.
+        signs : bool
+            Whether the balance sheet sign conventions are applied. Only used in pushdown mode.
+            Defaults to True.
+        pushdown : Optional[bool]
+            Specifies whether the database computes the normalized and signed balances, grouping
+            by transaction type only if requested, along with the balance subtotals by account
+            role used by the role and group middleware. If not provided, the value is determined
+            by the DJANGO_LEDGER_DIGEST_PUSHDOWN setting.
+        using : Optional[str]
+            The database alias the aggregation queries are run on, such as a read replica.
+            If not provided, the alias of the enclosing read_database() block is used, or the
+            primary database.
+        kwargs : dict
+            Additional parameters that can be passed for extended flexibility or
+            customization when filtering and processing transactions.
+
+        Returns
+        -------
+        IOResult
+            An object containing the aggregated results, filtered transaction querysets,
+            and metadata such as database query bounds or details about closing
+            entry matches.
+        """
+
+        TransactionModel = self.get_transaction_model()
+
+        # resolves to the denormalized column if DJANGO_LEDGER_USE_DENORMALIZED_TRANSACTIONS is enabled...
+        TIMESTAMP_LOOKUP = TransactionModel.resolve_lookup('journal_entry__timestamp')
+
+        PUSHDOWN = settings.DJANGO_LEDGER_DIGEST_PUSHDOWN
+        if pushdown is not None:
+            PUSHDOWN = pushdown
+
+        io_result = IOResult(db_to_date=to_date, db_from_date=from_date)
+
+        # a single account or activity may be passed as a string...
+        if isinstance(accounts, str):
+            accounts = [accounts]
+        elif accounts:
+            accounts = list(accounts)
+
+        if isinstance(activity, str):
+            activity = [activity]
+        elif activity:
+            activity = list(activity)
+
+        # pushed down balances are signed by the database from the joined account columns...
+        # account metadata is only invalidated while DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_ENABLED is enabled...
+        if settings.DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_ENABLED and not PUSHDOWN:
+            io_result.account_metadata = get_account_metadata(
+                entity_uuid=self.uuid if self.is_entity_model() else self.entity_id
+            )
+
+        txs_queryset_init = self.get_txs_queryset_init(
+            entity_slug=entity_slug,
+            unit_slug=unit_slug,
+            annotated=io_result.account_metadata is None,
+        )
+
+        using = get_read_database(using)
+        if using:
+            txs_queryset_init = txs_queryset_init.using(using)
+
+        txs_queryset_agg = txs_queryset_init.not_closing_entry()
+        txs_queryset_from_closing_entry = txs_queryset_init.none()
+        txs_queryset_to_closing_entry = txs_queryset_init.none()
+
+        USE_CLOSING_ENTRIES = settings.DJANGO_LEDGER_USE_CLOSING_ENTRIES
+        if use_closing_entry is not None:
+            USE_CLOSING_ENTRIES = use_closing_entry
+
+        USE_BALANCE_SNAPSHOTS = settings.DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS
+        if use_balance_snapshots is not None:
+            USE_BALANCE_SNAPSHOTS = use_balance_snapshots
+
+        # balance snapshots only hold posted balances, regardless of cleared/reconciled state...
+        # monthly snapshots cannot answer weekly buckets...
+        if USE_BALANCE_SNAPSHOTS and all(
+            [
+                validate_digest_period(by_period) != DIGEST_PERIOD_WEEK,
+                posted,
+                kwargs.get('cleared') is None,
+                kwargs.get('reconciled') is None,
+                not kwargs.get('for_test'),
+            ]
+        ):
+            snapshot_periods = self.get_balance_snapshot_periods(
+                from_date=from_date, to_date=to_date
+            )
+            if snapshot_periods:
+                io_result.snapshot_match = True
+                io_result.snapshot_from_period, io_result.snapshot_to_period = (
+                    snapshot_periods
+                )
+
+        # use snapshots for all full months, limit db aggregation to partial boundary months...
+        if io_result.snapshot_match:
+            delta_filter = Q(pk__in=[])
+            if io_result.snapshot_from_period:
+                delta_filter |= Q(
+                    **{f'{TIMESTAMP_LOOKUP}__date__lt': io_result.snapshot_from_period}
+                )
+            if io_result.snapshot_to_period:
+                delta_filter |= Q(
+                    **{
+                        f'{TIMESTAMP_LOOKUP}__date__gte': get_next_month_start(
+                            io_result.snapshot_to_period
+                        )
+                    }
+                )
+            txs_queryset_agg = txs_queryset_agg.filter(delta_filter)
+
+        # use closing entries to minimize DB aggregation if possible and activated...
+        elif USE_CLOSING_ENTRIES:
+            txs_queryset_closing_entry = txs_queryset_init.is_closing_entry()
+            entity_model = self.get_entity_model_from_io()
+
+            # looking up available dates...
+            ce_from_date = entity_model.get_closing_entry_for_date(
+                io_date=from_date, inclusive=False
+            )
+            ce_to_date = entity_model.get_closing_entry_for_date(io_date=to_date)
+
+            # unbounded lookup, no date match
+            # finding the closest closing entry to aggregate from if present...
+            if not from_date and not ce_to_date:
+                ce_alt_from_date = entity_model.get_nearest_next_closing_entry(
+                    io_date=to_date
+                )
+
+                # if there's a suitable closing entry...
+                if ce_alt_from_date:
+                    txs_queryset_from_closing_entry = txs_queryset_closing_entry.filter(
+                        **{f'{TIMESTAMP_LOOKUP}__date': ce_alt_from_date}
+                    )
+                    io_result.ce_match = True
+                    io_result.ce_from_date = ce_alt_from_date
+
+                    # limit db aggregation to unclosed entries...
+                    io_result.db_from_date = ce_alt_from_date + timedelta(days=1)
+                    io_result.db_to_date = to_date
+
+                    # print(f'Unbounded lookup no date match. Closest from_dt: {ce_alt_from_date}...')
+
+            # unbounded lookup, exact to_date match...
+            elif not from_date and ce_to_date:
+                txs_queryset_to_closing_entry = txs_queryset_closing_entry.filter(
+                    **{f'{TIMESTAMP_LOOKUP}__date': ce_to_date}
+                )
+                io_result.ce_match = True
+                io_result.ce_to_date = ce_to_date
+
+                # no need to DB aggregate, just use closing entry...
+                io_result.db_from_date = None
+                io_result.db_to_date = None
+                txs_queryset_agg = TransactionModel.objects.none()
+
+            # bounded exact from_date and to_date match...
+            elif ce_from_date and ce_to_date:
+                txs_queryset_from_closing_entry = txs_queryset_closing_entry.filter(
+                    **{f'{TIMESTAMP_LOOKUP}__date': ce_from_date}
+                )
+
+                txs_queryset_to_closing_entry = txs_queryset_closing_entry.filter(
+                    **{f'{TIMESTAMP_LOOKUP}__date': ce_to_date}
+                )
+
+                io_result.ce_match = True
+                io_result.ce_from_date = ce_from_date
+                io_result.ce_to_date = ce_to_date
+
+                # no need to aggregate, use both closing entries...
+                io_result.db_from_date = None
+                io_result.db_to_date = None
+                txs_queryset_agg = TransactionModel.objects.none()
+
+            # bounded lookup, no exact match...
+            # anchoring each boundary to the nearest prior closing entry if present...
+            # closing entry balances cannot be split into periods, period digests are aggregated directly...
+            elif from_date and not by_period:
+                ce_alt_from_date = entity_model.get_nearest_prior_closing_entry(
+                    io_date=from_date, inclusive=False
+                )
+                ce_alt_to_date = entity_model.get_nearest_prior_closing_entry(
+                    io_date=to_date
+                )
+
+                # boundaries on the same closing period are cheaper to aggregate directly...
+                if ce_alt_from_date and ce_alt_to_date and ce_alt_from_date != ce_alt_to_date:
+                    txs_queryset_from_closing_entry = txs_queryset_closing_entry.filter(
+                        **{f'{TIMESTAMP_LOOKUP}__date': ce_alt_from_date}
+                    )
+                    txs_queryset_to_closing_entry = txs_queryset_closing_entry.filter(
+                        **{f'{TIMESTAMP_LOOKUP}__date': ce_alt_to_date}
+                    )
+
+                    io_result.ce_match = True
+                    io_result.ce_from_date = ce_alt_from_date
+                    io_result.ce_to_date = ce_alt_to_date
+
+                    # limit db aggregation to the unclosed entries after each closing entry...
+                    # (ce_alt_from_date, from_date) and (ce_alt_to_date, to_date]
+                    io_result.db_from_date = ce_alt_from_date + timedelta(days=1)
+                    io_result.db_to_date = to_date
+                    txs_queryset_agg = txs_queryset_agg.exclude(
+                        **{
+                            f'{TIMESTAMP_LOOKUP}__date__gte': (
+                                from_date.date() if isinstance(from_date, datetime) else from_date
+                            ),
+                            f'{TIMESTAMP_LOOKUP}__date__lte': ce_alt_to_date,
+                        }
+                    )
+
+        USE_CLOSING_ENTRY_CACHE = settings.DJANGO_LEDGER_CLOSING_ENTRY_CACHE_ENABLED
+        if use_closing_entry_cache is not None:
+            USE_CLOSING_ENTRY_CACHE = use_closing_entry_cache
+
+        # the closing entry cache holds entity-wide posted balances only...
+        USE_CLOSING_ENTRY_CACHE = all(
+            [
+                USE_CLOSING_ENTRY_CACHE,
+                io_result.ce_match,
+                self.is_entity_model(),
+                not unit_slug,
+                posted,
+                kwargs.get('cleared') is None,
+                kwargs.get('reconciled') is None,
+                not kwargs.get('for_test'),
+            ]
+        )
+
+        if USE_CLOSING_ENTRY_CACHE:
+            txs_queryset_from_closing_entry = txs_queryset_init.none()
+            txs_queryset_to_closing_entry = txs_queryset_init.none()
+
+        txs_queryset_closing_entry = (
+            txs_queryset_from_closing_entry | txs_queryset_to_closing_entry
+        )
+
+        if io_result.db_from_date:
+            txs_queryset_agg = txs_queryset_agg.from_date(
+                from_date=io_result.db_from_date
+            )
+
+        if io_result.db_to_date:
+            txs_queryset_agg = txs_queryset_agg.to_date(to_date=io_result.db_to_date)
+
+        txs_queryset = txs_queryset_agg | txs_queryset_closing_entry
+
+        txs_queryset = self.filter_txs_queryset(
+            txs_queryset=txs_queryset,
+            posted=posted,
+            exclude_zero_bal=exclude_zero_bal,
+            accounts=accounts,
+            activity=activity,
+            role=role,
+            **kwargs,
+        )
+
+        if io_result.is_bounded:
+            # balances before from_date, closing entry included, are subtracted...
+            ce_lookup_from_date = (
+                from_date.date() if isinstance(from_date, datetime) else from_date
+            )
+            txs_queryset = txs_queryset.annotate(
+                amount_io=Case(
+                    When(
+                        **{f'{TIMESTAMP_LOOKUP}__date__lt': ce_lookup_from_date},
+                        then=-F('amount'),
+                    ),
+                    default=F('amount'),
+                    output_field=DecimalField(),
+                )
+            )
+
+        VALUES, ORDER_BY, ANNOTATE = self.get_digest_values_spec(
+            by_unit=by_unit,
+            by_period=by_period,
+            by_activity=by_activity,
+            by_tx_type=by_tx_type,
+            account_metadata=io_result.account_metadata is not None,
+            **kwargs,
+        )
+        AMOUNT_FIELD = 'amount_io' if io_result.is_bounded else 'amount'
+
+        if PUSHDOWN:
+            # signed balances no longer need the transaction type unless requested...
+            if not by_tx_type:
+                VALUES = [v for v in VALUES if v != 'tx_type']
+                ORDER_BY = [o for o in ORDER_BY if o != 'tx_type']
+
+            BALANCE_AGG = Sum(self.get_signed_balance_expression(amount_field=AMOUNT_FIELD, signs=signs))
+            io_result.signed = True
+            io_result.role_totals_queryset = (
+                txs_queryset.values(
+                    'account__role',
+                    *(
+                        ['journal_entry__entity_unit__uuid', 'journal_entry__entity_unit__name']
+                        if by_unit else []
+                    ),
+                ).annotate(balance=BALANCE_AGG, **ANNOTATE).order_by()
+            )
+        else:
+            BALANCE_AGG = Sum(AMOUNT_FIELD)
+
+        ANNOTATE = {
+            'balance': BALANCE_AGG,
+            **ANNOTATE,
+        }
+
+        io_result.txs_queryset = (
+            txs_queryset.values(*VALUES).annotate(**ANNOTATE).order_by(*ORDER_BY)
+        )
+
+        merged_values = None
+        if io_result.snapshot_match:
+            snapshot_queryset = self.get_balance_snapshot_queryset(
+                entity_slug=entity_slug, unit_slug=unit_slug
+            ).posted().for_periods(
+                from_period=io_result.snapshot_from_period,
+                to_period=io_result.snapshot_to_period,
+            )
+            if accounts:
+                snapshot_queryset = snapshot_queryset.for_accounts(account_list=accounts)
+            if activity:
+                snapshot_queryset = snapshot_queryset.for_activity(activity_list=activity)
+            if role:
+                snapshot_queryset = snapshot_queryset.for_roles(role_list=role)
+            if using:
+                snapshot_queryset = snapshot_queryset.using(using)
+
+            snapshot_values = snapshot_queryset.digest_values(
+                by_unit=by_unit,
+                by_period=by_period,
+                by_activity=by_activity,
+                exclude_zero_bal=exclude_zero_bal,
+                fy_start_month=self.get_entity_model_from_io().fy_start_month,
+            )
+            merged_values = snapshot_values
+
+        elif USE_CLOSING_ENTRY_CACHE:
+            # balances before from_date, closing entry included, are subtracted...
+            ce_values = list()
+            if io_result.ce_from_date:
+                ce_values += self.get_closing_entry_cache_digest_values(
+                    closing_date=io_result.ce_from_date,
+                    negate=io_result.is_bounded,
+                    by_unit=by_unit,
+                    by_period=by_period,
+                    by_activity=by_activity,
+                    activity=activity,
+                    role=role,
+                    accounts=accounts,
+                    exclude_zero_bal=exclude_zero_bal,
+                )
+            if io_result.ce_to_date:
+                ce_values += self.get_closing_entry_cache_digest_values(
+                    closing_date=io_result.ce_to_date,
+                    by_unit=by_unit,
+                    by_period=by_period,
+                    by_activity=by_activity,
+                    activity=activity,
+                    role=role,
+                    accounts=accounts,
+                    exclude_zero_bal=exclude_zero_bal,
+                )
+            merged_values = ce_values
+
+        if merged_values is not None:
+            if PUSHDOWN:
+                merged_values = self.sign_digest_values(
+                    digest_values=merged_values, signs=signs, by_tx_type=by_tx_type
+                )
+                io_result.role_totals = [
+                    {
+                        'account__role': v['account__role'],
+                        'journal_entry__entity_unit__uuid': v.get('journal_entry__entity_unit__uuid'),
+                        'journal_entry__entity_unit__name': v.get('journal_entry__entity_unit__name'),
+                        'period_year': v.get('period_year'),
+                        'period_month': v.get('period_month'),
+                        'balance': v['balance'],
+                    } for v in merged_values
+                ]
+            io_result.txs_queryset = self.sort_digest_values(
+                list(io_result.txs_queryset) + merged_values
+            )
+
+        return io_result
+
+    @staticmethod
+    def is_contra_balance(role: str, balance_type: str) -> bool:
+        """
+        Determines whether the balance of an account is reported with its sign reversed by the balance sheet
+        sign conventions, i.e. credit balance assets and debit balance liabilities or equity.
+
+        Parameters
+        ----------
+        role : str
+            The account role.
+        balance_type : str
+            The account balance type.
+
+        Returns
+        -------
+        bool
+            True if the account balance sign is reversed.
+        """
+        role_bs = roles_module.BS_ROLES.get(role)
+        return any(
+            [
+                role_bs == roles_module.BS_ASSET_ROLE and balance_type == CREDIT,
+                role_bs in (roles_module.BS_LIABILITIES_ROLE, roles_module.BS_EQUITY_ROLE)
+                and balance_type == DEBIT,
+            ]
+        )
+
+    def get_signed_balance_expression(self, amount_field: str = 'amount', signs: bool = True) -> Case:
+        """
+        Builds the database expression normalizing each transaction amount by its account balance type and,
+        optionally, by the balance sheet sign conventions, matching the balances produced by
+        iter_accounts_digest().
+
+        Parameters
+        ----------
+        amount_field : str
+            The transaction amount field or annotation.
+        signs : bool
+            Whether to apply the balance sheet sign conventions.
+
+        Returns
+        -------
+        Case
+            The signed amount expression, to be aggregated.
+        """
+        natural_q = Q(tx_type=F('account__balance_type'))
+        if not signs:
+            return Case(
+                When(natural_q, then=F(amount_field)),
+                default=-F(amount_field),
+                output_field=DecimalField(),
+            )
+
+        contra_q = Q(
+            account__role__in=[r for r in roles_module.BS_ROLES if self.is_contra_balance(r, CREDIT)],
+            account__balance_type=CREDIT,
+        ) | Q(
+            account__role__in=[r for r in roles_module.BS_ROLES if self.is_contra_balance(r, DEBIT)],
+            account__balance_type=DEBIT,
+        )
+
+        return Case(
+            When(natural_q & ~contra_q, then=F(amount_field)),
+            When(~natural_q & contra_q, then=F(amount_field)),
+            default=-F(amount_field),
+            output_field=DecimalField(),
+        )
+
+    def sign_digest_values(
+        self, digest_values: List[Dict], signs: bool = True, by_tx_type: bool = False
+    ) -> List[Dict]:
+        """
+        Normalizes and signs the balances of database digest records which did not come from the digest query,
+        such as balance snapshot or closing entry records, so they can be merged with the records of a
+        pushed down digest query.
+
+        Parameters
+        ----------
+        digest_values : list of dict
+            The database digest records, with their balances by transaction type.
+        signs : bool
+            Whether to apply the balance sheet sign conventions.
+        by_tx_type : bool
+            Whether the records are grouped by transaction type. The transaction type is dropped otherwise.
+
+        Returns
+        -------
+        list of dict
+            The records with signed balances.
+        """
+        for v in digest_values:
+            if v['account__balance_type'] != v['tx_type']:
+                v['balance'] = -v['balance']
+            if signs and self.is_contra_balance(v['account__role'], v['account__balance_type']):
+                v['balance'] = -v['balance']
+            if not by_tx_type:
+                del v['tx_type']
+        return digest_values
+
+    def get_closing_entry_cache_digest_values(
+        self,
+        closing_date: date,
+        negate: bool = False,
+        by_unit: bool = False,
+        by_period: Union[bool, str] = False,
+        by_activity: bool = False,
+        activity: Optional[Union[str, List[str]]] = None,
+        role: Optional[Union[str, List[str], Set[str]]] = None,
+        accounts: Optional[Union[str, List[str], Set[str]]] = None,
+        exclude_zero_bal: bool = True,
+    ) -> List[Dict]:
+        """
+        Builds database digest records from the cached balances of the closing entry of the given date, using
+        the same record layout produced by the database digest query, so they can be merged with
+        TransactionModel aggregations. The closing entry cache is populated on a cache miss.
+
+        Parameters
+        ----------
+        closing_date : date
+            The closing entry date.
+        negate : bool
+            Whether the closing entry balances are subtracted from the digest.
+        by_unit : bool
+            Whether to group by entity unit.
+        by_period : bool or str
+            The period to group by, one of DIGEST_PERIODS. True groups by month.
+        by_activity : bool
+            Whether to group by journal entry activity.
+        activity : Optional[Union[str, List[str]]]
+            The journal entry activities to filter by, if any.
+        role : Optional[Union[str, List[str], Set[str]]]
+            The account roles to filter by, if any.
+        accounts : Optional[Union[str, List[str], Set[str]]]
+            The accounts to filter by, if any.
+        exclude_zero_bal : bool
+            Whether to exclude zero balances.
+
+        Returns
+        -------
+        list of dict
+            The database digest records of the closing entry.
+        """
+        period = validate_digest_period(by_period)
+        entity_model = self.get_entity_model_from_io()
+        ce_balances = entity_model.get_closing_entry_cache_for_date(closing_date=closing_date)
+        if ce_balances is None:
+            ce_balances = entity_model.save_closing_entry_cache_for_date(closing_date=closing_date)
+
+        if activity:
+            activity = [activity] if isinstance(activity, str) else activity
+            ce_balances = [ce for ce in ce_balances if ce.activity in activity]
+
+        if not ce_balances:
+            return list()
+
+        AccountModel = lazy_loader.get_account_model()
+        account_qs = AccountModel.objects.filter(uuid__in={ce.account_uuid for ce in ce_balances})
+        if accounts:
+            accounts = [accounts] if isinstance(accounts, str) else list(accounts)
+            if isinstance(accounts[0], str):
+                account_qs = account_qs.filter(code__in=accounts)
+            elif isinstance(accounts[0], UUID):
+                account_qs = account_qs.filter(uuid__in=accounts)
+            else:
+                account_qs = account_qs.filter(uuid__in=[a.uuid for a in accounts])
+        if role:
+            account_qs = account_qs.filter(role__in=[role] if isinstance(role, str) else role)
+
+        account_values = {
+            a['uuid']: a for a in account_qs.values(
+                'uuid', 'balance_type', 'code', 'name', 'role', 'coa_model__slug'
+            )
+        }
+
+        unit_names = dict()
+        if by_unit:
+            EntityUnitModel = lazy_loader.get_entity_unit_model()
+            unit_names = dict(
+                EntityUnitModel.objects.filter(
+                    uuid__in={ce.unit_uuid for ce in ce_balances if ce.unit_uuid}
+                ).values_list('uuid', 'name')
+            )
+
+        digest_values = list()
+        for ce in ce_balances:
+            account = account_values.get(ce.account_uuid)
+            if account is None or (exclude_zero_bal and not ce.balance):
+                continue
+            record = {
+                'account__uuid': ce.account_uuid,
+                'account__balance_type': account['balance_type'],
+                'account__code': account['code'],
+                'account__name': account['name'],
+                'account__role': account['role'],
+                'account__coa_model__slug': account['coa_model__slug'],
+                'tx_type': ce.tx_type,
+            }
+            if by_unit:
+                record['journal_entry__entity_unit__uuid'] = ce.unit_uuid
+                record['journal_entry__entity_unit__name'] = unit_names.get(ce.unit_uuid)
+            if period:
+                record['period_year'], record['period_month'] = get_digest_period_key(
+                    closing_date, period=period, fy_start_month=entity_model.fy_start_month
+                )
+            if by_activity:
+                record['journal_entry__activity'] = ce.activity
+            record['balance'] = -ce.balance if negate else ce.balance
+            digest_values.append(record)
+        return digest_values
+
+    async def adatabase_digest(self, **kwargs) -> IOResult:
+        """
+        Async counterpart of database_digest(). The digest query is built in a worker thread, since building it
+        may require closing entry and balance snapshot lookups, and its records are fetched with the async
+        QuerySet iterator, so the event loop is not blocked while the database aggregates the transactions.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            The database_digest() arguments.
+
+        Returns
+        -------
+        IOResult
+            The IOResult with the txs_queryset attribute holding the fetched database digest records, and the
+            role_totals attribute holding the fetched role subtotals in pushdown mode.
+        """
+        io_result = await sync_to_async(self.database_digest)(**kwargs)
+        if isinstance(io_result.txs_queryset, QuerySet):
+            io_result.txs_queryset = [
+                v async for v in io_result.txs_queryset.aiterator(
+                    chunk_size=settings.DJANGO_LEDGER_DIGEST_STREAM_CHUNK_SIZE
+                )
+            ]
+        if io_result.role_totals_queryset is not None:
+            io_result.role_totals = [
+                v async for v in io_result.role_totals_queryset.aiterator()
+            ] + (io_result.role_totals or list())
+            io_result.role_totals_queryset = None
+        return io_result
+
+    def get_balance_snapshot_periods(
+        self,
+        from_date: Optional[Union[date, datetime]] = None,
+        to_date: Optional[Union[date, datetime]] = None,
+    ) -> Optional[Tuple[Optional[date], Optional[date]]]:
+        """
+        Determines the range of full months within the provided dates which can be answered
+        from account balance snapshots.
+
+        Parameters
+        ----------
+        from_date : Optional[Union[date, datetime]]
+            The inclusive starting date of the period. None if unbounded.
+        to_date : Optional[Union[date, datetime]]
+            The inclusive ending date of the period. None if unbounded.
+
+        Returns
+        -------
+        tuple or None
+            A tuple with the first and last month start dates covered by snapshots, where None
+            means unbounded. Returns None if the period does not contain any full month.
+        """
+        if isinstance(from_date, datetime):
+            from_date = localtime(from_date).date() if not is_naive(from_date) else from_date.date()
+        if isinstance(to_date, datetime):
+            to_date = localtime(to_date).date() if not is_naive(to_date) else to_date.date()
+
+        from_period = None
+        if from_date:
+            from_period = (
+                from_date if from_date.day == 1 else get_next_month_start(from_date)
+            )
+
+        to_period = None
+        if to_date:
+            if (to_date + timedelta(days=1)).day == 1:
+                to_period = to_date.replace(day=1)
+            else:
+                to_period = (to_date.replace(day=1) - timedelta(days=1)).replace(day=1)
+
+        if from_period and to_period and from_period > to_period:
+            return None
+        return from_period, to_period
+
+    def get_balance_snapshot_queryset(
+        self, entity_slug: Optional[str] = None, unit_slug: Optional[str] = None
+    ):
+        """
+        Retrieves the AccountBalanceSnapshotModelQuerySet where the IO model is operating from.
+
+        Parameters
+        ----------
+        entity_slug : Optional[str]
+            The identifier of the entity. Required when operating from a LedgerModel or
+            EntityUnitModel.
+        unit_slug : Optional[str]
+            The identifier of the unit to filter by, if any.
+
+        Returns
+        -------
+        AccountBalanceSnapshotModelQuerySet
+            The snapshot queryset for the IO model.
+        """
+        BalanceSnapshotModel = lazy_loader.get_balance_snapshot_model()
+
+        if self.is_entity_model():
+            snapshot_queryset = BalanceSnapshotModel.objects.for_entity(entity_model=self)
+            if unit_slug:
+                snapshot_queryset = snapshot_queryset.for_unit(unit_slug=unit_slug)
+        elif self.is_entity_unit_model():
+            snapshot_queryset = BalanceSnapshotModel.objects.for_entity(
+                entity_model=entity_slug
+            ).for_unit(unit_slug=unit_slug or self)
+        elif self.is_ledger_model():
+            snapshot_queryset = BalanceSnapshotModel.objects.for_entity(
+                entity_model=entity_slug
+            ).for_ledger(ledger_model=self)
+        else:
+            raise IOValidationError(
+                message=f'Cannot use balance snapshots from {self.__class__.__name__}'
+            )
+        return snapshot_queryset
+
+    @staticmethod
+    def sort_digest_values(digest_values: List[Dict]) -> List[Dict]:
+        """
+        Sorts database digest records by account, unit, period, activity and transaction type, so
+        records can be grouped when coming from more than one source. None values sort first.
+
+        Parameters
+        ----------
+        digest_values : list of dict
+            The database digest records.
+
+        Returns
+        -------
+        list of dict
+            The sorted list of records.
+        """
+
+        def sort_key(tx: Dict):
+            return tuple(
+                (False, '') if v is None else (True, v)
+                for v in (
+                    tx['account__uuid'],
+                    tx.get('journal_entry__entity_unit__uuid'),
+                    tx.get('period_year'),
+                    tx.get('period_month'),
+                    tx.get('journal_entry__activity'),
+                    tx.get('tx_type'),
+                )
+            )
+
+        digest_values.sort(key=sort_key)
+        return digest_values
+
+    def python_digest(
+        self,
+        entity_slug: Optional[str] = None,
+        unit_slug: Optional[str] = None,
+        to_date: Optional[Union[date, datetime, str]] = None,
+        from_date: Optional[Union[date, datetime, str]] = None,
+        equity_only: bool = False,
+        activity: str = None,
+        role: Optional[Union[Set[str], List[str]]] = None,
+        accounts: Optional[Union[Set[str], List[str]]] = None,
+        signs: bool = True,
+        by_unit: bool = False,
+        by_activity: bool = False,
+        by_tx_type: bool = False,
+        by_period: Union[bool, str] = False,
+        use_closing_entry: bool = False,
+        force_queryset_sorting: bool = False,
+        stream: bool = False,
+        compact: bool = False,
+        lazy: bool = False,
+        profiler: Optional[IODigestProfiler] = None,
+        **kwargs,
+    ) -> IOResult:
+        """
+        Computes and returns the digest of transactions for a given entity, unit,
+        and optional filters such as date range, account role, and activity. The
+        digest includes aggregated balances by specified group-by keys.
+
+        Parameters
+        ----------
+        user_model : Optional[UserModel]
+            The user model to be used for the computation. Defaults to None.
+        entity_slug : Optional[str]
+            The slug representing the entity to compute the digest for. Defaults
+            to None.
+        unit_slug : Optional[str]
+            The slug representing the unit within the entity. Defaults to None.
+        to_date : Optional[Union[date, datetime, str]]
+            The end date for the transaction filter. Defaults to None.
+        from_date : Optional[Union[date, datetime, str]]
+            The start date for the transaction filter. Defaults to None.
+        equity_only : bool
+            Whether to compute results only for earnings-related accounts. Defaults
+            to False.
+        activity : str
+            An optional activity filter for transactions. Defaults to None.
+        role : Optional[Union[Set[str], List[str]]]
+            The account roles to include in the digest. Defaults to None.
+        accounts : Optional[Union[Set[str], List[str]]]
+            A list or set of specific accounts to include. Defaults to None.
+        signs : bool
+            Whether to adjust the signs for the account balances based on balance type and account role.
+            Defaults to True.
+        by_unit : bool
+            Whether to group the results by unit. Defaults to False.
+        by_activity : bool
+            Whether to group the results by activity. Defaults to False.
+        by_tx_type : bool
+            Whether to group the results by transaction type. Defaults to False.
+        by_period : bool or str
+            Whether to group the results by period, one of 'week', 'month', 'fiscal_quarter' or
+            'fiscal_year'. True groups by month. Defaults to False.
+        use_closing_entry : bool
+            Whether to include closing entries in the computation. Defaults  to False.
+        force_queryset_sorting : bool
+            Whether to force sorting of the transaction queryset. Defaults to  False.
+        stream : bool
+            Whether to consume the transaction queryset with a chunked iterator and group it on the fly, so
+            memory does not grow with the number of database records. The transaction queryset is left
+            unevaluated. Ignored if force_queryset_sorting is True. Defaults to False.
+        compact : bool
+            Whether to store the accounts digest as a columnar CompactAccountsDigest instead of a list of
+            dictionaries. Defaults to False.
+        lazy : bool
+            Whether to leave the accounts digest as a single pass iterator of records instead of materializing
+            it. Defaults to False.
+        profiler : Optional[IODigestProfiler]
+            The profiler recording the database_digest and python_digest stages, if any.
+        **kwargs : dict
+            Additional keyword arguments passed to the computation.
+
+        Returns
+        -------
+        IOResult
+            An object containing the transaction queryset, grouped and aggregated
+            account balances, and other relevant digest information.
+        """
+
+        if equity_only:
+            role = roles_module.GROUP_EARNINGS
+
+        if profiler is None:
+            profiler = IODigestProfiler()
+
+        with profiler.stage('database_digest'):
+            io_result = self.database_digest(
+                entity_slug=entity_slug,
+                unit_slug=unit_slug,
+                to_date=to_date,
+                from_date=from_date,
+                by_unit=by_unit,
+                by_activity=by_activity,
+                by_tx_type=by_tx_type,
+                by_period=by_period,
+                activity=activity,
+                role=role,
+                accounts=accounts,
+                use_closing_entry=use_closing_entry,
+                signs=signs,
+                **kwargs,
+            )
+
+            # evaluating the queryset here, so SQL time is attributed to this stage...
+            if profiler.ENABLED and not stream:
+                profiler.set_rows('database_digest', len(io_result.txs_queryset))
+
+        with profiler.stage('python_digest'):
+            io_result = self.aggregate_digest_values(
+                io_result=io_result,
+                signs=signs,
+                by_unit=by_unit,
+                by_activity=by_activity,
+                by_tx_type=by_tx_type,
+                by_period=by_period,
+                force_queryset_sorting=force_queryset_sorting,
+                stream=stream,
+                compact=compact,
+                lazy=lazy,
+            )
+        if not lazy:
+            profiler.set_rows('python_digest', len(io_result.accounts_digest))
+        return io_result
+
+    def aggregate_digest_values(
+        self,
+        io_result: IOResult,
+        signs: bool = True,
+        by_unit: bool = False,
+        by_activity: bool = False,
+        by_tx_type: bool = False,
+        by_period: Union[bool, str] = False,
+        force_queryset_sorting: bool = False,
+        stream: bool = False,
+        compact: bool = False,
+        lazy: bool = False,
+    ) -> IOResult:
+        """
+        Groups the database digest records of the IOResult into the accounts digest, normalizing the
+        balances by transaction type and, optionally, by balance sheet sign conventions.
+
+        Parameters
+        ----------
+        io_result : IOResult
+            The IOResult holding the database digest records in the txs_queryset attribute.
+        signs : bool
+            Whether to adjust the signs for the account balances based on balance type and account role.
+            Defaults to True.
+        by_unit : bool
+            Whether the records are grouped by unit. Defaults to False.
+        by_activity : bool
+            Whether the records are grouped by activity. Defaults to False.
+        by_tx_type : bool
+            Whether the records are grouped by transaction type. Defaults to False.
+        by_period : bool or str
+            Whether the records are grouped by period. Defaults to False.
+        force_queryset_sorting : bool
+            Whether to force sorting of the records. Defaults to False.
+        stream : bool
+            Whether to consume the records with a chunked QuerySet iterator instead of evaluating the
+            QuerySet. Defaults to False.
+        compact : bool
+            Whether to store the accounts digest as a columnar CompactAccountsDigest. Defaults to False.
+        lazy : bool
+            Whether to store the accounts digest as the iter_accounts_digest() iterator. Records are only
+            grouped as the iterator is consumed, and it can only be consumed once. Combined with stream, memory
+            does not grow with the number of accounts digest records. Defaults to False.
+
+        Returns
+        -------
+        IOResult
+            The provided IOResult with the accounts_digest attribute populated.
+        """
+        if lazy and compact:
+            raise IOValidationError(message='Cannot provide both lazy and compact.')
+
+        txs_values = io_result.txs_queryset
+
+        if stream and not force_queryset_sorting:
+            # relies on the database ORDER BY to group records on the fly...
+            if isinstance(txs_values, QuerySet):
+                txs_values = txs_values.iterator(
+                    chunk_size=settings.DJANGO_LEDGER_DIGEST_STREAM_CHUNK_SIZE
+                )
+        elif force_queryset_sorting:
+            io_result.txs_queryset = list(io_result.txs_queryset)
+            io_result.txs_queryset.sort(
+                key=self.get_digest_values_group_key(
+                    by_unit=by_unit,
+                    by_period=by_period,
+                    by_activity=by_activity,
+                    by_tx_type=by_tx_type,
+                )
+            )
+            txs_values = io_result.txs_queryset
+
+        if io_result.account_metadata is not None:
+            txs_values = self.iter_with_account_metadata(
+                txs_values=txs_values,
+                account_metadata=io_result.account_metadata,
+                entity_uuid=self.uuid if self.is_entity_model() else self.entity_id
+            )
+
+        # pushed down records are normalized and signed by the database...
+        accounts_digest = self.iter_accounts_digest(
+            txs_values=txs_values,
+            signs=signs and not io_result.signed,
+            by_unit=by_unit,
+            by_activity=by_activity,
+            by_tx_type=by_tx_type,
+            by_period=by_period,
+            normalize=not io_result.signed,
+        )
+
+        if lazy:
+            io_result.accounts_digest = accounts_digest
+        elif compact:
+            io_result.accounts_digest = CompactAccountsDigest.from_records(accounts_digest)
+        else:
+            io_result.accounts_digest = list(accounts_digest)
+        return io_result
+
+    @staticmethod
+    def iter_with_account_metadata(
+        txs_values: Iterable[Dict],
+        account_metadata: Dict,
+        entity_uuid: UUID
+    ) -> Iterator[Dict]:
+        """
+        Attaches the cached account metadata to the database digest records. Records already holding
+        the account metadata, such as balance snapshot records, keep their own values. The metadata is
+        fetched again from the database if a record account is missing from the cached metadata.
+
+        Parameters
+        ----------
+        txs_values : iterable of dict
+            The database digest records.
+        account_metadata : dict
+            The account metadata by account UUID.
+        entity_uuid : UUID
+            The EntityModel UUID of the account metadata.
+
+        Yields
+        ------
+        dict
+            The database digest records, with the account metadata.
+        """
+        for tx in txs_values:
+            try:
+                tx_account_metadata = account_metadata[tx['account__uuid']]
+            except KeyError:
+                # account created after the metadata was cached...
+                account_metadata.update(get_account_metadata(entity_uuid=entity_uuid, refresh=True))
+                tx_account_metadata = account_metadata[tx['account__uuid']]
+            yield {**tx_account_metadata, **tx}
+
+    @staticmethod
+    def get_digest_values_group_key(
+        by_unit: bool = False,
+        by_period: Union[bool, str] = False,
+        by_activity: bool = False,
+        by_tx_type: bool = False,
+    ):
+        """
+        Returns the key function used to group the database digest records into account digest records.
+        """
+        return lambda a: (
+            a['account__uuid'],
+            a.get('journal_entry__entity_unit__uuid') if by_unit else None,
+            a.get('period_year') if by_period else None,
+            a.get('period_month') if by_period else None,
+            a.get('journal_entry__activity') if by_activity else None,
+            a.get('tx_type') if by_tx_type else None,
+        )
+
+    def iter_accounts_digest(
+        self,
+        txs_values: Iterable[Dict],
+        signs: bool = True,
+        by_unit: bool = False,
+        by_activity: bool = False,
+        by_tx_type: bool = False,
+        by_period: Union[bool, str] = False,
+        normalize: bool = True,
+    ) -> Iterator[Dict]:
+        """
+        Lazily groups sorted database digest records into account digest records. Only one group is held in
+        memory at a time, so the records may come from a QuerySet iterator.
+
+        Parameters
+        ----------
+        txs_values : iterable of dict
+            The database digest records, sorted by the group key.
+        signs : bool
+            Whether to adjust the signs for the account balances based on balance type and account role.
+            Defaults to True.
+        by_unit : bool
+            Whether the records are grouped by unit. Defaults to False.
+        by_activity : bool
+            Whether the records are grouped by activity. Defaults to False.
+        by_tx_type : bool
+            Whether the records are grouped by transaction type. Defaults to False.
+        by_period : bool or str
+            Whether the records are grouped by period. Defaults to False.
+        normalize : bool
+            Whether to normalize the record balances by transaction type. Records of a pushed down digest
+            query are already normalized and signed. Defaults to True.
+
+        Yields
+        ------
+        dict
+            The account digest records.
+        """
+
+        def normalize_balance(txs_values):
+            for tx_model in txs_values:
+                if tx_model['account__balance_type'] != tx_model['tx_type']:
+                    tx_model['balance'] = -tx_model['balance']
+                yield tx_model
+
+        if normalize:
+            txs_values = normalize_balance(txs_values)
+
+        gb_key = self.get_digest_values_group_key(
+            by_unit=by_unit,
+            by_period=by_period,
+            by_activity=by_activity,
+            by_tx_type=by_tx_type,
+        )
+
+        for k, g in groupby(txs_values, key=gb_key):
+            acc = self.aggregate_balances(k, g)
+            acc['balance_abs'] = abs(acc['balance'])
+
+            if signs and self.is_contra_balance(acc['role'], acc['balance_type']):
+                acc['balance'] = -acc['balance']
+
+            yield acc
+
+    @staticmethod
+    def aggregate_balances(k, g):
+        """
+        Aggregates balances from grouped data, providing a summarized representation of
+        account attributes and their balances over a specified period. The function is
+        used to compile essential details such as account identifiers, roles, activity,
+        and balance, summarizing them for further processing or presentation.
+
+        Parameters
+        ----------
+        k : tuple
+            A tuple consisting of grouped key values. Expected structure:
+            - The first element represents the account UUID.
+            - The second element represents the unit UUID.
+            - The third and fourth elements represent the period year and month, respectively.
+            - The sixth element represents the transaction type.
+
+        g : iterable
+            An iterable of grouped account data, typically containing dictionaries with
+            detailed account properties and their respective balance information.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the aggregated balance information and related
+            attributes, structured with the following keys:
+            - 'account_uuid'
+            - 'coa_slug'
+            - 'unit_uuid'
+            - 'unit_name'
+            - 'activity'
+            - 'period_year'
+            - 'period_month'
+            - 'role_bs'
+            - 'role'
+            - 'code'
+            - 'name'
+            - 'balance_type'
+            - 'tx_type'
+            - 'balance'
+        """
+        # the group is consumed lazily, only the first record is kept...
+        g = iter(g)
+        tx = next(g)
+        return {
+            'account_uuid': k[0],
+            'coa_slug': tx['account__coa_model__slug'],
+            'unit_uuid': k[1],
+            'unit_name': tx.get('journal_entry__entity_unit__name'),
+            'activity': tx.get('journal_entry__activity'),
+            'period_year': k[2],
+            'period_month': k[3],
+            'role_bs': roles_module.BS_ROLES.get(tx['account__role']),
+            'role': tx['account__role'],
+            'code': tx['account__code'],
+            'name': tx['account__name'],
+            'balance_type': tx['account__balance_type'],
+            'tx_type': k[5],
+            'balance': tx['balance'] + sum(a['balance'] for a in g),
+        }
+
+    def digest(
+        self,
+        entity_slug: Optional[str] = None,
+        unit_slug: Optional[str] = None,
+        to_date: Optional[Union[date, datetime, str]] = None,
+        from_date: Optional[Union[date, datetime, str]] = None,
+        accounts: Optional[Union[Set[str], List[str]]] = None,
+        role: Optional[Union[Set[str], List[str]]] = None,
+        activity: Optional[str] = None,
+        signs: bool = True,
+        process_roles: bool = False,
+        process_groups: bool = False,
+        process_ratios: bool = False,
+        process_activity: bool = False,
+        equity_only: bool = False,
+        by_period: Union[bool, str] = False,
+        by_unit: bool = False,
+        by_activity: bool = False,
+        by_tx_type: bool = False,
+        balance_sheet_statement: bool = False,
+        income_statement: bool = False,
+        cash_flow_statement: bool = False,
+        use_closing_entry: Optional[bool] = None,
+        use_cache: Optional[bool] = None,
+        profile: Optional[bool] = None,
+        lazy: bool = False,
+        **kwargs,
+    ) -> IODigestContextManager:
+        """
+        Processes financial data and generates various financial statements, ratios, or activity digests
+        based on the provided arguments. The method applies specific processing pipelines, such as role
+        processing, grouping, ratio computation, activity-based operations, or generating financial
+        statements like balance sheet, income statement, and cash flow statement.
+
+        Parameters
+        ----------
+        entity_slug : Optional[str]
+            The slug identifier for the entity to process the financial data for.
+        unit_slug : Optional[str]
+            The slug identifier for the specific unit of the entity to filter the data for.
+        to_date : Optional[Union[date, datetime, str]]
+            The upper limit of the date range for which the data will be processed. Can be a `date`,
+            `datetime`, or ISO 8601 formatted `str`.
+        from_date : Optional[Union[date, datetime, str]]
+            The lower limit of the date range for which the data will be processed. Can be a `date`,
+            `datetime`, or ISO 8601 formatted `str`.
+        user_model : Optional[UserModel]
+            A user model instance to filter data or apply user-specific permissions during processing.
+        accounts : Optional[Union[Set[str], List[str]]]
+            A collection of account identifiers to filter the financial data to process.
+        role : Optional[Union[Set[str], List[str]]]
+            A collection of roles used to filter or organize the data during processing.
+        activity : Optional[str]
+            Specific activity identifier to filter or process the data for.
+        signs : bool, default=True
+            If `True`, account roles with predefined signs will be applied to the financial data.
+        process_roles : bool, default=False
+            If `True`, processes account roles and organizes financial data accordingly.
+        process_groups : bool, default=False
+            If `True`, processes and organizes the financial data into predetermined account groups.
+        process_ratios : bool, default=False
+            If `True`, computes and processes financial ratios for the provided data.
+        process_activity : bool, default=False
+            If `True`, specific activity-based computation or segregation will be executed.
+        equity_only : bool, default=False
+            Processes only equity-specific accounts if set to `True`.
+        by_period : bool or str, default=False
+            Organizes or groups the output by accounting periods: 'week', 'month', 'fiscal_quarter'
+            or 'fiscal_year'. True groups by month.
+        by_unit : bool, default=False
+            Organizes or processes data specific to each unit when set to `True`.
+        by_activity : bool, default=False
+            Groups or segregates the processed data by activity when `True`.
+        by_tx_type : bool, default=False
+            Groups or organizes the result by transaction type when `True`.
+        balance_sheet_statement : bool, default=False
+            If `True`, prepares a balance sheet statement as part of the processing.
+        income_statement : bool, default=False
+            If `True`, generates an income statement as part of the processed result.
+        cash_flow_statement : bool, default=False
+            If `True`, prepares a cash flow statement based on the provided data.
+        use_closing_entry : Optional[bool]
+            Specifies whether to account for closing entries in the financial statement computation.
+        use_cache : Optional[bool]
+            Specifies whether the result should be read from, and stored in the IO digest cache. Cached results
+            hold the evaluated transaction rows instead of a QuerySet. If not provided, the value is determined
+            by the DJANGO_LEDGER_DIGEST_CACHE_ENABLED setting.
+        profile : Optional[bool]
+            Specifies whether the wall time, SQL queries and row counts of each digest stage should be recorded.
+            The results are available with IODigestContextManager.get_profile(), are logged and sent through the
+            io_digest_profiled signal. If not provided, the value is determined by the DJANGO_LEDGER_PROFILE_DIGEST
+            setting.
+        lazy : bool, default=False
+            If `True`, the accounts digest is a single pass iterator of records, grouped as it is consumed, instead
+            of a list. Use it with stream=True so neither the database records nor the accounts digest are held in
+            memory. Lazy digests cannot be cached or processed by the IO middleware and statements, which need the
+            accounts more than once, and the iterator must be consumed while the database connection is usable.
+        **kwargs
+            Additional named arguments that can be passed to adjust the behavior of specific processing
+            modules or middleware.
+
+        Returns
+        -------
+        IODigestContextManager
+            A context manager instance containing the processed financial data and results, including
+            financial statements, ratios, or any activity digest generated as per the input parameters.
+        """
+        if balance_sheet_statement:
+            from_date = None
+
+        if cash_flow_statement:
+            by_activity = True
+
+        if activity:
+            activity = validate_activity(activity)
+        if role:
+            role = roles_module.validate_roles(role)
+
+        from_date, to_date = validate_dates(from_date, to_date)
+
+        if lazy and any(
+            [
+                process_roles,
+                process_groups,
+                process_ratios,
+                process_activity,
+                balance_sheet_statement,
+                income_statement,
+                cash_flow_statement,
+            ]
+        ):
+            raise IOValidationError(message='Lazy digests cannot be processed by the IO middleware.')
+
+        USE_DIGEST_CACHE = settings.DJANGO_LEDGER_DIGEST_CACHE_ENABLED
+        if use_cache is not None:
+            USE_DIGEST_CACHE = use_cache
+
+        # a lazy accounts digest cannot be stored...
+        if USE_DIGEST_CACHE and not lazy:
+            digest_kwargs = dict(
+                entity_slug=entity_slug,
+                unit_slug=unit_slug,
+                to_date=to_date,
+                from_date=from_date,
+                accounts=accounts,
+                role=role,
+                activity=activity,
+                signs=signs,
+                process_roles=process_roles,
+                process_groups=process_groups,
+                process_ratios=process_ratios,
+                process_activity=process_activity,
+                equity_only=equity_only,
+                by_period=by_period,
+                by_unit=by_unit,
+                by_activity=by_activity,
+                by_tx_type=by_tx_type,
+                balance_sheet_statement=balance_sheet_statement,
+                income_statement=income_statement,
+                cash_flow_statement=cash_flow_statement,
+                use_closing_entry=use_closing_entry,
+                **kwargs,
+            )
+            digest_cache = IODigestCache(io_model=self)
+            return digest_cache.get_or_compute(
+                digest_kwargs=digest_kwargs,
+                digest_func=lambda: self.digest(use_cache=False, profile=profile, **digest_kwargs),
+            )
+
+        io_state = dict()
+        io_state['io_model'] = self
+        io_state['from_date'] = from_date
+        io_state['to_date'] = to_date
+        io_state['by_unit'] = by_unit
+        io_state['unit_slug'] = unit_slug
+        io_state['entity_slug'] = entity_slug
+        io_state['by_period'] = by_period
+        io_state['by_activity'] = by_activity
+        io_state['by_tx_type'] = by_tx_type
+
+        PROFILE_DIGEST = settings.DJANGO_LEDGER_PROFILE_DIGEST
+        if profile is not None:
+            PROFILE_DIGEST = profile
+        profiler = IODigestProfiler(enabled=PROFILE_DIGEST)
+
+        io_result: IOResult = self.python_digest(
+            profiler=profiler,
+            accounts=accounts,
+            role=role,
+            activity=activity,
+            entity_slug=entity_slug,
+            unit_slug=unit_slug,
+            to_date=to_date,
+            from_date=from_date,
+            signs=signs,
+            equity_only=equity_only,
+            by_period=by_period,
+            by_unit=by_unit,
+            by_activity=by_activity,
+            by_tx_type=by_tx_type,
+            use_closing_entry=use_closing_entry,
+            lazy=lazy,
+            **kwargs,
+        )
+
+        io_state['io_result'] = io_result
+        io_state['accounts'] = io_result.accounts_digest
+
+        io_digest = self.process_io_state(
+            io_state=io_state,
+            process_roles=process_roles,
+            process_groups=process_groups,
+            process_ratios=process_ratios,
+            process_activity=process_activity,
+            by_period=by_period,
+            by_unit=by_unit,
+            balance_sheet_statement=balance_sheet_statement,
+            income_statement=income_statement,
+            cash_flow_statement=cash_flow_statement,
+            profiler=profiler,
+        )
+
+        io_result.profile = profiler.get_profile()
+        profiler.emit(io_model=self)
+        return io_digest
+
+    async def adigest(
+        self,
+        entity_slug: Optional[str] = None,
+        unit_slug: Optional[str] = None,
+        to_date: Optional[Union[date, datetime, str]] = None,
+        from_date: Optional[Union[date, datetime, str]] = None,
+        accounts: Optional[Union[Set[str], List[str]]] = None,
+        role: Optional[Union[Set[str], List[str]]] = None,
+        activity: Optional[str] = None,
+        signs: bool = True,
+        process_roles: bool = False,
+        process_groups: bool = False,
+        process_ratios: bool = False,
+        process_activity: bool = False,
+        equity_only: bool = False,
+        by_period: Union[bool, str] = False,
+        by_unit: bool = False,
+        by_activity: bool = False,
+        by_tx_type: bool = False,
+        balance_sheet_statement: bool = False,
+        income_statement: bool = False,
+        cash_flow_statement: bool = False,
+        use_closing_entry: Optional[bool] = None,
+        use_cache: Optional[bool] = None,
+        profile: Optional[bool] = None,
+        force_queryset_sorting: bool = False,
+        compact: bool = False,
+        **kwargs,
+    ) -> IODigestContextManager:
+        """
+        Async counterpart of digest(), intended for ASGI deployments. The database digest records are fetched
+        with the async ORM, so independent digests may run concurrently on the same event loop, i.e. with
+        asyncio.gather(). Aggregation and the IO middleware run on the event loop, as they do not query the
+        database.
+
+        Digest caching and profiling rely on synchronous cache locks and connection instrumentation. If any of
+        them is enabled, the synchronous digest() is run in a worker thread instead.
+
+        Parameters
+        ----------
+        The same parameters as digest().
+
+        Returns
+        -------
+        IODigestContextManager
+            A context manager instance containing the processed financial data and results.
+        """
+        digest_kwargs = dict(
+            entity_slug=entity_slug,
+            unit_slug=unit_slug,
+            to_date=to_date,
+            from_date=from_date,
+            accounts=accounts,
+            role=role,
+            activity=activity,
+            signs=signs,
+            process_roles=process_roles,
+            process_groups=process_groups,
+            process_ratios=process_ratios,
+            process_activity=process_activity,
+            equity_only=equity_only,
+            by_period=by_period,
+            by_unit=by_unit,
+            by_activity=by_activity,
+            by_tx_type=by_tx_type,
+            balance_sheet_statement=balance_sheet_statement,
+            income_statement=income_statement,
+            cash_flow_statement=cash_flow_statement,
+            use_closing_entry=use_closing_entry,
+            force_queryset_sorting=force_queryset_sorting,
+            compact=compact,
+            **kwargs,
+        )
 
-        Returns
-        -------
-        IOResult
-            An object containing the transaction queryset, grouped and aggregated
-            account balances, and other relevant digest information.
-        """
+        USE_DIGEST_CACHE = settings.DJANGO_LEDGER_DIGEST_CACHE_ENABLED
+        if use_cache is not None:
+            USE_DIGEST_CACHE = use_cache
+
+        PROFILE_DIGEST = settings.DJANGO_LEDGER_PROFILE_DIGEST
+        if profile is not None:
+            PROFILE_DIGEST = profile
+
+        if USE_DIGEST_CACHE or PROFILE_DIGEST:
+            return await sync_to_async(self.digest)(
+                use_cache=USE_DIGEST_CACHE, profile=PROFILE_DIGEST, **digest_kwargs
+            )
+
+        if balance_sheet_statement:
+            from_date = None
+
+        if cash_flow_statement:
+            by_activity = True
+
+        if activity:
+            activity = validate_activity(activity)
+        if role:
+            role = roles_module.validate_roles(role)
 
         if equity_only:
             role = roles_module.GROUP_EARNINGS
 
-        io_result = self.database_digest(
+        from_date, to_date = validate_dates(from_date, to_date)
+
+        io_state = dict()
+        io_state['io_model'] = self
+        io_state['from_date'] = from_date
+        io_state['to_date'] = to_date
+        io_state['by_unit'] = by_unit
+        io_state['unit_slug'] = unit_slug
+        io_state['entity_slug'] = entity_slug
+        io_state['by_period'] = by_period
+        io_state['by_activity'] = by_activity
+        io_state['by_tx_type'] = by_tx_type
+
+        io_result = await self.adatabase_digest(
             entity_slug=entity_slug,
             unit_slug=unit_slug,
             to_date=to_date,
@@ -1079,124 +2799,168 @@ class IODatabaseMixIn:
             role=role,
             accounts=accounts,
             use_closing_entry=use_closing_entry,
+            signs=signs,
             **kwargs,
         )
 
-        for tx_model in io_result.txs_queryset:
-            if tx_model['account__balance_type'] != tx_model['tx_type']:
-                tx_model['balance'] = -tx_model['balance']
-
-        gb_key = lambda a: (
-            a['account__uuid'],
-            a.get('journal_entry__entity_unit__uuid') if by_unit else None,
-            a.get('dt_idx').year if by_period else None,
-            a.get('dt_idx').month if by_period else None,
-            a.get('journal_entry__activity') if by_activity else None,
-            a.get('tx_type') if by_tx_type else None,
+        io_result = self.aggregate_digest_values(
+            io_result=io_result,
+            signs=signs,
+            by_unit=by_unit,
+            by_activity=by_activity,
+            by_tx_type=by_tx_type,
+            by_period=by_period,
+            force_queryset_sorting=force_queryset_sorting,
+            compact=compact,
         )
 
-        if force_queryset_sorting:
-            io_result.txs_queryset = list(io_result.txs_queryset)
-            io_result.txs_queryset.sort(key=gb_key)
-
-        accounts_gb_code = groupby(io_result.txs_queryset, key=gb_key)
-        accounts_digest = [self.aggregate_balances(k, g) for k, g in accounts_gb_code]
-
-        for acc in accounts_digest:
-            acc['balance_abs'] = abs(acc['balance'])
-
-        if signs:
-            for acc in accounts_digest:
-                if any(
-                    [
-                        all(
-                            [
-                                acc['role_bs'] == roles_module.BS_ASSET_ROLE,
-                                acc['balance_type'] == CREDIT,
-                            ]
-                        ),
-                        all(
-                            [
-                                acc['role_bs']
-                                in (
-                                    roles_module.BS_LIABILITIES_ROLE,
-                                    roles_module.BS_EQUITY_ROLE,
-                                ),
-                                acc['balance_type'] == DEBIT,
-                            ]
-                        ),
-                    ]
-                ):
-                    acc['balance'] = -acc['balance']
+        io_state['io_result'] = io_result
+        io_state['accounts'] = io_result.accounts_digest
 
-        io_result.accounts_digest = accounts_digest
-        return io_result
+        return self.process_io_state(
+            io_state=io_state,
+            process_roles=process_roles,
+            process_groups=process_groups,
+            process_ratios=process_ratios,
+            process_activity=process_activity,
+            by_period=by_period,
+            by_unit=by_unit,
+            balance_sheet_statement=balance_sheet_statement,
+            income_statement=income_statement,
+            cash_flow_statement=cash_flow_statement,
+        )
 
-    @staticmethod
-    def aggregate_balances(k, g):
+    def process_io_state(
+        self,
+        io_state: Dict,
+        process_roles: bool = False,
+        process_groups: bool = False,
+        process_ratios: bool = False,
+        process_activity: bool = False,
+        by_period: Union[bool, str] = False,
+        by_unit: bool = False,
+        balance_sheet_statement: bool = False,
+        income_statement: bool = False,
+        cash_flow_statement: bool = False,
+        profiler: Optional[IODigestProfiler] = None,
+    ) -> IODigestContextManager:
         """
-        Aggregates balances from grouped data, providing a summarized representation of
-        account attributes and their balances over a specified period. The function is
-        used to compile essential details such as account identifiers, roles, activity,
-        and balance, summarizing them for further processing or presentation.
+        Runs the IO middleware pipeline (roles, groups, ratios, activity and financial statements) over
+        an IO state holding the accounts digest.
 
         Parameters
         ----------
-        k : tuple
-            A tuple consisting of grouped key values. Expected structure:
-            - The first element represents the account UUID.
-            - The second element represents the unit UUID.
-            - The third and fourth elements represent the period year and month, respectively.
-            - The sixth element represents the transaction type.
-
-        g : iterable
-            An iterable of grouped account data, typically containing dictionaries with
-            detailed account properties and their respective balance information.
+        io_state : dict
+            The IO state, holding the IOResult and its accounts digest.
+        process_roles : bool, default=False
+            If `True`, processes account roles.
+        process_groups : bool, default=False
+            If `True`, processes account groups.
+        process_ratios : bool, default=False
+            If `True`, computes financial ratios.
+        process_activity : bool, default=False
+            If `True`, processes journal entry activities.
+        by_period : bool or str, default=False
+            Whether the accounts digest is grouped by period.
+        by_unit : bool, default=False
+            Whether the accounts digest is grouped by unit.
+        balance_sheet_statement : bool, default=False
+            If `True`, prepares a balance sheet statement.
+        income_statement : bool, default=False
+            If `True`, prepares an income statement.
+        cash_flow_statement : bool, default=False
+            If `True`, prepares a cash flow statement.
+        profiler : Optional[IODigestProfiler]
+            The profiler recording each middleware stage, if any.
 
         Returns
         -------
-        dict
-            A dictionary containing the aggregated balance information and related
-            attributes, structured with the following keys:
-            - 'account_uuid'
-            - 'coa_slug'
-            - 'unit_uuid'
-            - 'unit_name'
-            - 'activity'
-            - 'period_year'
-            - 'period_month'
-            - 'role_bs'
-            - 'role'
-            - 'code'
-            - 'name'
-            - 'balance_type'
-            - 'tx_type'
-            - 'balance'
+        IODigestContextManager
+            A context manager instance containing the processed IO state.
         """
-        gl = list(g)
-        return {
-            'account_uuid': k[0],
-            'coa_slug': gl[0]['account__coa_model__slug'],
-            'unit_uuid': k[1],
-            'unit_name': gl[0].get('journal_entry__entity_unit__name'),
-            'activity': gl[0].get('journal_entry__activity'),
-            'period_year': k[2],
-            'period_month': k[3],
-            'role_bs': roles_module.BS_ROLES.get(gl[0]['account__role']),
-            'role': gl[0]['account__role'],
-            'code': gl[0]['account__code'],
-            'name': gl[0]['account__name'],
-            'balance_type': gl[0]['account__balance_type'],
-            'tx_type': k[5],
-            'balance': sum(a['balance'] for a in gl),
-        }
+        if profiler is None:
+            profiler = IODigestProfiler()
 
-    def digest(
+        # role subtotals computed by the database in pushdown mode, if any...
+        io_result = io_state.get('io_result')
+        role_totals = None
+        if io_result is not None and (process_roles or any(
+            [
+                process_groups,
+                balance_sheet_statement,
+                income_statement,
+                cash_flow_statement,
+            ]
+        )):
+            role_totals = io_result.get_role_totals()
+
+        if process_roles:
+            with profiler.stage('roles'):
+                roles_mgr = AccountRoleIOMiddleware(
+                    io_data=io_state, by_period=by_period, by_unit=by_unit, role_totals=role_totals
+                )
+
+                io_state = roles_mgr.digest()
+
+        if any(
+            [
+                process_groups,
+                balance_sheet_statement,
+                income_statement,
+                cash_flow_statement,
+            ]
+        ):
+            with profiler.stage('groups'):
+                group_mgr = AccountGroupIOMiddleware(
+                    io_data=io_state, by_period=by_period, by_unit=by_unit, role_totals=role_totals
+                )
+                io_state = group_mgr.digest()
+
+                # todo: migrate this to group manager...
+                io_state['group_account']['GROUP_ASSETS'].sort(
+                    key=lambda acc: roles_module.ROLES_ORDER_ASSETS.index(acc['role'])
+                )
+                io_state['group_account']['GROUP_LIABILITIES'].sort(
+                    key=lambda acc: roles_module.ROLES_ORDER_LIABILITIES.index(acc['role'])
+                )
+                io_state['group_account']['GROUP_CAPITAL'].sort(
+                    key=lambda acc: roles_module.ROLES_ORDER_CAPITAL.index(acc['role'])
+                )
+
+        if process_ratios:
+            with profiler.stage('ratios'):
+                ratio_gen = FinancialRatioManager(io_data=io_state)
+                io_state = ratio_gen.digest()
+
+        if process_activity:
+            with profiler.stage('activity'):
+                activity_manager = JEActivityIOMiddleware(
+                    io_data=io_state, by_unit=by_unit, by_period=by_period
+                )
+                activity_manager.digest()
+
+        if balance_sheet_statement:
+            with profiler.stage('balance_sheet'):
+                balance_sheet_mgr = BalanceSheetIOMiddleware(io_data=io_state)
+                io_state = balance_sheet_mgr.digest()
+
+        if income_statement:
+            with profiler.stage('income_statement'):
+                income_statement_mgr = IncomeStatementIOMiddleware(io_data=io_state)
+                io_state = income_statement_mgr.digest()
+
+        if cash_flow_statement:
+            with profiler.stage('cash_flow_statement'):
+                cfs = CashFlowStatementIOMiddleware(io_data=io_state)
+                io_state = cfs.digest()
+
+        return IODigestContextManager(io_state=io_state)
+
+    def digest_windows(
         self,
+        windows: List[Tuple[Optional[Union[date, datetime, str]], Optional[Union[date, datetime, str]]]],
         entity_slug: Optional[str] = None,
         unit_slug: Optional[str] = None,
-        to_date: Optional[Union[date, datetime, str]] = None,
-        from_date: Optional[Union[date, datetime, str]] = None,
         accounts: Optional[Union[Set[str], List[str]]] = None,
         role: Optional[Union[Set[str], List[str]]] = None,
         activity: Optional[str] = None,
@@ -1206,82 +2970,79 @@ class IODatabaseMixIn:
         process_ratios: bool = False,
         process_activity: bool = False,
         equity_only: bool = False,
-        by_period: bool = False,
+        by_period: Union[bool, str] = False,
         by_unit: bool = False,
         by_activity: bool = False,
         by_tx_type: bool = False,
         balance_sheet_statement: bool = False,
         income_statement: bool = False,
         cash_flow_statement: bool = False,
-        use_closing_entry: Optional[bool] = None,
+        using: Optional[str] = None,
         **kwargs,
-    ) -> IODigestContextManager:
+    ) -> List[IODigestContextManager]:
         """
-        Processes financial data and generates various financial statements, ratios, or activity digests
-        based on the provided arguments. The method applies specific processing pipelines, such as role
-        processing, grouping, ratio computation, activity-based operations, or generating financial
-        statements like balance sheet, income statement, and cash flow statement.
+        Computes the digest of several date windows with a single database aggregation query. Each window
+        balance is computed with a conditional aggregate over the window dates, and the resulting records are
+        fanned out into one IODigestContextManager per window, processed by the same IO middleware as digest().
+
+        Closing entries and balance snapshots are not used, every window is aggregated from the raw
+        transactions.
 
         Parameters
         ----------
+        windows : list of tuple
+            The (from_date, to_date) pairs to digest. A None from_date means an unbounded window. A None
+            to_date defaults to the current local date, same as digest().
         entity_slug : Optional[str]
             The slug identifier for the entity to process the financial data for.
         unit_slug : Optional[str]
             The slug identifier for the specific unit of the entity to filter the data for.
-        to_date : Optional[Union[date, datetime, str]]
-            The upper limit of the date range for which the data will be processed. Can be a `date`,
-            `datetime`, or ISO 8601 formatted `str`.
-        from_date : Optional[Union[date, datetime, str]]
-            The lower limit of the date range for which the data will be processed. Can be a `date`,
-            `datetime`, or ISO 8601 formatted `str`.
-        user_model : Optional[UserModel]
-            A user model instance to filter data or apply user-specific permissions during processing.
         accounts : Optional[Union[Set[str], List[str]]]
             A collection of account identifiers to filter the financial data to process.
         role : Optional[Union[Set[str], List[str]]]
-            A collection of roles used to filter or organize the data during processing.
+            A collection of roles used to filter the data.
         activity : Optional[str]
-            Specific activity identifier to filter or process the data for.
+            Specific activity identifier to filter the data for.
         signs : bool, default=True
             If `True`, account roles with predefined signs will be applied to the financial data.
         process_roles : bool, default=False
-            If `True`, processes account roles and organizes financial data accordingly.
+            If `True`, processes account roles for every window.
         process_groups : bool, default=False
-            If `True`, processes and organizes the financial data into predetermined account groups.
+            If `True`, processes account groups for every window.
         process_ratios : bool, default=False
-            If `True`, computes and processes financial ratios for the provided data.
+            If `True`, computes financial ratios for every window.
         process_activity : bool, default=False
-            If `True`, specific activity-based computation or segregation will be executed.
+            If `True`, processes journal entry activities for every window.
         equity_only : bool, default=False
             Processes only equity-specific accounts if set to `True`.
-        by_period : bool, default=False
-            Organizes or groups the output by accounting periods if `True`.
+        by_period : bool or str, default=False
+            Groups the output by accounting periods: 'week', 'month', 'fiscal_quarter' or
+            'fiscal_year'. True groups by month.
         by_unit : bool, default=False
-            Organizes or processes data specific to each unit when set to `True`.
+            Groups the output by entity unit if `True`.
         by_activity : bool, default=False
-            Groups or segregates the processed data by activity when `True`.
+            Groups the output by activity if `True`.
         by_tx_type : bool, default=False
-            Groups or organizes the result by transaction type when `True`.
+            Groups the output by transaction type if `True`.
         balance_sheet_statement : bool, default=False
-            If `True`, prepares a balance sheet statement as part of the processing.
+            If `True`, prepares a balance sheet statement for every window. Window from_dates are ignored.
         income_statement : bool, default=False
-            If `True`, generates an income statement as part of the processed result.
+            If `True`, prepares an income statement for every window.
         cash_flow_statement : bool, default=False
-            If `True`, prepares a cash flow statement based on the provided data.
-        use_closing_entry : Optional[bool]
-            Specifies whether to account for closing entries in the financial statement computation.
+            If `True`, prepares a cash flow statement for every window.
+        using : Optional[str]
+            The database alias the aggregation query is run on, such as a read replica. If not
+            provided, the alias of the enclosing read_database() block is used, or the primary database.
         **kwargs
-            Additional named arguments that can be passed to adjust the behavior of specific processing
-            modules or middleware.
+            Additional database digest filters, such as posted, exclude_zero_bal, cleared or reconciled.
 
         Returns
         -------
-        IODigestContextManager
-            A context manager instance containing the processed financial data and results, including
-            financial statements, ratios, or any activity digest generated as per the input parameters.
+        list of IODigestContextManager
+            One context manager per window, in the same order as the provided windows.
         """
         if balance_sheet_statement:
-            from_date = None
+            windows = [(None, to_date) for _, to_date in windows]
 
         if cash_flow_statement:
             by_activity = True
@@ -1290,98 +3051,288 @@ class IODatabaseMixIn:
             activity = validate_activity(activity)
         if role:
             role = roles_module.validate_roles(role)
+        if equity_only:
+            role = roles_module.GROUP_EARNINGS
 
-        from_date, to_date = validate_dates(from_date, to_date)
+        windows = [validate_dates(from_date, to_date) for from_date, to_date in windows]
+        if not windows:
+            return list()
 
-        io_state = dict()
-        io_state['io_model'] = self
-        io_state['from_date'] = from_date
-        io_state['to_date'] = to_date
-        io_state['by_unit'] = by_unit
-        io_state['unit_slug'] = unit_slug
-        io_state['entity_slug'] = entity_slug
-        io_state['by_period'] = by_period
-        io_state['by_activity'] = by_activity
-        io_state['by_tx_type'] = by_tx_type
+        TransactionModel = self.get_transaction_model()
+        TIMESTAMP_LOOKUP = TransactionModel.resolve_lookup('journal_entry__timestamp')
 
-        io_result: IOResult = self.python_digest(
+        account_metadata = None
+        if settings.DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_ENABLED:
+            account_metadata = get_account_metadata(
+                entity_uuid=self.uuid if self.is_entity_model() else self.entity_id
+            )
+
+        txs_queryset = self.get_txs_queryset_init(
+            entity_slug=entity_slug, unit_slug=unit_slug, annotated=account_metadata is None
+        ).not_closing_entry()
+
+        using = get_read_database(using)
+        if using:
+            txs_queryset = txs_queryset.using(using)
+
+        # limit the aggregation to the span of all windows...
+        if all(from_date for from_date, _ in windows):
+            txs_queryset = txs_queryset.from_date(
+                from_date=min(from_date for from_date, _ in windows)
+            )
+        txs_queryset = txs_queryset.to_date(to_date=max(to_date for _, to_date in windows))
+
+        txs_queryset = self.filter_txs_queryset(
+            txs_queryset=txs_queryset,
             accounts=accounts,
-            role=role,
             activity=activity,
-            entity_slug=entity_slug,
-            unit_slug=unit_slug,
-            to_date=to_date,
-            from_date=from_date,
-            signs=signs,
-            equity_only=equity_only,
-            by_period=by_period,
+            role=role,
+            **kwargs,
+        )
+
+        VALUES, ORDER_BY, ANNOTATE = self.get_digest_values_spec(
             by_unit=by_unit,
+            by_period=by_period,
             by_activity=by_activity,
             by_tx_type=by_tx_type,
-            use_closing_entry=use_closing_entry,
+            account_metadata=account_metadata is not None,
             **kwargs,
         )
 
-        io_state['io_result'] = io_result
-        io_state['accounts'] = io_result.accounts_digest
+        BALANCE_KEYS = [f'balance_{i}' for i in range(len(windows))]
+        for balance_key, (from_date, to_date) in zip(BALANCE_KEYS, windows):
+            window_filter = Q(**{f'{TIMESTAMP_LOOKUP}__date__lte': to_date})
+            if from_date:
+                window_filter &= Q(**{f'{TIMESTAMP_LOOKUP}__date__gte': from_date})
+            ANNOTATE[balance_key] = Sum('amount', filter=window_filter)
+
+        digest_values = list(
+            txs_queryset.values(*VALUES).annotate(**ANNOTATE).order_by(*ORDER_BY)
+        )
+
+        io_digests = list()
+        for balance_key, (from_date, to_date) in zip(BALANCE_KEYS, windows):
+            # records without transactions in the window aggregate to None...
+            window_values = [
+                {
+                    **{k: v for k, v in tx.items() if k not in BALANCE_KEYS},
+                    'balance': tx[balance_key],
+                }
+                for tx in digest_values
+                if tx[balance_key] is not None
+            ]
+
+            io_result = IOResult(
+                db_from_date=from_date, db_to_date=to_date, account_metadata=account_metadata
+            )
+            io_result.txs_queryset = window_values
+            io_result = self.aggregate_digest_values(
+                io_result=io_result,
+                signs=signs,
+                by_unit=by_unit,
+                by_activity=by_activity,
+                by_tx_type=by_tx_type,
+                by_period=by_period,
+            )
+
+            io_state = dict()
+            io_state['io_model'] = self
+            io_state['from_date'] = from_date
+            io_state['to_date'] = to_date
+            io_state['by_unit'] = by_unit
+            io_state['unit_slug'] = unit_slug
+            io_state['entity_slug'] = entity_slug
+            io_state['by_period'] = by_period
+            io_state['by_activity'] = by_activity
+            io_state['by_tx_type'] = by_tx_type
+            io_state['io_result'] = io_result
+            io_state['accounts'] = io_result.accounts_digest
+
+            io_digests.append(
+                self.process_io_state(
+                    io_state=io_state,
+                    process_roles=process_roles,
+                    process_groups=process_groups,
+                    process_ratios=process_ratios,
+                    process_activity=process_activity,
+                    by_period=by_period,
+                    by_unit=by_unit,
+                    balance_sheet_statement=balance_sheet_statement,
+                    income_statement=income_statement,
+                    cash_flow_statement=cash_flow_statement,
+                )
+            )
+
+        return io_digests
+
+    def digest_comparative(
+        self,
+        windows: Optional[List[Tuple[Optional[Union[date, datetime, str]], Optional[Union[date, datetime, str]]]]] = None,
+        from_date: Optional[Union[date, datetime, str]] = None,
+        to_date: Optional[Union[date, datetime, str]] = None,
+        by_period: Union[bool, str] = False,
+        labels: Optional[List[str]] = None,
+        base_column: Optional[int] = None,
+        entity_slug: Optional[str] = None,
+        unit_slug: Optional[str] = None,
+        balance_sheet_statement: bool = False,
+        income_statement: bool = False,
+        using: Optional[str] = None,
+        **kwargs,
+    ) -> IODigestContextManager:
+        """
+        Computes comparative financial statements, with one column per date window, from a single database
+        aggregation query. The columns are either the provided windows, or the periods of the from_date and
+        to_date range if by_period is provided. Balance sheet columns are computed as of each window to_date.
 
-        # IO Middleware...
+        The comparative statements mirror the balance sheet and income statement structures, with every balance
+        replaced by a comparative row holding the per-column balances, deltas and percent changes. See
+        ComparativeStatementIOMiddleware.
 
-        if process_roles:
-            roles_mgr = AccountRoleIOMiddleware(
-                io_data=io_state, by_period=by_period, by_unit=by_unit
-            )
+        Parameters
+        ----------
+        windows : list of tuple
+            The (from_date, to_date) pairs of the columns, such as this month, last month and the same month last
+            year. Mutually exclusive with by_period.
+        from_date : date or datetime or str
+            The first date of the by_period range.
+        to_date : date or datetime or str
+            The last date of the by_period range. Defaults to the current local date.
+        by_period : bool or str
+            The period of each column, one of DIGEST_PERIODS. True means month. The first and last periods are
+            clipped to the range.
+        labels : list of str
+            The column labels. Defaults to the period names if by_period is provided, or to the window dates.
+        base_column : int
+            The index of the column every delta and percent change is computed against. If not provided, each
+            column is compared against the preceding column.
+        entity_slug : Optional[str]
+            The slug identifier for the entity to process the financial data for.
+        unit_slug : Optional[str]
+            The slug identifier for the specific unit of the entity to filter the data for.
+        balance_sheet_statement : bool, default=False
+            If `True`, prepares a comparative balance sheet statement.
+        income_statement : bool, default=False
+            If `True`, prepares a comparative income statement.
+        using : Optional[str]
+            The database alias the aggregation query is run on, such as a read replica.
+        **kwargs
+            Additional digest_windows() arguments, such as accounts, activity, posted or exclude_zero_bal.
 
-            io_state = roles_mgr.digest()
+        Returns
+        -------
+        IODigestContextManager
+            The context manager holding the comparative statements, the column definitions and the digest of
+            every column.
 
-        if any(
-            [
-                process_groups,
-                balance_sheet_statement,
-                income_statement,
-                cash_flow_statement,
-            ]
-        ):
-            group_mgr = AccountGroupIOMiddleware(
-                io_data=io_state, by_period=by_period, by_unit=by_unit
+        Raises
+        ------
+        IOValidationError
+            If no statement is requested, or the columns are not properly defined.
+        """
+        if not any([balance_sheet_statement, income_statement]):
+            raise IOValidationError(
+                message='Comparative digest requires balance_sheet_statement or income_statement.'
             )
-            io_state = group_mgr.digest()
 
-            # todo: migrate this to group manager...
-            io_state['group_account']['GROUP_ASSETS'].sort(
-                key=lambda acc: roles_module.ROLES_ORDER_ASSETS.index(acc['role'])
-            )
-            io_state['group_account']['GROUP_LIABILITIES'].sort(
-                key=lambda acc: roles_module.ROLES_ORDER_LIABILITIES.index(acc['role'])
+        period = validate_digest_period(by_period)
+        if windows is not None and period:
+            raise IOValidationError(message='Cannot provide both windows and by_period.')
+
+        if period:
+            from_date, to_date = validate_dates(from_date, to_date)
+            if not from_date:
+                raise IOValidationError(message='Comparative digest by_period requires from_date.')
+            from_date = from_date.date() if isinstance(from_date, datetime) else from_date
+            to_date = to_date.date() if isinstance(to_date, datetime) else to_date
+            fy_start_month = self.get_entity_model_from_io().fy_start_month
+            windows = get_digest_period_windows(
+                from_date=from_date, to_date=to_date, period=period, fy_start_month=fy_start_month
             )
-            io_state['group_account']['GROUP_CAPITAL'].sort(
-                key=lambda acc: roles_module.ROLES_ORDER_CAPITAL.index(acc['role'])
-            )
-
-        if process_ratios:
-            ratio_gen = FinancialRatioManager(io_data=io_state)
-            io_state = ratio_gen.digest()
+            if not labels:
+                labels = [
+                    get_digest_period_label(window_from_date, period=period, fy_start_month=fy_start_month)
+                    for window_from_date, _ in windows
+                ]
+        elif windows:
+            windows = [validate_dates(window_from_date, window_to_date) for window_from_date, window_to_date in windows]
+            if not labels:
+                labels = [
+                    f'{window_from_date:%Y-%m-%d} - {window_to_date:%Y-%m-%d}'
+                    if window_from_date else f'{window_to_date:%Y-%m-%d}'
+                    for window_from_date, window_to_date in windows
+                ]
 
-        if process_activity:
-            activity_manager = JEActivityIOMiddleware(
-                io_data=io_state, by_unit=by_unit, by_period=by_period
+        if not windows:
+            raise IOValidationError(message='Comparative digest requires windows or by_period.')
+        if len(labels) != len(windows):
+            raise IOValidationError(
+                message=f'Comparative digest has {len(windows)} columns but {len(labels)} labels.'
             )
-            activity_manager.digest()
 
-        if balance_sheet_statement:
-            balance_sheet_mgr = BalanceSheetIOMiddleware(io_data=io_state)
-            io_state = balance_sheet_mgr.digest()
+        # income statement windows and balance sheet as-of windows share the same aggregation query...
+        ic_windows = windows if income_statement else list()
+        bs_windows = [(None, window_to_date) for _, window_to_date in windows] if balance_sheet_statement else list()
+        io_digests = self.digest_windows(
+            windows=ic_windows + bs_windows,
+            entity_slug=entity_slug,
+            unit_slug=unit_slug,
+            process_groups=True,
+            using=using,
+            **kwargs,
+        )
+        ic_digests = io_digests[:len(ic_windows)]
+        bs_digests = io_digests[len(ic_windows):]
+
+        from_dates = [window_from_date for window_from_date, _ in windows]
+        to_dates = [window_to_date for _, window_to_date in windows]
+        io_state = dict()
+        io_state['io_model'] = self
+        io_state['from_date'] = min(from_dates) if all(from_dates) else None
+        io_state['to_date'] = max(to_dates)
+        io_state['by_unit'] = kwargs.get('by_unit', False)
+        io_state['unit_slug'] = unit_slug
+        io_state['entity_slug'] = entity_slug
+        io_state['by_period'] = by_period
+        io_state['by_activity'] = kwargs.get('by_activity', False)
+        io_state['by_tx_type'] = kwargs.get('by_tx_type', False)
+        io_state['io_result'] = IOResult(db_from_date=io_state['from_date'], db_to_date=io_state['to_date'])
+        io_state['comparative_columns'] = [
+            {
+                'label': label,
+                'from_date': window_from_date,
+                'to_date': window_to_date,
+            } for label, (window_from_date, window_to_date) in zip(labels, windows)
+        ]
+        io_state['comparative_base_column'] = base_column
+        io_state['comparative_digests'] = {
+            IncomeStatementIOMiddleware.IC_DIGEST_KEY: ic_digests,
+            BalanceSheetIOMiddleware.BS_DIGEST_KEY: bs_digests,
+        }
 
         if income_statement:
-            income_statement_mgr = IncomeStatementIOMiddleware(io_data=io_state)
-            io_state = income_statement_mgr.digest()
+            for io_digest in ic_digests:
+                IncomeStatementIOMiddleware(io_data=io_digest.get_io_data()).digest()
+            io_state = ComparativeStatementIOMiddleware(
+                io_data=io_state,
+                columns_io_data=[io_digest.get_io_data() for io_digest in ic_digests],
+                statement_key=IncomeStatementIOMiddleware.IC_DIGEST_KEY,
+                base_column=base_column,
+            ).digest()
 
-        if cash_flow_statement:
-            cfs = CashFlowStatementIOMiddleware(io_data=io_state)
-            io_state = cfs.digest()
+        if balance_sheet_statement:
+            for io_digest in bs_digests:
+                BalanceSheetIOMiddleware(io_data=io_digest.get_io_data()).digest()
+            io_state = ComparativeStatementIOMiddleware(
+                io_data=io_state,
+                columns_io_data=[io_digest.get_io_data() for io_digest in bs_digests],
+                statement_key=BalanceSheetIOMiddleware.BS_DIGEST_KEY,
+                base_column=base_column,
+            ).digest()
 
         return IODigestContextManager(io_state=io_state)
 
+    @primary_database()
     def commit_txs(
         self,
         je_timestamp: Union[str, datetime, date],
@@ -1445,7 +3396,6 @@ class IODatabaseMixIn:
         """
         TransactionModel = self.get_transaction_model()
         JournalEntryModel = self.get_journal_entry_model()
-        StagedTransactionModel = self.get_staged_transaction_model()
 
         with transaction.atomic():
             # Validates that credits/debits balance.
@@ -1542,7 +3492,6 @@ class IODatabaseMixIn:
                     posted=False,
                     locked=False,
                 )
-                je_model.save(verify=False)
 
             # todo: add method to process list of transaction models...
             txs_models = [
@@ -1560,8 +3509,8 @@ class IODatabaseMixIn:
             ]
 
             for tx, txm_kwargs in txs_models:
-                if not getattr(tx, 'ledger_id', None):
-                    tx.ledger_id = je_model.ledger_id
+                # bulk_create bypasses the pre_save signal...
+                tx.sync_denormalized_fields(je_model=je_model)
                 if not getattr(tx, 'timestamp', None):
                     tx.timestamp = je_model.timestamp
                 staged_tx_model = txm_kwargs.get('staged_tx_model')
@@ -1569,10 +3518,217 @@ class IODatabaseMixIn:
                 if staged_tx_model:
                     staged_tx_model.transaction_model = tx
 
-            txs_models = TransactionModel.objects.bulk_create(i[0] for i in txs_models)
-            je_model.save(verify=True, post_on_verify=je_posted)
+            txs_models = [i[0] for i in txs_models]
+
+            if force_je_retrieval:
+                txs_models = TransactionModel.objects.bulk_create(txs_models)
+                je_model.save(verify=True, post_on_verify=je_posted)
+                return je_model, txs_models
+
+            # new JournalEntryModel, verified against the in-memory transactions...
+            je_model.verify(txs_qs=txs_models)
+            if je_posted:
+                je_model.mark_as_posted(
+                    commit=False,
+                    verify=False,
+                    force_lock=True,
+                    raise_exception=True,
+                    txs_qs=txs_models,
+                )
+
+            txs_models = je_model.save_with_transactions(txs_models)
             return je_model, txs_models
 
+    @primary_database()
+    def commit_many(
+        self,
+        entries: List[Dict],
+        je_posted: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> List[Tuple]:
+        """
+        Commits many journal entries at once. Meant for high volume posting, where calling commit_txs for every
+        journal entry is too expensive.
+
+        All entries are validated in memory before anything is written: credits and debits must balance, timestamps
+        must not fall on a closed period, the LedgerModel must not be locked and all transactions of an entry must
+        belong to the same chart of accounts. The activity of every journal entry is derived from the provided
+        account roles. Journal entries and transactions are then bulk created in batches, each batch in its own
+        atomic block, and JE numbers are assigned from a sequence range reserved once per EntityUnitModel and
+        fiscal year on every batch. New (unsaved) LedgerModels are bulk created along with the first batch
+        that uses them.
+
+        Parameters
+        ----------
+        entries : list of dict
+            The journal entries to commit. Each entry must provide a 'timestamp' and the list of 'txs', with the same
+            format as the je_txs of commit_txs. The transaction 'account' must be an AccountModel instance.
+            Optionally, each entry may provide a 'ledger' (required when committing from an EntityModel), 'unit',
+            'desc', 'origin' and 'posted'. The 'ledger' may be a new LedgerModel instance, not yet saved.
+        je_posted : bool, optional
+            Whether the journal entries are posted, unless overridden by the entry 'posted' key. Defaults to False.
+        batch_size : int, optional
+            The number of journal entries committed per atomic block. If not provided, the value is determined by the
+            DJANGO_LEDGER_COMMIT_MANY_BATCH_SIZE setting.
+
+        Returns
+        -------
+        list of tuple
+            A (je_model, txs_models) tuple for every entry, in the same order as the provided entries.
+
+        Raises
+        ------
+        IOValidationError
+            Raised if any of the entries is not valid. No journal entry is committed in such case.
+        """
+        TransactionModel = self.get_transaction_model()
+        JournalEntryModel = self.get_journal_entry_model()
+        LedgerModel = lazy_loader.get_ledger_model()
+        BalanceSnapshotModel = lazy_loader.get_balance_snapshot_model()
+        EntityStateModel = lazy_loader.get_entity_state_model()
+
+        if not batch_size:
+            batch_size = settings.DJANGO_LEDGER_COMMIT_MANY_BATCH_SIZE
+
+        entity_model = self.get_entity_model_from_io()
+        is_entity_model = isinstance(self, lazy_loader.get_entity_model())
+
+        je_txs_models = list()
+        ledgers_locked = dict()
+        for i, entry in enumerate(entries):
+            je_txs = entry['txs']
+            je_ledger_model = entry.get('ledger')
+            je_unit_model = entry.get('unit')
+
+            try:
+                if je_txs and not check_tx_balance(je_txs, perform_correction=False):
+                    raise IOValidationError(message=_('Credits and debits must match.'))
+                je_timestamp = validate_io_timestamp(dt=entry['timestamp'])
+                je_date = je_timestamp.date() if isinstance(je_timestamp, datetime) else je_timestamp
+
+                if entity_model.last_closing_date and entity_model.last_closing_date >= je_date:
+                    raise IOValidationError(
+                        message=_(f'The journal entry date {je_timestamp} is on a closed period.')
+                    )
+
+                if is_entity_model:
+                    if je_ledger_model is None:
+                        raise IOValidationError(
+                            'Committing from EntityModel requires an instance of LedgerModel'
+                        )
+                    if je_ledger_model.entity_id != self.uuid:
+                        raise IOValidationError(
+                            f'LedgerModel {je_ledger_model} does not belong to {self}'
+                        )
+                    if je_unit_model is not None and je_unit_model.entity_id != self.uuid:
+                        raise IOValidationError(
+                            f'EntityUnitModel {je_unit_model} does not belong to {self}'
+                        )
+
+                if not je_ledger_model:
+                    je_ledger_model = self
+
+                if je_ledger_model.uuid not in ledgers_locked:
+                    ledgers_locked[je_ledger_model.uuid] = je_ledger_model.is_locked()
+                if ledgers_locked[je_ledger_model.uuid]:
+                    raise IOValidationError(message=_('Cannot commit on locked ledger'))
+
+                if len({txm_kwargs['account'].coa_model_id for txm_kwargs in je_txs}) > 1:
+                    raise IOValidationError(
+                        message=_('All transactions must be associated with the same Chart of Accounts.')
+                    )
+
+                # activity flag...
+                role_set = {txm_kwargs['account'].role for txm_kwargs in je_txs}
+                activity = None
+                if roles_module.ASSET_CA_CASH in role_set:
+                    role_set.discard(roles_module.ASSET_CA_CASH)
+                    activity = JournalEntryModel.get_activity_from_roles(role_set=role_set)
+
+            except ValidationError as e:
+                raise IOValidationError(
+                    message=_(f'Cannot commit entry {i}: {"; ".join(e.messages)}')
+                )
+
+            posted = entry.get('posted', je_posted)
+            je_model = JournalEntryModel(
+                ledger=je_ledger_model,
+                entity_unit=je_unit_model,
+                description=entry.get('desc'),
+                timestamp=je_timestamp,
+                origin=entry.get('origin'),
+                activity=activity,
+                posted=posted,
+                locked=posted,
+            )
+            je_model._verified = True
+
+            txs_models = list()
+            for txm_kwargs in je_txs:
+                tx = TransactionModel(
+                    account=txm_kwargs['account'],
+                    amount=txm_kwargs['amount'],
+                    tx_type=txm_kwargs['tx_type'],
+                    description=txm_kwargs['description'],
+                    journal_entry=je_model,
+                )
+                # bulk_create bypasses the pre_save signal...
+                tx.sync_denormalized_fields(je_model=je_model)
+                if not getattr(tx, 'timestamp', None):
+                    tx.timestamp = je_model.timestamp
+                staged_tx_model = txm_kwargs.get('staged_tx_model')
+                if staged_tx_model:
+                    staged_tx_model.transaction_model = tx
+                txs_models.append(tx)
+
+            je_txs_models.append((je_model, txs_models))
+
+        for batch_start in range(0, len(je_txs_models), batch_size):
+            batch = je_txs_models[batch_start:batch_start + batch_size]
+            with transaction.atomic():
+                # reserves a JE number range for every unit and fiscal year...
+                je_sequences = dict()
+                for je_model, _txs in batch:
+                    fy_key = entity_model.get_fy_for_date(dt=je_model.timestamp)
+                    je_sequences.setdefault((je_model.entity_unit_id, fy_key), list()).append(je_model)
+
+                for (unit_uuid, fy_key), je_models in je_sequences.items():
+                    sequences = None
+                    while not sequences:
+                        sequences = EntityStateModel.objects.reserve_sequence(
+                            entity_model_id=entity_model.uuid,
+                            entity_unit_id=unit_uuid,
+                            fiscal_year=fy_key,
+                            key=EntityStateModel.KEY_JOURNAL_ENTRY,
+                            count=len(je_models),
+                            raise_exception=False
+                        )
+                    for seq, je_model in zip(sequences, je_models):
+                        je_model.je_number = je_model.get_je_number(fiscal_year=fy_key, sequence=seq)
+
+                # new ledgers are created along with their first journal entries...
+                new_ledger_models = {
+                    je_model.ledger.uuid: je_model.ledger for je_model, _txs in batch
+                    if isinstance(je_model.ledger, LedgerModel) and je_model.ledger._state.adding
+                }
+                if new_ledger_models:
+                    LedgerModel.objects.bulk_create(new_ledger_models.values())
+
+                JournalEntryModel.objects.bulk_create(je_model for je_model, _txs in batch)
+                TransactionModel.objects.bulk_create(tx for _je, txs_models in batch for tx in txs_models)
+
+                for je_model, _txs in batch:
+                    je_model._balance_snapshot_state = je_model.get_balance_snapshot_state()
+                if settings.DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS:
+                    BalanceSnapshotModel.objects.update_for_new_journal_entries(batch)
+
+                bump_digest_version(entity_model.uuid)
+
+            for je_model, _txs in batch:
+                je_model.send_state_signals(commited=True)
+
+        return je_txs_models
+
 
 class IOReportMixIn:
     """
@@ -1666,6 +3822,7 @@ class IOReportMixIn:
         filename: Optional[str] = None,
         user_model: Optional[UserModel] = None,
         save_pdf: bool = False,
+        using: Optional[str] = None,
         **kwargs,
     ) -> IODigestContextManager:
         """
@@ -1701,6 +3858,9 @@ class IOReportMixIn:
         save_pdf : bool, default=False
             A flag indicating whether the balance sheet should be saved as a PDF. If
             True, the method generates and stores the PDF in the specified location.
+        using : Optional[str], default=None
+            The database alias the report is digested from, such as a read replica. Defaults to
+            the DJANGO_LEDGER_READ_DATABASE setting, or the primary database if not set.
         **kwargs
             Additional keyword arguments required for generating the balance sheet.
             It may include filtering, formatting, or any other relevant parameters.
@@ -1714,7 +3874,10 @@ class IOReportMixIn:
         """
 
         io_digest = self.digest_balance_sheet(
-            to_date=to_date, user_model=user_model, **kwargs
+            to_date=to_date,
+            user_model=user_model,
+            using=using or settings.DJANGO_LEDGER_READ_DATABASE,
+            **kwargs,
         )
 
         BalanceSheetReport = lazy_loader.get_balance_sheet_report_class()
@@ -1794,6 +3957,7 @@ class IOReportMixIn:
         user_model: Optional[UserModel] = None,
         txs_queryset: Optional[QuerySet] = None,
         save_pdf: bool = False,
+        using: Optional[str] = None,
         **kwargs,
     ):
         """
@@ -1824,6 +3988,9 @@ class IOReportMixIn:
         save_pdf : bool
             Indicates whether the generated income statement should be saved as a PDF file.
             Defaults to False.
+        using : Optional[str]
+            The database alias the report is digested from, such as a read replica. Defaults to
+            the DJANGO_LEDGER_READ_DATABASE setting, or the primary database if not set.
         **kwargs :
             Additional optional keyword arguments for further customization or filtering.
 
@@ -1846,6 +4013,7 @@ class IOReportMixIn:
             to_date=to_date,
             user_model=user_model,
             txs_queryset=txs_queryset,
+            using=using or settings.DJANGO_LEDGER_READ_DATABASE,
             **kwargs,
         )
         IncomeStatementReport = lazy_loader.get_income_statement_report_class()
@@ -1919,6 +4087,7 @@ class IOReportMixIn:
         filename: Optional[str] = None,
         user_model: Optional[UserModel] = None,
         save_pdf: bool = False,
+        using: Optional[str] = None,
         **kwargs,
     ):
         """
@@ -1944,6 +4113,9 @@ class IOReportMixIn:
             report content.
         save_pdf : bool, default=False
             Flag to save the generated report as a PDF file.
+        using : Optional[str], default=None
+            The database alias the report is digested from, such as a read replica. Defaults to
+            the DJANGO_LEDGER_READ_DATABASE setting, or the primary database if not set.
         kwargs : dict
             Additional keyword arguments that are passed to the `digest_cash_flow_statement`
             method for further customization or additional processing.
@@ -1961,7 +4133,11 @@ class IOReportMixIn:
         """
 
         io_digest = self.digest_cash_flow_statement(
-            from_date=from_date, to_date=to_date, user_model=user_model, **kwargs
+            from_date=from_date,
+            to_date=to_date,
+            user_model=user_model,
+            using=using or settings.DJANGO_LEDGER_READ_DATABASE,
+            **kwargs,
         )
 
         CashFlowStatementReport = lazy_loader.get_cash_flow_statement_report_class()
@@ -2034,6 +4210,37 @@ class IOReportMixIn:
             **kwargs,
         )
 
+    async def adigest_financial_statements(
+        self,
+        from_date: Union[date, datetime],
+        to_date: Union[date, datetime],
+        user_model: Optional[UserModel] = None,
+        **kwargs,
+    ) -> IODigestContextManager:
+        """
+        Async counterpart of digest_financial_statements().
+
+        Parameters
+        ----------
+        The same parameters as digest_financial_statements().
+
+        Returns
+        -------
+        IODigestContextManager
+            Represents the context manager containing the digested financial
+            statements for the specified date range.
+        """
+        return await self.adigest(
+            from_date=from_date,
+            to_date=to_date,
+            user_model=user_model,
+            balance_sheet_statement=True,
+            income_statement=True,
+            cash_flow_statement=True,
+            as_io_digest=True,
+            **kwargs,
+        )
+
     def get_financial_statements(
         self,
         from_date: Union[date, datetime],
@@ -2042,6 +4249,7 @@ class IOReportMixIn:
         user_model: Optional[UserModel] = None,
         save_pdf: bool = False,
         filepath: Optional[Path] = None,
+        using: Optional[str] = None,
         **kwargs,
     ) -> ReportTuple:
         """
@@ -2068,6 +4276,9 @@ class IOReportMixIn:
         filepath : Optional[Path], optional
             The directory path where the PDF files will be saved. If not provided, the files will
             be saved in the application's base directory. Defaults to None.
+        using : Optional[str], optional
+            The database alias the financial statements are digested from, such as a read replica.
+            Defaults to the DJANGO_LEDGER_READ_DATABASE setting, or the primary database if not set.
         **kwargs
             Additional keyword arguments for customizing financial statement generation.
 
@@ -2083,9 +4294,94 @@ class IOReportMixIn:
             Raised if PDF support is not enabled in the application configuration.
         """
         io_digest = self.digest_financial_statements(
-            from_date=from_date, to_date=to_date, user_model=user_model, **kwargs
+            from_date=from_date,
+            to_date=to_date,
+            user_model=user_model,
+            using=using or settings.DJANGO_LEDGER_READ_DATABASE,
+            **kwargs,
+        )
+        return self.get_financial_statements_reports(
+            io_digest=io_digest,
+            from_date=from_date,
+            dt_strfmt=dt_strfmt,
+            save_pdf=save_pdf,
+            filepath=filepath,
+        )
+
+    async def aget_financial_statements(
+        self,
+        from_date: Union[date, datetime],
+        to_date: Union[date, datetime],
+        dt_strfmt: str = '%Y%m%d',
+        user_model: Optional[UserModel] = None,
+        save_pdf: bool = False,
+        filepath: Optional[Path] = None,
+        using: Optional[str] = None,
+        **kwargs,
+    ) -> ReportTuple:
+        """
+        Async counterpart of get_financial_statements(). The financial statements are digested with the async
+        ORM, and the reports, which may be written to disk, are generated in a worker thread.
+
+        Parameters
+        ----------
+        The same parameters as get_financial_statements().
+
+        Returns
+        -------
+        ReportTuple
+            A named tuple containing the generated balance sheet, income statement, and cash
+            flow statement as objects.
+        """
+        io_digest = await self.adigest_financial_statements(
+            from_date=from_date,
+            to_date=to_date,
+            user_model=user_model,
+            using=using or settings.DJANGO_LEDGER_READ_DATABASE,
+            **kwargs,
+        )
+        return await sync_to_async(self.get_financial_statements_reports)(
+            io_digest=io_digest,
+            from_date=from_date,
+            dt_strfmt=dt_strfmt,
+            save_pdf=save_pdf,
+            filepath=filepath,
         )
 
+    def get_financial_statements_reports(
+        self,
+        io_digest: IODigestContextManager,
+        from_date: Union[date, datetime],
+        dt_strfmt: str = '%Y%m%d',
+        save_pdf: bool = False,
+        filepath: Optional[Path] = None,
+    ) -> ReportTuple:
+        """
+        Builds the balance sheet, income statement and cash flow statement reports of a financial
+        statements digest, optionally saving them as PDF files.
+
+        Parameters
+        ----------
+        io_digest : IODigestContextManager
+            The financial statements digest, as returned by digest_financial_statements().
+        from_date : Union[date, datetime]
+            The start date of the financial statements, used for the PDF filenames.
+        dt_strfmt : str
+            The string format used for the filenames of the generated PDF reports. Defaults to
+            '%Y%m%d'.
+        save_pdf : bool, optional
+            Determines whether to save the generated financial statements as PDF files.
+            Defaults to False.
+        filepath : Optional[Path], optional
+            The directory path where the PDF files will be saved. If not provided, the files will
+            be saved in the application's base directory. Defaults to None.
+
+        Returns
+        -------
+        ReportTuple
+            A named tuple containing the generated balance sheet, income statement, and cash
+            flow statement as objects.
+        """
         BalanceSheetReport = lazy_loader.get_balance_sheet_report_class()
         bs_report = BalanceSheetReport(
             self.PDF_REPORT_ORIENTATION,
@@ -2137,6 +4433,69 @@ class IOReportMixIn:
             cash_flow_statement=cfs_report,
         )
 
+    def get_comparative_statements(
+        self,
+        subtitle: Optional[str] = None,
+        filepath: Optional[Path] = None,
+        filename: Optional[str] = None,
+        save_pdf: bool = False,
+        using: Optional[str] = None,
+        **kwargs,
+    ):
+        """
+        Generates the comparative financial statements report, with one balance column per date window or
+        period, and an option to save it as a landscape PDF file.
+
+        Parameters
+        ----------
+        subtitle : Optional[str], default=None
+            Subtitle text for the report.
+        filepath : Optional[Path], default=None
+            The directory path where the PDF report will be saved. Defaults to the
+            base directory if not provided.
+        filename : Optional[str], default=None
+            The name of the PDF report file. If not provided, a default name is generated.
+        save_pdf : bool, default=False
+            Flag to save the generated report as a PDF file.
+        using : Optional[str], default=None
+            The database alias the report is digested from, such as a read replica. Defaults to
+            the DJANGO_LEDGER_READ_DATABASE setting, or the primary database if not set.
+        kwargs : dict
+            The digest_comparative() arguments, such as windows, by_period, labels, base_column,
+            balance_sheet_statement and income_statement. Both statements are included by default.
+
+        Returns
+        -------
+        ComparativeStatementReport
+            An instance of the comparative statement report class.
+        """
+        if not any([kwargs.get('balance_sheet_statement'), kwargs.get('income_statement')]):
+            kwargs['balance_sheet_statement'] = True
+            kwargs['income_statement'] = True
+
+        io_digest = self.digest_comparative(
+            using=using or settings.DJANGO_LEDGER_READ_DATABASE,
+            **kwargs,
+        )
+
+        ComparativeStatementReport = lazy_loader.get_comparative_statement_report_class()
+        report = ComparativeStatementReport(
+            'L',
+            self.PDF_REPORT_MEASURE_UNIT,
+            self.PDF_REPORT_PAGE_SIZE,
+            io_digest=io_digest,
+            report_subtitle=subtitle,
+        )
+        if save_pdf:
+            base_dir = (
+                Path(global_settings.BASE_DIR) if not filepath else Path(filepath)
+            )
+            filename = report.get_pdf_filename() if not filename else filename
+            filepath = base_dir.joinpath(filename)
+            report.create_pdf_report()
+            report.output(filepath)
+        return report
+
 
 class IOMixIn(IODatabaseMixIn, IOReportMixIn):
     """
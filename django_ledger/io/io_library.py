@@ -255,6 +255,8 @@ class IOCursor:
                je_description: Optional[str] = None,
                post_new_ledgers: bool = False,
                post_journal_entries: bool = False,
+               batched: bool = False,
+               batch_size: Optional[int] = None,
                **kwargs):
 
         """
@@ -262,6 +264,10 @@ class IOCursor:
         entries are posted, the books will be immediately impacted by the new transactions. It is encouraged NOT to
         post anything until the transaction is reviews for accuracy.
 
+        By default, every ledger is committed independently with commit_txs. In batched mode, all journal entries are
+        validated upfront and the new ledgers, journal entries and transactions are bulk created with commit_many,
+        committing batch_size ledgers per database transaction. Meant for dispatching many blueprints at once.
+
         Parameters
         ----------
         je_timestamp: Optional[Union[datetime, date, str]]
@@ -272,8 +278,14 @@ class IOCursor:
             If a new ledger is created, the ledger model will be posted to the database.
         post_journal_entries: bool
             If new journal entries are created, the journal entry models will be posted to the database.
+        batched: bool
+            Commits all ledgers in batches with commit_many. Defaults to False.
+        batch_size: int
+            The number of ledgers committed per database transaction in batched mode. Defaults to the
+            DJANGO_LEDGER_COMMIT_MANY_BATCH_SIZE setting.
         kwargs
-            Additional keyword arguments passed to the IO commit_txs function.
+            Additional keyword arguments passed to the IO commit_txs function. In batched mode, only je_unit_model
+            and je_origin are supported.
         """
         if self.is_committed():
             raise IOCursorValidationError(
@@ -355,6 +367,18 @@ class IOCursor:
                     message=_(f'Account code {tx.account_code} not found. Is account available and not locked?')
                 )
 
+        if batched:
+            results = self.commit_batched(
+                instructions=instructions,
+                je_timestamp=je_timestamp,
+                je_description=je_description,
+                post_journal_entries=post_journal_entries,
+                batch_size=batch_size,
+                **kwargs
+            )
+            self.__COMMITTED = True
+            return results
+
         results = dict()
         for ledger_model, tr_items in instructions.items():
             if ledger_model._state.adding:
@@ -383,6 +407,58 @@ class IOCursor:
         self.__COMMITTED = True
         return results
 
+    def commit_batched(self,
+                       instructions: Dict,
+                       je_timestamp: Optional[Union[datetime, date, str]] = None,
+                       je_description: Optional[str] = None,
+                       post_journal_entries: bool = False,
+                       batch_size: Optional[int] = None,
+                       je_unit_model=None,
+                       je_origin: Optional[str] = None,
+                       **kwargs) -> Dict:
+        """
+        Commits the compiled instructions of all ledgers with the EntityModel commit_many method. New ledgers are
+        bulk created along with their journal entries. Called by commit in batched mode.
+
+        Returns
+        -------
+        dict
+            The results map, with the same format as commit.
+        """
+        if kwargs.get('force_je_retrieval'):
+            raise IOCursorValidationError(
+                message=_('Journal Entry retrieval is not supported in batched mode.')
+            )
+
+        je_timestamp = je_timestamp if je_timestamp else get_localtime()
+        ledger_instructions = list(instructions.items())
+        committed = self.ENTITY_MODEL.commit_many(
+            entries=[
+                {
+                    'timestamp': je_timestamp,
+                    'txs': [t.to_dict() for t in tr_items],
+                    'ledger': ledger_model,
+                    'unit': je_unit_model,
+                    'desc': je_description,
+                    'origin': je_origin,
+                } for ledger_model, tr_items in ledger_instructions
+            ],
+            je_posted=post_journal_entries,
+            batch_size=batch_size
+        )
+
+        results = dict()
+        for (ledger_model, tr_items), (je, txs_models) in zip(ledger_instructions, committed):
+            je.txs_models = txs_models
+            results[ledger_model] = {
+                'ledger_model': ledger_model,
+                'journal_entry': je,
+                'txs_models': txs_models,
+                'instructions': tr_items,
+                'account_model_qs': self.account_model_qs
+            }
+        return results
+
 
 class IOLibraryError(ValidationError):
     pass
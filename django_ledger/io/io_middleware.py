@@ -5,24 +5,197 @@ Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
 Contributions to this module:
     * Miguel Sanda <msanda@arrobalytics.com>
 """
+from array import array
 from collections import defaultdict
+from decimal import Decimal
+from functools import lru_cache
 from itertools import groupby, chain
+from typing import Dict, List, Optional, Tuple
 
 from django.core.exceptions import ValidationError
 
 from django_ledger.io import roles as roles_module
+from django_ledger.io.io_compact import CompactAccountsDigest
 from django_ledger.models.utils import lazy_loader
 
 
+@lru_cache(maxsize=None)
+def get_role_membership_map() -> Dict[str, Tuple[str, ...]]:
+    """
+    Maps every account role value to the ROLES_DIRECTORY role names it belongs to.
+    """
+    membership = defaultdict(list)
+    for c, l in roles_module.ROLES_DIRECTORY.items():
+        for r in l:
+            if r not in membership[getattr(roles_module, r)]:
+                membership[getattr(roles_module, r)].append(r)
+    return {role: tuple(names) for role, names in membership.items()}
+
+
+@lru_cache(maxsize=None)
+def get_group_membership_map() -> Dict[str, Tuple[str, ...]]:
+    """
+    Maps every account role value to the ROLES_GROUPS group names it belongs to.
+    """
+    membership = defaultdict(list)
+    for g in roles_module.ROLES_GROUPS:
+        for role in getattr(roles_module, g):
+            if g not in membership[role]:
+                membership[role].append(g)
+    return {role: tuple(groups) for role, groups in membership.items()}
+
+
+class AccountAggregationEngine:
+    """
+    Aggregates the digest accounts into named buckets (roles, groups, activities) in a single linear pass.
+    Accounts are assigned to buckets through a membership map, keyed by the account attribute value.
+    Per-bucket account lists, balances and period/unit balances preserve the order in which accounts and keys
+    are first seen, so the results are identical to scanning the account list once per bucket.
+    A CompactAccountsDigest is aggregated from its interned column codes instead, buckets hold row indexes and
+    the shared digest records are only built when the bucket accounts are requested.
+    If subtotals precomputed by the database are provided, bucket balances are aggregated from the subtotals
+    and accounts are only assigned to their buckets.
+    """
+    TOTALS_KEYS = {
+        'role': 'account__role',
+    }
+
+    def __init__(self,
+                 accounts: list,
+                 membership: dict,
+                 key: str = 'role',
+                 by_period: bool = False,
+                 by_unit: bool = False,
+                 totals: Optional[List[Dict]] = None):
+        self.ACCOUNTS = accounts
+        self.MEMBERSHIP = membership
+        self.KEY = key
+        self.BY_PERIOD = by_period
+        self.BY_UNIT = by_unit
+        self.TOTALS = totals
+
+        self.BUCKET_ACCOUNTS = defaultdict(list)
+        self.BUCKET_ROWS = defaultdict(lambda: array('I'))
+        self.BUCKET_BALANCES = defaultdict(int)
+        self.BUCKET_BALANCES_BY_PERIOD = defaultdict(dict)
+        self.BUCKET_UNIT_KEYS = defaultdict(dict)
+        self.BUCKET_BALANCES_BY_UNIT = defaultdict(dict)
+
+        self.process()
+
+    def process(self):
+        if self.TOTALS is not None:
+            return self.process_totals()
+
+        if isinstance(self.ACCOUNTS, CompactAccountsDigest):
+            return self.process_compact()
+
+        for acc in self.ACCOUNTS:
+            buckets = self.MEMBERSHIP.get(acc[self.KEY])
+            if not buckets:
+                continue
+
+            balance = acc['balance']
+            if self.BY_PERIOD:
+                period_key = (acc['period_year'], acc['period_month'])
+            if self.BY_UNIT:
+                unit_key = (acc['unit_uuid'], acc['unit_name'])
+
+            for b in buckets:
+                self.BUCKET_ACCOUNTS[b].append(acc)
+                self.BUCKET_BALANCES[b] += balance
+
+                if self.BY_PERIOD:
+                    by_period = self.BUCKET_BALANCES_BY_PERIOD[b]
+                    by_period[period_key] = by_period.get(period_key, 0) + balance
+                if self.BY_UNIT:
+                    self.BUCKET_UNIT_KEYS[b].setdefault(unit_key, None)
+                    by_unit = self.BUCKET_BALANCES_BY_UNIT[b]
+                    by_unit[unit_key[0]] = by_unit.get(unit_key[0], 0) + balance
+
+    def process_compact(self):
+        codes, values = self.ACCOUNTS.get_codes(self.KEY)
+        code_buckets = [self.MEMBERSHIP.get(v) for v in values]
+
+        # buckets only hold row indexes, records are built when the bucket accounts are requested...
+        for idx, code in enumerate(codes):
+            for b in code_buckets[code] or ():
+                self.BUCKET_ROWS[b].append(idx)
+
+        for value, balance in self.ACCOUNTS.reduce(self.KEY).items():
+            for b in self.MEMBERSHIP.get(value, ()):
+                self.BUCKET_BALANCES[b] += balance
+
+        if self.BY_PERIOD:
+            for (value, period_key), balance in self.ACCOUNTS.reduce((self.KEY, 'period')).items():
+                for b in self.MEMBERSHIP.get(value, ()):
+                    by_period = self.BUCKET_BALANCES_BY_PERIOD[b]
+                    by_period[period_key] = by_period.get(period_key, 0) + balance
+
+        if self.BY_UNIT:
+            for (value, unit_key), balance in self.ACCOUNTS.reduce((self.KEY, 'unit')).items():
+                for b in self.MEMBERSHIP.get(value, ()):
+                    self.BUCKET_UNIT_KEYS[b].setdefault(unit_key, None)
+                    by_unit = self.BUCKET_BALANCES_BY_UNIT[b]
+                    by_unit[unit_key[0]] = by_unit.get(unit_key[0], 0) + balance
+
+    def process_totals(self):
+        for acc in self.ACCOUNTS:
+            for b in self.MEMBERSHIP.get(acc[self.KEY], ()):
+                self.BUCKET_ACCOUNTS[b].append(acc)
+
+        totals_key = self.TOTALS_KEYS[self.KEY]
+        for total in self.TOTALS:
+            buckets = self.MEMBERSHIP.get(total[totals_key])
+            if not buckets:
+                continue
+
+            balance = total['balance']
+            if self.BY_PERIOD:
+                period_key = (total.get('period_year'), total.get('period_month'))
+            if self.BY_UNIT:
+                unit_key = (total['journal_entry__entity_unit__uuid'], total['journal_entry__entity_unit__name'])
+
+            for b in buckets:
+                self.BUCKET_BALANCES[b] += balance
+
+                if self.BY_PERIOD:
+                    by_period = self.BUCKET_BALANCES_BY_PERIOD[b]
+                    by_period[period_key] = by_period.get(period_key, 0) + balance
+                if self.BY_UNIT:
+                    self.BUCKET_UNIT_KEYS[b].setdefault(unit_key, None)
+                    by_unit = self.BUCKET_BALANCES_BY_UNIT[b]
+                    by_unit[unit_key[0]] = by_unit.get(unit_key[0], 0) + balance
+
+    def get_accounts(self, bucket: str) -> list:
+        if isinstance(self.ACCOUNTS, CompactAccountsDigest) and self.TOTALS is None:
+            return list(self.ACCOUNTS.iter_records(self.BUCKET_ROWS.get(bucket, ())))
+        return list(self.BUCKET_ACCOUNTS.get(bucket, []))
+
+    def get_balance(self, bucket: str):
+        return self.BUCKET_BALANCES.get(bucket, 0)
+
+    def get_balance_by_period(self, bucket: str) -> dict:
+        return self.BUCKET_BALANCES_BY_PERIOD.get(bucket, {})
+
+    def get_balance_by_unit(self, bucket: str) -> dict:
+        by_unit = self.BUCKET_BALANCES_BY_UNIT.get(bucket, {})
+        return {
+            unit_key: by_unit[unit_key[0]] for unit_key in self.BUCKET_UNIT_KEYS.get(bucket, {})
+        }
+
+
 class AccountRoleIOMiddleware:
 
     def __init__(self,
                  io_data: dict,
                  by_period: bool = False,
-                 by_unit: bool = False):
+                 by_unit: bool = False,
+                 role_totals: Optional[List[Dict]] = None):
 
         self.BY_PERIOD = by_period
         self.BY_UNIT = by_unit
+        self.ROLE_TOTALS = role_totals
 
         self.DIGEST = io_data
         self.DIGEST['role_account'] = None
@@ -35,14 +208,14 @@ class AccountRoleIOMiddleware:
         self.ROLES_BALANCE_SHEET = dict()
 
         if self.BY_PERIOD:
-            self.ROLES_BALANCES_BY_PERIOD = defaultdict(lambda: dict())
+            self.ROLES_BALANCES_BY_PERIOD = defaultdict(dict)
             self.DIGEST['role_balance_by_period'] = None
         if self.BY_UNIT:
-            self.ROLES_BALANCES_BY_UNIT = defaultdict(lambda: dict())
+            self.ROLES_BALANCES_BY_UNIT = defaultdict(dict)
             self.DIGEST['role_balance_by_unit'] = None
 
         if self.BY_PERIOD and self.BY_UNIT:
-            self.ROLES_BALANCES_BY_PERIOD_AND_UNIT = defaultdict(lambda: dict())
+            self.ROLES_BALANCES_BY_PERIOD_AND_UNIT = defaultdict(dict)
 
     def digest(self):
 
@@ -58,26 +231,25 @@ class AccountRoleIOMiddleware:
         return self.DIGEST
 
     def process_roles(self):
+        engine = AccountAggregationEngine(
+            accounts=self.ACCOUNTS,
+            membership=get_role_membership_map(),
+            by_period=self.BY_PERIOD,
+            by_unit=self.BY_UNIT,
+            totals=self.ROLE_TOTALS
+        )
 
         for c, l in roles_module.ROLES_DIRECTORY.items():
             for r in l:
-                acc_list = list(acc for acc in self.ACCOUNTS if acc['role'] == getattr(roles_module, r))
+                self.ROLES_ACCOUNTS[r] = engine.get_accounts(r)
+                self.ROLES_BALANCES[r] = engine.get_balance(r)
 
-                self.ROLES_ACCOUNTS[r] = acc_list
-                self.ROLES_BALANCES[r] = sum(acc['balance'] for acc in acc_list)
-
-                if self.BY_PERIOD or self.BY_UNIT:
-                    for acc in acc_list:
-                        if self.BY_PERIOD:
-                            key = (acc['period_year'], acc['period_month'])
-                            self.ROLES_BALANCES_BY_PERIOD[key][r] = sum(acc['balance'] for acc in acc_list if all([
-                                acc['period_year'] == key[0],
-                                acc['period_month'] == key[1]]
-                            ))
-                        if self.BY_UNIT:
-                            key = (acc['unit_uuid'], acc['unit_name'])
-                            self.ROLES_BALANCES_BY_UNIT[key][r] = sum(
-                                acc['balance'] for acc in acc_list if acc['unit_uuid'] == key[0])
+                if self.BY_PERIOD:
+                    for key, balance in engine.get_balance_by_period(r).items():
+                        self.ROLES_BALANCES_BY_PERIOD[key][r] = balance
+                if self.BY_UNIT:
+                    for key, balance in engine.get_balance_by_unit(r).items():
+                        self.ROLES_BALANCES_BY_UNIT[key][r] = balance
 
 
 class AccountGroupIOMiddleware:
@@ -89,10 +261,12 @@ class AccountGroupIOMiddleware:
     def __init__(self,
                  io_data: dict,
                  by_period: bool = False,
-                 by_unit: bool = False):
+                 by_unit: bool = False,
+                 role_totals: Optional[List[Dict]] = None):
 
         self.BY_PERIOD = by_period
         self.BY_UNIT = by_unit
+        self.ROLE_TOTALS = role_totals
 
         self.IO_DIGEST = io_data
 
@@ -105,15 +279,15 @@ class AccountGroupIOMiddleware:
         self.GROUPS_BALANCES = dict()
 
         if self.BY_PERIOD:
-            self.GROUPS_BALANCES_BY_PERIOD = defaultdict(lambda: dict())
+            self.GROUPS_BALANCES_BY_PERIOD = defaultdict(dict)
             self.IO_DIGEST[self.GROUP_BALANCE_BY_PERIOD_KEY] = None
 
         if self.BY_UNIT:
-            self.GROUPS_BALANCES_BY_UNIT = defaultdict(lambda: dict())
+            self.GROUPS_BALANCES_BY_UNIT = defaultdict(dict)
             self.IO_DIGEST[self.GROUP_BALANCE_BY_UNIT_KEY] = None
 
         if self.BY_PERIOD and self.BY_UNIT:
-            self.GROUPS_BALANCES_BY_PERIOD_AND_UNIT = defaultdict(lambda: dict())
+            self.GROUPS_BALANCES_BY_PERIOD_AND_UNIT = defaultdict(dict)
             self.IO_DIGEST[self.GROUP_BALANCE_BY_PERIOD_KEY] = None
 
     def digest(self):
@@ -132,25 +306,24 @@ class AccountGroupIOMiddleware:
         return (acc for acc in self.DIGEST_ACCOUNTS if acc['role'] in getattr(mod, g))
 
     def process_groups(self):
+        engine = AccountAggregationEngine(
+            accounts=self.DIGEST_ACCOUNTS,
+            membership=get_group_membership_map(),
+            by_period=self.BY_PERIOD,
+            by_unit=self.BY_UNIT,
+            totals=self.ROLE_TOTALS
+        )
+
         for g in roles_module.ROLES_GROUPS:
-            acc_list = list(self.get_accounts_generator(roles_module, g))
-            self.GROUPS_ACCOUNTS[g] = acc_list
-            self.GROUPS_BALANCES[g] = sum(acc['balance'] for acc in acc_list)
-
-            if self.BY_PERIOD or self.BY_UNIT:
-                for acc in acc_list:
-                    if self.BY_PERIOD:
-                        key = (acc['period_year'], acc['period_month'])
-                        self.GROUPS_BALANCES_BY_PERIOD[key][g] = sum(
-                            acc['balance'] for acc in acc_list if all([
-                                acc['period_year'] == key[0],
-                                acc['period_month'] == key[1]]
-                            ))
-                    if self.BY_UNIT:
-                        key = (acc['unit_uuid'], acc['unit_name'])
-                        self.GROUPS_BALANCES_BY_UNIT[key][g] = sum(
-                            acc['balance'] for acc in acc_list if acc['unit_uuid'] == key[0]
-                        )
+            self.GROUPS_ACCOUNTS[g] = engine.get_accounts(g)
+            self.GROUPS_BALANCES[g] = engine.get_balance(g)
+
+            if self.BY_PERIOD:
+                for key, balance in engine.get_balance_by_period(g).items():
+                    self.GROUPS_BALANCES_BY_PERIOD[key][g] = balance
+            if self.BY_UNIT:
+                for key, balance in engine.get_balance_by_unit(g).items():
+                    self.GROUPS_BALANCES_BY_UNIT[key][g] = balance
 
 
 class JEActivityIOMiddleware:
@@ -172,13 +345,13 @@ class JEActivityIOMiddleware:
         self.ACTIVITY_BALANCES = dict()
 
         if self.BY_PERIOD:
-            self.ACTIVITY_BALANCES_BY_PERIOD = defaultdict(lambda: dict())
+            self.ACTIVITY_BALANCES_BY_PERIOD = defaultdict(dict)
             self.DIGEST['activity_balance_by_period'] = None
         if self.BY_UNIT:
-            self.ACTIVITY_BALANCES_BY_UNIT = defaultdict(lambda: dict())
+            self.ACTIVITY_BALANCES_BY_UNIT = defaultdict(dict)
             self.DIGEST['activity_balance_by_unit'] = None
         if self.BY_PERIOD and self.BY_UNIT:
-            self.ROLES_BALANCES_BY_PERIOD_AND_UNIT = defaultdict(lambda: dict())
+            self.ROLES_BALANCES_BY_PERIOD_AND_UNIT = defaultdict(dict)
 
     def digest(self):
 
@@ -196,23 +369,24 @@ class JEActivityIOMiddleware:
 
     def process_activity(self):
         JournalEntryModel = lazy_loader.get_journal_entry_model()
+        engine = AccountAggregationEngine(
+            accounts=self.ACCOUNTS,
+            membership={act: (act,) for act in JournalEntryModel.VALID_ACTIVITIES},
+            key='activity',
+            by_period=self.BY_PERIOD,
+            by_unit=self.BY_UNIT
+        )
+
         for act in JournalEntryModel.VALID_ACTIVITIES:
-            acc_list = list(self.get_accounts_generator(act))
-            self.ACTIVITY_ACCOUNTS[act] = acc_list
-            self.ACTIVITY_BALANCES[act] = sum(acc['balance'] for acc in acc_list)
-
-            if self.BY_PERIOD or self.BY_UNIT:
-                for acc in acc_list:
-                    if self.BY_PERIOD:
-                        key = (acc['period_year'], acc['period_month'])
-                        self.ACTIVITY_BALANCES_BY_PERIOD[key][act] = sum(acc['balance'] for acc in acc_list if all([
-                            acc['period_year'] == key[0],
-                            acc['period_month'] == key[1]]
-                        ))
-                    if self.BY_UNIT:
-                        key = (acc['unit_uuid'], acc['unit_name'])
-                        self.ACTIVITY_BALANCES_BY_UNIT[key][act] = sum(
-                            acc['balance'] for acc in acc_list if acc['unit_uuid'] == key[0])
+            self.ACTIVITY_ACCOUNTS[act] = engine.get_accounts(act)
+            self.ACTIVITY_BALANCES[act] = engine.get_balance(act)
+
+            if self.BY_PERIOD:
+                for key, balance in engine.get_balance_by_period(act).items():
+                    self.ACTIVITY_BALANCES_BY_PERIOD[key][act] = balance
+            if self.BY_UNIT:
+                for key, balance in engine.get_balance_by_unit(act).items():
+                    self.ACTIVITY_BALANCES_BY_UNIT[key][act] = balance
 
 
 class BalanceSheetIOMiddleware:
@@ -464,3 +638,92 @@ class CashFlowStatementIOMiddleware:
         self.net_income()
         self.net_cash()
         return self.IO_DATA
+
+
+class ComparativeStatementIOMiddleware:
+    """
+    Merges the statements of several IO states, one per column, into a single comparative statement.
+    The comparative statement mirrors the structure of the column statements. Every balance is replaced by a
+    comparative row holding the per-column balances, along with the deltas and percent changes against the base
+    column of each column. Account lists are merged by account UUID, so accounts missing from a column report a
+    zero balance for it.
+
+    Deltas and percent changes are computed against a fixed base column if provided, or against the preceding
+    column otherwise. Percent changes are fractions of the absolute base balance, as rendered by the percentage
+    template filter, and None if the base balance is zero.
+    """
+    COMPARATIVE_DIGEST_KEY = 'comparative_{statement_key}'
+    ACCOUNT_BALANCE_KEYS = ('balance', 'balance_abs')
+
+    def __init__(self,
+                 io_data: dict,
+                 columns_io_data: List[dict],
+                 statement_key: str,
+                 base_column: Optional[int] = None):
+        self.IO_DATA = io_data
+        self.COLUMNS_IO_DATA = columns_io_data
+        self.STATEMENT_KEY = statement_key
+        self.N_COLUMNS = len(columns_io_data)
+        if base_column is not None and not -self.N_COLUMNS <= base_column < self.N_COLUMNS:
+            raise ValidationError(f'Invalid base column {base_column} for {self.N_COLUMNS} columns.')
+        self.BASE_COLUMN = base_column % self.N_COLUMNS if base_column is not None else None
+
+    def get_base_index(self, index: int) -> Optional[int]:
+        base_index = index - 1 if self.BASE_COLUMN is None else self.BASE_COLUMN
+        if base_index < 0 or base_index == index:
+            return None
+        return base_index
+
+    def get_comparative_row(self, balances: list) -> dict:
+        deltas = list()
+        changes = list()
+        for i, balance in enumerate(balances):
+            base_index = self.get_base_index(i)
+            if base_index is None:
+                deltas.append(None)
+                changes.append(None)
+                continue
+            base_balance = balances[base_index]
+            delta = balance - base_balance
+            deltas.append(delta)
+            changes.append(delta / abs(base_balance) if base_balance else None)
+        return {
+            'balances': balances,
+            'deltas': deltas,
+            'changes': changes,
+        }
+
+    def merge_accounts(self, column_accounts: list) -> list:
+        accounts = dict()
+        for i, acc_list in enumerate(column_accounts):
+            for acc in acc_list or ():
+                if acc['account_uuid'] not in accounts:
+                    accounts[acc['account_uuid']] = {
+                        **{k: v for k, v in acc.items() if k not in self.ACCOUNT_BALANCE_KEYS},
+                        'balances': [0] * self.N_COLUMNS,
+                    }
+                accounts[acc['account_uuid']]['balances'][i] += acc['balance']
+
+        for acc in accounts.values():
+            acc.update(self.get_comparative_row(acc['balances']))
+        return list(accounts.values())
+
+    def merge(self, column_values: list):
+        value = next((v for v in column_values if v is not None), None)
+        if isinstance(value, dict):
+            keys = dict.fromkeys(chain.from_iterable(v for v in column_values if v))
+            return {
+                k: self.merge([v.get(k) if v else None for v in column_values]) for k in keys
+            }
+        if isinstance(value, list):
+            return self.merge_accounts(column_values)
+        if isinstance(value, bool) or not isinstance(value, (int, float, Decimal)):
+            return value
+        return self.get_comparative_row([v or 0 for v in column_values])
+
+    def digest(self):
+        statements = [io_data.get(self.STATEMENT_KEY) for io_data in self.COLUMNS_IO_DATA]
+        if statements and all(s is not None for s in statements):
+            comparative_key = self.COMPARATIVE_DIGEST_KEY.format(statement_key=self.STATEMENT_KEY)
+            self.IO_DATA[comparative_key] = self.merge(statements)
+        return self.IO_DATA
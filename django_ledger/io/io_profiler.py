@@ -0,0 +1,121 @@
+"""
+Django Ledger created by Miguel Sanda <msanda@arrobalytics.com>.
+Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
+
+The IO digest profiler records the wall time, SQL query count, SQL query time and row counts of every stage of
+IOMixIn.digest(): the database aggregation, the python grouping, the role/group/activity middleware, the
+financial ratios and the financial statements.
+
+Profiling is opt-in, enabled by the DJANGO_LEDGER_PROFILE_DIGEST setting or the digest(profile=True) argument.
+Results are attached to the IOResult, logged and sent through the io_digest_profiled signal, so they can be
+forwarded to an APM.
+"""
+import logging
+from contextlib import ExitStack, contextmanager, nullcontext
+from time import perf_counter
+from typing import Dict, Optional
+
+from django.db import connections
+from django.dispatch import Signal
+
+logger = logging.getLogger(__name__)
+
+# sent with the io_model and profile arguments once a profiled digest completes...
+io_digest_profiled = Signal()
+
+
+class IODigestProfiler:
+    """
+    Collects per-stage instrumentation of an IO digest. Does nothing unless enabled.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.ENABLED = enabled
+        self.STAGES: Dict[str, Dict] = dict()
+
+    def get_stage_data(self, name: str) -> Dict:
+        if name not in self.STAGES:
+            self.STAGES[name] = {
+                'wall_time': 0.0,
+                'query_count': 0,
+                'query_time': 0.0,
+                'rows': None,
+            }
+        return self.STAGES[name]
+
+    def stage(self, name: str):
+        """
+        Context manager measuring the wall time and the SQL queries executed within the stage. Queries are
+        counted on every configured database alias, so digests read from a replica are instrumented too.
+
+        Parameters
+        ----------
+        name: str
+            The stage name.
+        """
+        if not self.ENABLED:
+            return nullcontext()
+        return self.profile_stage(name)
+
+    @contextmanager
+    def profile_stage(self, name: str):
+        stage_data = self.get_stage_data(name)
+
+        def query_wrapper(execute, sql, params, many, context):
+            start = perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                stage_data['query_count'] += 1
+                stage_data['query_time'] += perf_counter() - start
+
+        start = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for conn in connections.all():
+                    stack.enter_context(conn.execute_wrapper(query_wrapper))
+                yield stage_data
+        finally:
+            stage_data['wall_time'] += perf_counter() - start
+
+    def set_rows(self, name: str, rows: int):
+        if self.ENABLED:
+            self.get_stage_data(name)['rows'] = rows
+
+    def get_profile(self) -> Optional[Dict]:
+        """
+        Returns the collected stages and their totals, or None if profiling is not enabled.
+        """
+        if not self.ENABLED:
+            return
+        return {
+            'stages': self.STAGES,
+            'wall_time': sum(s['wall_time'] for s in self.STAGES.values()),
+            'query_count': sum(s['query_count'] for s in self.STAGES.values()),
+            'query_time': sum(s['query_time'] for s in self.STAGES.values()),
+        }
+
+    def emit(self, io_model):
+        """
+        Logs the collected profile and sends the io_digest_profiled signal.
+        """
+        profile = self.get_profile()
+        if profile is None:
+            return
+
+        logger.info(
+            'IO digest %s: %.4fs, %d queries (%.4fs). %s',
+            io_model,
+            profile['wall_time'],
+            profile['query_count'],
+            profile['query_time'],
+            ', '.join(
+                f'{name}: {s["wall_time"]:.4f}s/{s["query_count"]}q/{s["rows"]} rows'
+                for name, s in self.STAGES.items()
+            ),
+        )
+        io_digest_profiled.send_robust(
+            sender=io_model.__class__,
+            io_model=io_model,
+            profile=profile,
+        )
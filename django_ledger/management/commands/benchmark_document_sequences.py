@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import perf_counter, sleep
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from django_ledger.models import EntityModel, EntityStateModel
+from django_ledger.models.sequences import document_sequence_pool
+
+BENCHMARK_KEY = 'benchmark'
+
+
+def run_sequence_writers(entity_model_id,
+                         writers: int,
+                         documents: int,
+                         block_size: int,
+                         hold: float = 0.0) -> tuple:
+    """
+    Runs parallel writers, each allocating one sequence value per document in its own transaction. The transaction is
+    held open for the given number of seconds after the allocation, emulating the rest of the document work.
+
+    Returns
+    -------
+    tuple
+        The elapsed time in seconds and the list of all the allocated values.
+    """
+    barrier = Barrier(writers)
+
+    def writer() -> list:
+        values = list()
+        try:
+            barrier.wait()
+            for _ in range(documents):
+                with transaction.atomic():
+                    sequences = None
+                    while not sequences:
+                        sequences = EntityStateModel.objects.reserve_sequence(
+                            entity_model_id=entity_model_id,
+                            key=BENCHMARK_KEY,
+                            block_size=block_size,
+                            raise_exception=False
+                        )
+                    values.extend(sequences)
+                    if hold:
+                        sleep(hold)
+        finally:
+            connections.close_all()
+        return values
+
+    with ThreadPoolExecutor(max_workers=writers) as executor:
+        start = perf_counter()
+        futures = [executor.submit(writer) for _ in range(writers)]
+        values = [v for f in futures for v in f.result()]
+        elapsed = perf_counter() - start
+    return elapsed, values
+
+
+class Command(BaseCommand):
+    help = ('Benchmarks document sequence allocation under contention, with single value and block (hi-lo) '
+            'allocation. Meant to be run against a database supporting concurrent writers, such as PostgreSQL.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entity', type=str, default=None, help='EntityModel slug. Defaults to the first one.')
+        parser.add_argument('--writers', type=int, default=8)
+        parser.add_argument('--documents', type=int, default=50, help='Documents allocated by each writer.')
+        parser.add_argument('--block-sizes', type=int, nargs='+', default=[1, 10, 50])
+        parser.add_argument('--hold-ms', type=float, default=5.0,
+                            help='Milliseconds each document transaction is held open after the allocation.')
+
+    def cleanup(self, entity_model):
+        EntityStateModel.objects.filter(entity_model_id=entity_model.uuid, key=BENCHMARK_KEY).delete()
+        document_sequence_pool.clear()
+
+    def handle(self, *args, **options):
+        entity_qs = EntityModel.objects.all()
+        if options['entity']:
+            entity_qs = entity_qs.filter(slug__exact=options['entity'])
+        entity_model = entity_qs.first()
+        if not entity_model:
+            raise CommandError('EntityModel not found.')
+
+        writers = options['writers']
+        documents = options['documents']
+        self.stdout.write(f'Entity: {entity_model.slug} | writers: {writers} | documents per writer: {documents}')
+
+        try:
+            for block_size in options['block_sizes']:
+                self.cleanup(entity_model)
+                elapsed, values = run_sequence_writers(
+                    entity_model_id=entity_model.uuid,
+                    writers=writers,
+                    documents=documents,
+                    block_size=block_size,
+                    hold=options['hold_ms'] / 1000
+                )
+                if len(set(values)) != len(values):
+                    raise CommandError(f'Duplicated sequence values allocated with block size {block_size}.')
+                self.stdout.write(self.style.SUCCESS(
+                    f'Block size {block_size}: {elapsed:.3f}s | {len(values) / max(elapsed, 1e-9):.1f} docs/s | '
+                    f'gaps {max(values) - len(values)}'
+                ))
+        finally:
+            self.cleanup(entity_model)
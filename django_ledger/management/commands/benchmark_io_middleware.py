@@ -0,0 +1,75 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_ledger.io.io_benchmark import (
+    as_ordered_items,
+    generate_digest_accounts,
+    legacy_bucket_aggregation,
+    legacy_group_buckets,
+    legacy_role_buckets,
+)
+from django_ledger.io.io_middleware import AccountGroupIOMiddleware, AccountRoleIOMiddleware
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks the IO role and group middleware against the legacy per-role account scan.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--units', type=int, default=5)
+        parser.add_argument('--periods', type=int, default=24)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--skip-groups', action='store_true', default=False)
+
+    def benchmark(self, name, middleware_class, legacy_buckets, result_keys, accounts):
+        start = perf_counter()
+        legacy_result = legacy_bucket_aggregation(accounts, legacy_buckets, by_period=True, by_unit=True)
+        legacy_time = perf_counter() - start
+
+        start = perf_counter()
+        io_data = middleware_class(
+            io_data={'accounts': accounts},
+            by_period=True,
+            by_unit=True
+        ).digest()
+        engine_time = perf_counter() - start
+
+        if as_ordered_items([io_data[k] for k in result_keys]) != as_ordered_items(legacy_result):
+            raise CommandError(f'{name} middleware results do not match the legacy implementation.')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{name}: legacy {legacy_time:.3f}s | single-pass {engine_time:.3f}s | '
+            f'speedup {legacy_time / max(engine_time, 1e-9):.1f}x'
+        ))
+
+    def handle(self, *args, **options):
+        accounts = generate_digest_accounts(
+            rows=options['rows'],
+            units=options['units'],
+            periods=options['periods'],
+            seed=options['seed']
+        )
+        self.stdout.write(f'Digest rows: {len(accounts)}')
+
+        self.benchmark(
+            name='Roles',
+            middleware_class=AccountRoleIOMiddleware,
+            legacy_buckets=legacy_role_buckets(),
+            result_keys=['role_account', 'role_balance', 'role_balance_by_period', 'role_balance_by_unit'],
+            accounts=accounts
+        )
+
+        if not options['skip_groups']:
+            self.benchmark(
+                name='Groups',
+                middleware_class=AccountGroupIOMiddleware,
+                legacy_buckets=legacy_group_buckets(),
+                result_keys=[
+                    AccountGroupIOMiddleware.GROUP_ACCOUNTS_KEY,
+                    AccountGroupIOMiddleware.GROUP_BALANCE_KEY,
+                    AccountGroupIOMiddleware.GROUP_BALANCE_BY_PERIOD_KEY,
+                    AccountGroupIOMiddleware.GROUP_BALANCE_BY_UNIT_KEY,
+                ],
+                accounts=accounts
+            )
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_ledger.models import AccountBalanceSnapshotModel, EntityModel
+
+
+class Command(BaseCommand):
+    help = 'Compares the monthly account balance snapshots against the raw aggregation of posted transactions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entity', type=str, nargs='*', default=None,
+                            help='Entity slugs to check. Checks all entities if not provided.')
+        parser.add_argument('--rebuild', action='store_true', default=False,
+                            help='Rebuilds the snapshots of inconsistent entities.')
+
+    def handle(self, *args, **options):
+        entity_qs = EntityModel.objects.all()
+        if options['entity']:
+            entity_qs = entity_qs.filter(slug__in=options['entity'])
+
+        inconsistent_entities = list()
+        for entity_model in entity_qs:
+            inconsistencies = AccountBalanceSnapshotModel.objects.check_consistency(entity_model=entity_model)
+            if not inconsistencies:
+                self.stdout.write(self.style.SUCCESS(f'{entity_model.slug}: balance snapshots are consistent.'))
+                continue
+
+            for i in inconsistencies:
+                self.stdout.write(self.style.WARNING(
+                    f'{entity_model.slug}: {i["period"]:%Y-%m} | ledger {i["ledger_uuid"]} | '
+                    f'account {i["account_uuid"]} | unit {i["unit_uuid"]} | {i["activity"]} | {i["tx_type"]} | '
+                    f'snapshot {i["snapshot_balance"]} != raw {i["raw_balance"]}'
+                ))
+
+            if options['rebuild']:
+                AccountBalanceSnapshotModel.objects.rebuild(entity_model=entity_model)
+                self.stdout.write(self.style.SUCCESS(f'{entity_model.slug}: balance snapshots rebuilt.'))
+            else:
+                inconsistent_entities.append(entity_model.slug)
+
+        if inconsistent_entities:
+            raise CommandError(
+                f'Inconsistent balance snapshots found for entities: {", ".join(inconsistent_entities)}'
+            )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from django_ledger.models import AccountBalanceSnapshotModel, EntityModel
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the monthly account balance snapshots from the posted transactions of each entity'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entity', type=str, nargs='*', default=None,
+                            help='Entity slugs to rebuild. Rebuilds all entities if not provided.')
+
+    def handle(self, *args, **options):
+        entity_qs = EntityModel.objects.all()
+        if options['entity']:
+            entity_qs = entity_qs.filter(slug__in=options['entity'])
+
+        for entity_model in entity_qs:
+            snapshot_list = AccountBalanceSnapshotModel.objects.rebuild(entity_model=entity_model)
+            self.stdout.write(self.style.SUCCESS(
+                f'{entity_model.slug}: {len(snapshot_list)} balance snapshots rebuilt.'
+            ))
@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from django_ledger.models import ClosingEntryModel, EntityModel
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the closing entries made stale by changes to an earlier closing entry of the same entity'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entity', type=str, nargs='*', default=None,
+                            help='Entity slugs to recompute. Recomputes all entities if not provided.')
+        parser.add_argument('--workers', type=int, default=1,
+                            help='Number of entities recomputed concurrently. Defaults to 1.')
+        parser.add_argument('--verify', action='store_true', default=None,
+                            help='Verifies each recomputed closing entry against a full aggregation.')
+        parser.add_argument('--dry-run', action='store_true', default=False,
+                            help='Only lists the stale closing entries.')
+
+    def handle(self, *args, **options):
+        entity_qs = EntityModel.objects.all()
+        if options['entity']:
+            entity_qs = entity_qs.filter(slug__in=options['entity'])
+        entity_slugs = dict(entity_qs.values_list('uuid', 'slug'))
+
+        if options['dry_run']:
+            stale_qs = ClosingEntryModel.objects.filter(
+                entity_model__in=entity_qs
+            ).stale().order_by('entity_model__slug', 'closing_date')
+            for ce_model in stale_qs.select_related('entity_model'):
+                self.stdout.write(f'{ce_model.entity_model.slug}: {ce_model.closing_date}')
+            return
+
+        executor = None
+        if options['workers'] > 1:
+            executor = ThreadPoolExecutor(max_workers=options['workers'])
+
+        try:
+            ce_recomputed = ClosingEntryModel.objects.recompute_stale(
+                entity_model_qs=entity_qs,
+                executor=executor,
+                verify=options['verify'],
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        for entity_uuid, ce_list in ce_recomputed.items():
+            self.stdout.write(self.style.SUCCESS(
+                f'{entity_slugs[entity_uuid]}: {len(ce_list)} closing entries recomputed.'
+            ))
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:44
+
+import django.db.models.deletion
+import uuid
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_ledger', '0029_stagedtransactionmodel_matched_transaction_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountBalanceSnapshotModel',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True, null=True)),
+                ('uuid', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('activity', models.CharField(blank=True, choices=[('Operating', [('op', 'Operating')]), ('Investing', [('inv_ppe', 'Purchase/Disposition of PPE'), ('inv_securities', 'Purchase/Disposition of Securities'), ('inv', 'Investing Activity Other')]), ('Financing', [('fin_std', 'Payoff of Short Term Debt'), ('fin_ltd', 'Payoff of Long Term Debt'), ('fin_equity', 'Issuance of Common Stock, Preferred Stock or Capital Contribution'), ('fin_dividends', 'Dividends or Distributions to Shareholders'), ('fin', 'Financing Activity Other')])], max_length=20, null=True, verbose_name='Activity')),
+                ('tx_type', models.CharField(choices=[('credit', 'Credit'), ('debit', 'Debit')], max_length=10, verbose_name='Transaction Type')),
+                ('period', models.DateField(verbose_name='Period')),
+                ('balance', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=20, verbose_name='Snapshot Balance')),
+                ('account_model', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='django_ledger.accountmodel', verbose_name='Account Model')),
+                ('entity_model', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='django_ledger.entitymodel', verbose_name='Entity Model')),
+                ('ledger_model', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='django_ledger.ledgermodel', verbose_name='Ledger Model')),
+                ('unit_model', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='django_ledger.entityunitmodel', verbose_name='Entity Unit Model')),
+            ],
+            options={
+                'verbose_name': 'Account Balance Snapshot',
+                'verbose_name_plural': 'Account Balance Snapshots',
+                'ordering': ['-period'],
+                'abstract': False,
+                'indexes': [models.Index(fields=['entity_model', 'period'], name='django_ledg_entity__1413a0_idx'), models.Index(fields=['ledger_model', 'period'], name='django_ledg_ledger__f5dc71_idx'), models.Index(fields=['account_model', 'period'], name='django_ledg_account_2def4f_idx'), models.Index(fields=['entity_model', 'ledger_model', 'account_model', 'unit_model', 'activity', 'tx_type', 'period'], name='django_ledg_entity__0ade57_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_transaction_denormalized_fields(apps, schema_editor):
+    TransactionModel = apps.get_model('django_ledger', 'TransactionModel')
+    JournalEntryModel = apps.get_model('django_ledger', 'JournalEntryModel')
+    je_qs = JournalEntryModel.objects.filter(uuid=OuterRef('journal_entry_id'))
+    TransactionModel.objects.update(
+        entity_id=Subquery(je_qs.values('ledger__entity_id')[:1]),
+        ledger_id=Subquery(je_qs.values('ledger_id')[:1]),
+        je_timestamp=Subquery(je_qs.values('timestamp')[:1]),
+        je_posted=Subquery(je_qs.values('posted')[:1]),
+        ledger_posted=Subquery(je_qs.values('ledger__posted')[:1]),
+        is_closing_entry=Subquery(je_qs.values('is_closing_entry')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_ledger', '0030_accountbalancesnapshotmodel'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transactionmodel',
+            name='entity',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='django_ledger.entitymodel', verbose_name='Entity'),
+        ),
+        migrations.AddField(
+            model_name='transactionmodel',
+            name='is_closing_entry',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Is Closing Entry'),
+        ),
+        migrations.AddField(
+            model_name='transactionmodel',
+            name='je_posted',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Journal Entry Posted'),
+        ),
+        migrations.AddField(
+            model_name='transactionmodel',
+            name='je_timestamp',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Journal Entry Timestamp'),
+        ),
+        migrations.AddField(
+            model_name='transactionmodel',
+            name='ledger',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='django_ledger.ledgermodel', verbose_name='Ledger'),
+        ),
+        migrations.AddField(
+            model_name='transactionmodel',
+            name='ledger_posted',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Ledger Posted'),
+        ),
+        migrations.RunPython(
+            code=backfill_transaction_denormalized_fields,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddIndex(
+            model_name='transactionmodel',
+            index=models.Index(fields=['entity', 'account', 'je_timestamp'], name='django_ledg_entity__0a0945_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transactionmodel',
+            index=models.Index(fields=['entity', 'is_closing_entry', 'je_timestamp'], name='django_ledg_entity__c17511_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transactionmodel',
+            index=models.Index(fields=['ledger', 'je_timestamp'], name='django_ledg_ledger__f957a7_idx'),
+        ),
+    ]
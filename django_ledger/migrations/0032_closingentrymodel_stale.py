@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_ledger', '0031_transactionmodel_denormalized_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='closingentrymodel',
+            name='stale',
+            field=models.BooleanField(default=False, verbose_name='Is Stale'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:33
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+SNAPSHOT_KEY = ('entity_model', 'ledger_model', 'account_model', 'unit_model', 'activity', 'tx_type', 'period')
+
+
+def merge_duplicate_snapshots(apps, schema_editor):
+    # concurrent postings may have created the same snapshot more than once...
+    AccountBalanceSnapshotModel = apps.get_model('django_ledger', 'AccountBalanceSnapshotModel')
+    duplicates = AccountBalanceSnapshotModel.objects.values(*SNAPSHOT_KEY).annotate(
+        snapshot_count=Count('uuid'),
+        snapshot_balance=Sum('balance')
+    ).filter(snapshot_count__gt=1)
+    for duplicate in duplicates:
+        snapshot_qs = AccountBalanceSnapshotModel.objects.filter(**{k: duplicate[k] for k in SNAPSHOT_KEY})
+        snapshot_uuid = snapshot_qs.values_list('uuid', flat=True).first()
+        snapshot_qs.exclude(uuid=snapshot_uuid).delete()
+        snapshot_qs.filter(uuid=snapshot_uuid).update(balance=duplicate['snapshot_balance'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_ledger', '0032_closingentrymodel_stale'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_snapshots, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='accountbalancesnapshotmodel',
+            name='django_ledg_entity__0ade57_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='accountbalancesnapshotmodel',
+            constraint=models.UniqueConstraint(fields=('entity_model', 'ledger_model', 'account_model', 'unit_model', 'activity', 'tx_type', 'period'), name='unique_account_balance_snapshot', violation_error_message='Only one Account Balance Snapshot per key and period allowed.'),
+        ),
+    ]
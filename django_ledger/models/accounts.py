@@ -53,15 +53,16 @@ from random import randint
 from typing import Union, List, Optional
 from uuid import uuid4, UUID
 
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import models
 from django.db.models import Q, F, UniqueConstraint
-from django.db.models.signals import pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from treebeard.mp_tree import MP_Node, MP_NodeManager, MP_NodeQuerySet
 
 from django_ledger.io import DEBIT, CREDIT
+from django_ledger.io.io_account_cache import bump_account_metadata_version, is_account_metadata_cache_enabled
 from django_ledger.io.roles import (
     ACCOUNT_ROLE_CHOICES, BS_ROLES, GROUP_INVOICE, GROUP_BILL, validate_roles,
     GROUP_ASSETS, GROUP_LIABILITIES, GROUP_CAPITAL, GROUP_INCOME, GROUP_EXPENSES, GROUP_COGS,
@@ -1151,3 +1152,18 @@ def accountmodel_presave(instance: AccountModel, **kwargs):
 
 
 pre_save.connect(receiver=accountmodel_presave, sender=AccountModel)
+
+
+def accountmodel_postsave(instance: AccountModel, **kwargs):
+    # cached digest account metadata must reflect the new code, name, role and balance type...
+    if is_account_metadata_cache_enabled():
+        try:
+            entity_uuid = instance.coa_model.entity_id
+        except ObjectDoesNotExist:
+            # deleted along with its chart of accounts...
+            return
+        bump_account_metadata_version(entity_uuid=entity_uuid)
+
+
+post_save.connect(receiver=accountmodel_postsave, sender=AccountModel)
+post_delete.connect(receiver=accountmodel_postsave, sender=AccountModel)
@@ -15,9 +15,9 @@ from typing import Union, Optional, Tuple, Dict, List
 from uuid import uuid4, UUID
 
 from django.contrib.auth import get_user_model
-from django.core.exceptions import ValidationError, ObjectDoesNotExist
-from django.db import models, transaction, IntegrityError
-from django.db.models import Q, Sum, F, Count, QuerySet, Manager
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import Q, Sum, Count, QuerySet, Manager
 from django.db.models.signals import pre_save
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
@@ -1873,39 +1873,12 @@ class BillModelAbstract(
         EntityModel = lazy_loader.get_entity_model()
         entity_model = EntityModel.objects.get(uuid__exact=self.ledger.entity_id)
         fy_key = entity_model.get_fy_for_date(dt=self.date_draft)
-
-        try:
-            LOOKUP = {
-                'entity_model_id__exact': self.ledger.entity_id,
-                'entity_unit_id__exact': None,
-                'fiscal_year': fy_key,
-                'key__exact': EntityStateModel.KEY_BILL,
-            }
-
-            state_model_qs = (
-                EntityStateModel.objects.filter(**LOOKUP)
-                .select_related('entity_model')
-                .select_for_update()
-            )
-            state_model = state_model_qs.get()
-            state_model.sequence = F('sequence') + 1
-            state_model.save(update_fields=['sequence'])
-            state_model.refresh_from_db()
-            return state_model
-        except ObjectDoesNotExist:
-            LOOKUP = {
-                'entity_model_id': entity_model.uuid,
-                'entity_unit_id': None,
-                'fiscal_year': fy_key,
-                'key': EntityStateModel.KEY_BILL,
-                'sequence': 1,
-            }
-
-            state_model = EntityStateModel.objects.create(**LOOKUP)
-            return state_model
-        except IntegrityError as e:
-            if raise_exception:
-                raise e
+        return EntityStateModel.objects.get_next_state_model(
+            entity_model_id=self.ledger.entity_id,
+            fiscal_year=fy_key,
+            key=EntityStateModel.KEY_BILL,
+            raise_exception=raise_exception
+        )
 
     def generate_bill_number(self, commit: bool = False) -> str:
         """
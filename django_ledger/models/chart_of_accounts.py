@@ -66,6 +66,7 @@ from django_ledger.io import (
     ROOT_INCOME,
     ROOT_LIABILITIES,
 )
+from django_ledger.io.io_account_cache import bump_account_metadata_version
 from django_ledger.models import lazy_loader
 from django_ledger.models.accounts import AccountModel, AccountModelQuerySet
 from django_ledger.models.deprecations import deprecated_entity_slug_behavior
@@ -886,3 +887,5 @@ def chartofaccountsmodel_presave(instance: ChartOfAccountModelAbstract, **kwargs
 def chartofaccountsmodel_postsave(instance: ChartOfAccountModelAbstract, **kwargs):
     if not instance.is_configured():
         instance.configure()
+    # the chart of accounts slug is part of the cached digest account metadata...
+    bump_account_metadata_version(entity_uuid=instance.entity_id)
@@ -3,21 +3,24 @@ Django Ledger created by Miguel Sanda <msanda@arrobalytics.com>.
 Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
 """
 import warnings
+from concurrent.futures import Executor
 from datetime import datetime, time, date
 from decimal import Decimal
-from itertools import groupby, chain
-from typing import Optional
+from itertools import groupby
+from threading import current_thread
+from typing import Dict, List, Optional
 from uuid import uuid4, UUID
 
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import connections, models
 from django.db.models import Q, Manager, QuerySet, Count
 from django.db.models.signals import pre_save
 from django.urls import reverse
 from django.utils.timezone import make_aware
 from django.utils.translation import gettext_lazy as _
 
+from django_ledger.io.io_cache import bump_digest_version
 from django_ledger.models import EntityModel, deprecated_entity_slug_behavior, lazy_loader
 from django_ledger.models.journal_entry import JournalEntryModel
 from django_ledger.models.ledger import LedgerModel
@@ -46,6 +49,12 @@ class ClosingEntryModelQuerySet(QuerySet):
     def not_posted(self) -> 'ClosingEntryModelQuerySet':
         return self.filter(posted=False)
 
+    def stale(self) -> 'ClosingEntryModelQuerySet':
+        return self.filter(stale=True)
+
+    def not_stale(self) -> 'ClosingEntryModelQuerySet':
+        return self.filter(stale=False)
+
 
 class ClosingEntryModelManager(Manager):
 
@@ -82,6 +91,56 @@ class ClosingEntryModelManager(Manager):
             )
         return qs
 
+    def recompute_stale(
+        self,
+        entity_model_qs: Optional[QuerySet] = None,
+        executor: Optional[Executor] = None,
+        verify: Optional[bool] = None,
+    ) -> Dict[UUID, List['ClosingEntryModel']]:
+        """
+        Recomputes the stale closing entries of every EntityModel that has any. The closing entries of each
+        EntityModel depend on each other and are recomputed in order by a single task, while different
+        EntityModels may be recomputed concurrently.
+
+        Parameters
+        ----------
+        entity_model_qs: EntityModelQuerySet
+            Limits the recomputation to the EntityModels of the QuerySet. Defaults to all EntityModels.
+        executor: Executor
+            An optional concurrent.futures Executor, such as a local ThreadPoolExecutor, to run the tasks.
+            Tasks are run sequentially in the current thread if not provided.
+        verify: bool
+            Whether to verify each recomputed closing entry against a full aggregation.
+
+        Returns
+        -------
+        dict
+            The recomputed ClosingEntryModels, in ascending closing date order, by EntityModel UUID.
+        """
+        if entity_model_qs is None:
+            entity_model_qs = lazy_loader.get_entity_model().objects.all()
+        entity_model_list = list(
+            entity_model_qs.filter(
+                uuid__in=self.get_queryset().stale().values('entity_model_id')
+            )
+        )
+
+        caller_thread = current_thread()
+
+        def recompute_entity(entity_model: EntityModel) -> List['ClosingEntryModel']:
+            try:
+                return entity_model.recompute_stale_closing_entries(verify=verify)
+            finally:
+                # worker threads open their own database connections...
+                if current_thread() is not caller_thread:
+                    connections.close_all()
+
+        if executor is None:
+            return {e.uuid: recompute_entity(e) for e in entity_model_list}
+
+        futures = {e.uuid: executor.submit(recompute_entity, e) for e in entity_model_list}
+        return {entity_uuid: f.result() for entity_uuid, f in futures.items()}
+
 
 class ClosingEntryModelAbstract(CreateUpdateMixIn, MarkdownNotesMixIn):
     uuid = models.UUIDField(default=uuid4, editable=False, primary_key=True)
@@ -91,6 +150,7 @@ class ClosingEntryModelAbstract(CreateUpdateMixIn, MarkdownNotesMixIn):
     ledger_model = models.OneToOneField('django_ledger.LedgerModel', on_delete=models.CASCADE)
     closing_date = models.DateField(verbose_name=_('Closing Date'))
     posted = models.BooleanField(default=False, verbose_name=_('Is Posted'))
+    stale = models.BooleanField(default=False, verbose_name=_('Is Stale'))
     objects = ClosingEntryModelManager.from_queryset(queryset_class=ClosingEntryModelQuerySet)()
 
     class Meta:
@@ -119,6 +179,25 @@ class ClosingEntryModelAbstract(CreateUpdateMixIn, MarkdownNotesMixIn):
     def is_posted(self) -> bool:
         return self.posted is True
 
+    def is_stale(self) -> bool:
+        return self.stale is True
+
+    def mark_later_closing_entries_as_stale(self) -> int:
+        """
+        Flags every later closing entry of the EntityModel as stale, since their balances depend on this one.
+        Stale closing entries are excluded from the EntityModel closing entry dates meta, so the caller must
+        update it once done.
+
+        Returns
+        -------
+        int
+            The number of closing entries flagged as stale.
+        """
+        return self.__class__.objects.filter(
+            entity_model_id=self.entity_model_id,
+            closing_date__gt=self.closing_date
+        ).update(stale=True)
+
     def get_closing_date_as_timestamp(self):
         return make_aware(datetime.combine(self.closing_date, time.max))
 
@@ -183,26 +262,31 @@ class ClosingEntryModelAbstract(CreateUpdateMixIn, MarkdownNotesMixIn):
             ] for (unit_model_id, activity), je_txs in ce_txs_gb.items()
         }
 
-        JournalEntryModel.objects.bulk_create(objs=chain([l for _, l in ce_txs_journal_entries.items()]))
-        TransactionModel.objects.bulk_create(objs=chain.from_iterable([l for _, l in ce_je_txs.items()]))
+        # verified in memory against the accounts already selected, prior to any database write...
+        for k, je_model in ce_txs_journal_entries.items():
+            je_model.verify(txs_qs=ce_je_txs[k])
 
         for k, je_model in ce_txs_journal_entries.items():
-            je_model.save(verify=True)
+            je_model.save_with_transactions(ce_je_txs[k])
 
         self.ledger_model.lock(commit=True, raise_exception=True)
 
         return ce_txs_journal_entries, ce_je_txs
 
+    def get_entry_ledger_model(self) -> LedgerModel:
+        ledger_model = LedgerModel(
+            name=f'Closing Entry {self.closing_date} Ledger',
+            entity_id=self.entity_model_id,
+            hidden=True,
+            locked=False,
+            posted=True
+        )
+        ledger_model.clean()
+        return ledger_model
+
     def create_entry_ledger(self, commit: bool = False):
         if self.ledger_model_id is None:
-            ledger_model = LedgerModel(
-                name=f'Closing Entry {self.closing_date} Ledger',
-                entity_id=self.entity_model_id,
-                hidden=True,
-                locked=False,
-                posted=True
-            )
-            ledger_model.clean()
+            ledger_model = self.get_entry_ledger_model()
             ledger_model.save()
             self.ledger_model = ledger_model
 
@@ -233,6 +317,8 @@ class ClosingEntryModelAbstract(CreateUpdateMixIn, MarkdownNotesMixIn):
                 ])
             if update_entity_meta:
                 self.entity_model.save_closing_entry_dates_meta(commit=True)
+        self.entity_model.delete_closing_entry_cache_for_date(closing_date=self.closing_date)
+        bump_digest_version(self.entity_model_id)
 
     def get_mark_as_posted_html_id(self) -> str:
         return f'closing_entry_post_{self.uuid}'
@@ -268,7 +354,10 @@ class ClosingEntryModelAbstract(CreateUpdateMixIn, MarkdownNotesMixIn):
         ).for_ledger(ledger_model=self.ledger_model).delete()
 
         self.ledger_model.journal_entries.all().delete()
+        self.entity_model.delete_closing_entry_cache_for_date(closing_date=self.closing_date)
+        bump_digest_version(self.entity_model_id)
         if commit:
+            self.mark_later_closing_entries_as_stale()
             self.save(
                 update_fields=[
                     'posted',
@@ -308,6 +397,8 @@ class ClosingEntryModelAbstract(CreateUpdateMixIn, MarkdownNotesMixIn):
             force_update=force_update,
             post_closing_entry=post_closing_entry
         )
+        if self.mark_later_closing_entries_as_stale():
+            entity_model.save_closing_entry_dates_meta(commit=True)
 
     def get_update_transactions_html_id(self) -> str:
         return f'closing_entry_update_txs_{self.uuid}'
@@ -336,6 +427,8 @@ class ClosingEntryModelAbstract(CreateUpdateMixIn, MarkdownNotesMixIn):
             )
 
         self.ledger_model.unpost(commit=True, raise_exception=True)
+        if self.mark_later_closing_entries_as_stale():
+            self.entity_model.save_closing_entry_dates_meta(commit=True)
 
         TransactionModel.objects.for_entity(
             entity_model=self.entity_model_id
@@ -409,7 +502,7 @@ class ClosingEntryTransactionModelManager(Manager):
     @deprecated_entity_slug_behavior
     def for_entity(self, entity_model: EntityModel | str | UUID = None,
                    **kwargs) -> ClosingEntryTransactionModelQuerySet:
-        EntityModel = lazy_loader.get_entity(entity_model)
+        EntityModel = lazy_loader.get_entity_model()
 
         qs = self.get_queryset()
 
@@ -428,7 +521,7 @@ class ClosingEntryTransactionModelManager(Manager):
         elif isinstance(entity_model, UUID):
             qs = qs.filter(closing_entry_model__entity_model_id=entity_model)
         elif isinstance(entity_model, str):
-            qs = qs.filter(closing_entry_model__slug__exact=entity_model)
+            qs = qs.filter(closing_entry_model__entity_model__slug__exact=entity_model)
         else:
             raise ClosingEntryValidationError(
                 message=_('Must pass EntityModel or UUID or str')
@@ -10,8 +10,8 @@ import os
 import warnings
 from uuid import UUID, uuid4
 
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db import IntegrityError, models, transaction
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
 from django.db.models import F, Manager, Q, QuerySet
 from django.urls import reverse
 from django.utils.text import slugify
@@ -292,33 +292,11 @@ class CustomerModelAbstract(ContactInfoMixIn, TaxCollectionMixIn, CreateUpdateMi
             The EntityStateModel associated with the CustomerModel number sequence.
         """
         EntityStateModel = lazy_loader.get_entity_state_model()
-
-        try:
-            LOOKUP = {
-                'entity_model_id__exact': self.entity_model_id,
-                'key__exact': EntityStateModel.KEY_CUSTOMER,
-            }
-
-            state_model_qs = EntityStateModel.objects.filter(**LOOKUP).select_for_update()
-            state_model = state_model_qs.get()
-            state_model.sequence = F('sequence') + 1
-            state_model.save()
-            state_model.refresh_from_db()
-
-            return state_model
-        except ObjectDoesNotExist:
-            LOOKUP = {
-                'entity_model_id': self.entity_model_id,
-                'entity_unit_id': None,
-                'fiscal_year': None,
-                'key': EntityStateModel.KEY_CUSTOMER,
-                'sequence': 1,
-            }
-            state_model = EntityStateModel.objects.create(**LOOKUP)
-            return state_model
-        except IntegrityError as e:
-            if raise_exception:
-                raise e
+        return EntityStateModel.objects.get_next_state_model(
+            entity_model_id=self.entity_model_id,
+            key=EntityStateModel.KEY_CUSTOMER,
+            raise_exception=raise_exception
+        )
 
     def generate_customer_number(self, commit: bool = False) -> str:
         """
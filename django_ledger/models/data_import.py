@@ -45,7 +45,11 @@ from django_ledger.models.journal_entry import JournalEntryModel
 from django_ledger.models.mixins import CreateUpdateMixIn
 from django_ledger.models.receipt import ReceiptModel
 from django_ledger.models.transactions import TransactionModel
-from django_ledger.settings import DJANGO_LEDGER_MATCH_DAYS_WINDOW, DJANGO_LEDGER_USE_DEPRECATED_BEHAVIOR
+from django_ledger.settings import (
+    DJANGO_LEDGER_MATCH_DAYS_WINDOW,
+    DJANGO_LEDGER_READ_DATABASE,
+    DJANGO_LEDGER_USE_DEPRECATED_BEHAVIOR,
+)
 
 
 class ImportJobModelValidationError(ValidationError):
@@ -1316,7 +1320,7 @@ class StagedTransactionModelAbstract(CreateUpdateMixIn):
     def is_cash_transaction(self) -> bool:
         return getattr(self, '_is_cash_transaction', False)
 
-    def get_match_candidates_qs(self):
+    def get_match_candidates_qs(self, using: Optional[str] = None):
         """
         Returns a queryset of posted TransactionModel candidates that could match this staged
         transaction. A candidate matches when:
@@ -1324,6 +1328,12 @@ class StagedTransactionModelAbstract(CreateUpdateMixIn):
         - It impacts the same mapped cash/loan/credit account used by the bank account on the import job.
         - The amount equals this staged transaction amount (absolute value match consistent with TransactionModel schema).
         - The journal entry date is within +/- 7 days of the staged transaction posted date.
+
+        Parameters
+        ----------
+        using: str
+            The database alias the candidates are read from, such as a read replica. Defaults to the
+            DJANGO_LEDGER_READ_DATABASE setting, or the primary database if not set.
         """
         if self._state.adding:
             return TransactionModel.objects.none()
@@ -1339,7 +1349,7 @@ class StagedTransactionModelAbstract(CreateUpdateMixIn):
         from_date = self.date_posted - timedelta(days=7)
         to_date = self.date_posted + timedelta(days=7)
 
-        return (
+        candidates_qs = (
             TransactionModel.objects.filter(
                 account=account,
                 amount=self.amount,
@@ -1350,6 +1360,11 @@ class StagedTransactionModelAbstract(CreateUpdateMixIn):
             .select_related('journal_entry', 'account')
         )
 
+        using = using or DJANGO_LEDGER_READ_DATABASE
+        if using:
+            candidates_qs = candidates_qs.using(using)
+        return candidates_qs
+
     def has_activity(self) -> bool:
         """
         Determine if an activity is present.
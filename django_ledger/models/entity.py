@@ -18,30 +18,45 @@ specified at the time of creation. All key functionality around the Fiscal Year
 EntityReportMixIn.
 """
 
+from bisect import bisect_left
 from calendar import monthrange
 from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from itertools import zip_longest
 from random import choices
 from string import ascii_lowercase, digits
+from threading import get_ident
 from typing import Dict, List, Optional, Set, Tuple, Union
 from uuid import UUID, uuid4
 
 from django.contrib.auth import get_user_model
-from django.core import serializers
 from django.core.cache import caches
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models
-from django.db.models import F, Model, Q
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Manager, Model, Q, Sum
+from django.db.models.functions import TruncMonth
 from django.db.models.signals import pre_save
 from django.urls import reverse
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from django_ledger.io import IODigestContextManager, validate_roles
 from django_ledger.io import roles as roles_module
-from django_ledger.io.io_core import IOMixIn, get_localdate, get_localtime
+from django_ledger.io.io_cache import bump_digest_version
+from django_ledger.io.io_closing_entry_cache import (
+    ClosingEntryBalance,
+    decode_closing_entry_balances,
+    encode_closing_entry_balances,
+)
+from django_ledger.io.io_consolidation import (
+    EliminationRule,
+    apply_elimination_rules,
+    digest_consolidation_entity,
+    merge_accounts_digests,
+)
+from django_ledger.io.io_core import IOMixIn, IOResult, get_localdate, get_localtime, validate_dates
 from django_ledger.models.accounts import (
     CREDIT,
     DEBIT,
@@ -69,10 +84,18 @@ from django_ledger.models.mixins import (
     LoggingMixIn,
     SlugNameMixIn,
 )
+from django_ledger.models.sequences import document_sequence_pool, get_sequence_block_size
 from django_ledger.models.unit import EntityUnitModel
 from django_ledger.models.utils import lazy_loader
 from django_ledger.models.vendor import VendorModel, VendorModelQuerySet
-from django_ledger.settings import DJANGO_LEDGER_DEFAULT_CLOSING_ENTRY_CACHE_TIMEOUT
+from django_ledger.settings import (
+    DJANGO_LEDGER_CLOSING_ENTRY_CACHE_ENABLED,
+    DJANGO_LEDGER_CLOSING_ENTRY_CACHE_NAME,
+    DJANGO_LEDGER_CLOSING_ENTRY_INCREMENTAL,
+    DJANGO_LEDGER_CLOSING_ENTRY_VERIFY,
+    DJANGO_LEDGER_CONSOLIDATION_MAX_WORKERS,
+    DJANGO_LEDGER_DEFAULT_CLOSING_ENTRY_CACHE_TIMEOUT,
+)
 from treebeard.mp_tree import MP_Node, MP_NodeManager, MP_NodeQuerySet
 
 UserModel = get_user_model()
@@ -460,12 +483,253 @@ class EntityModelClosingEntryMixIn:
             )
 
     # ---> Closing Entry IO Digest <---
+    def get_closing_entry_data_full(
+        self,
+        to_date: date,
+        from_date: Optional[date] = None,
+        user_model: Optional[UserModel] = None,
+        **kwargs: Dict,
+    ) -> List[Dict]:
+        io_digest: IODigestContextManager = self.digest(
+            user_model=user_model,
+            to_date=to_date,
+            from_date=from_date,
+            by_unit=True,
+            by_activity=True,
+            signs=False,
+            **kwargs,
+        )
+        return io_digest.get_closing_entry_data()
+
+    def get_closing_entry_balances(self, closing_date: Optional[date] = None) -> Dict[Tuple, Dict]:
+        """
+        Fetches the balances of a posted closing entry, keyed by account, unit and activity. Balances are
+        expressed in the account balance type. Stale closing entries have no balances.
+
+        Parameters
+        ----------
+        closing_date: date
+            The closing entry date. If None, no balances are returned.
+
+        Returns
+        -------
+        dict
+            The closing entry records by (account_uuid, unit_uuid, activity).
+        """
+        ce_balances = dict()
+        if not closing_date:
+            return ce_balances
+
+        ce_qs = self.get_closing_entry_queryset_for_date(closing_date=closing_date).filter(
+            closing_entry_model__posted=True,
+            closing_entry_model__stale=False,
+        ).values(
+            'account_model_id',
+            'account_model__balance_type',
+            'unit_model_id',
+            'activity',
+            'tx_type',
+            'balance',
+        )
+
+        for ce in ce_qs:
+            k = (ce['account_model_id'], ce['unit_model_id'], ce['activity'])
+            balance = ce['balance'] if ce['tx_type'] == ce['account_model__balance_type'] else -ce['balance']
+            ce_balances[k] = {
+                'account_uuid': ce['account_model_id'],
+                'unit_uuid': ce['unit_model_id'],
+                'activity': ce['activity'],
+                'balance_type': ce['account_model__balance_type'],
+                'balance': balance,
+            }
+        return ce_balances
+
+    def get_closing_entry_data_for_dates(self, closing_dates: List[date]) -> Dict[date, List[Dict]]:
+        """
+        Computes the closing entry balances of several month-end closing dates with a single scan of the
+        transactions. Transactions are aggregated by account, unit, activity and month in the database, and
+        consumed in month order, so the cumulative balances are emitted at each closing date. The scan starts
+        from the nearest prior posted closing entry, if any.
+
+        Parameters
+        ----------
+        closing_dates: list of date
+            The month-end closing dates, in ascending order.
+
+        Returns
+        -------
+        dict
+            The closing entry records of each closing date, with account_uuid, unit_uuid, activity,
+            balance_type and balance keys. Balances are expressed in the account balance type.
+        """
+        TransactionModel = lazy_loader.get_txs_model()
+        TIMESTAMP_LOOKUP = TransactionModel.resolve_lookup('journal_entry__timestamp')
+
+        prev_closing_date = getattr(self, 'get_nearest_prior_closing_entry')(
+            io_date=closing_dates[0], inclusive=False
+        )
+        ce_balances = self.get_closing_entry_balances(closing_date=prev_closing_date)
+
+        txs_queryset = getattr(self, 'get_txs_queryset_init')().not_closing_entry()
+        txs_queryset = getattr(self, 'filter_txs_queryset')(txs_queryset=txs_queryset)
+        txs_queryset = txs_queryset.to_date(to_date=closing_dates[-1])
+        if prev_closing_date:
+            txs_queryset = txs_queryset.from_date(from_date=prev_closing_date + timedelta(days=1))
+
+        txs_queryset = txs_queryset.values(
+            'account__uuid',
+            'account__balance_type',
+            'journal_entry__entity_unit__uuid',
+            'journal_entry__activity',
+            'tx_type',
+        ).annotate(
+            period=TruncMonth(TIMESTAMP_LOOKUP),
+            balance=Sum('amount'),
+        ).order_by('period')
+
+        ce_data = dict()
+        idx = 0
+
+        def emit(closing_date):
+            ce_data[closing_date] = [dict(ce) for ce in ce_balances.values() if ce['balance']]
+
+        for tx in txs_queryset.iterator():
+            period = tx['period'].date() if isinstance(tx['period'], datetime) else tx['period']
+            while closing_dates[idx] < period:
+                emit(closing_dates[idx])
+                idx += 1
+
+            k = (tx['account__uuid'], tx['journal_entry__entity_unit__uuid'], tx['journal_entry__activity'])
+            balance = tx['balance'] if tx['tx_type'] == tx['account__balance_type'] else -tx['balance']
+            try:
+                ce_balances[k]['balance'] += balance
+            except KeyError:
+                ce_balances[k] = {
+                    'account_uuid': tx['account__uuid'],
+                    'unit_uuid': tx['journal_entry__entity_unit__uuid'],
+                    'activity': tx['journal_entry__activity'],
+                    'balance_type': tx['account__balance_type'],
+                    'balance': balance,
+                }
+
+        for closing_date in closing_dates[idx:]:
+            emit(closing_date)
+        return ce_data
+
+    def get_closing_entry_data_incremental(
+        self,
+        prev_closing_date: date,
+        to_date: date,
+        user_model: Optional[UserModel] = None,
+        **kwargs: Dict,
+    ) -> List[Dict]:
+        """
+        Computes the closing entry balances as of to_date from the balances of a prior posted closing entry plus
+        the transactions in (prev_closing_date, to_date], by account, unit and activity. Only the transactions
+        after the prior closing entry are aggregated. All transactions up to to_date are aggregated if the prior
+        closing entry is stale or not posted.
+
+        Parameters
+        ----------
+        prev_closing_date: date
+            The date of the prior posted closing entry.
+        to_date: date
+            The closing date.
+        user_model: UserModel
+            Optional user model, passed to the digest.
+
+        Returns
+        -------
+        list
+            The closing entry records, with account_uuid, unit_uuid, activity, balance_type and balance keys.
+            Balances are expressed in the account balance type.
+        """
+        if prev_closing_date not in self.fetch_closing_entry_dates_meta():
+            return self.get_closing_entry_data_full(
+                user_model=user_model,
+                to_date=to_date,
+                use_closing_entry=False,
+                **kwargs,
+            )
+
+        ce_balances = self.get_closing_entry_balances(closing_date=prev_closing_date)
+
+        delta_data = self.get_closing_entry_data_full(
+            user_model=user_model,
+            from_date=prev_closing_date + timedelta(days=1),
+            to_date=to_date,
+            use_closing_entry=False,
+            **kwargs,
+        )
+        for acc in delta_data:
+            k = (acc['account_uuid'], acc['unit_uuid'], acc['activity'])
+            try:
+                ce_balances[k]['balance'] += acc['balance']
+            except KeyError:
+                ce_balances[k] = {
+                    'account_uuid': acc['account_uuid'],
+                    'unit_uuid': acc['unit_uuid'],
+                    'activity': acc['activity'],
+                    'balance_type': acc['balance_type'],
+                    'balance': acc['balance'],
+                }
+
+        return [ce for ce in ce_balances.values() if ce['balance']]
+
+    def verify_closing_entry_data(
+        self,
+        ce_data: List[Dict],
+        to_date: date,
+        user_model: Optional[UserModel] = None,
+        **kwargs: Dict,
+    ):
+        """
+        Cross-checks closing entry records against a full aggregation of all transactions up to to_date.
+
+        Raises
+        ------
+        EntityModelValidationError
+            If any account, unit and activity balance does not match the full aggregation.
+        """
+
+        # compared at the closing entry transaction balance precision...
+        def get_balances(data):
+            balances = {
+                (ce['account_uuid'], ce['unit_uuid'], ce['activity']): Decimal(ce['balance']).quantize(Decimal('0.000001'))
+                for ce in data
+            }
+            return {k: v for k, v in balances.items() if v}
+
+        full_data = self.get_closing_entry_data_full(
+            user_model=user_model,
+            to_date=to_date,
+            use_closing_entry=False,
+            **kwargs,
+        )
+        ce_balances = get_balances(ce_data)
+        full_balances = get_balances(full_data)
+
+        mismatch = {
+            k: (ce_balances.get(k), full_balances.get(k))
+            for k in ce_balances.keys() | full_balances.keys()
+            if ce_balances.get(k) != full_balances.get(k)
+        }
+        if mismatch:
+            raise EntityModelValidationError(
+                message=_(
+                    f'Closing Entry for {to_date} does not match the full aggregation of transactions. '
+                    f'{len(mismatch)} balances differ.'
+                )
+            )
+
     def get_closing_entry_digest(
         self,
         to_date: date,
         from_date: Optional[date] = None,
         user_model: Optional[UserModel] = None,
         closing_entry_model=None,
+        incremental: Optional[bool] = None,
+        verify: Optional[bool] = None,
         **kwargs: Dict,
     ) -> Tuple:
         ClosingEntryModel = lazy_loader.get_closing_entry_model()
@@ -477,16 +741,32 @@ class EntityModelClosingEntryMixIn:
         else:
             self.validate_closing_entry_model(closing_entry_model, closing_date=to_date)
 
-        io_digest: IODigestContextManager = self.digest(
-            user_model=user_model,
-            to_date=to_date,
-            from_date=from_date,
-            by_unit=True,
-            by_activity=True,
-            signs=False,
-            **kwargs,
-        )
-        ce_data = io_digest.get_closing_entry_data()
+        if incremental is None:
+            incremental = DJANGO_LEDGER_CLOSING_ENTRY_INCREMENTAL
+        if verify is None:
+            verify = DJANGO_LEDGER_CLOSING_ENTRY_VERIFY
+
+        prev_closing_date = None
+        if incremental and not from_date:
+            prev_closing_date = getattr(self, 'get_nearest_prior_closing_entry')(io_date=to_date, inclusive=False)
+
+        if prev_closing_date:
+            ce_data = self.get_closing_entry_data_incremental(
+                prev_closing_date=prev_closing_date,
+                to_date=to_date,
+                user_model=user_model,
+                **kwargs,
+            )
+        else:
+            ce_data = self.get_closing_entry_data_full(
+                to_date=to_date,
+                from_date=from_date,
+                user_model=user_model,
+                **kwargs,
+            )
+
+        if verify and not from_date:
+            self.verify_closing_entry_data(ce_data=ce_data, to_date=to_date, user_model=user_model, **kwargs)
 
         ce_txs_list = [
             ClosingEntryTransactionModel(
@@ -534,7 +814,14 @@ class EntityModelClosingEntryMixIn:
         return self.get_closing_entry_queryset_for_date(closing_date=closing_date)
 
     # ----> Create Closing Entries <----
-    def create_closing_entry_for_date(self, closing_date: date, closing_entry_model=None, closing_entry_exists=True):
+    def create_closing_entry_for_date(
+        self,
+        closing_date: date,
+        closing_entry_model=None,
+        closing_entry_exists=True,
+        incremental: Optional[bool] = None,
+        verify: Optional[bool] = None,
+    ):
         if closing_entry_model:
             self.validate_closing_entry_model(closing_entry_model, closing_date=closing_date)
 
@@ -549,7 +836,10 @@ class EntityModelClosingEntryMixIn:
             closing_entry_model.closingentrytransactionmodel_set.all().delete()
 
         closing_entry_model, ce_txs_list = self.get_closing_entry_digest_for_date(
-            closing_date=closing_date, closing_entry_model=closing_entry_model
+            closing_date=closing_date,
+            closing_entry_model=closing_entry_model,
+            incremental=incremental,
+            verify=verify,
         )
 
         if closing_entry_model is not None:
@@ -587,21 +877,34 @@ class EntityModelClosingEntryMixIn:
     def get_closing_entry_cache_for_date(
         self,
         closing_date: date,
-        cache_name: str = 'default',
+        cache_name: str = DJANGO_LEDGER_CLOSING_ENTRY_CACHE_NAME,
         force_cache_update: bool = False,
         cache_timeout: Optional[int] = None,
         **kwargs,
-    ):
+    ) -> Optional[List[ClosingEntryBalance]]:
+        """
+        Fetches the cached closing entry balances for the given date.
+
+        Parameters
+        ----------
+        closing_date: date
+            The closing entry date.
+        cache_name: str
+            The name of the Django cache to use.
+        force_cache_update: bool
+            If True, the cache is refreshed from the database.
+        cache_timeout: int
+            The cache timeout, used when the cache is refreshed.
+
+        Returns
+        -------
+        list of ClosingEntryBalance or None
+            The closing entry balances. None if not cached, or cached with a different format version.
+        """
         if not force_cache_update:
             cache_system = caches[cache_name]
             ce_cache_key = self.get_closing_entry_cache_key_for_date(closing_date=closing_date)
-            ce_ser = cache_system.get(ce_cache_key)
-
-            # if closing entry is in cache...
-            if ce_ser:
-                ce_qs_serde_gen = serializers.deserialize(format='json', stream_or_string=ce_ser)
-                return list(ce.object for ce in ce_qs_serde_gen)
-            return
+            return decode_closing_entry_balances(cache_system.get(ce_cache_key))
 
         return self.save_closing_entry_cache_for_date(
             closing_date=closing_date,
@@ -614,7 +917,7 @@ class EntityModelClosingEntryMixIn:
         self,
         year: int,
         month: int,
-        cache_name: str = 'default',
+        cache_name: str = DJANGO_LEDGER_CLOSING_ENTRY_CACHE_NAME,
         force_cache_update: bool = False,
         cache_timeout: Optional[int] = None,
         **kwargs,
@@ -632,7 +935,7 @@ class EntityModelClosingEntryMixIn:
     def get_closing_entry_cache_for_fiscal_year(
         self,
         fiscal_year: int,
-        cache_name: str = 'default',
+        cache_name: str = DJANGO_LEDGER_CLOSING_ENTRY_CACHE_NAME,
         force_cache_update: bool = False,
         cache_timeout: Optional[int] = None,
         **kwargs,
@@ -650,26 +953,81 @@ class EntityModelClosingEntryMixIn:
     def save_closing_entry_cache_for_date(
         self,
         closing_date: date,
-        cache_name: str = 'default',
+        cache_name: str = DJANGO_LEDGER_CLOSING_ENTRY_CACHE_NAME,
         cache_timeout: Optional[int] = None,
         **kwargs,
-    ):
+    ) -> List[ClosingEntryBalance]:
+        """
+        Stores the closing entry balances for the given date in the compact binary closing entry cache format.
+
+        Parameters
+        ----------
+        closing_date: date
+            The closing entry date.
+        cache_name: str
+            The name of the Django cache to use.
+        cache_timeout: int
+            The cache timeout. Defaults to DJANGO_LEDGER_DEFAULT_CLOSING_ENTRY_CACHE_TIMEOUT.
+
+        Returns
+        -------
+        list of ClosingEntryBalance
+            The cached closing entry balances.
+        """
         cache_system = caches[cache_name]
         ce_qs = self.get_closing_entry_queryset_for_date(closing_date=closing_date)
         ce_cache_key = self.get_closing_entry_cache_key_for_date(closing_date=closing_date)
-        ce_ser = serializers.serialize(format='json', queryset=ce_qs)
+        ce_balances = [
+            ClosingEntryBalance(*ce_values) for ce_values in ce_qs.values_list(
+                'account_model_id',
+                'unit_model_id',
+                'activity',
+                'tx_type',
+                'balance',
+            )
+        ]
 
         if not cache_timeout:
             cache_timeout = DJANGO_LEDGER_DEFAULT_CLOSING_ENTRY_CACHE_TIMEOUT
 
-        cache_system.set(ce_cache_key, ce_ser, cache_timeout, **kwargs)
-        return list(ce_qs)
+        cache_system.set(ce_cache_key, encode_closing_entry_balances(ce_balances), cache_timeout, **kwargs)
+        return ce_balances
+
+    def delete_closing_entry_cache_for_dates(
+        self,
+        closing_dates: List[date],
+        cache_name: str = DJANGO_LEDGER_CLOSING_ENTRY_CACHE_NAME,
+    ):
+        """
+        Invalidates the cached closing entry balances of the given dates. Does nothing unless
+        DJANGO_LEDGER_CLOSING_ENTRY_CACHE_ENABLED is enabled.
+
+        Parameters
+        ----------
+        closing_dates: list of date
+            The closing entry dates.
+        cache_name: str
+            The name of the Django cache to use.
+        """
+        if not DJANGO_LEDGER_CLOSING_ENTRY_CACHE_ENABLED or not closing_dates:
+            return
+        cache_system = caches[cache_name]
+        cache_system.delete_many(
+            [self.get_closing_entry_cache_key_for_date(closing_date=cd) for cd in closing_dates]
+        )
+
+    def delete_closing_entry_cache_for_date(
+        self,
+        closing_date: date,
+        cache_name: str = DJANGO_LEDGER_CLOSING_ENTRY_CACHE_NAME,
+    ):
+        return self.delete_closing_entry_cache_for_dates(closing_dates=[closing_date], cache_name=cache_name)
 
     def save_closing_entry_cache_for_month(
         self,
         year: int,
         month: int,
-        cache_name: str = 'default',
+        cache_name: str = DJANGO_LEDGER_CLOSING_ENTRY_CACHE_NAME,
         cache_timeout: Optional[int] = None,
         **kwargs,
     ):
@@ -685,7 +1043,7 @@ class EntityModelClosingEntryMixIn:
     def save_closing_entry_cache_for_fiscal_year(
         self,
         fiscal_year: int,
-        cache_name: str = 'default',
+        cache_name: str = DJANGO_LEDGER_CLOSING_ENTRY_CACHE_NAME,
         cache_timeout: Optional[int] = None,
         **kwargs,
     ):
@@ -776,6 +1134,7 @@ class EntityModelAbstract(
     LOGGER_NAME_ATTRIBUTE = 'slug'
 
     META_KEY_CLOSING_ENTRY_DATES = 'closing_entries'
+    CLOSING_FREQUENCIES = ('month', 'fiscal_year')
 
     uuid = models.UUIDField(default=uuid4, editable=False, primary_key=True)
     name = models.CharField(max_length=150, verbose_name=_('Entity Name'))
@@ -2801,7 +3160,10 @@ class EntityModelAbstract(
         return [date.fromisoformat(d) for d in date_list]
 
     def compute_closing_entry_dates_list(self, as_iso: bool = True) -> List[Union[date, str]]:
-        closing_entry_qs = self.closingentrymodel_set.order_by('-closing_date').only('closing_date').posted()
+        # stale closing entries cannot anchor a digest until recomputed...
+        closing_entry_qs = self.closingentrymodel_set.order_by('-closing_date').only(
+            'closing_date'
+        ).posted().not_stale()
         if as_iso:
             return [ce.closing_date.isoformat() for ce in closing_entry_qs]
         return [ce.closing_date for ce in closing_entry_qs]
@@ -2815,6 +3177,7 @@ class EntityModelAbstract(
             self.last_closing_date = None
 
         self.meta[self.META_KEY_CLOSING_ENTRY_DATES] = [d.isoformat() for d in date_list]
+        self._CLOSING_ENTRY_DATES = None
         if commit:
             self.save(update_fields=['last_closing_date', 'updated', 'meta'])
         return date_list
@@ -2867,12 +3230,48 @@ class EntityModelAbstract(
             if p and p <= io_date < f:
                 return p
 
+    def get_nearest_prior_closing_entry(self, io_date: Union[date, datetime], inclusive: bool = True) -> Optional[date]:
+        """
+        Finds the nearest posted closing entry date at or before the provided date.
+
+        Parameters
+        ----------
+        io_date: date or datetime
+            The date to look up.
+        inclusive: bool
+            If False, only closing entries strictly before the provided date are considered. Defaults to True.
+
+        Returns
+        -------
+        date or None
+            The closing entry date, if any.
+        """
+        if io_date is None:
+            return
+
+        ce_date_list = self.fetch_closing_entry_dates_meta()
+        if not ce_date_list:
+            return
+
+        if isinstance(io_date, datetime):
+            io_date = io_date.date()
+
+        if not inclusive:
+            io_date = io_date - timedelta(days=1)
+
+        # closing entry dates are sorted in descending order...
+        idx = bisect_left(ce_date_list, -io_date.toordinal(), key=lambda d: -d.toordinal())
+        if idx < len(ce_date_list):
+            return ce_date_list[idx]
+
     def close_entity_books(
         self,
         closing_date: Optional[date] = None,
         closing_entry_model=None,
         force_update: bool = False,
         post_closing_entry: bool = True,
+        incremental: Optional[bool] = None,
+        verify: Optional[bool] = None,
     ):
         if closing_entry_model and closing_date:
             raise EntityModelValidationError(
@@ -2906,6 +3305,8 @@ class EntityModelAbstract(
                 closing_date=closing_date,
                 closing_entry_model=closing_entry_model,
                 closing_entry_exists=closing_entry_exists,
+                incremental=incremental,
+                verify=verify,
             )
 
             if post_closing_entry:
@@ -2921,6 +3322,8 @@ class EntityModelAbstract(
         month: int,
         force_update: bool = False,
         post_closing_entry: bool = True,
+        incremental: Optional[bool] = None,
+        verify: Optional[bool] = None,
     ):
         _, day = monthrange(year, month)
         closing_dt = date(year, month, day)
@@ -2929,6 +3332,8 @@ class EntityModelAbstract(
             force_update=force_update,
             post_closing_entry=post_closing_entry,
             closing_entry_model=None,
+            incremental=incremental,
+            verify=verify,
         )
 
     def close_books_for_fiscal_year(
@@ -2936,12 +3341,375 @@ class EntityModelAbstract(
         fiscal_year: int,
         force_update: bool = False,
         post_closing_entry: bool = True,
+        incremental: Optional[bool] = None,
+        verify: Optional[bool] = None,
     ):
         closing_dt = self.get_fy_end(year=fiscal_year)
         return self.close_entity_books(
             closing_date=closing_dt,
             force_update=force_update,
             post_closing_entry=post_closing_entry,
+            incremental=incremental,
+            verify=verify,
+        )
+
+    def get_closing_dates_for_range(self, start_date: date, end_date: date, frequency: str = 'month') -> List[date]:
+        """
+        Determines the closing dates between two dates, inclusive. Closing dates after the current local date
+        are excluded.
+
+        Parameters
+        ----------
+        start_date: date
+            The start date of the range.
+        end_date: date
+            The end date of the range.
+        frequency: str
+            Either "month", for every month end, or "fiscal_year", for every fiscal year end. Defaults to "month".
+
+        Returns
+        -------
+        list
+            The closing dates, in ascending order.
+        """
+        if frequency not in self.CLOSING_FREQUENCIES:
+            raise EntityModelValidationError(
+                message=_(f'Invalid closing frequency {frequency}. Valid values are {self.CLOSING_FREQUENCIES}.')
+            )
+
+        end_date = min(end_date, get_localdate())
+        if frequency == 'fiscal_year':
+            closing_dates = [self.get_fy_end(year=y) for y in range(start_date.year - 1, end_date.year + 2)]
+        else:
+            closing_dates = list()
+            year, month = start_date.year, start_date.month
+            while (year, month) <= (end_date.year, end_date.month):
+                _weekday, day = monthrange(year, month)
+                closing_dates.append(date(year, month, day))
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        return [d for d in closing_dates if start_date <= d <= end_date]
+
+    def close_books_for_range(
+        self,
+        start_date: date,
+        end_date: date,
+        frequency: str = 'month',
+        force_update: bool = False,
+        post_closing_entry: bool = True,
+        batch_size: int = 12,
+    ) -> List:
+        """
+        Backfills the closing entries of every closing date between two dates. The transactions are scanned
+        once, the closing entries, their ledgers and their transactions are bulk created and, if posted, migrated
+        into their closing entry ledgers in batched database transactions. The entity closing entry dates meta is
+        updated once at the end.
+
+        Parameters
+        ----------
+        start_date: date
+            The start date of the range.
+        end_date: date
+            The end date of the range.
+        frequency: str
+            Either "month" or "fiscal_year". Defaults to "month".
+        force_update: bool
+            Replaces existing closing entries within the range. Otherwise, EntityModelValidationError is raised
+            if any exist. Defaults to False.
+        post_closing_entry: bool
+            Posts the created closing entries. Defaults to True.
+        batch_size: int
+            The number of closing entries created per database transaction. Defaults to 12.
+
+        Returns
+        -------
+        list
+            The created ClosingEntryModel instances, in ascending closing date order.
+        """
+        ClosingEntryModel = lazy_loader.get_closing_entry_model()
+        ClosingEntryTransactionModel = lazy_loader.get_closing_entry_transaction_model()
+
+        closing_dates = self.get_closing_dates_for_range(
+            start_date=start_date,
+            end_date=end_date,
+            frequency=frequency,
+        )
+        if not closing_dates:
+            return list()
+
+        ce_qs = self.closingentrymodel_set.filter(closing_date__in=closing_dates)
+        ce_model_list = list(ce_qs.select_related('ledger_model', 'entity_model'))
+        if ce_model_list:
+            if not force_update:
+                raise EntityModelValidationError(
+                    message=_(f'Closing Entries for {[ce.closing_date for ce in ce_model_list]} already exist.')
+                )
+            with transaction.atomic():
+                for ce_model in ce_model_list:
+                    if ce_model.is_posted():
+                        ce_model.mark_as_unposted(commit=True, update_entity_meta=False)
+                    # deletes the closing entry ledger, along with the closing entry...
+                    ce_model.delete()
+            self.save_closing_entry_dates_meta(commit=True)
+
+        ce_data = self.get_closing_entry_data_for_dates(closing_dates=closing_dates)
+
+        closing_entry_list = list()
+        for i in range(0, len(closing_dates), batch_size):
+            with transaction.atomic():
+                ce_model_batch = list()
+                ce_txs_list = list()
+                for closing_date in closing_dates[i:i + batch_size]:
+                    ce_model = ClosingEntryModel(entity_model=self, closing_date=closing_date)
+                    # bulk_create bypasses the pre_save signal creating the closing entry ledger...
+                    ce_model.ledger_model = ce_model.get_entry_ledger_model()
+                    ce_model.clean()
+                    ce_model_batch.append(ce_model)
+
+                    for ce in ce_data[closing_date]:
+                        ce_txs = ClosingEntryTransactionModel(
+                            closing_entry_model=ce_model,
+                            account_model_id=ce['account_uuid'],
+                            unit_model_id=ce['unit_uuid'],
+                            tx_type=ce['balance_type'],
+                            activity=ce['activity'],
+                            balance=ce['balance'],
+                        )
+                        ce_txs.clean()
+                        ce_txs_list.append(ce_txs)
+
+                LedgerModel.objects.bulk_create(objs=[ce_model.ledger_model for ce_model in ce_model_batch])
+                ClosingEntryModel.objects.bulk_create(objs=ce_model_batch)
+                ClosingEntryTransactionModel.objects.bulk_create(objs=ce_txs_list, batch_size=500)
+
+                # journal entries are numbered and verified one at a time...
+                if post_closing_entry:
+                    for ce_model in ce_model_batch:
+                        ce_model.migrate()
+                        ce_model.posted = True
+                    ClosingEntryModel.objects.bulk_update(objs=ce_model_batch, fields=['posted'])
+
+            closing_entry_list += ce_model_batch
+
+        self.save_closing_entry_dates_meta(commit=True)
+        self.delete_closing_entry_cache_for_dates(closing_dates=closing_dates)
+        bump_digest_version(self.uuid)
+        return closing_entry_list
+
+    def recompute_stale_closing_entries(
+        self,
+        incremental: Optional[bool] = None,
+        verify: Optional[bool] = None
+    ) -> List:
+        """
+        Recomputes the stale closing entries of the EntityModel, in ascending closing date order, so each one may be
+        computed incrementally from the already recomputed closing entry before it. Posted closing entries are
+        posted again once recomputed.
+
+        Parameters
+        ----------
+        incremental: bool
+            Whether to compute each closing entry from the prior closing entry balances and the transactions since.
+            Defaults to DJANGO_LEDGER_CLOSING_ENTRY_INCREMENTAL.
+        verify: bool
+            Whether to verify each recomputed closing entry against a full aggregation.
+            Defaults to DJANGO_LEDGER_CLOSING_ENTRY_VERIFY.
+
+        Returns
+        -------
+        list
+            The recomputed ClosingEntryModel instances, in ascending closing date order.
+        """
+        stale_ce_list = list(
+            self.closingentrymodel_set.filter(stale=True).select_related(
+                'ledger_model', 'entity_model'
+            ).order_by('closing_date')
+        )
+
+        if stale_ce_list:
+            self.save_closing_entry_dates_meta(commit=False)
+
+        for ce_model in stale_ce_list:
+            with transaction.atomic():
+                post_closing_entry = ce_model.is_posted()
+                if post_closing_entry:
+                    ce_model.mark_as_unposted(commit=True, update_entity_meta=False)
+                self.close_entity_books(
+                    closing_entry_model=ce_model,
+                    post_closing_entry=post_closing_entry,
+                    incremental=incremental,
+                    verify=verify,
+                )
+                ce_model.stale = False
+                ce_model.save(update_fields=['stale', 'updated'])
+                # the next closing entry is computed incrementally from this one...
+                self.save_closing_entry_dates_meta(commit=False)
+
+        if stale_ce_list:
+            self.save_closing_entry_dates_meta(commit=True)
+        return stale_ce_list
+
+    # ### CONSOLIDATED FINANCIAL STATEMENTS ###
+
+    def digest_consolidated(
+        self,
+        to_date: Optional[Union[date, datetime, str]] = None,
+        from_date: Optional[Union[date, datetime, str]] = None,
+        signs: bool = True,
+        process_roles: bool = False,
+        process_groups: bool = False,
+        process_ratios: bool = False,
+        by_period: Union[bool, str] = False,
+        by_activity: bool = False,
+        by_tx_type: bool = False,
+        balance_sheet_statement: bool = False,
+        income_statement: bool = False,
+        cash_flow_statement: bool = False,
+        elimination_rules: Optional[List[EliminationRule]] = None,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> IODigestContextManager:
+        """
+        Computes the consolidated digest of the EntityModel and all of its descendants. Each EntityModel is
+        digested by a separate task with its own database connection, and the resulting accounts are merged by
+        account code and role before being processed by the IO middleware like a single EntityModel digest.
+
+        Parameters
+        ----------
+        to_date: date or datetime or str
+            The upper limit of the date range to consolidate.
+        from_date: date or datetime or str
+            The lower limit of the date range to consolidate.
+        signs: bool
+            If True, account roles with predefined signs will be applied to the financial data.
+        process_roles: bool
+            If True, processes the consolidated account roles.
+        process_groups: bool
+            If True, processes the consolidated account groups.
+        process_ratios: bool
+            If True, computes the consolidated financial ratios.
+        by_period: bool or str
+            Groups the output by accounting periods: 'week', 'month', 'fiscal_quarter' or 'fiscal_year'.
+            True groups by month.
+        by_activity: bool
+            Groups the output by activity if True.
+        by_tx_type: bool
+            Groups the output by transaction type if True.
+        balance_sheet_statement: bool
+            If True, prepares the consolidated balance sheet statement.
+        income_statement: bool
+            If True, prepares the consolidated income statement.
+        cash_flow_statement: bool
+            If True, prepares the consolidated cash flow statement.
+        elimination_rules: list of EliminationRule
+            The intercompany elimination rules applied to the consolidated accounts. The eliminated balances are
+            available with IODigestContextManager.get_eliminations_data().
+        executor: Executor
+            An optional concurrent.futures Executor to run the EntityModel digests. A ThreadPoolExecutor is used
+            if not provided and max_workers is greater than 1. Worker threads open their own database connections,
+            which cannot read uncommitted data, so EntityModelValidationError is raised if an executor is provided
+            within an atomic block.
+        max_workers: int
+            The maximum number of concurrent EntityModel digests when no executor is provided.
+            Defaults to DJANGO_LEDGER_CONSOLIDATION_MAX_WORKERS. A value of 1 digests every EntityModel in the
+            current thread. Every EntityModel is digested in the current thread within an atomic block.
+        kwargs
+            Additional named arguments passed to the digest() of every EntityModel, such as use_closing_entry,
+            role or accounts.
+
+        Returns
+        -------
+        IODigestContextManager
+            The consolidated digest.
+        """
+        if balance_sheet_statement:
+            from_date = None
+
+        if cash_flow_statement:
+            by_activity = True
+
+        from_date, to_date = validate_dates(from_date, to_date)
+
+        entity_uuid_list = [self.uuid] + list(self.get_descendants().values_list('uuid', flat=True))
+        digest_kwargs = dict(
+            to_date=to_date,
+            from_date=from_date,
+            signs=signs,
+            by_period=by_period,
+            by_activity=by_activity,
+            by_tx_type=by_tx_type,
+            **kwargs,
+        )
+
+        if max_workers is None:
+            max_workers = DJANGO_LEDGER_CONSOLIDATION_MAX_WORKERS
+
+        # worker thread connections cannot read the data of the caller open transaction...
+        if transaction.get_connection().in_atomic_block:
+            if executor is not None:
+                raise EntityModelValidationError(
+                    message=_('Consolidated digests cannot be run on an executor within an atomic block.')
+                )
+            max_workers = 1
+
+        local_executor = None
+        if executor is None and max_workers > 1 and len(entity_uuid_list) > 1:
+            executor = local_executor = ThreadPoolExecutor(
+                max_workers=min(max_workers, len(entity_uuid_list))
+            )
+
+        try:
+            if executor is None:
+                accounts_digests = [
+                    digest_consolidation_entity(entity_uuid, digest_kwargs) for entity_uuid in entity_uuid_list
+                ]
+            else:
+                futures = [
+                    executor.submit(digest_consolidation_entity, entity_uuid, digest_kwargs, get_ident())
+                    for entity_uuid in entity_uuid_list
+                ]
+                accounts_digests = [f.result() for f in futures]
+        finally:
+            if local_executor is not None:
+                local_executor.shutdown()
+
+        accounts = merge_accounts_digests(accounts_digests)
+        eliminations = list()
+        if elimination_rules:
+            accounts, eliminations = apply_elimination_rules(
+                accounts=accounts,
+                elimination_rules=elimination_rules,
+                signs=signs,
+            )
+
+        io_result = IOResult(db_from_date=from_date, db_to_date=to_date)
+        io_result.accounts_digest = accounts
+
+        io_state = dict()
+        io_state['io_model'] = self
+        io_state['from_date'] = from_date
+        io_state['to_date'] = to_date
+        io_state['by_unit'] = False
+        io_state['unit_slug'] = None
+        io_state['entity_slug'] = self.slug
+        io_state['by_period'] = by_period
+        io_state['by_activity'] = by_activity
+        io_state['by_tx_type'] = by_tx_type
+        io_state['io_result'] = io_result
+        io_state['accounts'] = accounts
+        io_state['consolidated_entities'] = entity_uuid_list
+        io_state['eliminations'] = eliminations
+
+        return self.process_io_state(
+            io_state=io_state,
+            process_roles=process_roles,
+            process_groups=process_groups,
+            process_ratios=process_ratios,
+            by_period=by_period,
+            balance_sheet_statement=balance_sheet_statement,
+            income_statement=income_statement,
+            cash_flow_statement=cash_flow_statement,
         )
 
     # ### RANDOM DATA GENERATION ####
@@ -3159,6 +3927,121 @@ class EntityModel(EntityModelAbstract):
 
 
 # ## ENTITY STATE....
+class EntityStateModelManager(Manager):
+    """
+    Allocates the document number sequences of the EntityModel. See django_ledger.models.sequences.
+    """
+
+    def reserve_sequence(self,
+                         entity_model_id: UUID,
+                         key: str,
+                         entity_unit_id: Optional[UUID] = None,
+                         fiscal_year: Optional[int] = None,
+                         count: int = 1,
+                         block_size: Optional[int] = None,
+                         raise_exception: bool = True) -> Optional[List[int]]:
+        """
+        Reserves the next sequence values. Values are taken from the process local pool when available. Otherwise,
+        a block of max(count, block size) values is reserved on the EntityStateModel row, and the values not used by
+        this call are pooled once the current transaction commits.
+
+        Parameters
+        ----------
+        entity_model_id: UUID
+            The EntityModel UUID.
+        key: str
+            The EntityStateModel key.
+        entity_unit_id: UUID
+            The EntityUnitModel UUID, if the sequence is kept by unit.
+        fiscal_year: int
+            The fiscal year, if the sequence is kept by fiscal year.
+        count: int
+            The number of values to reserve. Defaults to 1.
+        block_size: int
+            The number of values reserved on the EntityStateModel row at once. Defaults to the block size configured
+            for the key.
+        raise_exception: bool
+            Raises IntegrityError if unable to secure the EntityStateModel row. Defaults to True.
+
+        Returns
+        -------
+        list or None
+            The reserved sequence values in ascending order. None if the EntityStateModel row could not be secured and
+            raise_exception is False.
+        """
+        if block_size is None:
+            block_size = get_sequence_block_size(key)
+        pool_key = (self.db, entity_model_id, entity_unit_id, fiscal_year, key)
+
+        if block_size > 1:
+            values = document_sequence_pool.take(pool_key, count=count)
+            if values:
+                return values
+
+        reserve_count = max(count, block_size)
+        LOOKUP = {
+            'entity_model_id': entity_model_id,
+            'entity_unit_id': entity_unit_id,
+            'fiscal_year': fiscal_year,
+            'key': key
+        }
+        try:
+            state_model = self.get_queryset().filter(**LOOKUP).select_for_update().get()
+            state_model.sequence = F('sequence') + reserve_count
+            state_model.save(update_fields=['sequence'])
+            state_model.refresh_from_db(fields=['sequence'])
+        except ObjectDoesNotExist:
+            try:
+                with transaction.atomic(using=self.db):
+                    state_model = self.create(**LOOKUP, sequence=reserve_count)
+            except IntegrityError as e:
+                if raise_exception:
+                    raise e
+                return None
+
+        last = state_model.sequence
+        first = last - reserve_count + 1
+        if reserve_count > count:
+            transaction.on_commit(
+                lambda: document_sequence_pool.add(pool_key, first=first + count, last=last),
+                using=self.db
+            )
+        return list(range(first, first + count))
+
+    def get_next_state_model(self,
+                             entity_model_id: UUID,
+                             key: str,
+                             entity_unit_id: Optional[UUID] = None,
+                             fiscal_year: Optional[int] = None,
+                             raise_exception: bool = True) -> Optional['EntityStateModel']:
+        """
+        Allocates the next sequence value for a document.
+
+        Returns
+        -------
+        EntityStateModel or None
+            An EntityStateModel holding the allocated value as its sequence. The allocated value may lag behind the
+            persisted sequence when block allocation is enabled. None if the EntityStateModel row could not be secured
+            and raise_exception is False.
+        """
+        values = self.reserve_sequence(
+            entity_model_id=entity_model_id,
+            key=key,
+            entity_unit_id=entity_unit_id,
+            fiscal_year=fiscal_year,
+            raise_exception=raise_exception
+        )
+        if not values:
+            return None
+        return self.model(
+            entity_model_id=entity_model_id,
+            entity_unit_id=entity_unit_id,
+            fiscal_year=fiscal_year,
+            key=key,
+            sequence=values[0]
+        )
+
+
 class EntityStateModelAbstract(Model):
     KEY_JOURNAL_ENTRY = 'je'
     KEY_PURCHASE_ORDER = 'po'
@@ -3200,6 +4083,8 @@ class EntityStateModelAbstract(Model):
     key = models.CharField(choices=KEY_CHOICES, max_length=10)
     sequence = models.BigIntegerField(default=0, validators=[MinValueValidator(limit_value=0)])
 
+    objects = EntityStateModelManager()
+
     class Meta:
         abstract = True
         indexes = [
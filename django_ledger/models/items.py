@@ -24,9 +24,9 @@ from string import ascii_lowercase, digits
 from typing import Dict
 from uuid import uuid4, UUID
 
-from django.core.exceptions import ValidationError, ObjectDoesNotExist
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models, transaction, IntegrityError
+from django.db import models, transaction
 from django.db.models import Q, Sum, F, ExpressionWrapper, DecimalField, Value, Case, When, QuerySet, Manager
 from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
@@ -791,34 +791,11 @@ class ItemModelAbstract(CreateUpdateMixIn):
 
     def _get_next_state_model(self, raise_exception: bool = True):
         EntityStateModel = lazy_loader.get_entity_state_model()
-
-        try:
-            LOOKUP = {
-                'entity_model_id__exact': self.entity_id,
-                'key__exact': EntityStateModel.KEY_ITEM
-            }
-
-            state_model_qs = EntityStateModel.objects.filter(**LOOKUP).select_for_update()
-            state_model = state_model_qs.get()
-            state_model.sequence = F('sequence') + 1
-            state_model.save()
-            state_model.refresh_from_db()
-
-            return state_model
-        except ObjectDoesNotExist:
-
-            LOOKUP = {
-                'entity_model_id': self.entity_id,
-                'entity_unit_id': None,
-                'fiscal_year': None,
-                'key': EntityStateModel.KEY_ITEM,
-                'sequence': 1
-            }
-            state_model = EntityStateModel.objects.create(**LOOKUP)
-            return state_model
-        except IntegrityError as e:
-            if raise_exception:
-                raise e
+        return EntityStateModel.objects.get_next_state_model(
+            entity_model_id=self.entity_id,
+            key=EntityStateModel.KEY_ITEM,
+            raise_exception=raise_exception
+        )
 
     def generate_item_number(self, commit: bool = False) -> str:
         """
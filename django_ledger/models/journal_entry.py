@@ -26,6 +26,7 @@ business. Whenever an account with ASSET_CA_CASH role is involved in a Journal E
 JE is responsible for programmatically determine the kind of operation for the JE (Operating, Financing, Investing).
 """
 import warnings
+from collections import defaultdict
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
@@ -33,9 +34,9 @@ from itertools import chain
 from typing import Dict, List, Optional, Set, Tuple, Union
 from uuid import UUID, uuid4
 
-from django.core.exceptions import FieldError, ObjectDoesNotExist, ValidationError
-from django.db import IntegrityError, models, transaction
-from django.db.models import Count, F, Manager, Q, QuerySet, Sum
+from django.core.exceptions import FieldError, ValidationError
+from django.db import models, transaction
+from django.db.models import Case, Count, F, Manager, Q, QuerySet, Sum, Value, When
 from django.db.models.functions import Coalesce
 from django.db.models.signals import pre_save
 from django.urls import reverse
@@ -43,6 +44,7 @@ from django.utils.timezone import localtime
 from django.utils.translation import gettext_lazy as _
 
 from django_ledger.io import roles
+from django_ledger.io.io_cache import bump_digest_version
 from django_ledger.io.io_core import get_localtime
 from django_ledger.io.roles import (
     ASSET_CA_CASH,
@@ -67,10 +69,13 @@ from django_ledger.models.signals import (
     journal_entry_unposted,
 )
 from django_ledger.models.transactions import TransactionModelQuerySet
+from django_ledger.models.utils import lazy_loader
 from django_ledger.settings import (
     DJANGO_LEDGER_DOCUMENT_NUMBER_PADDING,
     DJANGO_LEDGER_JE_NUMBER_NO_UNIT_PREFIX,
     DJANGO_LEDGER_JE_NUMBER_PREFIX,
+    DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS,
+    DJANGO_LEDGER_USE_DENORMALIZED_TRANSACTIONS,
     DJANGO_LEDGER_USE_DEPRECATED_BEHAVIOR,
 )
 
@@ -220,6 +225,245 @@ class JournalEntryModelQuerySet(QuerySet):
             return self.filter(ledger=ledger_pk)
         return self.filter(ledger__uuid__exact=ledger_pk)
 
+    def get_txs_balances_by_journal_entry(self) -> Dict[UUID, List[Dict]]:
+        """
+        Aggregates the TransactionModels of all the Journal Entries in the QuerySet with a single grouped query.
+
+        Returns
+        -------
+        dict
+            The transaction balances of each Journal Entry UUID, grouped by account and tx_type. Each balance
+            includes the account role and Chart of Accounts.
+        """
+        TransactionModel = lazy_loader.get_txs_model()
+        txs_balances = TransactionModel._base_manager.filter(
+            journal_entry_id__in=self.values('uuid')
+        ).values(
+            'journal_entry_id',
+            'account_id',
+            'account__role',
+            'account__coa_model_id',
+            'tx_type'
+        ).annotate(
+            amount__sum=Sum('amount')
+        ).order_by()
+
+        je_txs_balances = defaultdict(list)
+        for tx in txs_balances:
+            je_txs_balances[tx['journal_entry_id']].append(tx)
+        return je_txs_balances
+
+    def bulk_verify(self,
+                    je_models: List['JournalEntryModel'],
+                    allow_empty: bool = True,
+                    force_activity: bool = False) -> Tuple[Dict[UUID, List[Dict]], Dict]:
+        """
+        Verifies the provided Journal Entries in memory from a single aggregation of their TransactionModels.
+        See JournalEntryModel.verify_txs_balances.
+
+        Parameters
+        ----------
+        je_models: list
+            The JournalEntryModels to verify, as retrieved from this QuerySet.
+        allow_empty: bool
+            Whether Journal Entries without transactions are considered valid. Defaults to True.
+        force_activity: bool
+            Forces the regeneration of the activity of all the Journal Entries.
+
+        Returns
+        -------
+        tuple
+            The transaction balances of each Journal Entry UUID and a dictionary with the error message of each
+            JournalEntryModel that failed verification.
+        """
+        je_txs_balances = self.get_txs_balances_by_journal_entry()
+        failed = dict()
+        for je_model in je_models:
+            txs_balances = je_txs_balances.get(je_model.uuid, list())
+            if not txs_balances and not allow_empty:
+                failed[je_model] = _('Cannot post an empty Journal Entry.')
+                continue
+            try:
+                je_model.verify_txs_balances(txs_balances=txs_balances, force_activity=force_activity)
+            except ValidationError as e:
+                failed[je_model] = e.message
+        return je_txs_balances, failed
+
+    def bulk_lock(
+        self,
+        commit: bool = True,
+        raise_exception: bool = False,
+        **kwargs
+    ) -> Tuple[List['JournalEntryModel'], Dict]:
+        """
+        Locks all the unlocked Journal Entries in the QuerySet. Journal Entries are verified with a single
+        aggregation query (see bulk_verify) and locked with a single UPDATE statement, instead of calling
+        mark_as_locked on each JournalEntryModel.
+
+        Parameters
+        ----------
+        commit: bool
+            Commits the changes into the database. Defaults to True.
+        raise_exception: bool
+            Raises JournalEntryValidationError if any Journal Entry cannot be locked, before any Journal Entry is
+            locked. Defaults to False.
+        kwargs: dict
+            Additional keyword arguments passed to the journal_entry_locked signal receivers.
+
+        Returns
+        -------
+        tuple
+            The list of locked JournalEntryModels and a dictionary with the error message of each JournalEntryModel
+            that could not be locked.
+        """
+        je_qs = self.unlocked().select_related('ledger', 'ledger__entity')
+        je_models = list(je_qs)
+
+        failed = dict()
+        for je_model in je_models:
+            if not je_model.can_lock():
+                failed[je_model] = _(f'Journal Entry {je_model.je_number} cannot be locked.')
+
+        je_txs_balances, verify_failed = je_qs.bulk_verify(
+            je_models=[je for je in je_models if je not in failed],
+            force_activity=True
+        )
+        failed.update(verify_failed)
+        if failed and raise_exception:
+            raise JournalEntryValidationError(
+                message=_(f'Could not lock {len(failed)} Journal Entries: '
+                          f'{", ".join(str(je.je_number) for je in failed)}')
+            )
+        je_models = [je for je in je_models if je not in failed]
+
+        for je_model in je_models:
+            je_model.locked = True
+
+        if commit and je_models:
+            with transaction.atomic():
+                self.bulk_update_state(je_models=je_models, locked=True)
+            bump_digest_version(je_models[0].ledger.entity_id)
+
+        for je_model in je_models:
+            journal_entry_locked.send_robust(sender=self.model,
+                                             instance=je_model,
+                                             commited=commit,
+                                             **kwargs)
+        return je_models, failed
+
+    def bulk_post(
+        self,
+        commit: bool = True,
+        force_lock: bool = False,
+        raise_exception: bool = False,
+        **kwargs
+    ) -> Tuple[List['JournalEntryModel'], Dict]:
+        """
+        Posts all the unposted Journal Entries in the QuerySet. Journal Entries are verified with a single
+        aggregation query (see bulk_verify) and posted with a single UPDATE statement, instead of calling
+        mark_as_posted on each JournalEntryModel. The denormalized TransactionModel fields and the
+        AccountBalanceSnapshotModel are updated from the same aggregation.
+
+        Parameters
+        ----------
+        commit: bool
+            Commits the changes into the database. Defaults to True.
+        force_lock: bool
+            Locks the unlocked Journal Entries before posting. Defaults to False.
+        raise_exception: bool
+            Raises JournalEntryValidationError if any Journal Entry cannot be posted, before any Journal Entry is
+            posted. Defaults to False.
+        kwargs: dict
+            Additional keyword arguments passed to the journal_entry_posted signal receivers.
+
+        Returns
+        -------
+        tuple
+            The list of posted JournalEntryModels and a dictionary with the error message of each JournalEntryModel
+            that could not be posted.
+        """
+        je_qs = self.unposted().select_related('ledger', 'ledger__entity')
+        je_models = list(je_qs)
+
+        failed = dict()
+        for je_model in je_models:
+            if je_model.ledger_is_locked() or je_model.is_in_locked_period():
+                failed[je_model] = _(f'Journal Entry {je_model.je_number} cannot post.')
+            elif not je_model.locked and not force_lock:
+                failed[je_model] = _(f'Journal Entry {je_model.je_number} must be locked before posting.')
+
+        je_txs_balances, verify_failed = je_qs.bulk_verify(
+            je_models=[je for je in je_models if je not in failed],
+            allow_empty=False
+        )
+        failed.update(verify_failed)
+        if failed and raise_exception:
+            raise JournalEntryValidationError(
+                message=_(f'Could not post {len(failed)} Journal Entries: '
+                          f'{", ".join(str(je.je_number) for je in failed)}')
+            )
+        je_models = [je for je in je_models if je not in failed]
+
+        for je_model in je_models:
+            # activity of unlocked Journal Entries has been regenerated by bulk_verify...
+            je_model.locked = True
+            je_model.posted = True
+
+        if commit and je_models:
+            TransactionModel = lazy_loader.get_txs_model()
+            with transaction.atomic():
+                self.bulk_update_state(je_models=je_models, locked=True, posted=True)
+                TransactionModel._base_manager.filter(
+                    journal_entry_id__in=[je.uuid for je in je_models]
+                ).update(je_posted=True)
+                if DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS:
+                    BalanceSnapshotModel = lazy_loader.get_balance_snapshot_model()
+                    BalanceSnapshotModel.objects.update_for_posted_journal_entries(
+                        je_txs_balances=[(je, je_txs_balances[je.uuid]) for je in je_models]
+                    )
+            for je_model in je_models:
+                je_model._balance_snapshot_state = je_model.get_balance_snapshot_state()
+            bump_digest_version(je_models[0].ledger.entity_id)
+
+        for je_model in je_models:
+            journal_entry_posted.send_robust(sender=self.model,
+                                             instance=je_model,
+                                             commited=commit,
+                                             **kwargs)
+        return je_models, failed
+
+    def bulk_update_state(self, je_models: List['JournalEntryModel'], **state) -> int:
+        """
+        Persists the state and the activity of the provided JournalEntryModels with a single UPDATE statement.
+
+        Parameters
+        ----------
+        je_models: list
+            The JournalEntryModels to update.
+        state: dict
+            The field values set on all the JournalEntryModels, such as posted or locked.
+
+        Returns
+        -------
+        int
+            The number of updated JournalEntryModels.
+        """
+        je_by_activity = defaultdict(list)
+        for je_model in je_models:
+            je_by_activity[je_model.activity].append(je_model.uuid)
+
+        return self.model._base_manager.using(self.db).filter(
+            uuid__in=[je.uuid for je in je_models]
+        ).update(
+            activity=Case(
+                *[When(uuid__in=uuids, then=Value(activity)) for activity, uuids in je_by_activity.items()],
+                default=F('activity'),
+                output_field=models.CharField()
+            ),
+            updated=localtime(),
+            **state
+        )
+
 
 class JournalEntryModelManager(Manager):
     """
@@ -436,9 +680,21 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
             models.Index(fields=['is_closing_entry']),
         ]
 
+    BALANCE_SNAPSHOT_FIELDS = ('posted', 'activity', 'timestamp', 'entity_unit_id')
+    TRANSACTION_DENORMALIZED_FIELDS = ('ledger', 'ledger_id', 'timestamp', 'posted', 'is_closing_entry')
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._verified = False
+        self._balance_snapshot_state = None
+        self._transactions_state = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._balance_snapshot_state = instance.get_balance_snapshot_state()
+        instance._transactions_state = instance.get_transactions_state()
+        return instance
 
     def __str__(self):
         if self.je_number:
@@ -688,13 +944,17 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         Validates that all transactions in the QuerySet are associated with the same Chart of Accounts (COA).
 
         Parameters:
-            txs_qs (TransactionModelQuerySet): A QuerySet containing transactions to validate.
+            txs_qs (TransactionModelQuerySet or list): A QuerySet or a list of TransactionModels with their
+                AccountModel already set, containing transactions to validate.
 
         Returns:
             bool: True if all transactions have the same Chart of Accounts, otherwise False.
         """
         if len(txs_qs) > 0:
-            coa_count = len(set(tx.coa_id for tx in txs_qs))
+            if isinstance(txs_qs, list):
+                coa_count = len(set(tx.account.coa_model_id for tx in txs_qs))
+            else:
+                coa_count = len(set(tx.coa_id for tx in txs_qs))
             is_valid = coa_count == 1
             if not is_valid and raise_exception:
                 raise JournalEntryValidationError(
@@ -708,7 +968,7 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         Validates whether the given Transaction QuerySet belongs to the current Journal Entry.
 
         Parameters:
-            txs_qs (TransactionModelQuerySet): A QuerySet containing transactions to validate.
+            txs_qs (TransactionModelQuerySet or list): A QuerySet or a list of TransactionModels to validate.
             raise_exception (bool): Whether to raise a JournalEntryValidationError if the validation fails.
 
         Returns:
@@ -717,8 +977,8 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         Raises:
             JournalEntryValidationError: If validation fails and raise_exception is True.
         """
-        if not isinstance(txs_qs, TransactionModelQuerySet):
-            raise JournalEntryValidationError('Must pass an instance of TransactionModelQuerySet')
+        if not isinstance(txs_qs, (TransactionModelQuerySet, list)):
+            raise JournalEntryValidationError('Must pass an instance of TransactionModelQuerySet or a list')
 
         is_valid = all(tx.journal_entry_id == self.uuid for tx in txs_qs)
         if not is_valid and raise_exception:
@@ -808,6 +1068,7 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
                        verify: bool = True,
                        force_lock: bool = False,
                        raise_exception: bool = False,
+                       txs_qs: Optional[Union[TransactionModelQuerySet, List]] = None,
                        **kwargs):
         """
         Posted transactions show on the EntityModel ledger and financial statements.
@@ -821,11 +1082,13 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
             Forces to lock the JournalEntry before is posted.
         raise_exception: bool
             Raises JournalEntryValidationError if cannot post. Defaults to False.
+        txs_qs: TransactionModelQuerySet or list
+            Optional pre-fetched transactions used for verification and activity, avoiding additional queries.
         kwargs: dict
             Additional keyword arguments.
         """
         if verify and not self.is_verified():
-            txs_qs, verified = self.verify()
+            txs_qs, verified = self.verify(txs_qs=txs_qs)
             if not len(txs_qs):
                 if raise_exception:
                     raise JournalEntryValidationError(
@@ -834,7 +1097,7 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
                 return
         if force_lock and not self.is_locked():
             try:
-                self.mark_as_locked(commit=False, raise_exception=True)
+                self.mark_as_locked(commit=False, raise_exception=True, txs_qs=txs_qs)
             except JournalEntryValidationError as e:
                 if raise_exception:
                     raise e
@@ -907,7 +1170,11 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         """
         return self.mark_as_unposted(**kwargs)
 
-    def mark_as_locked(self, commit: bool = False, raise_exception: bool = False, **kwargs):
+    def mark_as_locked(self,
+                       commit: bool = False,
+                       raise_exception: bool = False,
+                       txs_qs: Optional[Union[TransactionModelQuerySet, List]] = None,
+                       **kwargs):
         """
         Locked JournalEntryModels do not allow transactions to be edited.
 
@@ -917,6 +1184,8 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
             Commits changes into the Database, Defaults to False.
         raise_exception: bool
             Raises JournalEntryValidationError if cannot lock. Defaults to False.
+        txs_qs: TransactionModelQuerySet or list
+            Optional pre-fetched transactions used to generate the activity, avoiding additional queries.
         kwargs: dict
             Additional keyword arguments.
         """
@@ -926,7 +1195,7 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
                     raise JournalEntryValidationError(f'Journal Entry {self.uuid} is already locked.')
                 return
         if not self.is_locked():
-            self.generate_activity(force_update=True)
+            self.generate_activity(txs_qs=txs_qs, force_update=True)
             self.locked = True
             if self.is_locked():
                 if commit:
@@ -976,6 +1245,138 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         """
         return self.mark_as_unlocked(**kwargs)
 
+    def send_state_signals(self, commited: bool = True, **kwargs):
+        """
+        Sends the journal_entry_locked and journal_entry_posted signals matching the current JournalEntryModel state.
+        Meant for JournalEntryModels locked or posted in bulk, without calling mark_as_locked or mark_as_posted.
+
+        Parameters
+        ----------
+        commited: bool
+            Whether the state has been committed into the database. Defaults to True.
+        kwargs: dict
+            Additional keyword arguments passed to the signal receivers.
+        """
+        if self.locked:
+            journal_entry_locked.send_robust(sender=self.__class__,
+                                             instance=self,
+                                             commited=commited,
+                                             **kwargs)
+        if self.posted:
+            journal_entry_posted.send_robust(sender=self.__class__,
+                                             instance=self,
+                                             commited=commited,
+                                             **kwargs)
+
+    def get_balance_snapshot_state(self) -> Optional[Tuple]:
+        """
+        The state of the JournalEntryModel relevant to the AccountBalanceSnapshotModel.
+
+        Returns
+        -------
+        tuple or None
+            A (posted, activity, timestamp, entity_unit_id) tuple. None if any of the fields is deferred.
+        """
+        if not all(f in self.__dict__ for f in self.BALANCE_SNAPSHOT_FIELDS):
+            return None
+        return tuple(self.__dict__[f] for f in self.BALANCE_SNAPSHOT_FIELDS)
+
+    def update_balance_snapshots(self, previous_state: Optional[Tuple] = None):
+        """
+        Applies the changes of posted balances, if any, to the AccountBalanceSnapshotModel.
+        Called after the JournalEntryModel is saved. Does nothing unless DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS
+        is enabled.
+
+        Parameters
+        ----------
+        previous_state: tuple
+            The persisted snapshot state prior to saving. Defaults to the state when the instance was loaded
+            from the database.
+        """
+        if not DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS:
+            return
+        if previous_state is None:
+            previous_state = self._balance_snapshot_state
+        current_state = self.get_balance_snapshot_state()
+        self._balance_snapshot_state = current_state
+        BalanceSnapshotModel = lazy_loader.get_balance_snapshot_model()
+        BalanceSnapshotModel.objects.update_for_journal_entry(
+            je_model=self,
+            previous_state=previous_state,
+            current_state=current_state
+        )
+
+    def get_transactions_state(self) -> Optional[Tuple]:
+        """
+        The state of the JournalEntryModel denormalized into its TransactionModels.
+
+        Returns
+        -------
+        tuple or None
+            A (ledger_id, timestamp, posted, is_closing_entry) tuple. None if any of the fields is deferred.
+        """
+        fields = [f for f in self.TRANSACTION_DENORMALIZED_FIELDS if f != 'ledger']
+        if not all(f in self.__dict__ for f in fields):
+            return None
+        return tuple(self.__dict__[f] for f in fields)
+
+    def sync_transactions(self) -> int:
+        """
+        Refreshes the denormalized JournalEntryModel and LedgerModel fields of all the TransactionModels
+        associated with the JournalEntryModel.
+
+        Returns
+        -------
+        int
+            The number of updated TransactionModels.
+        """
+        TransactionModel = lazy_loader.get_txs_model()
+        return TransactionModel._base_manager.filter(journal_entry_id=self.uuid).update(
+            entity_id=self.ledger.entity_id,
+            ledger_id=self.ledger_id,
+            je_timestamp=self.timestamp,
+            je_posted=self.posted,
+            ledger_posted=self.ledger.posted,
+            is_closing_entry=self.is_closing_entry
+        )
+
+    def save_with_transactions(self, txs_models: List) -> List:
+        """
+        Saves a new JournalEntryModel along with its new TransactionModels. Meant for JournalEntryModels verified in
+        memory against the same TransactionModels (see verify), so no transactions are queried back from the database.
+        The denormalized TransactionModel fields and the AccountBalanceSnapshotModel are updated from the
+        in-memory state.
+
+        Parameters
+        ----------
+        txs_models: list
+            The unsaved TransactionModels of the JournalEntryModel.
+
+        Returns
+        -------
+        list
+            The created TransactionModels.
+        """
+        if not self._state.adding:
+            raise JournalEntryValidationError(f'Journal Entry {self.uuid} has already been saved.')
+        if txs_models and not self.is_verified():
+            raise JournalEntryValidationError(message='Cannot save an unverified Journal Entry.')
+
+        for tx_model in txs_models:
+            tx_model.journal_entry = self
+            tx_model.sync_denormalized_fields(je_model=self)
+
+        # nothing is posted until the transactions are created...
+        self._balance_snapshot_state = self.get_balance_snapshot_state()
+        self.save(verify=False)
+
+        TransactionModel = lazy_loader.get_txs_model()
+        txs_models = TransactionModel.objects.bulk_create(txs_models)
+        if DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS:
+            BalanceSnapshotModel = lazy_loader.get_balance_snapshot_model()
+            BalanceSnapshotModel.objects.update_for_new_journal_entries([(self, txs_models)])
+        return txs_models
+
     def get_transaction_queryset(self, select_accounts: bool = True) -> TransactionModelQuerySet:
         """
         Retrieves the `TransactionModelQuerySet` associated with this `JournalEntryModel` instance.
@@ -997,21 +1398,22 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
 
     def get_txs_balances(
             self,
-            txs_qs: Optional[TransactionModelQuerySet] = None,
+            txs_qs: Optional[Union[TransactionModelQuerySet, List]] = None,
             as_dict: bool = False
-    ) -> Union[TransactionModelQuerySet, Dict[str, Decimal]]:
+    ) -> Union[TransactionModelQuerySet, List[Dict], Dict[str, Decimal]]:
         """
         Calculates the total CREDIT and DEBIT balances for the journal entry.
 
         This method performs an aggregate database query to compute the sum of CREDITs and
         DEBITs across the transactions related to this journal entry. Optionally, a pre-fetched
-        `TransactionModelQuerySet` can be supplied for efficiency. Validation is performed to
-        ensure that all transactions belong to this journal entry.
+        `TransactionModelQuerySet` can be supplied for efficiency. If a list of TransactionModels is provided,
+        balances are computed in memory. Validation is performed to ensure that all transactions belong
+        to this journal entry.
 
         Parameters
         ----------
-        txs_qs : TransactionModelQuerySet, optional
-            A pre-fetched queryset of transactions. If None, the queryset is fetched automatically.
+        txs_qs : TransactionModelQuerySet or list, optional
+            A pre-fetched queryset or list of transactions. If None, the queryset is fetched automatically.
         as_dict : bool, optional
             If True, returns the results as a dictionary with keys "credit" and "debit". Defaults to False.
 
@@ -1028,7 +1430,7 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         """
         if not txs_qs:
             txs_qs = self.get_transaction_queryset(select_accounts=False)
-        elif not isinstance(txs_qs, TransactionModelQuerySet):
+        elif not isinstance(txs_qs, (TransactionModelQuerySet, list)):
             raise JournalEntryValidationError(
                 f"Expected a TransactionModelQuerySet, got {type(txs_qs).__name__}"
             )
@@ -1037,6 +1439,17 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
                 "Invalid TransactionModelQuerySet. All transactions must belong to the same journal entry."
             )
 
+        if isinstance(txs_qs, list):
+            balances = [
+                {
+                    'tx_type': tx_type,
+                    'amount__sum': sum((tx.amount for tx in txs_qs if tx.tx_type == tx_type), Decimal('0.00'))
+                } for tx_type in [CREDIT, DEBIT]
+            ]
+            if as_dict:
+                return {tx['tx_type']: tx['amount__sum'] for tx in balances}
+            return balances
+
         balances = txs_qs.values('tx_type').annotate(
             amount__sum=Coalesce(Sum('amount'), Decimal('0.00'), output_field=models.DecimalField())
         )
@@ -1047,7 +1460,7 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
 
     def get_txs_roles(
             self,
-            txs_qs: Optional[TransactionModelQuerySet] = None,
+            txs_qs: Optional[Union[TransactionModelQuerySet, List]] = None,
             exclude_cash_role: bool = False
     ) -> Set[str]:
         """
@@ -1216,7 +1629,7 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         return activity
 
     def generate_activity(self,
-                          txs_qs: Optional[TransactionModelQuerySet] = None,
+                          txs_qs: Optional[Union[TransactionModelQuerySet, List]] = None,
                           raise_exception: bool = True,
                           force_update: bool = False) -> Optional[str]:
         """
@@ -1225,7 +1638,8 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         Parameters
         ----------
         txs_qs : Optional[TransactionModelQuerySet], default None
-            Queryset of TransactionModel instances for validation. If None, transactions are queried.
+            Queryset or list of TransactionModel instances for validation. If None, transactions are queried.
+            Activity of a JournalEntryModel not yet saved is only generated when transactions are provided.
         raise_exception : bool, default True
             Determines whether exceptions are raised during processing.
         force_update : bool, default False
@@ -1236,7 +1650,7 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         Optional[str]
             Generated activity or None if not applicable.
         """
-        if not self._state.adding:
+        if not self._state.adding or txs_qs:
             if raise_exception and self.is_closing_entry:
                 raise_exception = False
 
@@ -1269,7 +1683,6 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         return self.activity
 
     # todo: add entity_model as parameter on all functions...
-    # todo: outsource this function to EntityStateModel...?...
     def _get_next_state_model(self, raise_exception: bool = True) -> Optional[EntityStateModel]:
         """
         Retrieves or creates the next state model for the Journal Entry.
@@ -1286,37 +1699,13 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         """
         entity_model = self.entity_model
         fy_key = entity_model.get_fy_for_date(dt=self.timestamp)
-
-        try:
-            LOOKUP = {
-                'entity_model_id__exact': self.entity_uuid,
-                'entity_unit_id__exact': self.entity_unit_id,
-                'fiscal_year': fy_key,
-                'key__exact': EntityStateModel.KEY_JOURNAL_ENTRY
-            }
-
-            state_model_qs = EntityStateModel.objects.filter(**LOOKUP).select_related(
-                'entity_model').select_for_update()
-            state_model = state_model_qs.get()
-            state_model.sequence = F('sequence') + 1
-            state_model.save()
-            state_model.refresh_from_db()
-            return state_model
-
-        except ObjectDoesNotExist:
-            LOOKUP = {
-                'entity_model_id': entity_model.uuid,
-                'entity_unit_id': self.entity_unit_id,
-                'fiscal_year': fy_key,
-                'key': EntityStateModel.KEY_JOURNAL_ENTRY,
-                'sequence': 1
-            }
-            state_model = EntityStateModel.objects.create(**LOOKUP)
-            return state_model
-
-        except IntegrityError as e:
-            if raise_exception:
-                raise e
+        return EntityStateModel.objects.get_next_state_model(
+            entity_model_id=self.entity_uuid,
+            entity_unit_id=self.entity_unit_id,
+            fiscal_year=fy_key,
+            key=EntityStateModel.KEY_JOURNAL_ENTRY,
+            raise_exception=raise_exception
+        )
 
     def can_generate_je_number(self) -> bool:
         """
@@ -1332,6 +1721,30 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
             not self.je_number
         ])
 
+    def get_je_number(self, fiscal_year: int, sequence: int) -> str:
+        """
+        Formats the Journal Entry number for a given fiscal year and sequence value.
+
+        Parameters
+        ----------
+        fiscal_year : int
+            The fiscal year of the Journal Entry.
+        sequence : int
+            The EntityStateModel sequence value.
+
+        Returns
+        -------
+        str
+            The formatted JE number.
+        """
+        if self.entity_unit_id:
+            unit_prefix = self.entity_unit.document_prefix
+        else:
+            unit_prefix = DJANGO_LEDGER_JE_NUMBER_NO_UNIT_PREFIX
+
+        seq = str(sequence).zfill(DJANGO_LEDGER_DOCUMENT_NUMBER_PADDING)
+        return f'{DJANGO_LEDGER_JE_NUMBER_PREFIX}-{fiscal_year}-{unit_prefix}-{seq}'
+
     def generate_je_number(self, commit: bool = False) -> str:
         """
         Generates the Journal Entry number in an atomic transaction.
@@ -1354,13 +1767,8 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
                 while not state_model:
                     state_model = self._get_next_state_model(raise_exception=False)
 
-                if self.entity_unit_id:
-                    unit_prefix = self.entity_unit.document_prefix
-                else:
-                    unit_prefix = DJANGO_LEDGER_JE_NUMBER_NO_UNIT_PREFIX
-
-                seq = str(state_model.sequence).zfill(DJANGO_LEDGER_DOCUMENT_NUMBER_PADDING)
-                self.je_number = f'{DJANGO_LEDGER_JE_NUMBER_PREFIX}-{state_model.fiscal_year}-{unit_prefix}-{seq}'
+                self.je_number = self.get_je_number(fiscal_year=state_model.fiscal_year,
+                                                    sequence=state_model.sequence)
 
                 if commit:
                     self.save(update_fields=['je_number'])
@@ -1368,7 +1776,7 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         return self.je_number
 
     def verify(self,
-               txs_qs: Optional[TransactionModelQuerySet] = None,
+               txs_qs: Optional[Union[TransactionModelQuerySet, List]] = None,
                force_verify: bool = False,
                raise_exception: bool = True,
                **kwargs) -> Tuple[TransactionModelQuerySet, bool]:
@@ -1379,7 +1787,9 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         Parameters
         ----------
         txs_qs : Optional[TransactionModelQuerySet], default None
-            Queryset of TransactionModel instances to validate. If None, transactions are queried.
+            Queryset of TransactionModel instances to validate. If None, transactions are queried. A list of
+            TransactionModel instances with their AccountModel already set, such as the transactions just built
+            by the caller, is verified in memory without any database query.
         force_verify : bool, default False
             Forces re-verification even if already verified.
         raise_exception : bool, default True
@@ -1398,7 +1808,7 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
             self._verified = False
 
             # fetches JEModel TXS QuerySet if not provided....
-            if not txs_qs:
+            if txs_qs is None:
                 txs_qs = self.get_transaction_queryset()
                 is_txs_qs_valid = True
             else:
@@ -1444,6 +1854,60 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
                 return txs_qs, self.is_verified()
         return self.get_transaction_queryset(), self.is_verified()
 
+    def verify_txs_balances(self, txs_balances: List[Dict], force_activity: bool = False) -> bool:
+        """
+        Verifies the Journal Entry from its pre-aggregated transaction balances, as returned by
+        JournalEntryModelQuerySet.get_txs_balances_by_journal_entry, without any database query.
+        Validates the CREDIT/DEBIT balance and the Chart of Accounts, and generates the activity.
+
+        Parameters
+        ----------
+        txs_balances : list
+            The transaction balances of the Journal Entry, grouped by account and tx_type.
+        force_activity : bool, default False
+            Forces the regeneration of the activity even if it exists.
+
+        Returns
+        -------
+        bool
+            True if verified.
+
+        Raises
+        ------
+        JournalEntryValidationError
+            If the balance, the Chart of Accounts or the activity are not valid.
+        """
+        self._verified = False
+        credits = sum((tx['amount__sum'] for tx in txs_balances if tx['tx_type'] == CREDIT), Decimal('0.00'))
+        debits = sum((tx['amount__sum'] for tx in txs_balances if tx['tx_type'] == DEBIT), Decimal('0.00'))
+        if credits != debits:
+            raise JournalEntryValidationError(
+                message='Balance of {0} CREDITs are {1} does not match DEBITs {2}.'.format(self, credits, debits)
+            )
+
+        if len(set(tx['account__coa_model_id'] for tx in txs_balances)) > 1:
+            raise JournalEntryValidationError(
+                message='All transactions in the QuerySet must be associated with the same Chart of Accounts.'
+            )
+
+        if any([
+            not self.has_activity(),
+            not self.is_locked(),
+            force_activity
+        ]):
+            role_set = set(tx['account__role'] for tx in txs_balances)
+            if ASSET_CA_CASH not in role_set:
+                self.activity = None
+            else:
+                role_set.discard(ASSET_CA_CASH)
+                self.activity = self.get_activity_from_roles(
+                    role_set=role_set,
+                    raise_exception=not self.is_closing_entry
+                )
+
+        self._verified = True
+        return self._verified
+
     def clean(self,
               verify: bool = False,
               raise_exception: bool = True,
@@ -1488,7 +1952,7 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
 
         self.generate_je_number(commit=True)
         if verify:
-            txs_qs, verified = self.verify()
+            txs_qs, verified = self.verify(txs_qs=txs_qs)
             return txs_qs, self.is_verified()
         return self.get_transaction_queryset(), self.is_verified()
 
@@ -1521,7 +1985,10 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
             raise JournalEntryValidationError(
                 message=_(f'JournalEntryModel {self.uuid} cannot be deleted...')
             )
-        return super().delete(**kwargs)
+        entity_uuid = self.entity_uuid
+        result = super().delete(**kwargs)
+        bump_digest_version(entity_uuid)
+        return result
 
     def save(
             self,
@@ -1577,7 +2044,32 @@ class JournalEntryModelAbstract(CreateUpdateMixIn):
         if not self.is_verified() and verify:
             raise JournalEntryValidationError(message='Cannot save an unverified Journal Entry.')
 
-        return super(JournalEntryModelAbstract, self).save(*args, **kwargs)
+        previous_snapshot_state = self._balance_snapshot_state
+        if DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS and previous_snapshot_state is None and not self._state.adding:
+            # deferred fields, fetching persisted state...
+            previous_snapshot_state = self.__class__._base_manager.filter(
+                uuid__exact=self.uuid
+            ).values_list(*self.BALANCE_SNAPSHOT_FIELDS).first()
+
+        adding = self._state.adding
+        update_fields = kwargs.get('update_fields')
+
+        result = super(JournalEntryModelAbstract, self).save(*args, **kwargs)
+        self.update_balance_snapshots(previous_state=previous_snapshot_state)
+
+        # denormalized transaction fields are only read, and kept in sync, if enabled...
+        if update_fields is not None:
+            sync_transactions = any(f in update_fields for f in self.TRANSACTION_DENORMALIZED_FIELDS)
+        else:
+            sync_transactions = self._transactions_state is None or (
+                    self._transactions_state != self.get_transactions_state()
+            )
+        if sync_transactions and DJANGO_LEDGER_USE_DENORMALIZED_TRANSACTIONS and not adding:
+            self.sync_transactions()
+        if update_fields is None or sync_transactions:
+            self._transactions_state = self.get_transactions_state()
+        bump_digest_version(self.entity_uuid)
+        return result
 
     # URLS Generation...
 
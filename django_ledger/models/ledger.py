@@ -36,6 +36,7 @@ from django.db.models import Q, Min, F, Count, Manager, QuerySet
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
+from django_ledger.io.io_cache import bump_digest_version
 from django_ledger.io.io_core import IOMixIn
 from django_ledger.models import lazy_loader
 from django_ledger.models.deprecations import deprecated_entity_slug_behavior
@@ -531,18 +532,73 @@ class LedgerModelAbstract(CreateUpdateMixIn, IOMixIn):
                 'posted',
                 'updated'
             ])
+            self.sync_transactions()
         ledger_posted.send_robust(sender=self.__class__,
                                   instance=self,
                                   commited=commit,
                                   **kwargs)
 
-    def post_journal_entries(self, commit: bool = True, **kwargs):
-        je_model_qs = self.journal_entries.unposted()
-        for je_model in je_model_qs:
-            je_model.mark_as_posted(raise_exception=False, commit=False)
-        if commit:
-            je_model_qs.bulk_update(objs=je_model_qs, fields=['posted', 'updated'])
-        return je_model_qs
+    def post_journal_entries(self, commit: bool = True, raise_exception: bool = False, **kwargs):
+        """
+        Posts all the unposted JournalEntryModels of the LedgerModel (see bulk_post_journal_entries).
+
+        Parameters
+        ----------
+        commit: bool
+            If True, saves the changes into the database. Defaults to True.
+        raise_exception: bool
+            Raises JournalEntryValidationError if any Journal Entry cannot be posted. No Journal Entry is posted
+            in that case. Defaults to False.
+        kwargs: dict
+            Additional keyword arguments passed to the journal_entry_posted signal receivers.
+
+        Returns
+        -------
+        JournalEntryModelQuerySet
+            The posted JournalEntryModels.
+        """
+        je_models, _failed = self.bulk_post_journal_entries(commit=commit, raise_exception=raise_exception, **kwargs)
+        return self.journal_entries.filter(uuid__in=[je_model.uuid for je_model in je_models])
+
+    def bulk_post_journal_entries(self, commit: bool = True, raise_exception: bool = False, **kwargs):
+        """
+        Posts all the unposted and locked JournalEntryModels of the LedgerModel. All Journal Entries are verified
+        with a single aggregation query and posted with a single UPDATE statement (see
+        JournalEntryModelQuerySet.bulk_post).
+
+        Parameters
+        ----------
+        commit: bool
+            If True, saves the changes into the database. Defaults to True.
+        raise_exception: bool
+            Raises JournalEntryValidationError if any Journal Entry cannot be posted. All Journal Entries are
+            verified first, so no Journal Entry is posted in that case. Otherwise, the valid Journal Entries are
+            posted. Defaults to False.
+        kwargs: dict
+            Additional keyword arguments passed to the journal_entry_posted signal receivers.
+
+        Returns
+        -------
+        tuple
+            The list of posted JournalEntryModels and a dictionary with the error message of each JournalEntryModel
+            that could not be posted.
+        """
+        return self.journal_entries.all().bulk_post(commit=commit, raise_exception=raise_exception, **kwargs)
+
+    def sync_transactions(self) -> int:
+        """
+        Refreshes the denormalized JournalEntryModel and LedgerModel fields of all the TransactionModels
+        associated with the LedgerModel.
+
+        Returns
+        -------
+        int
+            The number of updated TransactionModels.
+        """
+        TransactionModel = lazy_loader.get_txs_model()
+        updated = TransactionModel.objects.filter(journal_entry__ledger_id=self.uuid).sync_denormalized_fields()
+        bump_digest_version(self.entity_id)
+        return updated
 
     def unpost(self, commit: bool = False, raise_exception: bool = True, **kwargs):
         """
@@ -567,6 +623,7 @@ class LedgerModelAbstract(CreateUpdateMixIn, IOMixIn):
                 'posted',
                 'updated'
             ])
+            self.sync_transactions()
         ledger_unposted.send_robust(sender=self.__class__,
                                     instance=self,
                                     commited=commit,
@@ -596,18 +653,57 @@ class LedgerModelAbstract(CreateUpdateMixIn, IOMixIn):
                 'locked',
                 'updated'
             ])
+            bump_digest_version(self.entity_id)
         ledger_locked.send_robust(sender=self.__class__,
                                   instance=self,
                                   commited=commit,
                                   **kwargs)
 
-    def lock_journal_entries(self, commit: bool = True, **kwargs):
-        je_model_qs = self.journal_entries.unlocked()
-        for je_model in je_model_qs:
-            je_model.mark_as_locked(raise_exception=False, commit=False)
-        if commit:
-            je_model_qs.bulk_update(objs=je_model_qs, fields=['locked', 'updated'])
-        return je_model_qs
+    def lock_journal_entries(self, commit: bool = True, raise_exception: bool = False, **kwargs):
+        """
+        Locks all the unlocked JournalEntryModels of the LedgerModel (see bulk_lock_journal_entries).
+
+        Parameters
+        ----------
+        commit: bool
+            If True, saves the changes into the database. Defaults to True.
+        raise_exception: bool
+            Raises JournalEntryValidationError if any Journal Entry cannot be locked. No Journal Entry is locked
+            in that case. Defaults to False.
+        kwargs: dict
+            Additional keyword arguments passed to the journal_entry_locked signal receivers.
+
+        Returns
+        -------
+        JournalEntryModelQuerySet
+            The locked JournalEntryModels.
+        """
+        je_models, _failed = self.bulk_lock_journal_entries(commit=commit, raise_exception=raise_exception, **kwargs)
+        return self.journal_entries.filter(uuid__in=[je_model.uuid for je_model in je_models])
+
+    def bulk_lock_journal_entries(self, commit: bool = True, raise_exception: bool = False, **kwargs):
+        """
+        Locks all the unlocked JournalEntryModels of the LedgerModel. All Journal Entries are verified with a single
+        aggregation query and locked with a single UPDATE statement (see JournalEntryModelQuerySet.bulk_lock).
+
+        Parameters
+        ----------
+        commit: bool
+            If True, saves the changes into the database. Defaults to True.
+        raise_exception: bool
+            Raises JournalEntryValidationError if any Journal Entry cannot be locked. All Journal Entries are
+            verified first, so no Journal Entry is locked in that case. Otherwise, the valid Journal Entries are
+            locked. Defaults to False.
+        kwargs: dict
+            Additional keyword arguments passed to the journal_entry_locked signal receivers.
+
+        Returns
+        -------
+        tuple
+            The list of locked JournalEntryModels and a dictionary with the error message of each JournalEntryModel
+            that could not be locked.
+        """
+        return self.journal_entries.all().bulk_lock(commit=commit, raise_exception=raise_exception, **kwargs)
 
     def unlock(self, commit: bool = False, raise_exception: bool = True, **kwargs):
         """
@@ -631,6 +727,7 @@ class LedgerModelAbstract(CreateUpdateMixIn, IOMixIn):
                 'locked',
                 'updated'
             ])
+            bump_digest_version(self.entity_id)
         ledger_unlocked.send_robust(sender=self.__class__,
                                     instance=self,
                                     commited=commit,
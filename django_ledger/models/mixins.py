@@ -36,6 +36,7 @@ from django_ledger.io import (
     LIABILITY_LTL_MORTGAGE_PAYABLE,
     LIABILITY_LTL_NOTES_PAYABLE,
 )
+from django_ledger.io.io_cache import bump_digest_version
 from django_ledger.io.io_core import (
     check_tx_balance,
     get_localdate,
@@ -848,7 +849,13 @@ class AccrualMixIn(models.Model):
                 }
 
                 for u, je in je_list.items():
-                    je.clean(verify=False)
+                    je.generate_je_number(commit=False)
+
+                # single query for all the involved accounts, needed for in-memory verification...
+                AccountModel = lazy_loader.get_account_model()
+                account_models = AccountModel.objects.in_bulk(
+                    list(set(k[0] for k in diff_idx))
+                )
 
                 txs_list = [
                     (
@@ -859,7 +866,7 @@ class AccrualMixIn(models.Model):
                             tx_type=self.get_tx_type(
                                 acc_bal_type=bal_type, adjustment_amount=amt
                             ),
-                            account_id=acc_uuid,
+                            account=account_models[acc_uuid],
                             description=self.get_migrate_state_desc(),
                         ),
                     )
@@ -880,23 +887,28 @@ class AccrualMixIn(models.Model):
                 # validates all txs as a whole (for safety)...
                 txs = [tx for _, tx in txs_list]
                 check_tx_balance(tx_data=txs, perform_correction=True)
-                TransactionModel.objects.bulk_create(txs)
 
-                for _, je in je_list.items():
+                je_txs = {
+                    u: [tx for ui, tx in txs_list if ui == u] for u in unit_uuids
+                }
+
+                for u, je in je_list.items():
                     # will independently verify and populate appropriate activity for JE.
-                    je.clean(verify=True)
-                    if je.is_verified():
-                        je.mark_as_locked(commit=False, raise_exception=True)
+                    je.verify(txs_qs=je_txs[u])
+
+                if all([je.is_verified() for _, je in je_list.items()]):
+                    # only if all JEs have been verified will be posted and locked...
+                    for u, je in je_list.items():
+                        je.mark_as_locked(
+                            commit=False, raise_exception=True, txs_qs=je_txs[u]
+                        )
                         je.mark_as_posted(
                             commit=False, verify=False, raise_exception=True
                         )
 
-                if all([je.is_verified() for _, je in je_list.items()]):
-                    # only if all JEs have been verified will be posted and locked...
-                    JournalEntryModel.objects.bulk_update(
-                        objs=[je for _, je in je_list.items()],
-                        fields=['posted', 'locked', 'activity'],
-                    )
+                for u, je in je_list.items():
+                    je.save_with_transactions(je_txs[u])
+                bump_digest_version(self.ledger.entity_id)
 
             return item_data, io_data
 
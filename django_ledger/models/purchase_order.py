@@ -19,10 +19,10 @@ from typing import Tuple, List, Union, Optional, Dict
 from uuid import uuid4, UUID
 
 from django.contrib.auth import get_user_model
-from django.core.exceptions import ValidationError, ObjectDoesNotExist
+from django.core.exceptions import ValidationError
 from django.core.validators import MinLengthValidator
-from django.db import models, transaction, IntegrityError
-from django.db.models import Q, Sum, Count, F, Manager, QuerySet
+from django.db import models, transaction
+from django.db.models import Q, Sum, Count, Manager, QuerySet
 from django.db.models.functions import Coalesce
 from django.db.models.signals import pre_save
 from django.shortcuts import get_object_or_404
@@ -1183,38 +1183,12 @@ class PurchaseOrderModelAbstract(CreateUpdateMixIn,
         EntityModel = lazy_loader.get_entity_model()
         entity_model = EntityModel.objects.get(uuid__exact=self.entity_id)
         fy_key = entity_model.get_fy_for_date(dt=self.date_draft)
-        try:
-            LOOKUP = {
-                'entity_model_id__exact': self.entity_id,
-                'entity_unit_id': None,
-                'fiscal_year': fy_key,
-                'key__exact': EntityStateModel.KEY_PURCHASE_ORDER
-            }
-
-            state_model_qs = EntityStateModel.objects.filter(**LOOKUP).select_related(
-                'entity_model').select_for_update()
-            state_model = state_model_qs.get()
-            state_model.sequence = F('sequence') + 1
-            state_model.save()
-            state_model.refresh_from_db()
-            return state_model
-        except ObjectDoesNotExist:
-            EntityModel = lazy_loader.get_entity_model()
-            entity_model = EntityModel.objects.get(uuid__exact=self.entity_id)
-            fy_key = entity_model.get_fy_for_date(dt=self.date_draft)
-
-            LOOKUP = {
-                'entity_model_id': entity_model.uuid,
-                'entity_unit_id': None,
-                'fiscal_year': fy_key,
-                'key': EntityStateModel.KEY_PURCHASE_ORDER,
-                'sequence': 1
-            }
-            state_model = EntityStateModel.objects.create(**LOOKUP)
-            return state_model
-        except IntegrityError as e:
-            if raise_exception:
-                raise e
+        return EntityStateModel.objects.get_next_state_model(
+            entity_model_id=self.entity_id,
+            fiscal_year=fy_key,
+            key=EntityStateModel.KEY_PURCHASE_ORDER,
+            raise_exception=raise_exception
+        )
 
     def generate_po_number(self, commit: bool = False) -> str:
         """
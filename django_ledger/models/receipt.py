@@ -23,9 +23,9 @@ from decimal import Decimal
 from typing import Literal, Optional
 from uuid import UUID, uuid4
 
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
-from django.db import IntegrityError, models, transaction
+from django.db import models, transaction
 from django.db.models import F, Manager, Q, QuerySet
 from django.db.models.signals import pre_save
 from django.urls import reverse
@@ -579,38 +579,12 @@ class ReceiptModelAbstract(CreateUpdateMixIn, MarkdownNotesMixIn, IOMixIn):
         """
         entity_model = self.ledger_model.entity
         fy_key = entity_model.get_fy_for_date(dt=self.receipt_date)
-
-        LOOKUP = {
-            'entity_model_id__exact': entity_model.uuid,
-            'entity_unit_id__exact': None,
-            'fiscal_year': fy_key,
-            'key__exact': EntityStateModel.KEY_RECEIPT,
-        }
-
-        try:
-            state_model_qs = (
-                EntityStateModel.objects.filter(**LOOKUP).select_related('entity_model').select_for_update()
-            )
-
-            state_model = state_model_qs.get()
-            state_model.sequence = F('sequence') + 1
-            state_model.save(update_fields=['sequence'])
-            state_model.refresh_from_db()
-            return state_model
-        except ObjectDoesNotExist:
-            LOOKUP = {
-                'entity_model_id': entity_model.uuid,
-                'entity_unit_id': None,
-                'fiscal_year': fy_key,
-                'key': EntityStateModel.KEY_RECEIPT,
-                'sequence': 1,
-            }
-
-            state_model = EntityStateModel.objects.create(**LOOKUP)
-            return state_model
-        except IntegrityError as e:
-            if raise_exception:
-                raise e
+        return EntityStateModel.objects.get_next_state_model(
+            entity_model_id=entity_model.uuid,
+            fiscal_year=fy_key,
+            key=EntityStateModel.KEY_RECEIPT,
+            raise_exception=raise_exception
+        )
 
     def generate_receipt_number(self, commit: bool = False) -> str:
         """Generate and optionally persist a sequential receipt number.
@@ -0,0 +1,107 @@
+"""
+Django Ledger created by Miguel Sanda <msanda@arrobalytics.com>.
+Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
+
+Document numbers (journal entries, bills, invoices, items, etc.) are generated from the EntityStateModel sequences.
+Incrementing the sequence for every single document locks the EntityStateModel row until the transaction commits, so
+concurrent writers in the same EntityModel and fiscal year serialize on that row.
+
+When DJANGO_LEDGER_DOCUMENT_SEQUENCE_BLOCK_SIZE is greater than one, sequences of the document keys listed in
+DJANGO_LEDGER_DOCUMENT_SEQUENCE_GAP_TOLERANT_KEYS are reserved in blocks (hi-lo allocation). The first value of the
+block is used right away and the remaining values are kept in a process local pool once the reserving transaction
+commits, so the following documents do not hit the EntityStateModel row at all.
+
+Block allocation trades strictly consecutive numbering for throughput: numbers are unique but not ordered by creation
+time across processes, and the unused values of a block are lost when the process exits. Document keys that require
+gapless numbering must not be listed as gap tolerant.
+"""
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from django_ledger import settings
+
+
+def get_sequence_block_size(key: str) -> int:
+    """
+    The number of sequence values reserved at once for the given EntityStateModel key.
+
+    Parameters
+    ----------
+    key: str
+        The EntityStateModel key.
+
+    Returns
+    -------
+    int
+        The block size. Always 1 for keys that are not gap tolerant.
+    """
+    if key not in settings.DJANGO_LEDGER_DOCUMENT_SEQUENCE_GAP_TOLERANT_KEYS:
+        return 1
+    return max(settings.DJANGO_LEDGER_DOCUMENT_SEQUENCE_BLOCK_SIZE, 1)
+
+
+class DocumentSequencePool:
+    """
+    Thread safe, process local pool of reserved sequence values, keyed by database alias, EntityModel, EntityUnitModel,
+    fiscal year and EntityStateModel key. Each pool key holds one block of consecutive values.
+    """
+
+    def __init__(self):
+        self._blocks: Dict[Tuple, List[int]] = dict()
+        self._lock = Lock()
+
+    def take(self, pool_key: Tuple, count: int = 1) -> Optional[List[int]]:
+        """
+        Takes the next values from the pooled block.
+
+        Parameters
+        ----------
+        pool_key: tuple
+            The pool key.
+        count: int
+            The number of values to take.
+
+        Returns
+        -------
+        list or None
+            The sequence values. None if the block does not hold enough values.
+        """
+        with self._lock:
+            block = self._blocks.get(pool_key)
+            if not block or block[1] - block[0] + 1 < count:
+                return None
+            values = list(range(block[0], block[0] + count))
+            block[0] += count
+            if block[0] > block[1]:
+                del self._blocks[pool_key]
+            return values
+
+    def add(self, pool_key: Tuple, first: int, last: int):
+        """
+        Adds a block of reserved values to the pool, replacing the current block of the pool key, if any.
+
+        Parameters
+        ----------
+        pool_key: tuple
+            The pool key.
+        first: int
+            The first available value of the block.
+        last: int
+            The last available value of the block.
+        """
+        if first > last:
+            return
+        with self._lock:
+            self._blocks[pool_key] = [first, last]
+
+    def get_available(self, pool_key: Tuple) -> int:
+        with self._lock:
+            block = self._blocks.get(pool_key)
+            return block[1] - block[0] + 1 if block else 0
+
+    def clear(self):
+        with self._lock:
+            self._blocks.clear()
+
+
+document_sequence_pool = DocumentSequencePool()
@@ -0,0 +1,573 @@
+"""
+Django Ledger created by Miguel Sanda <msanda@arrobalytics.com>.
+Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
+
+The AccountBalanceSnapshotModel holds materialized monthly account balances for every posted JournalEntryModel.
+Each record aggregates the transaction amounts of a given month, keyed by EntityModel, LedgerModel, AccountModel,
+EntityUnitModel, activity and transaction type. Snapshots are maintained incrementally whenever a JournalEntryModel
+is posted or un-posted, so that the IO digest only needs to aggregate the raw transactions of the partial months at the
+boundaries of the requested period.
+
+Snapshots are derived data. They can be safely rebuilt at any time from the underlying TransactionModels and must be
+rebuilt whenever the DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS setting is activated on an existing database.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple, Union
+from uuid import UUID, uuid4
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import DateField, F, Manager, QuerySet, Sum
+from django.db.models.functions import TruncMonth
+from django.utils.timezone import is_aware, localtime
+from django.utils.translation import gettext_lazy as _
+
+from django_ledger.io.io_core import DIGEST_PERIOD_WEEK, get_digest_period_key, validate_digest_period
+from django_ledger.models.entity import EntityModel
+from django_ledger.models.journal_entry import JournalEntryModel
+from django_ledger.models.mixins import CreateUpdateMixIn
+from django_ledger.models.transactions import TransactionModel
+from django_ledger.models.utils import lazy_loader
+
+
+class AccountBalanceSnapshotValidationError(ValidationError):
+    pass
+
+
+def get_snapshot_period(timestamp: date | datetime) -> date:
+    """
+    Determines the snapshot period (first day of the month) for a given JournalEntryModel timestamp.
+    Aware timestamps are converted to the current timezone, consistent with TruncMonth database lookups.
+
+    Parameters
+    ----------
+    timestamp: date or datetime
+        The JournalEntryModel timestamp.
+
+    Returns
+    -------
+    date
+        The first day of the month of the provided timestamp.
+    """
+    if isinstance(timestamp, datetime):
+        if is_aware(timestamp):
+            timestamp = localtime(timestamp)
+        timestamp = timestamp.date()
+    return timestamp.replace(day=1)
+
+
+class AccountBalanceSnapshotModelQuerySet(QuerySet):
+
+    def posted(self) -> 'AccountBalanceSnapshotModelQuerySet':
+        """
+        Snapshots only hold balances for posted JournalEntryModels. The posted state of the
+        LedgerModel is evaluated at query time.
+        """
+        return self.filter(ledger_model__posted=True)
+
+    def for_ledger(self, ledger_model) -> 'AccountBalanceSnapshotModelQuerySet':
+        if isinstance(ledger_model, UUID):
+            return self.filter(ledger_model_id=ledger_model)
+        return self.filter(ledger_model=ledger_model)
+
+    def for_unit(self, unit_slug) -> 'AccountBalanceSnapshotModelQuerySet':
+        if isinstance(unit_slug, lazy_loader.get_entity_unit_model()):
+            return self.filter(unit_model=unit_slug)
+        return self.filter(unit_model__slug__exact=unit_slug)
+
+    def for_accounts(self, account_list: list) -> 'AccountBalanceSnapshotModelQuerySet':
+        if isinstance(account_list[0], str):
+            return self.filter(account_model__code__in=account_list)
+        elif isinstance(account_list[0], UUID):
+            return self.filter(account_model__uuid__in=account_list)
+        return self.filter(account_model__in=account_list)
+
+    def for_roles(self, role_list) -> 'AccountBalanceSnapshotModelQuerySet':
+        if isinstance(role_list, str):
+            return self.filter(account_model__role__in=[role_list])
+        return self.filter(account_model__role__in=role_list)
+
+    def for_activity(self, activity_list) -> 'AccountBalanceSnapshotModelQuerySet':
+        if isinstance(activity_list, str):
+            return self.filter(activity__in=[activity_list])
+        return self.filter(activity__in=activity_list)
+
+    def for_periods(self,
+                    from_period: Optional[date] = None,
+                    to_period: Optional[date] = None) -> 'AccountBalanceSnapshotModelQuerySet':
+        qs = self
+        if from_period:
+            qs = qs.filter(period__gte=from_period)
+        if to_period:
+            qs = qs.filter(period__lte=to_period)
+        return qs
+
+    def digest_values(self,
+                      by_unit: bool = False,
+                      by_period: Union[bool, str] = False,
+                      by_activity: bool = False,
+                      exclude_zero_bal: bool = True,
+                      fy_start_month: int = 1) -> List[Dict]:
+        """
+        Aggregates the snapshot balances using the same record layout produced by the IO database digest, so
+        snapshot records can be merged with TransactionModel aggregations. Monthly snapshots can be bucketed by
+        month, fiscal quarter or fiscal year, but not by week.
+
+        Returns
+        -------
+        list
+            A list of dictionaries with the same keys as the IO database digest values.
+        """
+        VALUES = {
+            'account_model__uuid': 'account__uuid',
+            'account_model__balance_type': 'account__balance_type',
+            'account_model__code': 'account__code',
+            'account_model__name': 'account__name',
+            'account_model__role': 'account__role',
+            'account_model__coa_model__slug': 'account__coa_model__slug',
+            'tx_type': 'tx_type',
+        }
+
+        if by_unit:
+            VALUES['unit_model__uuid'] = 'journal_entry__entity_unit__uuid'
+            VALUES['unit_model__name'] = 'journal_entry__entity_unit__name'
+        period = validate_digest_period(by_period)
+        if period == DIGEST_PERIOD_WEEK:
+            raise AccountBalanceSnapshotValidationError(
+                message=_('Monthly balance snapshots cannot be grouped by week.')
+            )
+        if period:
+            VALUES['period'] = 'period'
+        if by_activity:
+            VALUES['activity'] = 'journal_entry__activity'
+
+        snapshot_qs = self.values(*VALUES.keys()).annotate(snapshot_balance=Sum('balance')).order_by()
+
+        digest_values = list()
+        for snapshot in snapshot_qs:
+            if exclude_zero_bal and not snapshot['snapshot_balance']:
+                continue
+            record = {v: snapshot[k] for k, v in VALUES.items()}
+            if period:
+                record['period_year'], record['period_month'] = get_digest_period_key(
+                    record.pop('period'), period=period, fy_start_month=fy_start_month
+                )
+            record['balance'] = snapshot['snapshot_balance']
+            digest_values.append(record)
+        return digest_values
+
+
+class AccountBalanceSnapshotModelManager(Manager):
+
+    def get_queryset(self) -> AccountBalanceSnapshotModelQuerySet:
+        return AccountBalanceSnapshotModelQuerySet(self.model, using=self._db)
+
+    def for_entity(self, entity_model: EntityModel | str | UUID) -> AccountBalanceSnapshotModelQuerySet:
+        qs = self.get_queryset()
+        if isinstance(entity_model, EntityModel):
+            return qs.filter(entity_model=entity_model)
+        elif isinstance(entity_model, UUID):
+            return qs.filter(entity_model_id=entity_model)
+        elif isinstance(entity_model, str):
+            return qs.filter(entity_model__slug__exact=entity_model)
+        raise AccountBalanceSnapshotValidationError(
+            message=_('Must pass EntityModel, slug or UUID')
+        )
+
+    def get_raw_balances(self, entity_model: EntityModel | str | UUID) -> Dict[Tuple, Decimal]:
+        """
+        Aggregates the balances of all posted TransactionModels of the EntityModel, keyed by the snapshot key.
+
+        Parameters
+        ----------
+        entity_model: EntityModel or str or UUID
+            The EntityModel instance, slug or UUID.
+
+        Returns
+        -------
+        dict
+            A dictionary with the snapshot key as key and the aggregated amount as value.
+        """
+        txs_qs = TransactionModel.objects.for_entity(entity_model=entity_model).filter(
+            journal_entry__posted=True,
+            journal_entry__is_closing_entry=False
+        ).values(
+            'journal_entry__ledger__entity_id',
+            'journal_entry__ledger_id',
+            'account_id',
+            'journal_entry__entity_unit_id',
+            'journal_entry__activity',
+            'tx_type',
+        ).annotate(
+            snapshot_period=TruncMonth('journal_entry__timestamp', output_field=DateField()),
+            snapshot_balance=Sum('amount')
+        ).order_by()
+
+        raw_balances = dict()
+        for tx in txs_qs:
+            key = (
+                tx['journal_entry__ledger__entity_id'],
+                tx['journal_entry__ledger_id'],
+                tx['account_id'],
+                tx['journal_entry__entity_unit_id'],
+                tx['journal_entry__activity'],
+                tx['tx_type'],
+                tx['snapshot_period'],
+            )
+            raw_balances[key] = raw_balances.get(key, Decimal('0.00')) + tx['snapshot_balance']
+        return raw_balances
+
+    def get_snapshot_balances(self, entity_model: EntityModel | str | UUID) -> Dict[Tuple, Decimal]:
+        snapshot_qs = self.for_entity(entity_model=entity_model).values(
+            'entity_model_id',
+            'ledger_model_id',
+            'account_model_id',
+            'unit_model_id',
+            'activity',
+            'tx_type',
+            'period',
+        ).annotate(snapshot_balance=Sum('balance')).order_by()
+
+        return {
+            (
+                s['entity_model_id'],
+                s['ledger_model_id'],
+                s['account_model_id'],
+                s['unit_model_id'],
+                s['activity'],
+                s['tx_type'],
+                s['period'],
+            ): s['snapshot_balance'] for s in snapshot_qs
+        }
+
+    def rebuild(self, entity_model: EntityModel | str | UUID) -> List['AccountBalanceSnapshotModel']:
+        """
+        Deletes and rebuilds all AccountBalanceSnapshotModels of the EntityModel from the raw TransactionModels.
+
+        Parameters
+        ----------
+        entity_model: EntityModel or str or UUID
+            The EntityModel instance, slug or UUID.
+
+        Returns
+        -------
+        list
+            The list of created AccountBalanceSnapshotModels.
+        """
+        raw_balances = self.get_raw_balances(entity_model=entity_model)
+        snapshot_list = [
+            self.model(
+                entity_model_id=entity_id,
+                ledger_model_id=ledger_id,
+                account_model_id=account_id,
+                unit_model_id=unit_id,
+                activity=activity,
+                tx_type=tx_type,
+                period=period,
+                balance=balance
+            ) for (entity_id, ledger_id, account_id, unit_id, activity, tx_type, period), balance in
+            raw_balances.items()
+        ]
+
+        with transaction.atomic():
+            self.for_entity(entity_model=entity_model).delete()
+            return self.bulk_create(objs=snapshot_list, batch_size=500)
+
+    def check_consistency(self, entity_model: EntityModel | str | UUID) -> List[Dict]:
+        """
+        Compares the AccountBalanceSnapshotModel totals against the raw TransactionModel aggregation.
+
+        Parameters
+        ----------
+        entity_model: EntityModel or str or UUID
+            The EntityModel instance, slug or UUID.
+
+        Returns
+        -------
+        list
+            A list of dictionaries describing every inconsistent snapshot key. An empty list means snapshots are
+            consistent with the raw transactions.
+        """
+        raw_balances = self.get_raw_balances(entity_model=entity_model)
+        snapshot_balances = self.get_snapshot_balances(entity_model=entity_model)
+
+        inconsistencies = list()
+        for key in set(raw_balances).union(snapshot_balances):
+            raw_balance = raw_balances.get(key, Decimal('0.00'))
+            snapshot_balance = snapshot_balances.get(key, Decimal('0.00'))
+            if raw_balance != snapshot_balance:
+                entity_id, ledger_id, account_id, unit_id, activity, tx_type, period = key
+                inconsistencies.append({
+                    'ledger_uuid': ledger_id,
+                    'account_uuid': account_id,
+                    'unit_uuid': unit_id,
+                    'activity': activity,
+                    'tx_type': tx_type,
+                    'period': period,
+                    'snapshot_balance': snapshot_balance,
+                    'raw_balance': raw_balance
+                })
+        inconsistencies.sort(key=lambda i: (i['period'], str(i['account_uuid'])))
+        return inconsistencies
+
+    def get_journal_entry_deltas(self,
+                                 je_model: JournalEntryModel,
+                                 previous_state: Optional[Tuple],
+                                 current_state: Optional[Tuple]) -> Dict[Tuple, Decimal]:
+        """
+        Computes the snapshot balance deltas produced by a JournalEntryModel state change.
+
+        Parameters
+        ----------
+        je_model: JournalEntryModel
+            The JournalEntryModel instance.
+        previous_state: tuple
+            The (posted, activity, timestamp, unit_id) state of the JournalEntryModel as persisted in the database
+            before the change.
+        current_state: tuple
+            The (posted, activity, timestamp, unit_id) state of the JournalEntryModel after the change.
+
+        Returns
+        -------
+        dict
+            The balance deltas keyed by snapshot key.
+        """
+        deltas = dict()
+        if previous_state == current_state or je_model.is_closing_entry:
+            return deltas
+
+        was_posted = previous_state is not None and previous_state[0]
+        is_posted = current_state is not None and current_state[0]
+        if not was_posted and not is_posted:
+            return deltas
+
+        txs_balances = TransactionModel.objects.filter(
+            journal_entry_id=je_model.uuid
+        ).values('account_id', 'tx_type').annotate(
+            snapshot_balance=Sum('amount')
+        ).order_by()
+
+        entity_id = je_model.entity_uuid
+        for tx in txs_balances:
+            for state, sign in [(previous_state, -1), (current_state, 1)]:
+                if state is None or not state[0]:
+                    continue
+                _, activity, timestamp, unit_id = state
+                key = (
+                    entity_id,
+                    je_model.ledger_id,
+                    tx['account_id'],
+                    unit_id,
+                    activity,
+                    tx['tx_type'],
+                    get_snapshot_period(timestamp)
+                )
+                deltas[key] = deltas.get(key, Decimal('0.00')) + sign * tx['snapshot_balance']
+        return deltas
+
+    def update_for_journal_entry(self,
+                                 je_model: JournalEntryModel,
+                                 previous_state: Optional[Tuple],
+                                 current_state: Optional[Tuple]):
+        """
+        Incrementally maintains the snapshots affected by a JournalEntryModel state change.
+        """
+        deltas = self.get_journal_entry_deltas(je_model, previous_state, current_state)
+        if deltas:
+            self.apply_deltas(deltas)
+
+    def update_for_new_journal_entries(self, je_txs_models: List[Tuple[JournalEntryModel, List[TransactionModel]]]):
+        """
+        Applies the balances of newly created JournalEntryModels to the snapshots, computed from the provided
+        TransactionModel instances instead of querying them back. Non-posted and closing JournalEntryModels are ignored.
+
+        Parameters
+        ----------
+        je_txs_models: list
+            A list of (JournalEntryModel, list of TransactionModel) tuples.
+        """
+        deltas = dict()
+        for je_model, txs_models in je_txs_models:
+            if not je_model.posted or je_model.is_closing_entry:
+                continue
+            period = get_snapshot_period(je_model.timestamp)
+            for tx in txs_models:
+                key = (
+                    je_model.entity_uuid,
+                    je_model.ledger_id,
+                    tx.account_id,
+                    je_model.entity_unit_id,
+                    je_model.activity,
+                    tx.tx_type,
+                    period
+                )
+                deltas[key] = deltas.get(key, Decimal('0.00')) + tx.amount
+        if deltas:
+            self.apply_deltas(deltas)
+
+    def update_for_posted_journal_entries(self, je_txs_balances: List[Tuple[JournalEntryModel, List[Dict]]]):
+        """
+        Applies the balances of previously unposted JournalEntryModels that have just been posted, computed from
+        their pre-aggregated transaction balances (see JournalEntryModelQuerySet.get_txs_balances_by_journal_entry).
+        Closing JournalEntryModels are ignored.
+
+        Parameters
+        ----------
+        je_txs_balances: list
+            A list of (JournalEntryModel, list of transaction balances) tuples.
+        """
+        deltas = dict()
+        for je_model, txs_balances in je_txs_balances:
+            if not je_model.posted or je_model.is_closing_entry:
+                continue
+            period = get_snapshot_period(je_model.timestamp)
+            for tx in txs_balances:
+                key = (
+                    je_model.ledger.entity_id,
+                    je_model.ledger_id,
+                    tx['account_id'],
+                    je_model.entity_unit_id,
+                    je_model.activity,
+                    tx['tx_type'],
+                    period
+                )
+                deltas[key] = deltas.get(key, Decimal('0.00')) + tx['amount__sum']
+        if deltas:
+            self.apply_deltas(deltas)
+
+    def apply_deltas(self, deltas: Dict[Tuple, Decimal]):
+        """
+        Applies balance deltas to the corresponding snapshot records, creating the records when not present.
+        The AccountModels of the deltas are locked for the duration of the transaction, so concurrent postings
+        never create the same snapshot record twice. The unique_account_balance_snapshot constraint does not
+        cover snapshot keys without a unit or an activity, since NULL values are distinct in unique indexes.
+
+        Parameters
+        ----------
+        deltas: dict
+            A dictionary keyed by snapshot key (entity, ledger, account, unit, activity, tx_type, period)
+            with the Decimal amount to add to the snapshot balance.
+        """
+        deltas = {k: delta for k, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        AccountModel = lazy_loader.get_account_model()
+        with transaction.atomic():
+            # locked in a consistent order to prevent deadlocks between concurrent postings...
+            list(
+                AccountModel.objects.select_for_update().filter(
+                    uuid__in={k[2] for k in deltas}
+                ).order_by('uuid').values_list('uuid', flat=True)
+            )
+
+            for (entity_id, ledger_id, account_id, unit_id, activity, tx_type, period), delta in deltas.items():
+                snapshot_kwargs = {
+                    'entity_model_id': entity_id,
+                    'ledger_model_id': ledger_id,
+                    'account_model_id': account_id,
+                    'unit_model_id': unit_id,
+                    'activity': activity,
+                    'tx_type': tx_type,
+                    'period': period,
+                }
+                updated = self.get_queryset().filter(**snapshot_kwargs).update(balance=F('balance') + delta)
+                if not updated:
+                    self.create(**snapshot_kwargs, balance=delta)
+
+
+class AccountBalanceSnapshotModelAbstract(CreateUpdateMixIn):
+    """
+    Materialized monthly balance of an AccountModel for posted JournalEntryModels.
+
+    Attributes
+    ----------
+    uuid : UUID
+        This is a unique primary key generated for the table. The default value of this field is uuid4().
+    entity_model: EntityModel
+        The EntityModel the snapshot belongs to.
+    ledger_model: LedgerModel
+        The LedgerModel of the aggregated JournalEntryModels.
+    account_model: AccountModel
+        The AccountModel of the aggregated TransactionModels.
+    unit_model: EntityUnitModel
+        The EntityUnitModel of the aggregated JournalEntryModels, if any.
+    activity: str
+        The activity of the aggregated JournalEntryModels, if any.
+    tx_type: str
+        The transaction type of the aggregated TransactionModels.
+    period: date
+        The first day of the month of the aggregated JournalEntryModels.
+    balance: Decimal
+        The sum of all aggregated TransactionModel amounts.
+    """
+    uuid = models.UUIDField(default=uuid4, editable=False, primary_key=True)
+    entity_model = models.ForeignKey('django_ledger.EntityModel',
+                                     on_delete=models.CASCADE,
+                                     verbose_name=_('Entity Model'))
+    ledger_model = models.ForeignKey('django_ledger.LedgerModel',
+                                     on_delete=models.CASCADE,
+                                     verbose_name=_('Ledger Model'))
+    account_model = models.ForeignKey('django_ledger.AccountModel',
+                                      on_delete=models.CASCADE,
+                                      verbose_name=_('Account Model'))
+    unit_model = models.ForeignKey('django_ledger.EntityUnitModel',
+                                   null=True,
+                                   blank=True,
+                                   on_delete=models.CASCADE,
+                                   verbose_name=_('Entity Unit Model'))
+    activity = models.CharField(max_length=20,
+                                choices=JournalEntryModel.ACTIVITIES,
+                                null=True,
+                                blank=True,
+                                verbose_name=_('Activity'))
+    tx_type = models.CharField(choices=TransactionModel.TX_TYPE,
+                               max_length=10,
+                               verbose_name=_('Transaction Type'))
+    period = models.DateField(verbose_name=_('Period'))
+    balance = models.DecimalField(verbose_name=_('Snapshot Balance'),
+                                  max_digits=20,
+                                  decimal_places=2,
+                                  default=Decimal('0.00'))
+
+    objects = AccountBalanceSnapshotModelManager.from_queryset(queryset_class=AccountBalanceSnapshotModelQuerySet)()
+
+    class Meta:
+        abstract = True
+        ordering = ['-period']
+        verbose_name = _('Account Balance Snapshot')
+        verbose_name_plural = _('Account Balance Snapshots')
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    'entity_model',
+                    'ledger_model',
+                    'account_model',
+                    'unit_model',
+                    'activity',
+                    'tx_type',
+                    'period',
+                ],
+                name='unique_account_balance_snapshot',
+                violation_error_message=_('Only one Account Balance Snapshot per key and period allowed.')
+            )
+        ]
+        indexes = [
+            models.Index(fields=['entity_model', 'period']),
+            models.Index(fields=['ledger_model', 'period']),
+            models.Index(fields=['account_model', 'period']),
+        ]
+
+    def __str__(self):
+        return f'{self.__class__.__name__}: {self.period.strftime("%Y-%m")} | {self.tx_type} | {self.balance}'
+
+
+class AccountBalanceSnapshotModel(AccountBalanceSnapshotModelAbstract):
+    """
+    Base AccountBalanceSnapshotModel Class
+    """
+
+    class Meta(AccountBalanceSnapshotModelAbstract.Meta):
+        abstract = False
+
@@ -26,11 +26,12 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.db import models
-from django.db.models import Q, QuerySet, Manager, F
-from django.db.models.signals import pre_save
+from django.db.models import Q, QuerySet, Manager, F, OuterRef, Subquery
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
+from django_ledger.io.io_cache import bump_digest_version
 from django_ledger.io.io_core import validate_io_timestamp
 from django_ledger.models import (
     AccountModel,
@@ -43,7 +44,10 @@ from django_ledger.models.deprecations import deprecated_entity_slug_behavior
 from django_ledger.models.mixins import CreateUpdateMixIn
 from django_ledger.models.unit import EntityUnitModel
 from django_ledger.models.utils import lazy_loader
-from django_ledger.settings import DJANGO_LEDGER_USE_DEPRECATED_BEHAVIOR
+from django_ledger.settings import (
+    DJANGO_LEDGER_USE_DEPRECATED_BEHAVIOR,
+    DJANGO_LEDGER_USE_DENORMALIZED_TRANSACTIONS,
+)
 
 UserModel = get_user_model()
 
@@ -103,7 +107,8 @@ class TransactionModelQuerySet(QuerySet):
             A QuerySet containing only transactions that meet the "posted" criteria.
         """
         return self.filter(
-            Q(journal_entry__posted=True) & Q(journal_entry__ledger__posted=True)
+            Q(**{self.model.resolve_lookup('journal_entry__posted'): True})
+            & Q(**{self.model.resolve_lookup('journal_entry__ledger__posted'): True})
         )
 
     def for_accounts(
@@ -226,9 +231,10 @@ class TransactionModelQuerySet(QuerySet):
         if isinstance(to_date, str):
             to_date = validate_io_timestamp(to_date)
 
+        timestamp_lookup = self.model.resolve_lookup('journal_entry__timestamp')
         if isinstance(to_date, date):
-            return self.filter(journal_entry__timestamp__date__lte=to_date)
-        return self.filter(journal_entry__timestamp__lte=to_date)
+            return self.filter(**{f'{timestamp_lookup}__date__lte': to_date})
+        return self.filter(**{f'{timestamp_lookup}__lte': to_date})
 
     def from_date(
         self, from_date: Union[str, date, datetime]
@@ -253,10 +259,11 @@ class TransactionModelQuerySet(QuerySet):
         if isinstance(from_date, str):
             from_date = validate_io_timestamp(from_date)
 
+        timestamp_lookup = self.model.resolve_lookup('journal_entry__timestamp')
         if isinstance(from_date, date):
-            return self.filter(journal_entry__timestamp__date__gte=from_date)
+            return self.filter(**{f'{timestamp_lookup}__date__gte': from_date})
 
-        return self.filter(journal_entry__timestamp__gte=from_date)
+        return self.filter(**{f'{timestamp_lookup}__gte': from_date})
 
     def not_closing_entry(self) -> 'TransactionModelQuerySet':
         """
@@ -267,7 +274,7 @@ class TransactionModelQuerySet(QuerySet):
         TransactionModelQuerySet
             A QuerySet with transactions where the `journal_entry__is_closing_entry` field is False.
         """
-        return self.filter(journal_entry__is_closing_entry=False)
+        return self.filter(**{self.model.resolve_lookup('journal_entry__is_closing_entry'): False})
 
     def is_closing_entry(self) -> 'TransactionModelQuerySet':
         """
@@ -278,7 +285,7 @@ class TransactionModelQuerySet(QuerySet):
         TransactionModelQuerySet
             A QuerySet with transactions where the `journal_entry__is_closing_entry` field is True.
         """
-        return self.filter(journal_entry__is_closing_entry=True)
+        return self.filter(**{self.model.resolve_lookup('journal_entry__is_closing_entry'): True})
 
     def for_ledger(
         self, ledger_model: Union[LedgerModel, UUID, str]
@@ -297,8 +304,8 @@ class TransactionModelQuerySet(QuerySet):
             A queryset containing transactions associated with the given ledger and entity.
         """
         if isinstance(ledger_model, UUID):
-            return self.filter(journal_entry__ledger__uuid__exact=ledger_model)
-        return self.filter(journal_entry__ledger=ledger_model)
+            return self.filter(**{self.model.resolve_lookup('journal_entry__ledger__uuid__exact'): ledger_model})
+        return self.filter(**{self.model.resolve_lookup('journal_entry__ledger'): ledger_model})
 
     def for_journal_entry(self, je_model) -> 'TransactionModelQuerySet':
         """
@@ -368,6 +375,27 @@ class TransactionModelQuerySet(QuerySet):
             timestamp=F('journal_entry__timestamp'),
         )
 
+    def sync_denormalized_fields(self) -> int:
+        """
+        Refreshes the denormalized JournalEntryModel and LedgerModel columns of the TransactionModels in the
+        QuerySet from their current JournalEntryModel state with a single UPDATE statement.
+
+        Returns
+        -------
+        int
+            The number of updated TransactionModels.
+        """
+        JournalEntryModel = lazy_loader.get_journal_entry_model()
+        je_qs = JournalEntryModel.objects.filter(uuid=OuterRef('journal_entry_id'))
+        return self.update(
+            entity_id=Subquery(je_qs.values('ledger__entity_id')[:1]),
+            ledger_id=Subquery(je_qs.values('ledger_id')[:1]),
+            je_timestamp=Subquery(je_qs.values('timestamp')[:1]),
+            je_posted=Subquery(je_qs.values('posted')[:1]),
+            ledger_posted=Subquery(je_qs.values('ledger__posted')[:1]),
+            is_closing_entry=Subquery(je_qs.values('is_closing_entry')[:1]),
+        )
+
     def is_cleared(self) -> 'TransactionModelQuerySet':
         return self.filter(cleared=True)
 
@@ -403,9 +431,9 @@ class TransactionModelManager(Manager):
         """
         qs = TransactionModelQuerySet(self.model, using=self._db)
         return qs.annotate(
-            _entity_slug=F('journal_entry__ledger__entity__slug'),
-            _ledger_uuid=F('journal_entry__ledger_id'),
-            timestamp=F('journal_entry__timestamp'),
+            _entity_slug=F(self.model.resolve_lookup('journal_entry__ledger__entity__slug')),
+            _ledger_uuid=F(self.model.resolve_lookup('journal_entry__ledger_id')),
+            timestamp=F(self.model.resolve_lookup('journal_entry__timestamp')),
             _coa_id=F('account__coa_model_id'),
         ).select_related(
             'journal_entry',
@@ -415,7 +443,7 @@ class TransactionModelManager(Manager):
 
     @deprecated_entity_slug_behavior
     def for_entity(
-        self, entity_model: EntityModel | str | UUID = None, **kwargs
+        self, entity_model: EntityModel | str | UUID = None, annotated: bool = True, **kwargs
     ) -> TransactionModelQuerySet:
         """
         Filters transactions for a specific entity, optionally scoped to a specific user.
@@ -424,6 +452,10 @@ class TransactionModelManager(Manager):
         ----------
         entity_model : Union[EntityModel, str, UUID]
             Identifier for the entity. This can be an `EntityModel` object, a slug (str), or a UUID.
+        annotated : bool
+            Whether to start from the annotated and pre-loaded base queryset. Aggregation queries
+            not using the annotations may pass False, so the account and chart of accounts tables
+            are not joined. Defaults to True.
 
         Returns
         -------
@@ -436,7 +468,7 @@ class TransactionModelManager(Manager):
         - Supports flexible filtering by accepting different forms of `entity_slug`.
         """
 
-        qs = self.get_queryset()
+        qs = self.get_queryset() if annotated else TransactionModelQuerySet(self.model, using=self._db)
         if 'user_model' in kwargs:
             warnings.warn(
                 'user_model parameter is deprecated and will be removed in a future release. '
@@ -448,11 +480,11 @@ class TransactionModelManager(Manager):
                 qs = qs.for_user(kwargs['user_model'])
 
         if isinstance(entity_model, EntityModel):
-            qs = qs.filter(journal_entry__ledger__entity=entity_model)
+            qs = qs.filter(**{self.model.resolve_lookup('journal_entry__ledger__entity'): entity_model})
         elif isinstance(entity_model, UUID):
-            qs = qs.filter(journal_entry__ledger__entity_id=entity_model)
+            qs = qs.filter(**{self.model.resolve_lookup('journal_entry__ledger__entity_id'): entity_model})
         elif isinstance(entity_model, str):
-            qs = qs.filter(journal_entry__ledger__entity__slug__exact=entity_model)
+            qs = qs.filter(**{self.model.resolve_lookup('journal_entry__ledger__entity__slug__exact'): entity_model})
         else:
             raise TransactionModelValidationError(
                 message='entity_model parameter must be either an EntityModel, String or a UUID.'
@@ -487,6 +519,18 @@ class TransactionModelAbstract(CreateUpdateMixIn):
         Indicates if the transaction has been cleared. Defaults to False.
     reconciled : bool
         Indicates if the transaction has been reconciled. Defaults to False.
+    entity : ForeignKey
+        Denormalized EntityModel of the JournalEntryModel LedgerModel.
+    ledger : ForeignKey
+        Denormalized LedgerModel of the JournalEntryModel.
+    je_timestamp : datetime
+        Denormalized timestamp of the JournalEntryModel.
+    je_posted : bool
+        Denormalized posted state of the JournalEntryModel.
+    ledger_posted : bool
+        Denormalized posted state of the LedgerModel.
+    is_closing_entry : bool
+        Denormalized closing entry flag of the JournalEntryModel.
     objects : TransactionModelManager
         Custom manager for managing transaction models.
     """
@@ -495,6 +539,19 @@ class TransactionModelAbstract(CreateUpdateMixIn):
     DEBIT = 'debit'
     TX_TYPE = [(CREDIT, _('Credit')), (DEBIT, _('Debit'))]
 
+    # Lookups through the JournalEntryModel that can be answered by the denormalized columns.
+    DENORMALIZED_LOOKUPS = {
+        'journal_entry__ledger__entity_id': 'entity_id',
+        'journal_entry__ledger__entity': 'entity',
+        'journal_entry__ledger__uuid': 'ledger_id',
+        'journal_entry__ledger__posted': 'ledger_posted',
+        'journal_entry__ledger_id': 'ledger_id',
+        'journal_entry__ledger': 'ledger',
+        'journal_entry__timestamp': 'je_timestamp',
+        'journal_entry__posted': 'je_posted',
+        'journal_entry__is_closing_entry': 'is_closing_entry',
+    }
+
     uuid = models.UUIDField(default=uuid4, editable=False, primary_key=True)
     tx_type = models.CharField(
         max_length=10, choices=TX_TYPE, verbose_name=_('Transaction Type')
@@ -532,6 +589,41 @@ class TransactionModelAbstract(CreateUpdateMixIn):
     )
     cleared = models.BooleanField(default=False, verbose_name=_('Cleared'))
     reconciled = models.BooleanField(default=False, verbose_name=_('Reconciled'))
+
+    # denormalized JournalEntryModel & LedgerModel fields...
+    entity = models.ForeignKey(
+        'django_ledger.EntityModel',
+        editable=False,
+        null=True,
+        blank=True,
+        db_index=False,
+        related_name='+',
+        verbose_name=_('Entity'),
+        on_delete=models.CASCADE,
+    )
+    ledger = models.ForeignKey(
+        'django_ledger.LedgerModel',
+        editable=False,
+        null=True,
+        blank=True,
+        db_index=False,
+        related_name='+',
+        verbose_name=_('Ledger'),
+        on_delete=models.CASCADE,
+    )
+    je_timestamp = models.DateTimeField(
+        editable=False, null=True, blank=True, verbose_name=_('Journal Entry Timestamp')
+    )
+    je_posted = models.BooleanField(
+        default=False, editable=False, verbose_name=_('Journal Entry Posted')
+    )
+    ledger_posted = models.BooleanField(
+        default=False, editable=False, verbose_name=_('Ledger Posted')
+    )
+    is_closing_entry = models.BooleanField(
+        default=False, editable=False, verbose_name=_('Is Closing Entry')
+    )
+
     objects = TransactionModelManager.from_queryset(TransactionModelQuerySet)()
 
     class Meta:
@@ -547,6 +639,9 @@ class TransactionModelAbstract(CreateUpdateMixIn):
             models.Index(fields=['updated']),
             models.Index(fields=['cleared']),
             models.Index(fields=['reconciled']),
+            models.Index(fields=['entity', 'account', 'je_timestamp']),
+            models.Index(fields=['entity', 'is_closing_entry', 'je_timestamp']),
+            models.Index(fields=['ledger', 'je_timestamp']),
         ]
 
     def __str__(self):
@@ -558,6 +653,51 @@ class TransactionModelAbstract(CreateUpdateMixIn):
             tx_type=self.tx_type,
         )
 
+    @classmethod
+    def resolve_lookup(cls, lookup: str) -> str:
+        """
+        Translates a lookup spanning the JournalEntryModel into the equivalent lookup on the denormalized
+        columns when DJANGO_LEDGER_USE_DENORMALIZED_TRANSACTIONS is enabled. Otherwise, the lookup is returned
+        unchanged.
+
+        Parameters
+        ----------
+        lookup: str
+            The lookup, e.g. "journal_entry__timestamp__date__lte".
+
+        Returns
+        -------
+        str
+            The resolved lookup.
+        """
+        if not DJANGO_LEDGER_USE_DENORMALIZED_TRANSACTIONS:
+            return lookup
+        for je_lookup, tx_lookup in cls.DENORMALIZED_LOOKUPS.items():
+            if lookup == je_lookup:
+                return tx_lookup
+            if lookup.startswith(f'{je_lookup}__'):
+                return tx_lookup + lookup[len(je_lookup):]
+        return lookup
+
+    def sync_denormalized_fields(self, je_model=None):
+        """
+        Populates the denormalized fields from the JournalEntryModel and its LedgerModel. Does not save the instance.
+
+        Parameters
+        ----------
+        je_model: JournalEntryModel
+            Optional JournalEntryModel instance. Defaults to the TransactionModel journal_entry.
+        """
+        if je_model is None:
+            je_model = self.journal_entry
+        ledger_model = je_model.ledger
+        self.entity_id = ledger_model.entity_id
+        self.ledger_id = ledger_model.uuid
+        self.je_timestamp = je_model.timestamp
+        self.je_posted = je_model.posted
+        self.ledger_posted = ledger_model.posted
+        self.is_closing_entry = je_model.is_closing_entry
+
     @property
     def entity_slug(self) -> str:
         try:
@@ -673,6 +813,10 @@ def transactionmodel_presave(instance: TransactionModel, **kwargs):
        the transaction cannot be modified. The save process is halted if the
        journal entry is marked as locked.
 
+    3. **Denormalized Fields**:
+       Populates the denormalized JournalEntryModel and LedgerModel fields
+       of the instance.
+
     Parameters
     ----------
     instance : TransactionModel
@@ -712,5 +856,16 @@ def transactionmodel_presave(instance: TransactionModel, **kwargs):
             message=_('Cannot modify transactions on locked journal entries.')
         )
 
+    instance.sync_denormalized_fields()
+
+
+def transactionmodel_postsave(instance: TransactionModel, **kwargs):
+    """
+    Invalidates the cached IO digests of the EntityModel after a TransactionModel instance is saved or deleted.
+    """
+    bump_digest_version(instance.entity_id)
+
 
 pre_save.connect(transactionmodel_presave, sender=TransactionModel)
+post_save.connect(transactionmodel_postsave, sender=TransactionModel)
+post_delete.connect(transactionmodel_postsave, sender=TransactionModel)
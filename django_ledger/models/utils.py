@@ -24,6 +24,7 @@ class LazyLoader:
         ENTITY_UNIT_MODEL (str): The name of the entity unit model.
         CLOSING_ENTRY_MODEL (str): The name of the closing entry model.
         CLOSING_ENTRY_TRANSACTION_MODEL (str): The name of the closing entry transaction model.
+        BALANCE_SNAPSHOT_MODEL (str): The name of the account balance snapshot model.
 
         BANK_ACCOUNT_MODEL (str): The name of the bank account model.
         PURCHASE_ORDER_MODEL (str): The name of the purchase order model.
@@ -41,6 +42,7 @@ class LazyLoader:
         BALANCE_SHEET_REPORT_CLASS (BalanceSheetReport): The BalanceSheetReport class used for generating balance sheet reports.
         INCOME_STATEMENT_REPORT_CLASS (IncomeStatementReport): The IncomeStatementReport class used for generating income statement reports.
         CASH_FLOW_STATEMENT_REPORT_CLASS (CashFlowStatementReport): The CashFlowStatementReport class used for generating cash flow statement reports.
+        COMPARATIVE_STATEMENT_REPORT_CLASS (ComparativeStatementReport): The ComparativeStatementReport class used for generating comparative statement reports.
 
     Methods:
         get_entity_model() -> Model: Returns the entity model.
@@ -67,6 +69,7 @@ class LazyLoader:
         get_balance_sheet_report_class() -> BalanceSheetReport: Returns the BalanceSheetReport class.
         get_income_statement_report_class() -> IncomeStatementReport: Returns the IncomeStatementReport class.
         get_cash_flow_statement_report_class() -> CashFlowStatementReport: Returns the CashFlowStatementReport class.
+        get_comparative_statement_report_class() -> ComparativeStatementReport: Returns the ComparativeStatementReport class.
     """
 
     app_config = apps.get_app_config(app_label='django_ledger')
@@ -83,6 +86,7 @@ class LazyLoader:
     ENTITY_UNIT_MODEL = 'entityunitmodel'
     CLOSING_ENTRY_MODEL = 'closingentrymodel'
     CLOSING_ENTRY_TRANSACTION_MODEL = 'closingentrytransactionmodel'
+    BALANCE_SNAPSHOT_MODEL = 'accountbalancesnapshotmodel'
 
     BANK_ACCOUNT_MODEL = 'bankaccountmodel'
     PURCHASE_ORDER_MODEL = 'purchaseordermodel'
@@ -101,6 +105,7 @@ class LazyLoader:
     BALANCE_SHEET_REPORT_CLASS = None
     INCOME_STATEMENT_REPORT_CLASS = None
     CASH_FLOW_STATEMENT_REPORT_CLASS = None
+    COMPARATIVE_STATEMENT_REPORT_CLASS = None
 
     def get_entity_model(self):
         return self.app_config.get_model(self.ENTITY_MODEL)
@@ -169,6 +174,9 @@ class LazyLoader:
     def get_closing_entry_transaction_model(self):
         return self.app_config.get_model(self.CLOSING_ENTRY_TRANSACTION_MODEL)
 
+    def get_balance_snapshot_model(self):
+        return self.app_config.get_model(self.BALANCE_SNAPSHOT_MODEL)
+
     def get_entity_data_generator(self):
         if not self.ENTITY_DATA_GENERATOR:
             from django_ledger.io.io_generator import EntityDataGenerator
@@ -197,5 +205,12 @@ class LazyLoader:
             self.CASH_FLOW_STATEMENT_REPORT_CLASS = CashFlowStatementReport
         return self.CASH_FLOW_STATEMENT_REPORT_CLASS
 
+    def get_comparative_statement_report_class(self):
+        if not self.COMPARATIVE_STATEMENT_REPORT_CLASS:
+            from django_ledger.report.comparative import ComparativeStatementReport
+
+            self.COMPARATIVE_STATEMENT_REPORT_CLASS = ComparativeStatementReport
+        return self.COMPARATIVE_STATEMENT_REPORT_CLASS
+
 
 lazy_loader = LazyLoader()
@@ -0,0 +1,150 @@
+from datetime import datetime, date
+from typing import Optional, Dict, Union
+
+from django_ledger.io import IODigestContextManager
+from django_ledger.report.core import BaseReportSupport, PDFReportValidationError
+from django_ledger.settings import DJANGO_LEDGER_CURRENCY_SYMBOL
+from django_ledger.templatetags.django_ledger import currency_format, percentage
+
+
+class ComparativeStatementReport(BaseReportSupport):
+    """
+    Comparative income statement and balance sheet report, with one balance column per comparative digest column,
+    followed by the change and percent change of the last column. Meant to be printed in landscape orientation.
+    """
+    PAGE_WIDTH = 270
+    CODE_WIDTH = 20
+    NAME_WIDTH = 45
+    CHANGE_WIDTH = 22
+
+    def __init__(self, *args, io_digest: IODigestContextManager, report_subtitle: Optional[str] = None, **kwargs):
+
+        if not io_digest.is_comparative():
+            raise PDFReportValidationError('IO Digest does not have comparative statements information.')
+        if not any([io_digest.has_comparative_income_statement(), io_digest.has_comparative_balance_sheet()]):
+            raise PDFReportValidationError('IO Digest does not have comparative statements information.')
+        super().__init__(*args, io_digest=io_digest, report_subtitle=report_subtitle, **kwargs)
+        self.COLUMNS = io_digest.get_comparative_columns()
+        n_columns = len(self.COLUMNS)
+        balances_width = self.PAGE_WIDTH - 10 - self.CODE_WIDTH - self.NAME_WIDTH - 2 * self.CHANGE_WIDTH
+        self.BALANCE_WIDTH = balances_width / n_columns
+        self.FONT_SIZE = 9 if n_columns <= 6 else 6
+        self.set_default_font()
+
+    def get_report_data(self) -> Dict:
+        return {
+            'income_statement': self.IO_DIGEST.get_comparative_income_statement_data(raise_exception=False),
+            'balance_sheet': self.IO_DIGEST.get_comparative_balance_sheet_data(raise_exception=False),
+        }
+
+    def get_report_name(self) -> str:
+        return 'Comparative Financial Statements'
+
+    def print_headers(self):
+        self.set_font(self.FONT_FAMILY, style='B', size=self.FONT_SIZE)
+        self.cell(w=self.CODE_WIDTH, h=5, txt='Account Code')
+        self.cell(w=self.NAME_WIDTH, h=5, txt='Account Name')
+        for column in self.COLUMNS:
+            self.cell(w=self.BALANCE_WIDTH, h=5, txt=column['label'], align='R')
+        self.cell(w=self.CHANGE_WIDTH, h=5, txt=f'Change ({DJANGO_LEDGER_CURRENCY_SYMBOL})', align='R')
+        self.cell(w=self.CHANGE_WIDTH, h=5, txt='Change (%)', align='R')
+        self.ln(8)
+        self.set_default_font()
+
+    def print_balances(self, row: Dict):
+        for balance in row['balances']:
+            self.cell(w=self.BALANCE_WIDTH, h=3, txt=currency_format(balance), align='R')
+        delta = row['deltas'][-1]
+        self.cell(w=self.CHANGE_WIDTH, h=3, txt=currency_format(delta) if delta is not None else '-', align='R')
+        self.cell(w=self.CHANGE_WIDTH, h=3, txt=percentage(row['changes'][-1]) or '-', align='R')
+
+    def print_accounts(self, accounts):
+        self.set_font(self.FONT_FAMILY, size=self.FONT_SIZE)
+        for acc in accounts:
+            self.cell(w=self.CODE_WIDTH, h=3, txt=acc['code'])
+            self.cell(w=self.NAME_WIDTH, h=3, txt=acc['name'][:40])
+            self.print_balances(acc)
+            self.ln(4)
+
+    def print_total(self, title: str, row: Dict, style: str = 'B'):
+        self.set_font(self.FONT_FAMILY, style=style, size=self.FONT_SIZE)
+        self.cell(w=self.CODE_WIDTH + self.NAME_WIDTH, h=3, txt=title)
+        self.print_balances(row)
+        self.ln(3)
+        self.print_hline()
+        self.ln(4)
+        self.set_default_font()
+
+    def print_income_statement(self):
+        ic_data = self.IO_DIGEST.get_comparative_income_statement_data()
+        operating_section = ic_data['operating']
+        other_section = ic_data['other']
+
+        self.print_section_title('Income Statement', zoom=3)
+        self.ln(8)
+        for title, accounts, total_title, total in [
+            ('Operating Revenues', operating_section['revenues'],
+             'Net Operating Revenue', operating_section['net_operating_revenue']),
+            ('Cost of Goods Sold', operating_section['cogs'],
+             'Net COGS', operating_section['net_cogs']),
+            ('Operating Expenses', operating_section['expenses'],
+             'Net Operating Expenses', operating_section['net_operating_expenses']),
+            ('Other Revenues', other_section['revenues'],
+             'Net Other Revenues', other_section['net_other_revenues']),
+            ('Other Expenses', other_section['expenses'],
+             'Net Other Expenses', other_section['net_other_expenses']),
+        ]:
+            self.print_section_title(title, zoom=1)
+            self.ln(6)
+            self.print_accounts(accounts)
+            self.print_total(total_title, total)
+
+        self.print_total('Gross Profit', operating_section['gross_profit'])
+        self.print_total('Net Operating Income', operating_section['net_operating_income'])
+        self.print_total('Net Other Income', other_section['net_other_income'])
+        self.print_total('Net Income (Loss)', ic_data['net_income'], style='BU')
+        self.ln(5)
+
+    def print_balance_sheet(self):
+        bs_data = self.IO_DIGEST.get_comparative_balance_sheet_data()
+
+        self.print_section_title('Balance Sheet', zoom=3)
+        self.ln(8)
+        for bs_role, title in [
+            ('assets', 'Assets'),
+            ('liabilities', 'Liabilities'),
+            ('equity', 'Equity'),
+        ]:
+            self.print_section_title(title, zoom=1)
+            self.ln(6)
+            section_data = bs_data.get(bs_role)
+            if section_data:
+                for role_data in section_data['roles'].values():
+                    self.set_font(self.FONT_FAMILY, style='U', size=self.FONT_SIZE)
+                    self.cell(w=self.CODE_WIDTH + self.NAME_WIDTH, h=3, txt=role_data['role_name'])
+                    self.ln(4)
+                    self.print_accounts(role_data['accounts'])
+                    self.print_total(f'Total {role_data["role_name"]}', role_data['total_balance'])
+                if bs_role != 'equity':
+                    self.print_total(f'Total {title}', section_data['total_balance'], style='BU')
+
+        self.print_total('Retained Earnings', bs_data['retained_earnings_balance'])
+        self.print_total('Total Equity', bs_data['equity_balance'], style='BU')
+        self.print_total('Total Liabilities + Equity', bs_data['liabilities_equity_balance'], style='BU')
+
+    def get_pdf_filename(self,
+                         to_dt: Optional[Union[datetime, date]] = None,
+                         dt_strfmt: str = '%Y%m%d'):
+        if to_dt:
+            to_dt = to_dt.strftime(dt_strfmt if dt_strfmt else self.IO_DIGEST.get_strftime_format())
+        else:
+            to_dt = self.IO_DIGEST.get_to_datetime(fmt=dt_strfmt, as_str=True)
+        f_name = f'{self.get_report_title()}_ComparativeStatements_{to_dt}.pdf'
+        return f_name
+
+    def create_pdf_report(self):
+        self.print_headers()
+        if self.IO_DIGEST.has_comparative_income_statement():
+            self.print_income_statement()
+        if self.IO_DIGEST.has_comparative_balance_sheet():
+            self.print_balance_sheet()
@@ -17,6 +17,7 @@ class PDFReportValidationError(ValidationError):
 
 class BaseReportSupport(FPDF):
     FOOTER_LOGO_PATH = 'django_ledger/logo/django-ledger-logo-report.png'
+    PAGE_WIDTH = 210
 
     def __init__(self,
                  *args,
@@ -29,7 +30,6 @@ class BaseReportSupport(FPDF):
         self.REPORT_SUBTITLE: Optional[str] = report_subtitle
         self.FONT_SIZE: int = 9
         self.FONT_FAMILY: str = 'helvetica'
-        self.PAGE_WIDTH = 210
         self.IO_DIGEST: IODigestContextManager = io_digest
         self.CURRENCY_SYMBOL = currency_symbol()
         self.set_default_font()
@@ -200,7 +200,7 @@ class BaseReportSupport(FPDF):
         self.cell(0, 5, 'Page ' + str(self.page_no()) + '/{nb}', 0, 1, 'C')
         self.set_font(family=self.FONT_FAMILY, size=self.FONT_SIZE - 3)
         self.image(self.get_report_footer_logo_path(),
-                   w=30, x=(200 - 30) / 2,
+                   w=30, x=(self.PAGE_WIDTH - 10 - 30) / 2,
                    link='https://www.djangoledger.com')
         self.ln(1)
         self.cell(0, 5,
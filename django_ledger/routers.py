@@ -0,0 +1,122 @@
+"""
+Django Ledger created by Miguel Sanda <msanda@arrobalytics.com>.
+Copyright© EDMA Group Inc licensed under the GPLv3 Agreement.
+
+Database routing of the read-only Django Ledger workloads, such as digests and financial statement reports, to a
+read replica database alias.
+
+Reads are only routed to a replica when explicitly requested, either with the using parameter of the digest and
+report methods, or within a read_database() block. All other reads and all writes use the primary database, so
+closing entries, commit_txs() and state changes never operate on replicated data that may be lagging behind.
+
+The DjangoLedgerRouter must be added to the DATABASE_ROUTERS setting for read_database() blocks to take effect, and
+so model instances fetched from a replica may be related to, and saved on the primary database:
+
+    DATABASES = {
+        'default': {...},
+        'replica': {...},
+    }
+    DATABASE_ROUTERS = ['django_ledger.routers.DjangoLedgerRouter']
+    DJANGO_LEDGER_READ_DATABASE = 'replica'
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from django.db import DEFAULT_DB_ALIAS
+
+from django_ledger import settings
+
+DJANGO_LEDGER_APP_LABEL = 'django_ledger'
+
+_read_database: ContextVar[Optional[str]] = ContextVar('django_ledger_read_database', default=None)
+
+
+def get_read_database(using: Optional[str] = None) -> Optional[str]:
+    """
+    Resolves the database alias of a read-only Django Ledger workload.
+
+    Parameters
+    ----------
+    using: str
+        The database alias explicitly requested, if any.
+
+    Returns
+    -------
+    str or None
+        The requested alias, or the alias of the enclosing read_database() block. None means the primary database.
+    """
+    if using:
+        return using
+    return _read_database.get()
+
+
+@contextmanager
+def read_database(using: Optional[str] = None):
+    """
+    Routes the Django Ledger reads within the block to a read replica.
+
+    Parameters
+    ----------
+    using: str
+        The read replica database alias. Defaults to DJANGO_LEDGER_READ_DATABASE.
+    """
+    token = _read_database.set(using or settings.DJANGO_LEDGER_READ_DATABASE)
+    try:
+        yield
+    finally:
+        _read_database.reset(token)
+
+
+@contextmanager
+def primary_database():
+    """
+    Routes the Django Ledger reads within the block to the primary database, even inside a read_database() block.
+    May be used as a decorator.
+    """
+    token = _read_database.set(None)
+    try:
+        yield
+    finally:
+        _read_database.reset(token)
+
+
+class DjangoLedgerRouter:
+    """
+    Routes the Django Ledger model reads within a read_database() block to the read replica. Writes always go to the
+    primary database, including the writes of model instances fetched from the replica.
+    """
+
+    def get_database_aliases(self) -> set:
+        aliases = {DEFAULT_DB_ALIAS}
+        if settings.DJANGO_LEDGER_READ_DATABASE:
+            aliases.add(settings.DJANGO_LEDGER_READ_DATABASE)
+        read_alias = _read_database.get()
+        if read_alias:
+            aliases.add(read_alias)
+        return aliases
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        if model._meta.app_label == DJANGO_LEDGER_APP_LABEL:
+            return _read_database.get()
+        return None
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        if model._meta.app_label == DJANGO_LEDGER_APP_LABEL:
+            return DEFAULT_DB_ALIAS
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        aliases = self.get_database_aliases()
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        if all([
+            app_label == DJANGO_LEDGER_APP_LABEL,
+            db != DEFAULT_DB_ALIAS,
+            db == settings.DJANGO_LEDGER_READ_DATABASE,
+        ]):
+            return False
+        return None
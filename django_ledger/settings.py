@@ -13,6 +13,25 @@ logger.setLevel(logging.INFO)
 DJANGO_LEDGER_USE_CLOSING_ENTRIES = getattr(settings, 'DJANGO_LEDGER_USE_CLOSING_ENTRIES', True)
 DJANGO_LEDGER_DEFAULT_CLOSING_ENTRY_CACHE_TIMEOUT = getattr(settings,
                                                             'DJANGO_LEDGER_DEFAULT_CLOSING_ENTRY_CACHE_TIMEOUT', 3600)
+DJANGO_LEDGER_CLOSING_ENTRY_CACHE_ENABLED = getattr(settings, 'DJANGO_LEDGER_CLOSING_ENTRY_CACHE_ENABLED', False)
+DJANGO_LEDGER_CLOSING_ENTRY_CACHE_NAME = getattr(settings, 'DJANGO_LEDGER_CLOSING_ENTRY_CACHE_NAME', 'default')
+DJANGO_LEDGER_CLOSING_ENTRY_INCREMENTAL = getattr(settings, 'DJANGO_LEDGER_CLOSING_ENTRY_INCREMENTAL', False)
+DJANGO_LEDGER_CLOSING_ENTRY_VERIFY = getattr(settings, 'DJANGO_LEDGER_CLOSING_ENTRY_VERIFY', False)
+DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS = getattr(settings, 'DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS', False)
+DJANGO_LEDGER_USE_DENORMALIZED_TRANSACTIONS = getattr(settings, 'DJANGO_LEDGER_USE_DENORMALIZED_TRANSACTIONS', False)
+DJANGO_LEDGER_DIGEST_CACHE_ENABLED = getattr(settings, 'DJANGO_LEDGER_DIGEST_CACHE_ENABLED', False)
+DJANGO_LEDGER_DIGEST_CACHE_NAME = getattr(settings, 'DJANGO_LEDGER_DIGEST_CACHE_NAME', 'default')
+DJANGO_LEDGER_DIGEST_CACHE_TIMEOUT = getattr(settings, 'DJANGO_LEDGER_DIGEST_CACHE_TIMEOUT', 3600)
+DJANGO_LEDGER_DIGEST_CACHE_LOCK_TIMEOUT = getattr(settings, 'DJANGO_LEDGER_DIGEST_CACHE_LOCK_TIMEOUT', 30)
+DJANGO_LEDGER_DIGEST_STREAM_CHUNK_SIZE = getattr(settings, 'DJANGO_LEDGER_DIGEST_STREAM_CHUNK_SIZE', 2000)
+DJANGO_LEDGER_DIGEST_PUSHDOWN = getattr(settings, 'DJANGO_LEDGER_DIGEST_PUSHDOWN', False)
+DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_ENABLED = getattr(settings, 'DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_ENABLED', False)
+DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_NAME = getattr(settings, 'DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_NAME', 'default')
+DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_TIMEOUT = getattr(settings, 'DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_TIMEOUT', 3600)
+DJANGO_LEDGER_PROFILE_DIGEST = getattr(settings, 'DJANGO_LEDGER_PROFILE_DIGEST', False)
+DJANGO_LEDGER_CONSOLIDATION_MAX_WORKERS = getattr(settings, 'DJANGO_LEDGER_CONSOLIDATION_MAX_WORKERS', 1)
+DJANGO_LEDGER_READ_DATABASE = getattr(settings, 'DJANGO_LEDGER_READ_DATABASE', None)
+DJANGO_LEDGER_COMMIT_MANY_BATCH_SIZE = getattr(settings, 'DJANGO_LEDGER_COMMIT_MANY_BATCH_SIZE', 500)
 DJANGO_LEDGER_AUTHORIZED_SUPERUSER = getattr(settings, 'DJANGO_LEDGER_AUTHORIZED_SUPERUSER', False)
 DJANGO_LEDGER_LOGIN_URL = getattr(settings, 'DJANGO_LEDGER_LOGIN_URL', settings.LOGIN_URL)
 DJANGO_LEDGER_BILL_NUMBER_LENGTH = getattr(settings, 'DJANGO_LEDGER_BILL_NUMBER_LENGTH', 10)
@@ -41,6 +60,10 @@ DJANGO_LEDGER_EXPENSE_NUMBER_PREFIX = getattr(settings, 'DJANGO_LEDGER_EXPENSE_N
 DJANGO_LEDGER_INVENTORY_NUMBER_PREFIX = getattr(settings, 'DJANGO_LEDGER_INVENTORY_NUMBER_PREFIX', 'INV')
 DJANGO_LEDGER_PRODUCT_NUMBER_PREFIX = getattr(settings, 'DJANGO_LEDGER_PRODUCT_NUMBER_PREFIX', 'IPR')
 DJANGO_LEDGER_DOCUMENT_NUMBER_PADDING = getattr(settings, 'DJANGO_LEDGER_DOCUMENT_NUMBER_PADDING', 10)
+DJANGO_LEDGER_DOCUMENT_SEQUENCE_BLOCK_SIZE = getattr(settings, 'DJANGO_LEDGER_DOCUMENT_SEQUENCE_BLOCK_SIZE', 1)
+DJANGO_LEDGER_DOCUMENT_SEQUENCE_GAP_TOLERANT_KEYS = getattr(settings,
+                                                            'DJANGO_LEDGER_DOCUMENT_SEQUENCE_GAP_TOLERANT_KEYS',
+                                                            ('je', 'po', 'estimate', 'vendor', 'customer', 'item'))
 DJANGO_LEDGER_JE_NUMBER_NO_UNIT_PREFIX = getattr(settings, 'DJANGO_LEDGER_JE_NUMBER_NO_UNIT_PREFIX', '000')
 
 DJANGO_LEDGER_BILL_MODEL_ABSTRACT_CLASS = getattr(settings,
@@ -113,6 +113,7 @@ def balance_sheet_statement(context, io_model, to_date=None):
         signs=True,
         process_groups=True,
         balance_sheet_statement=True,
+        using=context.get('read_database'),
     )
 
     return {
@@ -144,6 +145,7 @@ def cash_flow_statement(context, io_model):
         from_date=from_date,
         to_date=to_date,
         process_groups=True,
+        using=context.get('read_database'),
     )
 
     return {
@@ -177,6 +179,7 @@ def income_statement_table(context, io_model, from_date=None, to_date=None):
         process_groups=True,
         income_statement=True,
         signs=True,
+        using=context.get('read_database'),
     )
 
     return {
@@ -9,7 +9,7 @@ from zoneinfo import ZoneInfo
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase
 from django.test.client import Client
 from django.utils.timezone import get_default_timezone
 
@@ -20,7 +20,7 @@ from django_ledger.models.entity import EntityModel, EntityModelQuerySet, UserMo
 UserModel = get_user_model()
 
 
-class DjangoLedgerBaseTest(TestCase):
+class DjangoLedgerBaseTestMixIn:
     FY_STARTS = None
     CAPITAL_CONTRIBUTION = None
     START_DATE = None
@@ -294,3 +294,18 @@ class DjangoLedgerBaseTest(TestCase):
         return set.union(*[
             set(v) for v in self.URL_PATTERNS.values()
         ])
+
+
+class DjangoLedgerBaseTest(DjangoLedgerBaseTestMixIn, TestCase):
+    pass
+
+
+class DjangoLedgerBaseTransactionTest(DjangoLedgerBaseTestMixIn, TransactionTestCase):
+    """
+    Populates the test data before every test and commits it, so it is visible to the database connections of other
+    threads.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.setUpTestData()
@@ -1,9 +1,18 @@
-from random import choice
+from datetime import timedelta
+from decimal import Decimal
+from random import choice, randint
+from unittest.mock import patch
 from urllib.parse import urlparse
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from django_ledger.io.io_closing_entry_cache import decode_closing_entry_balances, encode_closing_entry_balances
+from django_ledger.models import ClosingEntryModel, EntityModel, LedgerModel
+from django_ledger.models.entity import EntityModelValidationError
 from django_ledger.tests.base import DjangoLedgerBaseTest
 from django_ledger.urls.closing_entry import urlpatterns as closing_entry_urls
 
@@ -30,6 +39,260 @@ class ClosingEntryModelTests(DjangoLedgerBaseTest):
                     post_closing_entry=True
                 )
 
+    def test_closing_entry_anchoring(self):
+        entity_model = self.get_random_entity_model()
+        for m in range(1, 5):
+            closing_date = (self.START_DATE + timedelta(days=31 * m)).date()
+            entity_model.close_entity_books(closing_date=closing_date)
+        ce_dates = entity_model.fetch_closing_entry_dates_meta()
+
+        from_date = ce_dates[-1] + timedelta(days=randint(1, 20))
+        to_date = ce_dates[0] + timedelta(days=randint(1, 20))
+        self.assertEqual(entity_model.get_nearest_prior_closing_entry(io_date=to_date), ce_dates[0])
+        self.assertEqual(entity_model.get_nearest_prior_closing_entry(io_date=from_date, inclusive=False), ce_dates[-1])
+        self.assertIsNone(entity_model.get_nearest_prior_closing_entry(io_date=ce_dates[-1], inclusive=False))
+
+        for digest_kwargs in [
+            {'from_date': from_date, 'to_date': to_date},
+            {'from_date': from_date, 'to_date': ce_dates[0]},
+            {'from_date': ce_dates[-1] + timedelta(days=1), 'to_date': to_date},
+        ]:
+            ce_digest = entity_model.digest(use_closing_entry=True, by_unit=True, by_activity=True, **digest_kwargs)
+            raw_digest = entity_model.digest(use_closing_entry=False, by_unit=True, by_activity=True, **digest_kwargs)
+            self.assertTrue(ce_digest.get_io_result().ce_match)
+            self.assertEqual(self.get_digest_balances(ce_digest), self.get_digest_balances(raw_digest))
+
+    def test_closing_entry_incremental(self):
+        entity_model = self.get_random_entity_model()
+        for m in range(1, 5):
+            closing_date = (self.START_DATE + timedelta(days=31 * m)).date()
+            entity_model.close_entity_books(closing_date=closing_date, incremental=True, verify=True)
+
+        ce_dates = entity_model.fetch_closing_entry_dates_meta()
+        closing_date = ce_dates[0] + timedelta(days=randint(1, 20))
+        _, ce_txs_incremental = entity_model.get_closing_entry_digest_for_date(
+            closing_date=closing_date,
+            incremental=True
+        )
+        _, ce_txs_full = entity_model.get_closing_entry_digest_for_date(
+            closing_date=closing_date,
+            incremental=False
+        )
+
+        self.assertTrue(len(ce_txs_full) > 0)
+        self.assertEqual(self.get_ce_balances(ce_txs_incremental), self.get_ce_balances(ce_txs_full))
+
+        ce_data = entity_model.get_closing_entry_data_incremental(
+            prev_closing_date=ce_dates[0],
+            to_date=closing_date
+        )
+        entity_model.verify_closing_entry_data(ce_data=ce_data, to_date=closing_date)
+        ce_data[0]['balance'] += Decimal('1.00')
+        with self.assertRaises(EntityModelValidationError):
+            entity_model.verify_closing_entry_data(ce_data=ce_data, to_date=closing_date)
+
+    def test_closing_entry_range(self):
+        entity_model = self.get_random_entity_model()
+        start_date = self.START_DATE.date()
+        end_date = start_date + timedelta(days=randint(120, 240))
+
+        with CaptureQueriesContext(connection) as ctx:
+            closing_entry_list = entity_model.close_books_for_range(
+                start_date=start_date,
+                end_date=end_date,
+                batch_size=2
+            )
+        closing_dates = entity_model.get_closing_dates_for_range(start_date=start_date, end_date=end_date)
+        self.assertEqual([ce.closing_date for ce in closing_entry_list], closing_dates)
+
+        # closing entries and their ledgers are inserted once per batch...
+        batch_count = (len(closing_dates) + 1) // 2
+        for table in [ClosingEntryModel._meta.db_table, LedgerModel._meta.db_table]:
+            self.assertEqual(
+                len([q for q in ctx.captured_queries if q['sql'].startswith(f'INSERT INTO "{table}"')]),
+                batch_count
+            )
+        self.assertTrue(all(ce.is_posted() for ce in closing_entry_list))
+        self.assertEqual(entity_model.fetch_closing_entry_dates_meta(), closing_dates[::-1])
+
+        for closing_date in [closing_dates[0], choice(closing_dates), closing_dates[-1]]:
+            _, ce_txs_full = entity_model.get_closing_entry_digest_for_date(
+                closing_date=closing_date,
+                incremental=False,
+                use_closing_entry=False
+            )
+            self.assertEqual(
+                self.get_ce_balances(entity_model.get_closing_entry_queryset_for_date(closing_date=closing_date)),
+                self.get_ce_balances(ce_txs_full)
+            )
+
+        with self.assertRaises(EntityModelValidationError):
+            entity_model.close_books_for_range(start_date=start_date, end_date=end_date)
+
+        # replaced closing entries do not leave their ledgers behind...
+        ledger_count = LedgerModel.objects.count()
+        closing_entry_list = entity_model.close_books_for_range(
+            start_date=start_date,
+            end_date=end_date,
+            force_update=True
+        )
+        self.assertEqual([ce.closing_date for ce in closing_entry_list], closing_dates)
+        self.assertEqual(LedgerModel.objects.count(), ledger_count)
+        self.assertEqual(
+            set(entity_model.closingentrymodel_set.values_list('ledger_model_id', flat=True)),
+            {ce.ledger_model_id for ce in closing_entry_list}
+        )
+
+        fy_closing_dates = entity_model.get_closing_dates_for_range(
+            start_date=start_date,
+            end_date=start_date + timedelta(days=800),
+            frequency='fiscal_year'
+        )
+        self.assertEqual(len(fy_closing_dates), len(set(fy_closing_dates)))
+        self.assertTrue(all((d + timedelta(days=1)).month == entity_model.fy_start_month for d in fy_closing_dates))
+
+        with self.assertRaises(EntityModelValidationError):
+            entity_model.get_closing_dates_for_range(start_date=start_date, end_date=end_date, frequency='week')
+
+    def test_closing_entry_stale_recompute(self):
+        entity_model = self.get_random_entity_model()
+        for m in range(1, 5):
+            closing_date = (self.START_DATE + timedelta(days=31 * m)).date()
+            entity_model.close_entity_books(closing_date=closing_date)
+        ce_dates = sorted(entity_model.fetch_closing_entry_dates_meta())
+
+        stale_qs = ClosingEntryModel.objects.for_entity(entity_model=entity_model).stale()
+        ce_model = entity_model.closingentrymodel_set.get(closing_date=ce_dates[1])
+        ce_model.mark_as_unposted(commit=False)
+        self.assertFalse(stale_qs.exists())
+
+        # later closing entries are flagged once committed...
+        ce_model.save(update_fields=['posted', 'updated'])
+        self.assertEqual(ce_model.mark_later_closing_entries_as_stale(), 2)
+        ce_model.entity_model.save_closing_entry_dates_meta(commit=True)
+        self.assertEqual(sorted(stale_qs.values_list('closing_date', flat=True)), ce_dates[2:])
+
+        # stale closing entries are not used until recomputed...
+        entity_model = EntityModel.objects.get(uuid__exact=entity_model.uuid)
+        self.assertEqual(entity_model.fetch_closing_entry_dates_meta(), ce_dates[:1])
+        self.assertEqual(entity_model.get_closing_entry_balances(closing_date=ce_dates[2]), dict())
+        io_result = entity_model.database_digest(
+            from_date=ce_dates[2] + timedelta(days=1),
+            to_date=ce_dates[3],
+            role=None,
+            use_closing_entry=True
+        )
+        self.assertFalse(io_result.ce_match)
+        entity_model.verify_closing_entry_data(
+            ce_data=entity_model.get_closing_entry_data_incremental(prev_closing_date=ce_dates[2], to_date=ce_dates[3]),
+            to_date=ce_dates[3]
+        )
+
+        ce_recomputed = ClosingEntryModel.objects.recompute_stale(
+            entity_model_qs=EntityModel.objects.filter(uuid=entity_model.uuid)
+        )
+        self.assertEqual([ce.closing_date for ce in ce_recomputed[entity_model.uuid]], ce_dates[2:])
+        self.assertFalse(stale_qs.exists())
+
+        for ce_model in ce_recomputed[entity_model.uuid]:
+            self.assertTrue(ce_model.is_posted())
+            _, ce_txs_full = entity_model.get_closing_entry_digest_for_date(
+                closing_date=ce_model.closing_date,
+                incremental=False,
+                use_closing_entry=False
+            )
+            self.assertEqual(
+                self.get_ce_balances(entity_model.get_closing_entry_queryset_for_date(ce_model.closing_date)),
+                self.get_ce_balances(ce_txs_full)
+            )
+
+        ce_model = entity_model.closingentrymodel_set.get(closing_date=ce_dates[0])
+        ce_model.mark_as_unposted(commit=True)
+        ce_model.update_transactions()
+        self.assertEqual(sorted(stale_qs.values_list('closing_date', flat=True)), ce_dates[1:])
+        self.assertEqual(
+            [ce.closing_date for ce in entity_model.recompute_stale_closing_entries()],
+            ce_dates[1:]
+        )
+        self.assertFalse(stale_qs.exists())
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    @patch('django_ledger.models.entity.DJANGO_LEDGER_CLOSING_ENTRY_CACHE_ENABLED', True)
+    def test_closing_entry_cache(self):
+        entity_model = self.get_random_entity_model()
+        for m in range(1, 5):
+            closing_date = (self.START_DATE + timedelta(days=31 * m)).date()
+            entity_model.close_entity_books(closing_date=closing_date)
+        ce_dates = entity_model.fetch_closing_entry_dates_meta()
+
+        closing_date = choice(ce_dates)
+        ce_balances = entity_model.save_closing_entry_cache_for_date(closing_date=closing_date)
+        self.assertEqual(entity_model.get_closing_entry_cache_for_date(closing_date=closing_date), ce_balances)
+        self.assertEqual(
+            {(ce.account_uuid, ce.unit_uuid, ce.activity): (ce.tx_type, ce.balance) for ce in ce_balances},
+            {
+                (ce.account_model_id, ce.unit_model_id, ce.activity): (ce.tx_type, ce.balance)
+                for ce in entity_model.get_closing_entry_queryset_for_date(closing_date=closing_date)
+            }
+        )
+        self.assertIsNone(decode_closing_entry_balances(encode_closing_entry_balances(ce_balances)[:-1]))
+        self.assertIsNone(decode_closing_entry_balances('[{"model": "django_ledger.closingentrytransactionmodel"}]'))
+
+        from_date = ce_dates[-1] + timedelta(days=randint(1, 20))
+        to_date = ce_dates[0] + timedelta(days=randint(1, 20))
+        for digest_kwargs in [
+            {'to_date': ce_dates[0]},
+            {'from_date': from_date, 'to_date': to_date, 'by_unit': True, 'by_activity': True},
+            {'from_date': ce_dates[-1] + timedelta(days=1), 'to_date': ce_dates[0], 'by_period': True},
+        ]:
+            cached_digest = entity_model.digest(use_closing_entry=True, use_closing_entry_cache=True, **digest_kwargs)
+            ce_digest = entity_model.digest(use_closing_entry=True, use_closing_entry_cache=False, **digest_kwargs)
+            self.assertTrue(cached_digest.get_io_result().ce_match)
+            self.assertIsInstance(cached_digest.get_io_result().txs_queryset, list)
+            self.assertEqual(self.get_digest_balances(cached_digest), self.get_digest_balances(ce_digest))
+
+        ce_model = entity_model.closingentrymodel_set.get(closing_date=ce_dates[0])
+        ce_model.mark_as_unposted(commit=True)
+        self.assertIsNone(entity_model.get_closing_entry_cache_for_date(closing_date=ce_dates[0]))
+
+    def test_closing_entry_anchoring_by_period(self):
+        entity_model = self.get_random_entity_model()
+        for m in range(1, 5):
+            closing_date = (self.START_DATE + timedelta(days=31 * m)).date()
+            entity_model.close_entity_books(closing_date=closing_date)
+        ce_dates = entity_model.fetch_closing_entry_dates_meta()
+
+        from_date = ce_dates[-1] + timedelta(days=randint(1, 20))
+        to_date = ce_dates[0] + timedelta(days=randint(1, 20))
+        ce_digest = entity_model.digest(use_closing_entry=True, by_period=True, from_date=from_date, to_date=to_date)
+        raw_digest = entity_model.digest(use_closing_entry=False, by_period=True, from_date=from_date, to_date=to_date)
+        self.assertFalse(ce_digest.get_io_result().ce_match)
+
+        def get_period_balances(io_digest) -> dict:
+            balances = dict()
+            for acc in io_digest.get_io_data()['accounts']:
+                key = (acc['account_uuid'], acc['period_year'], acc['period_month'])
+                balances[key] = balances.get(key, Decimal('0.00')) + acc['balance']
+            return {k: v for k, v in balances.items() if v}
+
+        self.assertEqual(get_period_balances(ce_digest), get_period_balances(raw_digest))
+
+    def get_digest_balances(self, io_digest) -> dict:
+        balances = dict()
+        for acc in io_digest.get_io_data()['accounts']:
+            key = (acc['account_uuid'], acc['unit_uuid'], acc['activity'])
+            balances[key] = balances.get(key, Decimal('0.00')) + acc['balance']
+        # sqlite aggregates decimals as floating point...
+        balances = {k: v.quantize(Decimal('0.01')) for k, v in balances.items()}
+        return {k: v for k, v in balances.items() if v}
+
+    def get_ce_balances(self, ce_txs) -> dict:
+        balances = {
+            (ce.account_model_id, ce.unit_model_id, ce.activity): (ce.tx_type, ce.balance.quantize(Decimal('0.01')))
+            for ce in ce_txs
+        }
+        return {k: v for k, v in balances.items() if v[1]}
+
     def test_protected_views(self):
         self.logout_client()
         entity_model = self.get_random_entity_model()
@@ -1,15 +1,23 @@
 from datetime import date
 from random import choice
+from unittest.mock import patch
 from urllib.parse import urlparse
 
+from asgiref.sync import async_to_sync
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.http import JsonResponse
+from django.test import RequestFactory
 from django.urls import reverse
+from django.views.generic import View
 
 from django_ledger.io.io_core import get_localdate
-from django_ledger.models import EntityModel
+from django_ledger.models import EntityModel, EntityStateModel
+from django_ledger.models.sequences import document_sequence_pool
 from django_ledger.tests.base import DjangoLedgerBaseTest
 from django_ledger.urls.entity import urlpatterns as entity_urls
+from django_ledger.views.mixins import DjangoLedgerAsyncSecurityMixIn
 
 UserModel = get_user_model()
 
@@ -49,6 +57,52 @@ class EntityModelTests(DjangoLedgerBaseTest):
                 else:
                     start_month += 1
 
+    # DOCUMENT SEQUENCES...
+    def test_document_sequence_blocks(self):
+        entity_model = self.get_random_entity_model()
+        state_lookup = {
+            'entity_model_id': entity_model.uuid,
+            'entity_unit_id': None,
+            'fiscal_year': 2000,
+        }
+
+        def get_persisted_sequence(key: str) -> int:
+            return EntityStateModel.objects.get(key=key, **state_lookup).sequence
+
+        def get_next_sequence(key: str) -> int:
+            with self.captureOnCommitCallbacks(execute=True):
+                return EntityStateModel.objects.get_next_state_model(key=key, **state_lookup).sequence
+
+        try:
+            with patch('django_ledger.settings.DJANGO_LEDGER_DOCUMENT_SEQUENCE_BLOCK_SIZE', 5):
+                je_sequences = [get_next_sequence(EntityStateModel.KEY_JOURNAL_ENTRY)]
+                self.assertEqual(get_persisted_sequence(EntityStateModel.KEY_JOURNAL_ENTRY), 5)
+                with self.assertNumQueries(0):
+                    je_sequences += [get_next_sequence(EntityStateModel.KEY_JOURNAL_ENTRY) for _ in range(4)]
+                je_sequences.append(get_next_sequence(EntityStateModel.KEY_JOURNAL_ENTRY))
+                self.assertEqual(je_sequences, list(range(1, 7)))
+                self.assertEqual(get_persisted_sequence(EntityStateModel.KEY_JOURNAL_ENTRY), 10)
+
+                # values are pooled only once the reserving transaction commits...
+                with self.captureOnCommitCallbacks(execute=False):
+                    EntityStateModel.objects.reserve_sequence(key=EntityStateModel.KEY_BILL, block_size=5,
+                                                              **state_lookup)
+                self.assertEqual(
+                    document_sequence_pool.get_available(
+                        ('default', entity_model.uuid, None, 2000, EntityStateModel.KEY_BILL)
+                    ),
+                    0
+                )
+
+                # bills are not gap tolerant by default...
+                self.assertEqual(
+                    [get_next_sequence(EntityStateModel.KEY_BILL) for _ in range(2)],
+                    [6, 7]
+                )
+                self.assertEqual(get_persisted_sequence(EntityStateModel.KEY_BILL), 7)
+        finally:
+            document_sequence_pool.clear()
+
 #     def test_closing_entry_meta(self):
 #         self.logger.info('test_closing_entry_creation...')
 #         for entity_model in self.ENTITY_MODEL_QUERYSET:
@@ -281,3 +335,52 @@ class EntityModelTests(DjangoLedgerBaseTest):
             home_url = reverse('django_ledger:home')
             response = self.CLIENT.get(home_url)
             self.assertNotContains(response, text=entity_model.slug)
+
+    def test_api_views(self):
+        entity_model = choice(self.ENTITY_MODEL_QUERYSET)
+        api_urls = [
+            reverse(f'django_ledger:{name}', kwargs={'entity_slug': entity_model.slug})
+            for name in ['entity-json-pnl', 'entity-json-net-payables', 'entity-json-net-receivables']
+        ]
+
+        for api_url in api_urls:
+            response = self.client.get(api_url)
+            self.assertEqual(response.status_code, 302)
+
+        self.client.force_login(self.user_model)
+        for api_url in api_urls:
+            response = self.client.get(api_url)
+            self.assertEqual(response.status_code, 200)
+            results = response.json()['results']
+            self.assertEqual(results['entity_slug'], entity_model.slug)
+            self.assertEqual(results['entity_name'], entity_model.name)
+
+        response = self.client.get(api_urls[0], data={'toDate': self.get_random_date().isoformat()})
+        pnl_data = response.json()['results']['pnl_data']
+        self.assertTrue(all(isinstance(v, dict) for v in pnl_data.values()))
+
+    def test_api_views_dispatch_chain(self):
+        entity_model = choice(self.ENTITY_MODEL_QUERYSET)
+        dispatched = list()
+
+        class DispatchTraceMixIn:
+            def dispatch(self, request, *args, **kwargs):
+                dispatched.append(request.path)
+                return super().dispatch(request, *args, **kwargs)
+
+        class TracedAPIView(DjangoLedgerAsyncSecurityMixIn, DispatchTraceMixIn, View):
+            async def get(self, request, *args, **kwargs):
+                return JsonResponse({'entity_slug': self.kwargs['entity_slug']})
+
+        view = TracedAPIView.as_view()
+        request = RequestFactory().get('/traced/')
+        request.user = AnonymousUser()
+        response = async_to_sync(view)(request, entity_slug=entity_model.slug)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(dispatched, [])
+
+        # mixins following the security mixin are dispatched once authorized...
+        request.user = self.user_model
+        response = async_to_sync(view)(request, entity_slug=entity_model.slug)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(dispatched, ['/traced/'])
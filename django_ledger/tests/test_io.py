@@ -1,12 +1,32 @@
-from datetime import timedelta, datetime
+import asyncio
+from concurrent.futures import Executor, Future
+from datetime import date, timedelta, datetime
+from decimal import Decimal
 from random import randint
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, connections, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
+from django_ledger.io.io_account_cache import get_account_metadata_version
+from django_ledger.io.io_cache import get_digest_version
+from django_ledger.io import roles as roles_module
+from django_ledger.io.io_compact import CompactAccountsDigest
+from django_ledger.io.io_consolidation import EliminationRule
 from django_ledger.io.io_core import IOValidationError
-from django_ledger.models import EntityModel
-from django_ledger.tests.base import DjangoLedgerBaseTest
+from django_ledger.io.io_library import IOBluePrint, IOLibrary
+from django_ledger.io.io_profiler import io_digest_profiled
+from django_ledger.models import EntityModel, AccountBalanceSnapshotModel, JournalEntryModel, TransactionModel
+from django_ledger.models.entity import EntityModelValidationError
+from django_ledger.models.signals import journal_entry_posted
+from django_ledger.routers import DjangoLedgerRouter, primary_database, read_database
+from django_ledger.tests.base import DjangoLedgerBaseTest, DjangoLedgerBaseTransactionTest
 
 
 class IOTest(DjangoLedgerBaseTest):
@@ -212,3 +232,1081 @@ class IOTest(DjangoLedgerBaseTest):
         # Every transaction returned by the IO for an entity digest must belong to that entity.
         for tx in tx_qs:
             self.assertEqual(tx['journal_entry__ledger__entity_id'], entity_model.uuid)
+
+    def get_digest_balances(self, io_digest) -> dict:
+        balances = dict()
+        for acc in io_digest.get_io_data()['accounts']:
+            key = (
+                acc['account_uuid'],
+                acc['unit_uuid'],
+                acc['period_year'],
+                acc['period_month'],
+                acc['activity'],
+            )
+            balances[key] = balances.get(key, Decimal('0.00')) + acc['balance']
+        return {k: v for k, v in balances.items() if v}
+
+    def test_digest_balance_snapshots(self):
+        entity_model = self.get_random_entity_model()
+        AccountBalanceSnapshotModel.objects.rebuild(entity_model=entity_model)
+        self.assertEqual(AccountBalanceSnapshotModel.objects.check_consistency(entity_model=entity_model), [])
+
+        from_date = self.START_DATE + timedelta(days=randint(10, 60))
+        to_date = from_date + timedelta(days=randint(60, 180))
+
+        for digest_kwargs in [
+            {'from_date': from_date, 'to_date': to_date},
+            {'from_date': from_date.date(), 'to_date': to_date.date()},
+            {'to_date': to_date},
+        ]:
+            for group_kwargs in [
+                {},
+                {'by_unit': True, 'by_period': True, 'by_activity': True},
+                {'by_period': 'fiscal_quarter'},
+            ]:
+                raw_digest = entity_model.digest(
+                    use_closing_entry=False,
+                    use_balance_snapshots=False,
+                    **digest_kwargs,
+                    **group_kwargs
+                )
+                snapshot_digest = entity_model.digest(
+                    use_closing_entry=False,
+                    use_balance_snapshots=True,
+                    **digest_kwargs,
+                    **group_kwargs
+                )
+                self.assertTrue(snapshot_digest.get_io_result().snapshot_match)
+                self.assertEqual(self.get_digest_balances(raw_digest), self.get_digest_balances(snapshot_digest))
+
+        # a single account code or activity may be passed as a string...
+        account_code = next(
+            acc['code'] for acc in entity_model.digest(to_date=to_date).get_io_data()['accounts']
+            if acc['balance']
+        )
+        for filter_kwargs in [
+            {'accounts': account_code},
+            {'activity': JournalEntryModel.OPERATING_ACTIVITY},
+        ]:
+            raw_digest = entity_model.digest(
+                to_date=to_date, use_closing_entry=False, use_balance_snapshots=False, **filter_kwargs
+            )
+            snapshot_digest = entity_model.digest(
+                to_date=to_date, use_closing_entry=False, use_balance_snapshots=True, **filter_kwargs
+            )
+            self.assertTrue(snapshot_digest.get_io_result().snapshot_match)
+            self.assertTrue(self.get_digest_balances(raw_digest))
+            self.assertEqual(self.get_digest_balances(raw_digest), self.get_digest_balances(snapshot_digest))
+
+    def test_balance_snapshots_post_unpost(self):
+        entity_model = self.get_random_entity_model()
+        AccountBalanceSnapshotModel.objects.rebuild(entity_model=entity_model)
+
+        je_model = next(
+            je for je in JournalEntryModel.objects.for_entity(entity_model).posted().select_related(
+                'ledger', 'ledger__entity'
+            ) if je.can_unpost()
+        )
+
+        with patch('django_ledger.models.journal_entry.DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS', True):
+            je_model.mark_as_unposted(commit=True, raise_exception=True)
+            self.assertEqual(AccountBalanceSnapshotModel.objects.check_consistency(entity_model=entity_model), [])
+
+            je_model.mark_as_posted(commit=True, force_lock=True, raise_exception=True)
+            self.assertEqual(AccountBalanceSnapshotModel.objects.check_consistency(entity_model=entity_model), [])
+
+    def test_balance_snapshots_unique_key(self):
+        entity_model = self.get_random_entity_model()
+        AccountBalanceSnapshotModel.objects.rebuild(entity_model=entity_model)
+        snapshot_model = AccountBalanceSnapshotModel.objects.filter(
+            entity_model=entity_model,
+            unit_model__isnull=False,
+            activity__isnull=False
+        ).first()
+        snapshot_key = (
+            snapshot_model.entity_model_id,
+            snapshot_model.ledger_model_id,
+            snapshot_model.account_model_id,
+            snapshot_model.unit_model_id,
+            snapshot_model.activity,
+            snapshot_model.tx_type,
+            snapshot_model.period
+        )
+        snapshot_count = AccountBalanceSnapshotModel.objects.count()
+
+        # existing snapshots are updated in place...
+        AccountBalanceSnapshotModel.objects.apply_deltas({snapshot_key: Decimal('10.00')})
+        snapshot_model.refresh_from_db()
+        self.assertEqual(AccountBalanceSnapshotModel.objects.count(), snapshot_count)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            AccountBalanceSnapshotModel.objects.create(
+                entity_model_id=snapshot_model.entity_model_id,
+                ledger_model_id=snapshot_model.ledger_model_id,
+                account_model_id=snapshot_model.account_model_id,
+                unit_model_id=snapshot_model.unit_model_id,
+                activity=snapshot_model.activity,
+                tx_type=snapshot_model.tx_type,
+                period=snapshot_model.period,
+                balance=Decimal('10.00')
+            )
+
+    def test_digest_denormalized_transactions(self):
+        entity_model = self.get_random_entity_model()
+
+        # denormalized fields are kept in sync with the journal entries...
+        txs_values = TransactionModel.objects.for_entity(entity_model=entity_model).values(
+            'entity_id',
+            'ledger_id',
+            'je_timestamp',
+            'je_posted',
+            'ledger_posted',
+            'is_closing_entry',
+            'journal_entry__ledger__entity_id',
+            'journal_entry__ledger_id',
+            'journal_entry__timestamp',
+            'journal_entry__posted',
+            'journal_entry__ledger__posted',
+            'journal_entry__is_closing_entry',
+        )
+        self.assertTrue(len(txs_values) > 0)
+        for tx in txs_values:
+            self.assertEqual(tx['entity_id'], tx['journal_entry__ledger__entity_id'])
+            self.assertEqual(tx['ledger_id'], tx['journal_entry__ledger_id'])
+            self.assertEqual(tx['je_timestamp'], tx['journal_entry__timestamp'])
+            self.assertEqual(tx['je_posted'], tx['journal_entry__posted'])
+            self.assertEqual(tx['ledger_posted'], tx['journal_entry__ledger__posted'])
+            self.assertEqual(tx['is_closing_entry'], tx['journal_entry__is_closing_entry'])
+
+        # transactions are only synced if enabled and a denormalized field changed...
+        je_model = JournalEntryModel.objects.for_entity(entity_model).filter(
+            transactionmodel__isnull=False
+        ).distinct().first()
+        txs_table = TransactionModel._meta.db_table
+
+        def count_txs_updates(**save_kwargs):
+            with CaptureQueriesContext(connection) as ctx:
+                je_model.save(verify=False, **save_kwargs)
+            return len([q for q in ctx.captured_queries if q['sql'].startswith(f'UPDATE "{txs_table}"')])
+
+        je_model.description = 'Denormalized transactions'
+        self.assertEqual(count_txs_updates(), 0)
+        with patch('django_ledger.models.journal_entry.DJANGO_LEDGER_USE_DENORMALIZED_TRANSACTIONS', True):
+            self.assertEqual(count_txs_updates(), 0)
+            self.assertEqual(count_txs_updates(update_fields=['description', 'updated']), 0)
+            self.assertEqual(count_txs_updates(update_fields=['timestamp', 'updated']), 1)
+            je_model.timestamp += timedelta(minutes=1)
+            self.assertEqual(count_txs_updates(), 1)
+        self.assertEqual(
+            set(TransactionModel.objects.filter(journal_entry=je_model).values_list('je_timestamp', flat=True)),
+            {je_model.timestamp}
+        )
+
+        from_date = self.START_DATE + timedelta(days=randint(10, 60))
+        to_date = from_date + timedelta(days=randint(60, 180))
+
+        for digest_kwargs in [
+            {'from_date': from_date, 'to_date': to_date},
+            {'from_date': from_date.date(), 'to_date': to_date.date()},
+            {'to_date': to_date, 'by_unit': True, 'by_period': True, 'by_activity': True},
+        ]:
+            digest = entity_model.digest(**digest_kwargs)
+            with patch('django_ledger.models.transactions.DJANGO_LEDGER_USE_DENORMALIZED_TRANSACTIONS', True):
+                denormalized_digest = entity_model.digest(**digest_kwargs)
+            self.assertEqual(self.get_digest_balances(digest), self.get_digest_balances(denormalized_digest))
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_digest_cache(self):
+        entity_model = self.get_random_entity_model()
+        digest_kwargs = {
+            'to_date': self.START_DATE + timedelta(days=randint(60, 180)),
+            'process_groups': True,
+            'by_unit': True,
+            'balance_sheet_statement': True,
+            'income_statement': True,
+        }
+
+        with patch('django_ledger.settings.DJANGO_LEDGER_DIGEST_CACHE_ENABLED', True):
+            io_digest = entity_model.digest(**digest_kwargs)
+
+            # cached results do not hit the database...
+            with self.assertNumQueries(0):
+                cached_io_digest = entity_model.digest(**digest_kwargs)
+            self.assertEqual(cached_io_digest.get_io_data()['accounts'], io_digest.get_io_data()['accounts'])
+            self.assertEqual(cached_io_digest.get_balance_sheet_data(), io_digest.get_balance_sheet_data())
+
+            # ledger mutations invalidate the cached results...
+            je_model = next(
+                je for je in JournalEntryModel.objects.for_entity(entity_model).posted().select_related(
+                    'ledger', 'ledger__entity'
+                ) if je.can_unpost()
+            )
+            version = get_digest_version(entity_model.uuid)
+            je_model.mark_as_unposted(commit=True, raise_exception=True)
+            self.assertNotEqual(get_digest_version(entity_model.uuid), version)
+            io_digest = entity_model.digest(**digest_kwargs)
+
+            # deleted transactions invalidate the cached results...
+            tx_model = TransactionModel.objects.for_entity(entity_model=entity_model).posted().filter(
+                journal_entry__timestamp__lte=digest_kwargs['to_date'],
+                amount__gt=0
+            ).first()
+            version = get_digest_version(entity_model.uuid)
+            TransactionModel.objects.filter(uuid__exact=tx_model.uuid).delete()
+            self.assertNotEqual(get_digest_version(entity_model.uuid), version)
+            deleted_io_digest = entity_model.digest(**digest_kwargs)
+            self.assertNotEqual(self.get_digest_balances(deleted_io_digest), self.get_digest_balances(io_digest))
+            io_digest = deleted_io_digest
+
+        self.assertEqual(
+            self.get_digest_balances(io_digest),
+            self.get_digest_balances(entity_model.digest(use_cache=False, **digest_kwargs))
+        )
+
+    def test_digest_fiscal_periods(self):
+        entity_model = self.get_random_entity_model()
+        entity_model.fy_start_month = randint(2, 12)
+        to_date = self.START_DATE + timedelta(days=randint(400, 600))
+
+        def get_account_balances(io_digest, key_func) -> dict:
+            balances = dict()
+            for acc in io_digest.get_io_data()['accounts']:
+                key = (acc['account_uuid'], *key_func(acc))
+                balances[key] = balances.get(key, Decimal('0.00')) + acc['balance']
+            # sqlite aggregates decimals as floating point...
+            balances = {k: v.quantize(Decimal('0.01')) for k, v in balances.items()}
+            return {k: v for k, v in balances.items() if v}
+
+        def get_fiscal_quarter(acc):
+            dt = date(acc['period_year'], acc['period_month'], 1)
+            fy = entity_model.get_fy_for_date(dt)
+            quarter = next(
+                q for q in range(1, 5)
+                if entity_model.get_quarter_start(fy, q) <= dt <= entity_model.get_quarter_end(fy, q)
+            )
+            return fy, quarter
+
+        month_digest = entity_model.digest(to_date=to_date, by_period=True, use_closing_entry=False)
+        for by_period, key_func in [
+            ('fiscal_quarter', get_fiscal_quarter),
+            ('fiscal_year', lambda acc: (get_fiscal_quarter(acc)[0], None)),
+        ]:
+            period_digest = entity_model.digest(to_date=to_date, by_period=by_period, use_closing_entry=False)
+            self.assertEqual(
+                get_account_balances(month_digest, key_func),
+                get_account_balances(period_digest, lambda acc: (acc['period_year'], acc['period_month']))
+            )
+
+        week_digest = entity_model.digest(to_date=to_date, by_period='week', use_closing_entry=False)
+        io_digest = entity_model.digest(to_date=to_date, use_closing_entry=False)
+        self.assertEqual(
+            get_account_balances(week_digest, lambda acc: ()),
+            get_account_balances(io_digest, lambda acc: ())
+        )
+        self.assertTrue(all(1 <= acc['period_month'] <= 53 for acc in week_digest.get_io_data()['accounts']))
+
+        with self.assertRaises(IOValidationError):
+            entity_model.digest(to_date=to_date, by_period='quarter')
+
+    def test_digest_pushdown(self):
+        entity_model = self.get_random_entity_model()
+        to_date = self.START_DATE + timedelta(days=randint(200, 400))
+
+        def quantize(value):
+            if isinstance(value, dict):
+                value = {k: quantize(v) for k, v in value.items()}
+                return {k: v for k, v in value.items() if v != {} and v != Decimal('0.00')}
+            # sqlite aggregates decimals as floating point...
+            return Decimal(value).quantize(Decimal('0.01'))
+
+        def get_account_balances(io_data) -> dict:
+            balances = dict()
+            for acc in io_data['accounts']:
+                key = (acc['account_uuid'], acc.get('unit_uuid'), acc.get('period_year'), acc.get('period_month'))
+                balances[key] = balances.get(key, Decimal('0.00')) + acc['balance']
+            return quantize(balances)
+
+        for digest_kwargs in [
+            {},
+            {'by_period': True},
+            {'by_unit': True},
+            {'by_period': True, 'by_unit': True},
+            {'signs': False},
+            {'by_tx_type': True},
+        ]:
+            digests = [
+                entity_model.digest(
+                    to_date=to_date,
+                    process_roles=True,
+                    process_groups=True,
+                    use_closing_entry=False,
+                    pushdown=pushdown,
+                    **digest_kwargs
+                ) for pushdown in (False, True)
+            ]
+            self.assertEqual([io_digest.get_io_result().signed for io_digest in digests], [False, True])
+            digests = [io_digest.get_io_data() for io_digest in digests]
+            self.assertEqual(*[get_account_balances(io_data) for io_data in digests])
+            for key in ['role_balance', 'group_balance']:
+                self.assertEqual(*[quantize(io_data[key]) for io_data in digests])
+            if digest_kwargs.get('by_period'):
+                for key in ['role_balance_by_period', 'group_balance_by_period']:
+                    self.assertEqual(*[quantize(io_data[key]) for io_data in digests])
+            if digest_kwargs.get('by_unit'):
+                for key in ['role_balance_by_unit', 'group_balance_by_unit']:
+                    self.assertEqual(*[quantize(io_data[key]) for io_data in digests])
+
+        # snapshot balances are signed in python before being merged...
+        AccountBalanceSnapshotModel.objects.rebuild(entity_model=entity_model)
+        digests = [
+            entity_model.digest(
+                to_date=to_date,
+                process_groups=True,
+                use_closing_entry=False,
+                use_balance_snapshots=True,
+                pushdown=pushdown
+            ) for pushdown in (False, True)
+        ]
+        self.assertTrue(all(io_digest.get_io_result().snapshot_match for io_digest in digests))
+        digests = [io_digest.get_io_data() for io_digest in digests]
+        self.assertEqual(*[get_account_balances(io_data) for io_data in digests])
+        self.assertEqual(*[quantize(io_data['group_balance']) for io_data in digests])
+
+    def test_digest_consolidated(self):
+        root_entity_model = self.get_random_entity_model()
+        child_entity_models = list(EntityModel.objects.exclude(uuid__exact=root_entity_model.uuid)[:2])
+        for child_entity_model in child_entity_models:
+            child_entity_model.move(root_entity_model, pos='last-child')
+        to_date = self.START_DATE + timedelta(days=randint(200, 400))
+
+        def get_code_balances(accounts) -> dict:
+            balances = dict()
+            for acc in accounts:
+                key = (acc['code'], acc['role'])
+                balances[key] = balances.get(key, Decimal('0.00')) + acc['balance']
+            # sqlite aggregates decimals as floating point...
+            balances = {k: v.quantize(Decimal('0.01')) for k, v in balances.items()}
+            return {k: v for k, v in balances.items() if v}
+
+        entity_digests = [
+            EntityModel.objects.get(uuid__exact=e.uuid).digest(
+                to_date=to_date, process_groups=True, use_closing_entry=False
+            ) for e in [root_entity_model] + child_entity_models
+        ]
+        expected_balances = get_code_balances(
+            acc for io_digest in entity_digests for acc in io_digest.get_io_data()['accounts']
+        )
+
+        class InlineExecutor(Executor):
+            def submit(self, fn, *args, **kwargs):
+                future = Future()
+                future.set_result(fn(*args, **kwargs))
+                return future
+
+        # executors cannot read the data of the open test transaction...
+        with self.assertRaises(EntityModelValidationError):
+            root_entity_model.digest_consolidated(to_date=to_date, executor=InlineExecutor())
+
+        # pooled digests fall back to the current thread within the open test transaction...
+        for consolidation_kwargs in [{'max_workers': 1}, {'max_workers': 4}]:
+            consolidated_digest = root_entity_model.digest_consolidated(
+                to_date=to_date,
+                process_groups=True,
+                use_closing_entry=False,
+                **consolidation_kwargs
+            )
+            self.assertTrue(consolidated_digest.is_consolidated())
+            self.assertEqual(len(consolidated_digest.get_consolidated_entities()), len(entity_digests))
+            io_data = consolidated_digest.get_io_data()
+            self.assertEqual(get_code_balances(io_data['accounts']), expected_balances)
+            self.assertEqual(
+                io_data['group_balance']['GROUP_ASSETS'].quantize(Decimal('0.01')),
+                sum(
+                    io_digest.get_io_data()['group_balance']['GROUP_ASSETS'] for io_digest in entity_digests
+                ).quantize(Decimal('0.01'))
+            )
+
+        elimination_rule = EliminationRule(name='Intercompany Receivables', roles=(roles_module.ASSET_CA_RECEIVABLES,))
+        consolidated_digest = root_entity_model.digest_consolidated(
+            to_date=to_date,
+            balance_sheet_statement=True,
+            elimination_rules=[elimination_rule],
+            use_closing_entry=False,
+            max_workers=1
+        )
+        self.assertTrue(consolidated_digest.has_balance_sheet())
+        self.assertFalse(
+            any(
+                acc['role'] == roles_module.ASSET_CA_RECEIVABLES
+                for acc in consolidated_digest.get_io_data()['accounts']
+            )
+        )
+        eliminations = consolidated_digest.get_eliminations_data()
+        self.assertEqual([e['name'] for e in eliminations], [elimination_rule.name])
+        self.assertEqual(
+            eliminations[0]['difference'].quantize(Decimal('0.01')),
+            sum(
+                v for (code, role), v in expected_balances.items() if role == roles_module.ASSET_CA_RECEIVABLES
+            )
+        )
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_digest_account_metadata_cache(self):
+        entity_model = self.get_random_entity_model()
+        digest_kwargs = {
+            'to_date': self.START_DATE + timedelta(days=randint(60, 180)),
+            'by_unit': True,
+            'by_period': True,
+            'process_groups': True,
+            'use_closing_entry': False,
+        }
+        io_digest = entity_model.digest(**digest_kwargs)
+
+        with patch('django_ledger.settings.DJANGO_LEDGER_ACCOUNT_METADATA_CACHE_ENABLED', True):
+            # digest records are grouped by account only, without joining the account tables...
+            io_result = entity_model.database_digest(role=None, **digest_kwargs)
+            self.assertIsNotNone(io_result.account_metadata)
+            self.assertNotIn('django_ledger_accountmodel', str(io_result.txs_queryset.query))
+
+            cached_io_digest = entity_model.digest(**digest_kwargs)
+            self.assertEqual(cached_io_digest.get_io_data()['accounts'], io_digest.get_io_data()['accounts'])
+            self.assertEqual(self.get_digest_balances(cached_io_digest), self.get_digest_balances(io_digest))
+
+            # account changes invalidate the cached metadata...
+            account_model = entity_model.get_default_coa_accounts().get(
+                uuid__exact=cached_io_digest.get_io_data()['accounts'][0]['account_uuid']
+            )
+            version = get_account_metadata_version(entity_model.uuid)
+            account_model.name = 'Renamed Account'
+            account_model.save(update_fields=['name', 'updated'])
+            self.assertNotEqual(get_account_metadata_version(entity_model.uuid), version)
+
+            renamed_io_digest = entity_model.digest(**digest_kwargs)
+            self.assertIn(
+                'Renamed Account',
+                [acc['name'] for acc in renamed_io_digest.get_io_data()['accounts']]
+            )
+
+            # records of accounts missing from the cached metadata fetch the metadata again...
+            account_metadata = entity_model.database_digest(role=None, **digest_kwargs).account_metadata
+            del account_metadata[account_model.uuid]
+            txs_values = list(entity_model.iter_with_account_metadata(
+                txs_values=[{'account__uuid': account_model.uuid}],
+                account_metadata=account_metadata,
+                entity_uuid=entity_model.uuid
+            ))
+            self.assertEqual(txs_values[0]['account__name'], 'Renamed Account')
+
+    def test_digest_windows(self):
+        entity_model = self.get_random_entity_model()
+        from_date = self.START_DATE + timedelta(days=randint(10, 60))
+        windows = [
+            (from_date, from_date + timedelta(days=30)),
+            (from_date + timedelta(days=15), from_date + timedelta(days=90)),
+            (None, from_date + timedelta(days=120)),
+        ]
+
+        for digest_kwargs in [
+            {'process_groups': True, 'income_statement': True},
+            {'by_unit': True, 'by_period': True, 'by_activity': True},
+        ]:
+            with self.assertNumQueries(1):
+                io_digests = entity_model.digest_windows(windows=windows, **digest_kwargs)
+            self.assertEqual(len(io_digests), len(windows))
+
+            for (window_from_date, window_to_date), io_digest in zip(windows, io_digests):
+                window_digest = entity_model.digest(
+                    from_date=window_from_date,
+                    to_date=window_to_date,
+                    use_closing_entry=False,
+                    **digest_kwargs
+                )
+                self.assertEqual(self.get_digest_balances(window_digest), self.get_digest_balances(io_digest))
+                if digest_kwargs.get('income_statement'):
+                    self.assertEqual(
+                        window_digest.get_income_statement_data(),
+                        io_digest.get_income_statement_data()
+                    )
+
+    def test_digest_comparative(self):
+        entity_model = self.get_random_entity_model()
+        from_date = (self.START_DATE + timedelta(days=randint(10, 60))).date()
+        to_date = from_date + timedelta(days=randint(60, 120))
+
+        def quantize(balances):
+            # sqlite aggregates decimals as floating point...
+            return [Decimal(b).quantize(Decimal('0.01')) for b in balances]
+
+        with self.assertNumQueries(1):
+            io_digest = entity_model.digest_comparative(
+                from_date=from_date,
+                to_date=to_date,
+                by_period='month',
+                balance_sheet_statement=True,
+                income_statement=True,
+            )
+        self.assertTrue(io_digest.is_comparative())
+        columns = io_digest.get_comparative_columns()
+        self.assertEqual(columns[0]['from_date'], from_date)
+        self.assertEqual(columns[-1]['to_date'], to_date)
+        self.assertEqual(columns[0]['label'], f'{from_date.year}-{from_date.month:02d}')
+
+        ic_data = io_digest.get_comparative_income_statement_data()
+        bs_data = io_digest.get_comparative_balance_sheet_data()
+        for i, column in enumerate(columns):
+            ic_digest = entity_model.digest(
+                from_date=column['from_date'],
+                to_date=column['to_date'],
+                income_statement=True,
+                use_closing_entry=False,
+            )
+            bs_digest = entity_model.digest(
+                to_date=column['to_date'],
+                balance_sheet_statement=True,
+                use_closing_entry=False,
+            )
+            self.assertEqual(
+                quantize([ic_data['net_income']['balances'][i]]),
+                quantize([ic_digest.get_income_statement_data()['net_income']])
+            )
+            self.assertEqual(
+                quantize([bs_data['liabilities_equity_balance']['balances'][i]]),
+                quantize([bs_digest.get_balance_sheet_data()['liabilities_equity_balance']])
+            )
+
+        # each column is compared against the preceding column...
+        net_income = ic_data['net_income']
+        self.assertIsNone(net_income['deltas'][0])
+        for i in range(1, len(columns)):
+            self.assertEqual(
+                quantize([net_income['deltas'][i]]),
+                quantize([net_income['balances'][i] - net_income['balances'][i - 1]])
+            )
+
+        # explicit windows, compared against a base column...
+        windows = [
+            (from_date, from_date + timedelta(days=30)),
+            (from_date + timedelta(days=31), from_date + timedelta(days=61)),
+        ]
+        io_digest = entity_model.digest_comparative(
+            windows=windows,
+            labels=['Previous', 'Current'],
+            base_column=1,
+            income_statement=True,
+        )
+        self.assertFalse(io_digest.has_comparative_balance_sheet())
+        net_income = io_digest.get_comparative_income_statement_data()['net_income']
+        self.assertIsNone(net_income['deltas'][1])
+        self.assertEqual(
+            quantize([net_income['deltas'][0]]),
+            quantize([net_income['balances'][0] - net_income['balances'][1]])
+        )
+
+        with self.assertRaises(IOValidationError):
+            entity_model.digest_comparative(windows=windows, by_period='month', income_statement=True)
+
+        report = entity_model.get_comparative_statements(from_date=from_date, to_date=to_date, by_period='month')
+        report.create_pdf_report()
+        self.assertTrue(bytes(report.output()).startswith(b'%PDF'))
+
+    def test_digest_stream(self):
+        entity_model = self.get_random_entity_model()
+        digest_kwargs = {
+            'from_date': self.START_DATE + timedelta(days=randint(10, 60)),
+            'to_date': self.START_DATE + timedelta(days=randint(90, 180)),
+            'by_unit': True,
+            'by_period': True,
+            'by_activity': True,
+            'process_groups': True,
+        }
+        io_digest = entity_model.digest(**digest_kwargs)
+        stream_digest = entity_model.digest(stream=True, **digest_kwargs)
+        self.assertEqual(stream_digest.get_io_data()['accounts'], io_digest.get_io_data()['accounts'])
+        self.assertEqual(stream_digest.get_io_data()['group_balance'], io_digest.get_io_data()['group_balance'])
+
+    def test_digest_lazy(self):
+        entity_model = self.get_random_entity_model()
+        digest_kwargs = {
+            'from_date': self.START_DATE + timedelta(days=randint(10, 60)),
+            'to_date': self.START_DATE + timedelta(days=randint(90, 180)),
+            'by_unit': True,
+            'by_period': True,
+        }
+        accounts_digest = entity_model.digest(**digest_kwargs).get_io_data()['accounts']
+        lazy_digest = entity_model.digest(stream=True, lazy=True, use_cache=True, **digest_kwargs)
+        lazy_accounts = lazy_digest.get_io_data()['accounts']
+        self.assertNotIsInstance(lazy_accounts, (list, CompactAccountsDigest))
+        self.assertEqual(list(lazy_accounts), accounts_digest)
+        # single pass...
+        self.assertEqual(list(lazy_accounts), [])
+
+        with self.assertRaises(IOValidationError):
+            entity_model.digest(lazy=True, process_groups=True, **digest_kwargs)
+        with self.assertRaises(IOValidationError):
+            entity_model.digest(lazy=True, compact=True, **digest_kwargs)
+
+    def test_digest_compact(self):
+        entity_model = self.get_random_entity_model()
+        digest_kwargs = {
+            'to_date': self.START_DATE + timedelta(days=randint(90, 180)),
+            'by_unit': True,
+            'by_period': True,
+            'process_roles': True,
+            'process_groups': True,
+            'process_activity': True,
+            'balance_sheet_statement': True,
+            'income_statement': True,
+            'cash_flow_statement': True,
+        }
+        io_data = entity_model.digest(**digest_kwargs).get_io_data()
+        compact_io_data = entity_model.digest(compact=True, **digest_kwargs).get_io_data()
+
+        compact_digest = compact_io_data['accounts']
+        self.assertIsInstance(compact_digest, CompactAccountsDigest)
+        self.assertEqual(list(compact_digest), io_data['accounts'])
+        for key in ['role_account', 'group_account']:
+            self.assertEqual(compact_io_data[key], io_data[key], msg=f'{key} does not match.')
+        # records are shared between the digest and the middleware buckets...
+        for acc in compact_io_data['group_account']['GROUP_INCOME']:
+            self.assertIn('role_name', acc)
+            self.assertTrue(any(acc is r for r in compact_digest))
+
+        for key in [
+            'role_balance',
+            'role_balance_by_period',
+            'role_balance_by_unit',
+            'group_balance',
+            'group_balance_by_period',
+            'group_balance_by_unit',
+            'activity_balance',
+            'balance_sheet',
+            'income_statement',
+            'cash_flow_statement',
+        ]:
+            self.assertEqual(compact_io_data[key], io_data[key], msg=f'{key} does not match.')
+
+        role_balances = dict()
+        for acc in io_data['accounts']:
+            role_balances[acc['role']] = role_balances.get(acc['role'], 0) + acc['balance']
+        self.assertEqual(compact_digest.reduce('role'), role_balances)
+
+    def test_digest_profile(self):
+        entity_model = self.get_random_entity_model()
+        digest_kwargs = {
+            'to_date': self.START_DATE + timedelta(days=randint(90, 180)),
+            'process_groups': True,
+            'balance_sheet_statement': True,
+        }
+        self.assertIsNone(entity_model.digest(**digest_kwargs).get_profile())
+
+        received = list()
+
+        def receiver(sender, io_model, profile, **kwargs):
+            received.append((io_model, profile))
+
+        io_digest_profiled.connect(receiver)
+        try:
+            io_digest = entity_model.digest(profile=True, **digest_kwargs)
+        finally:
+            io_digest_profiled.disconnect(receiver)
+
+        profile = io_digest.get_profile()
+        self.assertEqual(
+            list(profile['stages']),
+            ['database_digest', 'python_digest', 'groups', 'balance_sheet']
+        )
+        self.assertGreater(profile['stages']['database_digest']['query_count'], 0)
+        self.assertEqual(profile['stages']['python_digest']['query_count'], 0)
+        self.assertEqual(
+            profile['stages']['python_digest']['rows'],
+            len(io_digest.get_io_data()['accounts'])
+        )
+        self.assertEqual(
+            profile['query_count'],
+            sum(s['query_count'] for s in profile['stages'].values())
+        )
+        self.assertEqual(received, [(entity_model, profile)])
+
+    async def test_adigest(self):
+        entity_model = await EntityModel.objects.order_by('?').afirst()
+        to_date = self.START_DATE + timedelta(days=randint(90, 180))
+        digest_kwargs = {
+            'to_date': to_date,
+            'by_unit': True,
+            'by_period': True,
+            'process_groups': True,
+            'balance_sheet_statement': True,
+        }
+        bounded_kwargs = {
+            'from_date': self.START_DATE + timedelta(days=randint(10, 60)),
+            'to_date': to_date,
+            'process_groups': True,
+            'income_statement': True,
+        }
+        io_digest, bounded_io_digest = await asyncio.gather(
+            entity_model.adigest(**digest_kwargs),
+            entity_model.adigest(**bounded_kwargs),
+        )
+
+        for adigest_result, kwargs in [(io_digest, digest_kwargs), (bounded_io_digest, bounded_kwargs)]:
+            expected = await sync_to_async(entity_model.digest)(**kwargs)
+            self.assertEqual(adigest_result.get_io_data()['accounts'], expected.get_io_data()['accounts'])
+            self.assertEqual(
+                adigest_result.get_io_data()['group_balance'],
+                expected.get_io_data()['group_balance']
+            )
+
+        self.assertEqual(
+            io_digest.get_balance_sheet_data(),
+            (await sync_to_async(entity_model.digest)(**digest_kwargs)).get_balance_sheet_data()
+        )
+
+    def test_commit_many(self):
+        entity_model = self.get_random_entity_model()
+        AccountBalanceSnapshotModel.objects.rebuild(entity_model=entity_model)
+        ledger_model = entity_model.create_ledger(name='Bulk Commit Ledger', posted=True)
+        accounts_qs = entity_model.get_coa_accounts()
+        cash_account = accounts_qs.filter(role=roles_module.ASSET_CA_CASH).first()
+        income_account = accounts_qs.filter(role=roles_module.INCOME_OPERATIONAL).first()
+        timestamp = datetime.now(tz=ZoneInfo(settings.TIME_ZONE)) - timedelta(days=1)
+
+        def get_txs(amount: Decimal):
+            return [
+                {'account': cash_account, 'amount': amount, 'tx_type': 'debit', 'description': 'Sale'},
+                {'account': income_account, 'amount': amount, 'tx_type': 'credit', 'description': 'Sale'},
+            ]
+
+        entries = [
+            {'timestamp': timestamp, 'txs': get_txs(Decimal(f'{i + 1}00.00')), 'desc': f'Bulk Sale {i}'}
+            for i in range(5)
+        ]
+
+        with patch('django_ledger.settings.DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS', True), \
+                patch('django_ledger.models.journal_entry.DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS', True):
+            je_model, _ = entity_model.commit_txs(
+                je_timestamp=timestamp,
+                je_txs=get_txs(Decimal('50.00')),
+                je_posted=True,
+                je_ledger_model=ledger_model,
+            )
+            results = entity_model.commit_many(
+                entries=[dict(ledger=ledger_model, **entry) for entry in entries],
+                je_posted=True,
+                batch_size=2
+            )
+            self.assertEqual(AccountBalanceSnapshotModel.objects.check_consistency(entity_model=entity_model), [])
+
+        self.assertEqual(len(results), len(entries))
+        je_prefix, last_seq = je_model.je_number.rsplit('-', 1)
+        for i, (bulk_je_model, txs_models) in enumerate(results):
+            self.assertEqual(bulk_je_model.je_number, f'{je_prefix}-{str(int(last_seq) + i + 1).zfill(len(last_seq))}')
+            self.assertEqual(bulk_je_model.activity, je_model.activity)
+            self.assertTrue(bulk_je_model.is_posted())
+            self.assertEqual(len(txs_models), 2)
+
+        saved_je_qs = JournalEntryModel.objects.filter(uuid__in=[je.uuid for je, _ in results])
+        self.assertTrue(all(je.is_posted() and je.is_locked() for je in saved_je_qs))
+        for saved_je_model in saved_je_qs:
+            txs_qs, verified = saved_je_model.verify(force_verify=True)
+            self.assertTrue(verified)
+            self.assertEqual(len(txs_qs), 2)
+        self.assertEqual(
+            TransactionModel.objects.filter(journal_entry__ledger=ledger_model, je_posted=True).count(),
+            2 * (len(entries) + 1)
+        )
+
+        je_count = JournalEntryModel.objects.filter(ledger=ledger_model).count()
+        invalid_entries = [
+            {'ledger': ledger_model, 'timestamp': timestamp, 'txs': get_txs(Decimal('10.00'))},
+            {'ledger': ledger_model, 'timestamp': timestamp, 'txs': get_txs(Decimal('10.00'))[:1]},
+        ]
+        with self.assertRaises(IOValidationError):
+            entity_model.commit_many(entries=invalid_entries)
+        with self.assertRaises(IOValidationError):
+            entity_model.commit_many(entries=[{'timestamp': timestamp, 'txs': get_txs(Decimal('10.00'))}])
+        self.assertEqual(JournalEntryModel.objects.filter(ledger=ledger_model).count(), je_count)
+
+    def test_commit_txs_verified_in_memory(self):
+        entity_model = self.get_random_entity_model()
+        AccountBalanceSnapshotModel.objects.rebuild(entity_model=entity_model)
+        ledger_model = entity_model.create_ledger(name='In Memory Ledger', posted=True)
+        accounts_qs = entity_model.get_coa_accounts()
+        cash_account = accounts_qs.filter(role=roles_module.ASSET_CA_CASH).first()
+        income_account = accounts_qs.filter(role=roles_module.INCOME_OPERATIONAL).first()
+        timestamp = datetime.now(tz=ZoneInfo(settings.TIME_ZONE)) - timedelta(days=1)
+        je_txs = [
+            {'account': cash_account, 'amount': Decimal('75.00'), 'tx_type': 'debit', 'description': 'Sale'},
+            {'account': income_account, 'amount': Decimal('75.00'), 'tx_type': 'credit', 'description': 'Sale'},
+        ]
+
+        txs_table = TransactionModel._meta.db_table
+        with patch('django_ledger.settings.DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS', True), \
+                patch('django_ledger.models.journal_entry.DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS', True):
+            with CaptureQueriesContext(connection) as ctx:
+                je_model, txs_models = entity_model.commit_txs(
+                    je_timestamp=timestamp,
+                    je_txs=je_txs,
+                    je_posted=True,
+                    je_ledger_model=ledger_model,
+                )
+            self.assertEqual(AccountBalanceSnapshotModel.objects.check_consistency(entity_model=entity_model), [])
+
+        txs_queries = [q['sql'] for q in ctx.captured_queries if txs_table in q['sql']]
+        self.assertEqual(len(txs_queries), 1)
+        self.assertTrue(txs_queries[0].startswith('INSERT'))
+
+        self.assertEqual(len(txs_models), 2)
+        self.assertTrue(je_model.je_number)
+        self.assertEqual(je_model.activity, JournalEntryModel.OPERATING_ACTIVITY)
+        saved_je_model = JournalEntryModel.objects.get(uuid__exact=je_model.uuid)
+        self.assertTrue(saved_je_model.is_posted())
+        self.assertTrue(saved_je_model.locked)
+        self.assertEqual(saved_je_model.activity, je_model.activity)
+        self.assertTrue(all(
+            tx.je_posted and tx.ledger_id == ledger_model.uuid and tx.entity_id == entity_model.uuid
+            for tx in TransactionModel.objects.filter(journal_entry=je_model)
+        ))
+
+        je_count = JournalEntryModel.objects.filter(ledger=ledger_model).count()
+        with self.assertRaises(ValidationError):
+            entity_model.commit_txs(
+                je_timestamp=timestamp,
+                je_txs=je_txs[:1],
+                je_ledger_model=ledger_model,
+            )
+        self.assertEqual(JournalEntryModel.objects.filter(ledger=ledger_model).count(), je_count)
+
+    def test_ledger_bulk_lock_and_post(self):
+        entity_model = self.get_random_entity_model()
+        AccountBalanceSnapshotModel.objects.rebuild(entity_model=entity_model)
+        ledger_model = entity_model.create_ledger(name='Bulk Post Ledger', posted=True)
+        accounts_qs = entity_model.get_coa_accounts()
+        cash_account = accounts_qs.filter(role=roles_module.ASSET_CA_CASH).first()
+        income_account = accounts_qs.filter(role=roles_module.INCOME_OPERATIONAL).first()
+        timestamp = datetime.now(tz=ZoneInfo(settings.TIME_ZONE)) - timedelta(days=1)
+
+        je_models = [
+            entity_model.commit_txs(
+                je_timestamp=timestamp,
+                je_txs=[
+                    {'account': cash_account, 'amount': Decimal('40.00'), 'tx_type': 'debit', 'description': 'Sale'},
+                    {'account': income_account, 'amount': Decimal('40.00'), 'tx_type': 'credit', 'description': 'Sale'},
+                ],
+                je_ledger_model=ledger_model,
+            )[0] for _ in range(3)
+        ]
+        unbalanced_je_model = je_models[0]
+        TransactionModel.objects.create(
+            journal_entry=unbalanced_je_model,
+            account=income_account,
+            amount=Decimal('5.00'),
+            tx_type='credit',
+            description='Unbalanced'
+        )
+
+        posted_je_models, failed = ledger_model.bulk_post_journal_entries()
+        self.assertEqual(posted_je_models, [])
+        self.assertEqual(len(failed), 3)
+
+        je_table = JournalEntryModel._meta.db_table
+        with CaptureQueriesContext(connection) as ctx:
+            locked_je_models, failed = ledger_model.bulk_lock_journal_entries()
+        self.assertEqual(len([q for q in ctx.captured_queries if q['sql'].startswith(f'UPDATE "{je_table}"')]), 1)
+        self.assertEqual(len([q for q in ctx.captured_queries if q['sql'].startswith('SELECT')]), 2)
+        self.assertEqual({je.uuid for je in locked_je_models}, {je.uuid for je in je_models[1:]})
+        self.assertEqual([je.uuid for je in failed], [unbalanced_je_model.uuid])
+        self.assertIn('does not match DEBITs', str(list(failed.values())[0]))
+
+        # all Journal Entries are verified before posting...
+        with self.assertRaises(ValidationError):
+            ledger_model.bulk_post_journal_entries(raise_exception=True)
+        self.assertFalse(JournalEntryModel.objects.filter(ledger=ledger_model, posted=True).exists())
+
+        with patch('django_ledger.settings.DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS', True), \
+                patch('django_ledger.models.journal_entry.DJANGO_LEDGER_USE_BALANCE_SNAPSHOTS', True):
+            posted_je_models, failed = ledger_model.bulk_post_journal_entries()
+            self.assertEqual(AccountBalanceSnapshotModel.objects.check_consistency(entity_model=entity_model), [])
+        self.assertEqual({je.uuid for je in posted_je_models}, {je.uuid for je in je_models[1:]})
+        self.assertEqual([je.uuid for je in failed], [unbalanced_je_model.uuid])
+
+        saved_je_qs = JournalEntryModel.objects.filter(ledger=ledger_model).order_by('je_number')
+        for saved_je_model in saved_je_qs:
+            is_valid = saved_je_model.uuid != unbalanced_je_model.uuid
+            self.assertEqual(saved_je_model.is_posted(), is_valid)
+            self.assertEqual(saved_je_model.locked, is_valid)
+            if is_valid:
+                self.assertEqual(saved_je_model.activity, JournalEntryModel.OPERATING_ACTIVITY)
+        self.assertEqual(
+            TransactionModel.objects.filter(journal_entry__ledger=ledger_model, je_posted=True).count(), 4
+        )
+        with self.assertRaises(ValidationError):
+            ledger_model.post_journal_entries(raise_exception=True)
+
+        # the JournalEntryModel QuerySet API is kept...
+        self.assertFalse(ledger_model.post_journal_entries().exists())
+        TransactionModel.objects.filter(journal_entry=unbalanced_je_model, description='Unbalanced').delete()
+        self.assertEqual(
+            list(ledger_model.lock_journal_entries().values_list('uuid', flat=True)), [unbalanced_je_model.uuid]
+        )
+        received = list()
+
+        def receiver(sender, instance, **kwargs):
+            received.append((instance.uuid, kwargs.get('user_model')))
+
+        journal_entry_posted.connect(receiver)
+        try:
+            self.assertEqual(
+                list(ledger_model.post_journal_entries(user_model=self.user_model).values_list('uuid', flat=True)),
+                [unbalanced_je_model.uuid]
+            )
+        finally:
+            journal_entry_posted.disconnect(receiver)
+        self.assertEqual(received, [(unbalanced_je_model.uuid, self.user_model)])
+
+    def test_io_cursor_batched_commit(self):
+        entity_model = self.get_random_entity_model()
+        accounts_qs = entity_model.get_coa_accounts().can_transact()
+        cash_account = accounts_qs.filter(role=roles_module.ASSET_CA_CASH).first()
+        income_account = accounts_qs.filter(role=roles_module.INCOME_OPERATIONAL).first()
+        existing_ledger_model = entity_model.create_ledger(name='Existing Blueprint Ledger', ledger_xid='existing-xid')
+
+        def revenue_recognition(amount: Decimal) -> IOBluePrint:
+            blueprint = IOBluePrint()
+            blueprint.debit(account_code=cash_account.code, amount=amount)
+            blueprint.credit(account_code=income_account.code, amount=amount)
+            return blueprint
+
+        io_library = IOLibrary(name='batched-library')
+        io_library.register(revenue_recognition)
+        io_cursor = io_library.get_cursor(entity_model=entity_model, user_model=self.user_model)
+        ledger_xids = [f'customer-{i}' for i in range(5)] + ['existing-xid']
+        for i, ledger_xid in enumerate(ledger_xids):
+            io_cursor.dispatch('revenue_recognition', ledger_model=ledger_xid, amount=Decimal(f'{i + 1}0.00'))
+
+        results = io_cursor.commit(post_new_ledgers=True, post_journal_entries=True, batched=True, batch_size=2)
+
+        self.assertTrue(io_cursor.is_committed())
+        self.assertEqual(len(results), len(ledger_xids))
+        self.assertIn(existing_ledger_model, results)
+        ledger_qs = entity_model.ledgermodel_set.filter(ledger_xid__in=ledger_xids)
+        self.assertEqual(ledger_qs.count(), len(ledger_xids))
+        for ledger_model, result in results.items():
+            self.assertFalse(ledger_model._state.adding)
+            je_model = result['journal_entry']
+            self.assertEqual(je_model.ledger_id, ledger_model.uuid)
+            self.assertEqual(len(result['txs_models']), 2)
+            self.assertTrue(je_model.is_posted())
+        self.assertEqual(
+            JournalEntryModel.objects.filter(ledger__in=ledger_qs, posted=True, locked=True).count(),
+            len(ledger_xids)
+        )
+        self.assertEqual(TransactionModel.objects.filter(journal_entry__ledger__in=ledger_qs).count(), 12)
+
+        io_cursor = io_library.get_cursor(entity_model=entity_model, user_model=self.user_model)
+        io_cursor.dispatch('revenue_recognition', ledger_model='customer-new', amount=Decimal('10.00'))
+        io_cursor.dispatch('revenue_recognition', ledger_model='customer-bad', amount=Decimal('10.00'))
+        io_cursor.blueprints['customer-bad'][0].debit(account_code=cash_account.code, amount=Decimal('1.00'))
+        io_cursor.blueprints['customer-bad'][0].credit(account_code=income_account.code, amount=Decimal('0.50'))
+        with self.assertRaises(ValidationError):
+            io_cursor.commit(batched=True)
+        self.assertFalse(entity_model.ledgermodel_set.filter(ledger_xid__in=['customer-new', 'customer-bad']).exists())
+
+
+class IOReadDatabaseTest(DjangoLedgerBaseTest):
+    databases = {'default', 'replica'}
+
+    get_digest_balances = IOTest.get_digest_balances
+
+    def setUp(self):
+        super().setUp()
+        # the replica mirrors the default test database and must read the data of the open test transaction...
+        with connections['replica'].cursor() as cursor:
+            cursor.execute('PRAGMA read_uncommitted = 1')
+
+    def test_digest_read_database(self):
+        entity_model = self.get_random_entity_model()
+        to_date = self.START_DATE + timedelta(days=randint(100, 300))
+        digest_kwargs = {'to_date': to_date, 'role': None, 'use_closing_entry': False, 'use_balance_snapshots': False}
+
+        self.assertEqual(entity_model.database_digest(**digest_kwargs).txs_queryset.db, 'default')
+        io_result = entity_model.database_digest(using='replica', pushdown=True, **digest_kwargs)
+        self.assertEqual(io_result.txs_queryset.db, 'replica')
+        self.assertEqual(io_result.role_totals_queryset.db, 'replica')
+
+        # the digest queries are run on the replica connection only...
+        txs_table = TransactionModel._meta.db_table
+        with CaptureQueriesContext(connections['default']) as default_ctx:
+            with CaptureQueriesContext(connections['replica']) as replica_ctx:
+                replica_io_digest = entity_model.digest(using='replica', **digest_kwargs)
+        self.assertTrue(any(txs_table in q['sql'] for q in replica_ctx.captured_queries))
+        self.assertFalse(any(txs_table in q['sql'] for q in default_ctx.captured_queries))
+        self.assertTrue(self.get_digest_balances(replica_io_digest))
+        self.assertEqual(
+            self.get_digest_balances(replica_io_digest),
+            self.get_digest_balances(entity_model.digest(**digest_kwargs))
+        )
+
+        router = DjangoLedgerRouter()
+        self.assertIsNone(router.db_for_read(TransactionModel))
+        with read_database('replica'):
+            self.assertEqual(entity_model.database_digest(**digest_kwargs).txs_queryset.db, 'replica')
+            self.assertEqual(router.db_for_read(TransactionModel), 'replica')
+            self.assertIsNone(router.db_for_read(get_user_model()))
+            self.assertEqual(router.db_for_write(TransactionModel), 'default')
+            with primary_database():
+                self.assertEqual(entity_model.database_digest(**digest_kwargs).txs_queryset.db, 'default')
+                self.assertIsNone(router.db_for_read(TransactionModel))
+        self.assertIsNone(router.db_for_read(TransactionModel))
+
+        self.assertEqual(
+            self.get_digest_balances(entity_model.digest(using='default', **digest_kwargs)),
+            self.get_digest_balances(entity_model.digest(**digest_kwargs))
+        )
+
+    def test_digest_profile_read_database(self):
+        entity_model = self.get_random_entity_model()
+        to_date = self.START_DATE + timedelta(days=randint(100, 300))
+        digest_kwargs = {'to_date': to_date, 'use_closing_entry': False, 'use_balance_snapshots': False}
+
+        # queries routed to the replica are profiled too...
+        with CaptureQueriesContext(connections['default']) as default_ctx:
+            with CaptureQueriesContext(connections['replica']) as replica_ctx:
+                profile = entity_model.digest(using='replica', profile=True, **digest_kwargs).get_profile()
+        self.assertGreater(len(replica_ctx.captured_queries), 0)
+        self.assertGreater(profile['stages']['database_digest']['query_count'], 0)
+        self.assertEqual(
+            profile['query_count'],
+            len(default_ctx.captured_queries) + len(replica_ctx.captured_queries)
+        )
+
+
+class IOConsolidationThreadsTest(DjangoLedgerBaseTransactionTest):
+    N = 3
+
+    def test_digest_consolidated_threads(self):
+        root_entity_model = self.get_random_entity_model()
+        for child_entity_model in EntityModel.objects.exclude(uuid__exact=root_entity_model.uuid):
+            child_entity_model.move(root_entity_model, pos='last-child')
+        root_entity_model = EntityModel.objects.get(uuid__exact=root_entity_model.uuid)
+        to_date = self.START_DATE + timedelta(days=randint(200, 400))
+
+        # the test data is committed, so it is visible to the worker thread connections...
+        self.assertFalse(connection.in_atomic_block)
+        io_data_list = [
+            root_entity_model.digest_consolidated(
+                to_date=to_date,
+                process_groups=True,
+                use_closing_entry=False,
+                **consolidation_kwargs
+            ).get_io_data() for consolidation_kwargs in [{'max_workers': 1}, {'max_workers': 3}]
+        ]
+        self.assertEqual(*[len(io_data['consolidated_entities']) for io_data in io_data_list])
+        self.assertEqual(len(io_data_list[0]['consolidated_entities']), self.N)
+        self.assertEqual(*[
+            {(acc['code'], acc['role']): acc['balance'].quantize(Decimal('0.01')) for acc in io_data['accounts']}
+            for io_data in io_data_list
+        ])
+        self.assertEqual(*[
+            {k: Decimal(v).quantize(Decimal('0.01')) for k, v in io_data['group_balance'].items()}
+            for io_data in io_data_list
+        ])
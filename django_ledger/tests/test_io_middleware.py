@@ -0,0 +1,39 @@
+from django.test import SimpleTestCase
+
+from django_ledger.io.io_benchmark import (
+    as_ordered_items,
+    generate_digest_accounts,
+    legacy_bucket_aggregation,
+    legacy_group_buckets,
+    legacy_role_buckets,
+)
+from django_ledger.io.io_middleware import AccountGroupIOMiddleware, AccountRoleIOMiddleware
+
+
+class IOMiddlewareTest(SimpleTestCase):
+
+    def test_single_pass_aggregation_matches_legacy(self):
+        accounts = generate_digest_accounts(rows=500, units=3, periods=12, seed=7)
+
+        for by_period, by_unit in [(False, False), (True, False), (False, True), (True, True)]:
+            role_data = AccountRoleIOMiddleware(
+                io_data={'accounts': accounts},
+                by_period=by_period,
+                by_unit=by_unit
+            ).digest()
+            group_data = AccountGroupIOMiddleware(
+                io_data={'accounts': accounts},
+                by_period=by_period,
+                by_unit=by_unit
+            ).digest()
+
+            for io_data, keys, buckets in [
+                (role_data, ['role_account', 'role_balance', 'role_balance_by_period', 'role_balance_by_unit'],
+                 legacy_role_buckets()),
+                (group_data, ['group_account', 'group_balance', 'group_balance_by_period', 'group_balance_by_unit'],
+                 legacy_group_buckets())
+            ]:
+                legacy_result = legacy_bucket_aggregation(accounts, buckets, by_period=by_period, by_unit=by_unit)
+                for k, legacy_value in zip(keys, legacy_result):
+                    if k in io_data:
+                        self.assertEqual(as_ordered_items(io_data[k]), as_ordered_items(legacy_value))
@@ -105,6 +105,16 @@ def accruable_net_summary(queryset: QuerySet) -> dict:
     return nets
 
 
+async def aaccruable_net_summary(queryset: QuerySet) -> dict:
+    """
+    Async counterpart of accruable_net_summary. Fetches the accruable objects with the async QuerySet iterator.
+
+    :param queryset: Accruable Objects Queryset.
+    :return: A dictionary summarizing current net summary 0,30,60,90,90+ bill open amounts.
+    """
+    return accruable_net_summary([b async for b in queryset])
+
+
 def get_end_date_from_session(entity_slug: str, request) -> date:
     session_end_date_filter = get_end_date_session_key(entity_slug)
     end_date = request.session.get(session_end_date_filter)
@@ -12,25 +12,25 @@ from django.http import JsonResponse
 from django.views.generic import View
 
 from django_ledger.models import BillModel, EntityModel, InvoiceModel
-from django_ledger.utils import accruable_net_summary
-from django_ledger.views.mixins import DjangoLedgerSecurityMixIn, EntityUnitMixIn
+from django_ledger.utils import aaccruable_net_summary
+from django_ledger.views.mixins import DjangoLedgerAsyncSecurityMixIn, EntityUnitMixIn
 
 
 # from jsonschema import validate, ValidationError
 
 
-class PnLAPIView(DjangoLedgerSecurityMixIn, EntityUnitMixIn, View):
+class PnLAPIView(DjangoLedgerAsyncSecurityMixIn, EntityUnitMixIn, View):
     http_method_names = ['get']
 
-    def get(self, request, *args, **kwargs):
+    async def get(self, request, *args, **kwargs):
         if request.user.is_authenticated:
-            entity = EntityModel.objects.for_user(
-                user_model=self.request.user).get(
+            entity = await EntityModel.objects.for_user(
+                user_model=self.request.user).aget(
                 slug__exact=self.kwargs['entity_slug'])
 
             unit_slug = self.get_unit_slug()
 
-            io_digest = entity.digest(
+            io_digest = await entity.adigest(
                 user_model=self.request.user,
                 unit_slug=unit_slug,
                 equity_only=True,
@@ -67,10 +67,10 @@ class PnLAPIView(DjangoLedgerSecurityMixIn, EntityUnitMixIn, View):
         }, status=401)
 
 
-class PayableNetAPIView(DjangoLedgerSecurityMixIn, EntityUnitMixIn, View):
+class PayableNetAPIView(DjangoLedgerAsyncSecurityMixIn, EntityUnitMixIn, View):
     http_method_names = ['get']
 
-    def get(self, request, *args, **kwargs):
+    async def get(self, request, *args, **kwargs):
         if request.user.is_authenticated:
             bill_qs = BillModel.objects.for_entity(
                 entity_model=self.AUTHORIZED_ENTITY_MODEL
@@ -81,8 +81,8 @@ class PayableNetAPIView(DjangoLedgerSecurityMixIn, EntityUnitMixIn, View):
             # if unit_slug:
             #     bill_qs.filter(ledger__journal_entry__entity_unit__slug__exact=unit_slug)
 
-            net_summary = accruable_net_summary(bill_qs)
-            entity_model = bill_qs.first().ledger.entity
+            net_summary = await aaccruable_net_summary(bill_qs)
+            entity_model = self.AUTHORIZED_ENTITY_MODEL
             net_payables = {
                 'entity_slug': self.kwargs['entity_slug'],
                 'entity_name': entity_model.name,
@@ -98,10 +98,10 @@ class PayableNetAPIView(DjangoLedgerSecurityMixIn, EntityUnitMixIn, View):
         }, status=401)
 
 
-class ReceivableNetAPIView(DjangoLedgerSecurityMixIn, EntityUnitMixIn, View):
+class ReceivableNetAPIView(DjangoLedgerAsyncSecurityMixIn, EntityUnitMixIn, View):
     http_method_names = ['get']
 
-    def get(self, request, *args, **kwargs):
+    async def get(self, request, *args, **kwargs):
         if request.user.is_authenticated:
             invoice_qs = InvoiceModel.objects.for_entity(
                 entity_model=self.kwargs['entity_slug']
@@ -112,8 +112,8 @@ class ReceivableNetAPIView(DjangoLedgerSecurityMixIn, EntityUnitMixIn, View):
             # if unit_slug:
             #     invoice_qs.filter(ledger__journal_entry__entity_unit__slug__exact=unit_slug)
 
-            net_summary = accruable_net_summary(invoice_qs)
-            entity_model = invoice_qs.first().ledger.entity
+            net_summary = await aaccruable_net_summary(invoice_qs)
+            entity_model = self.AUTHORIZED_ENTITY_MODEL
             net_receivable = {
                 'entity_slug': self.kwargs['entity_slug'],
                 'entity_name': entity_model.name,
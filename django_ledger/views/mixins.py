@@ -8,8 +8,10 @@ Contributions to this module:
 
 from calendar import monthrange
 from datetime import timedelta, date
+from inspect import isawaitable
 from typing import Tuple, Optional
 
+from asgiref.sync import sync_to_async
 from django.contrib.auth.mixins import PermissionRequiredMixin, LoginRequiredMixin
 from django.core.exceptions import (
     ValidationError,
@@ -25,7 +27,7 @@ from django.views.generic.dates import YearMixin, MonthMixin, DayMixin
 
 from django_ledger.models import EntityModel, InvoiceModel, BillModel, LedgerModel
 from django_ledger.models.entity import EntityModelFiscalPeriodMixIn
-from django_ledger.settings import DJANGO_LEDGER_AUTHORIZED_SUPERUSER
+from django_ledger.settings import DJANGO_LEDGER_AUTHORIZED_SUPERUSER, DJANGO_LEDGER_READ_DATABASE
 
 
 class ContextFromToDateMixin:
@@ -387,6 +389,28 @@ class DjangoLedgerSecurityMixIn(LoginRequiredMixin, PermissionRequiredMixin):
         return entity_model.name
 
 
+class DjangoLedgerAsyncSecurityMixIn(DjangoLedgerSecurityMixIn):
+    """
+    Security MixIn for views with async handlers. The authentication and permission checks query the database,
+    so they run in a single thread sensitive call before the async handler is awaited. Thread sensitive calls
+    share the thread and database connection of the request, as the synchronous checks would.
+    The synchronous LoginRequiredMixin and PermissionRequiredMixin dispatch methods are replaced by these checks,
+    the rest of the dispatch chain is preserved.
+    """
+
+    def check_authorization(self) -> bool:
+        return self.request.user.is_authenticated and self.has_permission()
+
+    async def dispatch(self, request, *args, **kwargs):
+        is_authorized = await sync_to_async(self.check_authorization)()
+        if not is_authorized:
+            return await sync_to_async(self.handle_no_permission)()
+        response = super(PermissionRequiredMixin, self).dispatch(request, *args, **kwargs)
+        if isawaitable(response):
+            response = await response
+        return response
+
+
 class EntityUnitMixIn:
     UNIT_SLUG_KWARG = 'unit_slug'
     UNIT_SLUG_QUERY_PARAM = 'unit'
@@ -410,7 +434,24 @@ class EntityUnitMixIn:
         return context
 
 
-class DigestContextMixIn:
+class ReadDatabaseMixIn:
+    """
+    Digests the reports of the view from a read replica database alias. Defaults to DJANGO_LEDGER_READ_DATABASE.
+    The alias is also made available to the financial statement template tags.
+    """
+    READ_DATABASE: Optional[str] = None
+    READ_DATABASE_CONTEXT_NAME = 'read_database'
+
+    def get_read_database(self) -> Optional[str]:
+        return self.READ_DATABASE or DJANGO_LEDGER_READ_DATABASE
+
+    def get_context_data(self, **kwargs):
+        context = super(ReadDatabaseMixIn, self).get_context_data(**kwargs)
+        context[self.READ_DATABASE_CONTEXT_NAME] = self.get_read_database()
+        return context
+
+
+class DigestContextMixIn(ReadDatabaseMixIn):
     IO_DIGEST_UNBOUNDED = False
     IO_DIGEST_BOUNDED = False
 
@@ -463,6 +504,7 @@ class DigestContextMixIn:
                     process_ratios=True,
                     process_roles=True,
                     process_groups=True,
+                    using=self.get_read_database(),
                 )
 
                 context[self.get_io_manager_unbounded_context_name()] = io_digest
@@ -481,6 +523,7 @@ class DigestContextMixIn:
                     process_ratios=True,
                     process_roles=True,
                     process_groups=True,
+                    using=self.get_read_database(),
                 )
 
                 context[self.get_io_manager_bounded_context_name()] = io_digest_equity
@@ -574,7 +617,7 @@ class BaseDateNavigationUrlMixIn:
         )
 
 
-class PDFReportMixIn:
+class PDFReportMixIn(ReadDatabaseMixIn):
     class PDFReportEnum:
         BS = 'BS'
         IS = 'IS'
@@ -608,6 +651,7 @@ class PDFReportMixIn:
             to_date=self.get_pdf_to_date(),
             user_model=self.request.user,
             subtitle=self.get_pdf_subtitle(),
+            using=self.get_read_database(),
         )
         pdf.create_pdf_report()
         return pdf